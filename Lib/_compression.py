@@ -1,10 +1,29 @@
 """Internal classes used by the gzip, lzma and bz2 modules"""
 
+import collections
 import io
+import os
+import threading
 
 
 BUFFER_SIZE = io.DEFAULT_BUFFER_SIZE  # Compressed data read chunk size
 
+READAHEAD_SIZE = 8 * io.DEFAULT_BUFFER_SIZE  # Decompressed read-ahead chunk size
+
+
+def thread_count(threads):
+    """Validate the threads argument of the file classes.
+
+    Return the number of threads to use; 0 means one per CPU.
+    """
+    if not isinstance(threads, int):
+        raise TypeError("threads must be an integer")
+    if threads < 0:
+        raise ValueError("threads must be a non-negative integer")
+    if threads == 0:
+        threads = os.cpu_count() or 1
+    return threads
+
 
 class BaseStream(io.BufferedIOBase):
     """Mode-checking helper functions."""
@@ -150,3 +169,200 @@ class DecompressReader(io.RawIOBase):
     def tell(self):
         """Return the current file position."""
         return self._pos
+
+
+class ReadAheadReader(io.RawIOBase):
+    """Runs a DecompressReader ahead of its consumer in another thread.
+
+    Decompressed chunks are queued, up to max_chunks of them, so that
+    decompression overlaps with the processing of the data already
+    returned.  The decompressors release the GIL while they work.
+    """
+
+    def readable(self):
+        return True
+
+    def __init__(self, raw, max_chunks):
+        self.raw = raw
+        self._max_chunks = max_chunks
+        self._chunks = collections.deque()
+        self._cond = threading.Condition(threading.Lock())
+        self._thread = None
+        self._stop = None
+        self._pos = 0
+
+    def _start(self):
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=_read_ahead,
+            args=(self.raw, self._chunks, self._cond, self._max_chunks,
+                  self._stop),
+            daemon=True)
+        self._thread.start()
+
+    def _halt(self):
+        if self._thread is None:
+            return
+        with self._cond:
+            self._stop.set()
+            self._cond.notify_all()
+        self._thread.join()
+        self._thread = None
+        self._chunks.clear()
+
+    def close(self):
+        try:
+            self._halt()
+            self.raw.close()
+        finally:
+            super().close()
+
+    def seekable(self):
+        return self.raw.seekable()
+
+    def readinto(self, b):
+        with memoryview(b) as view, view.cast("B") as byte_view:
+            data = self.read(len(byte_view))
+            byte_view[:len(data)] = data
+        return len(data)
+
+    def read(self, size=-1):
+        if size < 0:
+            return self.readall()
+        if not size:
+            return b""
+        if self._thread is None:
+            self._start()
+        with self._cond:
+            while not self._chunks:
+                self._cond.wait()
+            data = self._chunks[0]
+            if isinstance(data, BaseException):
+                raise data
+            if len(data) > size:
+                self._chunks[0] = data[size:]
+                data = data[:size]
+            elif data:
+                self._chunks.popleft()
+                self._cond.notify_all()
+        self._pos += len(data)
+        return data
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset = self._pos + offset
+            whence = io.SEEK_SET
+        if (whence == io.SEEK_SET and offset >= self._pos and
+                self._thread is not None):
+            # Skip forward through the data already decompressed.
+            while self._pos < offset:
+                if not self.read(min(offset - self._pos, READAHEAD_SIZE)):
+                    break
+            return self._pos
+        self._halt()
+        self._pos = self.raw.seek(offset, whence)
+        return self._pos
+
+    def tell(self):
+        """Return the current file position."""
+        return self._pos
+
+
+def _read_ahead(raw, chunks, cond, max_chunks, stop):
+    # Body of the ReadAheadReader thread.  It does not reference the
+    # reader itself, so that an unclosed reader can still be collected.
+    while True:
+        try:
+            data = raw.read(READAHEAD_SIZE)
+        except BaseException as exc:
+            data = exc
+        with cond:
+            while len(chunks) >= max_chunks and not stop.is_set():
+                cond.wait()
+            if stop.is_set():
+                return
+            chunks.append(data)
+            cond.notify_all()
+        if not data or isinstance(data, BaseException):
+            # EOF and errors stay at the end of the queue.
+            return
+
+
+class ParallelCompressor:
+    """Compresses independent blocks of data in a pool of threads.
+
+    It has the compress() and flush() methods of the compressor objects.
+    The input is split into blocks of block_size bytes, and each block
+    is passed to compress_block(data, history, last) in a worker thread.
+    history is None for the first block, otherwise it holds the last
+    history_size bytes of input preceding the block.  last is true for
+    the block submitted by a final flush().  The compressed blocks are
+    returned in order.
+    """
+
+    def __init__(self, compress_block, threads, block_size, history_size=0):
+        from concurrent.futures import ThreadPoolExecutor
+        self._compress_block = compress_block
+        self._block_size = block_size
+        self._history_size = history_size
+        self._history = None
+        self._max_pending = 2 * threads
+        self._executor = ThreadPoolExecutor(threads)
+        self._pending = collections.deque()
+        self._buffer = []
+        self._buffered = 0
+
+    def _submit(self, data, last=False):
+        self._pending.append(self._executor.submit(
+            self._compress_block, data, self._history, last))
+        if self._history_size:
+            history = (self._history or b"") + data
+            self._history = history[-self._history_size:]
+        else:
+            self._history = b""
+
+    def _collect(self, wait):
+        # Return the compressed blocks available at the head of the queue,
+        # waiting for all of them if wait is true, or else for enough of
+        # them to keep at most max_pending blocks in flight.
+        out = []
+        pending = self._pending
+        while pending and (wait or pending[0].done() or
+                           len(pending) > self._max_pending):
+            out.append(pending.popleft().result())
+        return b"".join(out)
+
+    def compress(self, data):
+        if self._executor is None:
+            raise ValueError("Compressor has been flushed")
+        with memoryview(data) as view, view.cast("B") as byte_view:
+            pos = 0
+            length = len(byte_view)
+            while pos < length:
+                n = min(length - pos, self._block_size - self._buffered)
+                self._buffer.append(bytes(byte_view[pos:pos + n]))
+                self._buffered += n
+                pos += n
+                if self._buffered == self._block_size:
+                    self._submit(b"".join(self._buffer))
+                    self._buffer.clear()
+                    self._buffered = 0
+        return self._collect(False)
+
+    def flush(self, last=True):
+        """Compress the buffered data and return all the pending output.
+
+        If last is false, the compressor can still be used afterwards.
+        """
+        if self._executor is None:
+            raise ValueError("Repeated call to flush()")
+        if self._buffered or last:
+            self._submit(b"".join(self._buffer), last)
+            self._buffer.clear()
+            self._buffered = 0
+        try:
+            return self._collect(True)
+        finally:
+            if last:
+                self._executor.shutdown()
+                self._executor = None
@@ -16,6 +16,7 @@ from .runners import *
 from .queues import *
 from .streams import *
 from .subprocess import *
+from .taskgroups import *
 from .tasks import *
 from .transports import *
 
@@ -34,6 +35,7 @@ __all__ = (base_events.__all__ +
            queues.__all__ +
            streams.__all__ +
            subprocess.__all__ +
+           taskgroups.__all__ +
            tasks.__all__ +
            transports.__all__)
 
@@ -45,17 +45,9 @@ from . import transports
 from .log import logger
 
 
-__all__ = 'BaseEventLoop',
+__all__ = 'BaseEventLoop', 'TimerWheel'
 
 
-# Minimum number of _scheduled timer handles before cleanup of
-# cancelled handles is performed.
-_MIN_SCHEDULED_TIMER_HANDLES = 100
-
-# Minimum fraction of _scheduled timer handles that are cancelled
-# before cleanup of cancelled handles is performed.
-_MIN_CANCELLED_TIMER_HANDLES_FRACTION = 0.5
-
 # Exceptions which must not call the exception handler in fatal error
 # methods (_fatal_error())
 _FATAL_ERROR_IGNORE = (BrokenPipeError,
@@ -347,14 +339,307 @@ class Server(events.AbstractServer):
         await waiter
 
 
+class _TimerHeap(heapq.IndexedHeap):
+    """Default container of the timer handles of an event loop.
+
+    A timer container supports len(), iteration, push(timer) which
+    returns a token, remove(token), clear(), next_deadline() and
+    pop_due(end_time).
+    """
+
+    def next_deadline(self):
+        """Return the time of the earliest timer, or None."""
+        # Timer handles cancelled before being scheduled are only
+        # removed here.
+        while self and self.peek()._cancelled:
+            self.pop()._scheduled = None
+        if not self:
+            return None
+        return self.peek()._when
+
+    def pop_due(self, end_time):
+        """Remove and return the timers due before end_time."""
+        due = []
+        while self:
+            timer = self.peek()
+            if timer._when >= end_time:
+                break
+            due.append(self.pop())
+        return due
+
+
+class _WheelEntry:
+
+    __slots__ = ('timer', 'tick', 'slot', 'level', 'index')
+
+
+class TimerWheel:
+    """Hierarchical timer wheel holding the timer handles of a loop.
+
+    Adding and cancelling a timer take constant time, independently of
+    the number of timers, at the price of precision: a timer is called
+    up to *granularity* seconds after its deadline, and timers whose
+    deadlines fall in the same interval of *granularity* seconds are
+    called in an arbitrary order.
+
+    Each of the *levels* wheels has *slots* slots, a slot of a wheel
+    spanning the whole next lower wheel.  Timers beyond the range of the
+    last wheel are kept aside until it gets close enough.
+
+    Install it with loop.set_timer_queue(TimerWheel()).
+    """
+
+    def __init__(self, granularity=0.001, slots=256, levels=4):
+        if granularity <= 0:
+            raise ValueError('granularity must be positive')
+        if slots < 2:
+            raise ValueError('slots must be at least 2')
+        if levels < 1:
+            raise ValueError('levels must be at least 1')
+        self._granularity = granularity
+        self._slots = slots
+        self._spans = [slots ** k for k in range(levels + 1)]
+        # Slots of each wheel, by index: only non-empty slots are kept.
+        self._levels = [{} for k in range(levels)]
+        self._overflow = set()
+        # No timer of the overflow is due before this tick, at most the
+        # earliest tick of its timers.
+        self._overflow_tick = None
+        self._tick = None       # first tick whose timers were not popped
+        self._len = 0
+        self._scheduled_count = 0
+        self._cancelled_count = 0
+        self._expired_count = 0
+        self._cascaded_count = 0
+
+    def __repr__(self):
+        return (f'<{self.__class__.__name__} '
+                f'granularity={self._granularity} pending={self._len}>')
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        timers = [entry.timer for entry in self._overflow]
+        for slots in self._levels:
+            for slot in slots.values():
+                timers.extend(entry.timer for entry in slot)
+        return iter(timers)
+
+    @property
+    def granularity(self):
+        return self._granularity
+
+    def stats(self):
+        """Return a dict with the counts of timers of the wheel.
+
+        'pending' is the number of timers in the wheel, 'scheduled',
+        'cancelled' and 'expired' the number of timers added, removed
+        and popped since the wheel was created, and 'cascaded' the
+        number of times a timer was moved to a lower level wheel.
+        """
+        return {
+            'pending': self._len,
+            'scheduled': self._scheduled_count,
+            'cancelled': self._cancelled_count,
+            'expired': self._expired_count,
+            'cascaded': self._cascaded_count,
+        }
+
+    def push(self, timer):
+        """Add a timer handle and return its token."""
+        entry = _WheelEntry()
+        entry.timer = timer
+        entry.tick = int(timer._when // self._granularity)
+        self._place(entry)
+        self._len += 1
+        self._scheduled_count += 1
+        return entry
+
+    def remove(self, entry):
+        """Remove the timer handle of the token returned by push()."""
+        slot = entry.slot
+        if slot is None:
+            raise ValueError('timer is not in the wheel')
+        slot.discard(entry)
+        entry.slot = None
+        if not slot and entry.level is not None:
+            del self._levels[entry.level][entry.index]
+        self._len -= 1
+        self._cancelled_count += 1
+
+    def clear(self):
+        """Remove all timer handles."""
+        for slots in self._levels:
+            for slot in slots.values():
+                for entry in slot:
+                    entry.slot = None
+            slots.clear()
+        for entry in self._overflow:
+            entry.slot = None
+        self._overflow.clear()
+        self._overflow_tick = None
+        self._len = 0
+
+    def next_deadline(self):
+        """Return the time at which the earliest timers are due, or None.
+
+        This is the end of the earliest non-empty slot of the first wheel,
+        or the start of the earliest non-empty slot of another wheel, for
+        its timers to be moved to a lower level wheel.
+        """
+        if not self._len:
+            return None
+        tick = self._tick
+        if tick is None:
+            return min(entry.timer._when for entry in self._overflow)
+        slots = self._levels[0]
+        if slots:
+            return (tick - tick % self._slots + min(slots) + 1) * \
+                self._granularity
+        spans = self._spans
+        for level in range(1, len(self._levels)):
+            slots = self._levels[level]
+            if slots:
+                high = spans[level + 1]
+                start = tick // high * high + min(slots) * spans[level]
+                return start * self._granularity
+        high = spans[-1]
+        return self._overflow_tick // high * high * self._granularity
+
+    def pop_due(self, end_time):
+        """Remove and return the timers of the slots ending before
+        end_time.
+        """
+        target = int(end_time // self._granularity)
+        due = []
+        if self._tick is None:
+            # The wheels are positioned at the first call.
+            self._tick = target
+            entries = self._overflow
+            self._overflow = set()
+            self._overflow_tick = None
+            self._replace(entries, due)
+        slots_count = self._slots
+        spans = self._spans
+        levels = self._levels
+        while True:
+            tick = self._tick
+            base = tick - tick % slots_count
+            slots = levels[0]
+            if slots:
+                stop = target - base
+                for index in [index for index in slots if index < stop]:
+                    for entry in slots.pop(index):
+                        entry.slot = None
+                        due.append(entry.timer)
+            if target < base + slots_count:
+                self._tick = max(tick, target)
+                # The current slot holds the timers added when they were
+                # already due.
+                index = self._tick % slots_count
+                slot = slots.get(index)
+                if slot:
+                    late = [entry for entry in slot if entry.tick < target]
+                    for entry in late:
+                        slot.remove(entry)
+                        entry.slot = None
+                        due.append(entry.timer)
+                    if not slot:
+                        del slots[index]
+                break
+            # Move to the next slot of a higher level wheel holding
+            # timers, or to the target if there is none before it.
+            new_tick = target
+            for level in range(1, len(levels)):
+                slots = levels[level]
+                if slots:
+                    high = spans[level + 1]
+                    start = tick // high * high + min(slots) * spans[level]
+                    new_tick = min(new_tick, start)
+                    break
+            else:
+                if self._overflow:
+                    # Jump to the span of the last wheel holding the
+                    # earliest timer of the overflow.
+                    high = spans[-1]
+                    new_tick = min(new_tick,
+                                   self._overflow_tick // high * high)
+            self._move(new_tick, due)
+        self._len -= len(due)
+        self._expired_count += len(due)
+        return due
+
+    def _move(self, new_tick, due):
+        # Advance the wheels to new_tick, moving the timers of the slots
+        # reached to lower level wheels, or to due if they are due
+        # before new_tick.
+        tick = self._tick
+        self._tick = new_tick
+        spans = self._spans
+        if new_tick // spans[-1] != tick // spans[-1]:
+            entries = self._overflow
+            self._overflow = set()
+            self._overflow_tick = None
+            self._replace(entries, due)
+        for level in reversed(range(1, len(self._levels))):
+            span = spans[level]
+            if new_tick // span != tick // span:
+                slot = self._levels[level].pop(
+                    new_tick // span % self._slots, None)
+                if slot:
+                    self._cascaded_count += len(slot)
+                    self._replace(slot, due)
+
+    def _replace(self, entries, due):
+        tick = self._tick
+        for entry in entries:
+            if entry.tick < tick:
+                entry.slot = None
+                due.append(entry.timer)
+            else:
+                self._place(entry)
+
+    def _place(self, entry):
+        tick = self._tick
+        if tick is None:
+            slot = self._overflow
+            entry.level = None
+        else:
+            # A timer already due goes to the current slot.
+            t = max(entry.tick, tick)
+            spans = self._spans
+            for level, slots in enumerate(self._levels):
+                high = spans[level + 1]
+                if t // high == tick // high:
+                    index = t // spans[level] % self._slots
+                    slot = slots.get(index)
+                    if slot is None:
+                        slot = slots[index] = set()
+                    entry.level = level
+                    entry.index = index
+                    break
+            else:
+                slot = self._overflow
+                entry.level = None
+        if entry.level is None:
+            if self._overflow_tick is None or entry.tick < self._overflow_tick:
+                self._overflow_tick = entry.tick
+        slot.add(entry)
+        entry.slot = slot
+
+
 class BaseEventLoop(events.AbstractEventLoop):
 
     def __init__(self):
-        self._timer_cancelled_count = 0
         self._closed = False
         self._stopping = False
         self._ready = collections.deque()
-        self._scheduled = []
+        # Timer handles are kept in a container, by default an indexed
+        # heap, which removes them at once when they are cancelled.  The
+        # _scheduled attribute of a timer handle is its token in the
+        # container while it is in it.
+        self._scheduled = _TimerHeap()
         self._default_executor = None
         self._internal_fds = 0
         # Identifier of the thread running the event loop, or None if the
@@ -601,6 +886,8 @@ class BaseEventLoop(events.AbstractEventLoop):
             logger.debug("Close %r", self)
         self._closed = True
         self._ready.clear()
+        for timer in self._scheduled:
+            timer._scheduled = None
         self._scheduled.clear()
         executor = self._default_executor
         if executor is not None:
@@ -665,10 +952,25 @@ class BaseEventLoop(events.AbstractEventLoop):
         timer = events.TimerHandle(when, callback, args, self, context)
         if timer._source_traceback:
             del timer._source_traceback[-1]
-        heapq.heappush(self._scheduled, timer)
-        timer._scheduled = True
+        timer._scheduled = self._scheduled.push(timer)
         return timer
 
+    def set_timer_queue(self, queue):
+        """Set the container of the callbacks of call_later() and call_at().
+
+        If queue is None, the default heap is used.  Callbacks already
+        scheduled are moved to the new container.
+        """
+        self._check_closed()
+        if queue is None:
+            queue = _TimerHeap()
+        elif len(queue):
+            raise ValueError('the timer queue must be empty')
+        for timer in self._scheduled:
+            timer._scheduled = queue.push(timer)
+        self._scheduled.clear()
+        self._scheduled = queue
+
     def call_soon(self, callback, *args, context=None):
         """Arrange for a callback to be called as soon as possible.
 
@@ -832,7 +1134,7 @@ class BaseEventLoop(events.AbstractEventLoop):
                 read = await self.run_in_executor(None, file.readinto, view)
                 if not read:
                     break  # EOF
-                await self.sock_sendall(sock, view)
+                await self.sock_sendall(sock, view[:read])
                 total_sent += read
             return total_sent
         finally:
@@ -1087,7 +1389,7 @@ class BaseEventLoop(events.AbstractEventLoop):
                 if not read:
                     return total_sent  # EOF
                 await proto.drain()
-                transp.write(view)
+                transp.write(view[:read])
                 total_sent += read
         finally:
             if total_sent > 0 and hasattr(file, 'seek'):
@@ -1673,8 +1975,9 @@ class BaseEventLoop(events.AbstractEventLoop):
 
     def _timer_handle_cancelled(self, handle):
         """Notification that a TimerHandle has been cancelled."""
-        if handle._scheduled:
-            self._timer_cancelled_count += 1
+        if handle._scheduled is not None:
+            self._scheduled.remove(handle._scheduled)
+            handle._scheduled = None
 
     def _run_once(self):
         """Run one full iteration of the event loop.
@@ -1684,48 +1987,23 @@ class BaseEventLoop(events.AbstractEventLoop):
         'call_later' callbacks.
         """
 
-        sched_count = len(self._scheduled)
-        if (sched_count > _MIN_SCHEDULED_TIMER_HANDLES and
-            self._timer_cancelled_count / sched_count >
-                _MIN_CANCELLED_TIMER_HANDLES_FRACTION):
-            # Remove delayed calls that were cancelled if their number
-            # is too high
-            new_scheduled = []
-            for handle in self._scheduled:
-                if handle._cancelled:
-                    handle._scheduled = False
-                else:
-                    new_scheduled.append(handle)
-
-            heapq.heapify(new_scheduled)
-            self._scheduled = new_scheduled
-            self._timer_cancelled_count = 0
-        else:
-            # Remove delayed calls that were cancelled from head of queue.
-            while self._scheduled and self._scheduled[0]._cancelled:
-                self._timer_cancelled_count -= 1
-                handle = heapq.heappop(self._scheduled)
-                handle._scheduled = False
-
         timeout = None
         if self._ready or self._stopping:
             timeout = 0
         elif self._scheduled:
             # Compute the desired timeout.
-            when = self._scheduled[0]._when
-            timeout = min(max(0, when - self.time()), MAXIMUM_SELECT_TIMEOUT)
+            when = self._scheduled.next_deadline()
+            if when is not None:
+                timeout = min(max(0, when - self.time()),
+                              MAXIMUM_SELECT_TIMEOUT)
 
         event_list = self._selector.select(timeout)
         self._process_events(event_list)
 
         # Handle 'later' callbacks that are ready.
         end_time = self.time() + self._clock_resolution
-        while self._scheduled:
-            handle = self._scheduled[0]
-            if handle._when >= end_time:
-                break
-            handle = heapq.heappop(self._scheduled)
-            handle._scheduled = False
+        for handle in self._scheduled.pop_due(end_time):
+            handle._scheduled = None
             self._ready.append(handle)
 
         # This is the only place where callbacks are actually *called*.
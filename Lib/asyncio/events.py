@@ -105,7 +105,7 @@ class TimerHandle(Handle):
         if self._source_traceback:
             del self._source_traceback[-1]
         self._when = when
-        self._scheduled = False
+        self._scheduled = None
 
     def _repr_info(self):
         info = super()._repr_info()
@@ -0,0 +1,220 @@
+"""Structured groups of tasks."""
+
+__all__ = 'TaskGroup',
+
+from . import events
+from . import exceptions
+from . import locks
+from . import tasks
+
+
+class TaskGroup:
+    """Asynchronous context manager holding a group of tasks.
+
+    Tasks are added to the group with create_task().  When the
+    'async with' block exits, the group waits for all of its tasks
+    to finish.  If any task fails with an exception other than
+    CancelledError, the remaining tasks are cancelled, the body of
+    the 'async with' block is cancelled if it is still running, and
+    the first exception is raised once every task has finished.
+    Further exceptions raised by the cancelled tasks are reported
+    to the event loop's exception handler.
+
+    If *limit* is given, at most *limit* tasks of the group run their
+    coroutine at any one time; tasks created beyond that wait for a
+    running one to finish before starting.
+
+    Example:
+
+        async with asyncio.TaskGroup(limit=10) as group:
+            for url in urls:
+                group.create_task(fetch(url))
+        # All fetch() calls are done here.
+
+    The group keeps no reference to a task once it is done.
+    """
+
+    def __init__(self, *, limit=None):
+        if limit is not None and limit <= 0:
+            raise ValueError("limit must be greater than 0")
+        self._limit = limit
+        self._semaphore = None
+        self._entered = False
+        self._exiting = False
+        self._aborting = False
+        self._loop = None
+        self._parent_task = None
+        self._parent_cancel_requested = False
+        self._tasks = set()
+        self._errors = []
+        self._base_error = None
+        self._on_completed_fut = None
+
+    def __repr__(self):
+        info = ['']
+        if self._limit is not None:
+            info.append(f'limit={self._limit}')
+        if self._tasks:
+            info.append(f'tasks={len(self._tasks)}')
+        if self._errors:
+            info.append(f'errors={len(self._errors)}')
+        if self._aborting:
+            info.append('cancelling')
+        elif self._entered:
+            info.append('entered')
+        info_str = ' '.join(info)
+        return f'<{type(self).__name__}{info_str}>'
+
+    async def __aenter__(self):
+        if self._entered:
+            raise RuntimeError(f"TaskGroup {self!r} has been already entered")
+        self._entered = True
+        self._loop = events.get_running_loop()
+        self._parent_task = tasks.current_task(self._loop)
+        if self._parent_task is None:
+            raise RuntimeError(
+                f"TaskGroup {self!r} cannot determine the parent task")
+        if self._limit is not None:
+            self._semaphore = locks.Semaphore(self._limit)
+        return self
+
+    async def __aexit__(self, et, exc, tb):
+        self._exiting = True
+        propagate_cancellation_error = None
+
+        if exc is not None and _is_base_error(exc) and self._base_error is None:
+            self._base_error = exc
+
+        if et is exceptions.CancelledError:
+            if not self._parent_cancel_requested:
+                # The parent task was cancelled from outside the group:
+                # the cancellation has to be propagated once the tasks
+                # are done.  Otherwise the group cancelled its parent
+                # itself and the exception is swallowed below.
+                propagate_cancellation_error = exc
+
+        if et is not None and not self._aborting:
+            # The body of the 'async with' block failed or was
+            # cancelled: the group's tasks have to be cancelled too.
+            self._abort()
+
+        # Wait for all the tasks to finish, even if they were cancelled.
+        while self._tasks:
+            if self._on_completed_fut is None:
+                self._on_completed_fut = self._loop.create_future()
+            try:
+                await self._on_completed_fut
+            except exceptions.CancelledError as ex:
+                if not self._aborting:
+                    # The parent task was cancelled while waiting for
+                    # the tasks: cancel them and propagate the
+                    # cancellation once they are done.
+                    propagate_cancellation_error = ex
+                    self._abort()
+            self._on_completed_fut = None
+
+        assert not self._tasks
+
+        if self._base_error is not None:
+            raise self._base_error
+
+        if propagate_cancellation_error is not None:
+            raise propagate_cancellation_error
+
+        if et is not None and et is not exceptions.CancelledError:
+            # The body's own exception propagates, exceptions of the
+            # tasks are only reported.
+            self._report_errors(self._errors)
+            return False
+
+        if self._errors:
+            self._report_errors(self._errors[1:])
+            raise self._errors[0]
+
+        return None
+
+    def create_task(self, coro, *, name=None):
+        """Schedule the execution of a coroutine in the group.
+
+        Return the Task object.
+        """
+        if not self._entered:
+            raise RuntimeError(f"TaskGroup {self!r} has not been entered")
+        if self._exiting and not self._tasks:
+            raise RuntimeError(f"TaskGroup {self!r} is finished")
+        if self._aborting:
+            raise RuntimeError(f"TaskGroup {self!r} is shutting down")
+        if self._semaphore is not None:
+            coro = self._run_limited(coro)
+        task = self._loop.create_task(coro, name=name)
+        task.add_done_callback(self._on_task_done)
+        self._tasks.add(task)
+        return task
+
+    async def _run_limited(self, coro):
+        try:
+            await self._semaphore.acquire()
+        except BaseException:
+            # Cancelled before it could start: avoid a "coroutine was
+            # never awaited" warning.
+            coro.close()
+            raise
+        try:
+            return await coro
+        finally:
+            self._semaphore.release()
+
+    def _abort(self):
+        self._aborting = True
+        for task in self._tasks:
+            if not task.done():
+                task.cancel()
+
+    def _report_errors(self, errors):
+        for exc in errors:
+            self._loop.call_exception_handler({
+                'message': f'Unhandled exception in {self!r}',
+                'exception': exc,
+            })
+
+    def _on_task_done(self, task):
+        self._tasks.discard(task)
+
+        if self._on_completed_fut is not None and not self._tasks:
+            if not self._on_completed_fut.done():
+                self._on_completed_fut.set_result(True)
+
+        if task.cancelled():
+            return
+
+        exc = task.exception()
+        if exc is None:
+            return
+
+        self._errors.append(exc)
+        if _is_base_error(exc) and self._base_error is None:
+            self._base_error = exc
+
+        if self._parent_task.done():
+            # Should not happen since __aexit__() waits for the tasks,
+            # but never lose an exception.
+            self._loop.call_exception_handler({
+                'message': f'Task {task!r} has errored out but its parent '
+                           f'task {self._parent_task} is already completed',
+                'exception': exc,
+                'task': task,
+            })
+            return
+
+        if not self._aborting and not self._parent_cancel_requested:
+            # Cancel the other tasks and the body of the 'async with'
+            # block if it is still running; __aexit__() swallows the
+            # resulting CancelledError and raises *exc* instead.
+            self._abort()
+            self._parent_cancel_requested = True
+            self._parent_task.cancel()
+
+
+def _is_base_error(exc):
+    assert isinstance(exc, BaseException)
+    return not isinstance(exc, Exception)
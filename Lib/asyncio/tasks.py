@@ -3,12 +3,13 @@
 __all__ = (
     'Task', 'create_task',
     'FIRST_COMPLETED', 'FIRST_EXCEPTION', 'ALL_COMPLETED',
-    'wait', 'wait_for', 'as_completed', 'sleep',
+    'wait', 'wait_for', 'as_completed', 'iter_completed', 'sleep',
     'gather', 'shield', 'ensure_future', 'run_coroutine_threadsafe',
     'current_task', 'all_tasks',
     '_register_task', '_unregister_task', '_enter_task', '_leave_task',
 )
 
+import collections
 import concurrent.futures
 import contextvars
 import functools
@@ -578,6 +579,74 @@ def as_completed(fs, *, loop=None, timeout=None):
         yield _wait_for_one()
 
 
+async def iter_completed(aws, *, limit=None):
+    """Asynchronous iterator yielding futures as they complete.
+
+    *aws* may be any iterable of awaitables, including a generator
+    producing coroutines on demand.  It is consumed lazily: at most
+    *limit* of its awaitables are scheduled at any one time, and the
+    next one is pulled only after a running one has completed.  When
+    *limit* is None, all awaitables are scheduled immediately.
+
+    The values yielded are done futures; call result() on them to get
+    the result or the exception of the original awaitable:
+
+        async for fut in iter_completed(coros, limit=100):
+            result = fut.result()  # May raise.
+
+    The iterator keeps no reference to futures once they have been
+    yielded.  When it is closed before being exhausted (see aclose()),
+    the tasks it created that are still pending are cancelled.
+    """
+    if inspect.isawaitable(aws):
+        raise TypeError(f"expect an iterable of awaitables, "
+                        f"not {type(aws).__name__}")
+    if limit is not None and limit <= 0:
+        raise ValueError("limit must be greater than 0")
+    loop = events.get_running_loop()
+    aws = iter(aws)
+    pending = {}  # future -> True if the iterator created it
+    done = collections.deque()
+    waiter = None
+
+    def _on_completion(f):
+        if pending.pop(f, None) is None:
+            return  # The iterator has been closed.
+        done.append(f)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    try:
+        while True:
+            while aws is not None and (limit is None or len(pending) < limit):
+                try:
+                    aw = next(aws)
+                except StopIteration:
+                    aws = None
+                    break
+                f = ensure_future(aw, loop=loop)
+                if f in pending:
+                    continue
+                pending[f] = f is not aw
+                f.add_done_callback(_on_completion)
+            if not done:
+                if not pending:
+                    break
+                waiter = loop.create_future()
+                try:
+                    await waiter
+                finally:
+                    waiter = None
+            yield done.popleft()
+    finally:
+        for f, created in pending.items():
+            f.remove_done_callback(_on_completion)
+            if created:
+                f.cancel()
+        pending.clear()
+        done.clear()
+
+
 @types.coroutine
 def __sleep0():
     """Skip one event loop run cycle.
@@ -10,6 +10,7 @@ __all__ = ["BZ2File", "BZ2Compressor", "BZ2Decompressor",
 __author__ = "Nadeem Vawda <nadeem.vawda@gmail.com>"
 
 from builtins import open as _builtin_open
+import functools
 import io
 import os
 import warnings
@@ -38,7 +39,8 @@ class BZ2File(_compression.BaseStream):
     returned as bytes, and data to be written should be given as bytes.
     """
 
-    def __init__(self, filename, mode="r", buffering=_sentinel, compresslevel=9):
+    def __init__(self, filename, mode="r", buffering=_sentinel, compresslevel=9,
+                 *, threads=1):
         """Open a bzip2-compressed file.
 
         If filename is a str, bytes, or PathLike object, it gives the
@@ -57,6 +59,13 @@ class BZ2File(_compression.BaseStream):
 
         If mode is 'r', the input file may be the concatenation of
         multiple compressed streams.
+
+        threads is the number of threads used for compressing or
+        decompressing; 0 means one per CPU.  When writing with more than
+        one thread, the data is split into blocks compressed in parallel
+        as separate streams.  When reading with more than one thread,
+        the data is decompressed ahead of time in a background thread.
+        The default is 1.
         """
         # This lock must be recursive, so that BufferedIOBase's
         # writelines() does not deadlock.
@@ -73,6 +82,7 @@ class BZ2File(_compression.BaseStream):
 
         if not (1 <= compresslevel <= 9):
             raise ValueError("compresslevel must be between 1 and 9")
+        threads = _compression.thread_count(threads)
 
         if mode in ("", "r", "rb"):
             mode = "rb"
@@ -80,15 +90,15 @@ class BZ2File(_compression.BaseStream):
         elif mode in ("w", "wb"):
             mode = "wb"
             mode_code = _MODE_WRITE
-            self._compressor = BZ2Compressor(compresslevel)
+            self._compressor = _new_compressor(compresslevel, threads)
         elif mode in ("x", "xb"):
             mode = "xb"
             mode_code = _MODE_WRITE
-            self._compressor = BZ2Compressor(compresslevel)
+            self._compressor = _new_compressor(compresslevel, threads)
         elif mode in ("a", "ab"):
             mode = "ab"
             mode_code = _MODE_WRITE
-            self._compressor = BZ2Compressor(compresslevel)
+            self._compressor = _new_compressor(compresslevel, threads)
         else:
             raise ValueError("Invalid mode: %r" % (mode,))
 
@@ -105,6 +115,8 @@ class BZ2File(_compression.BaseStream):
         if self._mode == _MODE_READ:
             raw = _compression.DecompressReader(self._fp,
                 BZ2Decompressor, trailing_error=OSError)
+            if threads > 1:
+                raw = _compression.ReadAheadReader(raw, 2 * threads)
             self._buffer = io.BufferedReader(raw)
         else:
             self._pos = 0
@@ -287,7 +299,7 @@ class BZ2File(_compression.BaseStream):
 
 
 def open(filename, mode="rb", compresslevel=9,
-         encoding=None, errors=None, newline=None):
+         encoding=None, errors=None, newline=None, *, threads=1):
     """Open a bzip2-compressed file in binary or text mode.
 
     The filename argument can be an actual filename (a str, bytes, or
@@ -299,8 +311,9 @@ def open(filename, mode="rb", compresslevel=9,
     The default mode is "rb", and the default compresslevel is 9.
 
     For binary mode, this function is equivalent to the BZ2File
-    constructor: BZ2File(filename, mode, compresslevel). In this case,
-    the encoding, errors and newline arguments must not be provided.
+    constructor: BZ2File(filename, mode, compresslevel, threads=threads).
+    In this case, the encoding, errors and newline arguments must not be
+    provided.
 
     For text mode, a BZ2File object is created, and wrapped in an
     io.TextIOWrapper instance with the specified encoding, error
@@ -319,7 +332,8 @@ def open(filename, mode="rb", compresslevel=9,
             raise ValueError("Argument 'newline' not supported in binary mode")
 
     bz_mode = mode.replace("t", "")
-    binary_file = BZ2File(filename, bz_mode, compresslevel=compresslevel)
+    binary_file = BZ2File(filename, bz_mode, compresslevel=compresslevel,
+                          threads=threads)
 
     if "t" in mode:
         return io.TextIOWrapper(binary_file, encoding, errors, newline)
@@ -327,6 +341,23 @@ def open(filename, mode="rb", compresslevel=9,
         return binary_file
 
 
+def _new_compressor(compresslevel, threads):
+    if threads == 1:
+        return BZ2Compressor(compresslevel)
+    # Blocks of the size of the bzip2 blocks for that level.
+    return _compression.ParallelCompressor(
+        functools.partial(_compress_block, compresslevel),
+        threads, compresslevel * 100 * 1000)
+
+
+def _compress_block(compresslevel, data, history, last):
+    # Compress a block for ParallelCompressor as a complete stream.  The
+    # decompressor reads the concatenated streams as a single file.
+    if not data and history is not None:
+        return b""
+    return compress(data, compresslevel)
+
+
 def compress(data, compresslevel=9):
     """Compress a block of data.
 
@@ -8,6 +8,8 @@ list, set, and tuple.
 * Counter      dict subclass for counting hashable objects
 * OrderedDict  dict subclass that remembers the order entries were added
 * defaultdict  dict subclass that calls a factory function to supply missing values
+* SortedList   sequence that keeps its items sorted
+* SortedDict   dict subclass that iterates over its keys in sorted order
 * UserDict     wrapper around dictionary objects for easier dict subclassing
 * UserList     wrapper around list objects for easier list subclassing
 * UserString   wrapper around string objects for easier string subclassing
@@ -15,10 +17,12 @@ list, set, and tuple.
 '''
 
 __all__ = ['deque', 'defaultdict', 'namedtuple', 'UserDict', 'UserList',
-            'UserString', 'Counter', 'OrderedDict', 'ChainMap']
+            'UserString', 'Counter', 'OrderedDict', 'ChainMap',
+            'SortedList', 'SortedDict']
 
 import _collections_abc
 from operator import itemgetter as _itemgetter, eq as _eq
+from bisect import bisect_left as _bisect_left, bisect_right as _bisect_right
 from keyword import iskeyword as _iskeyword
 import sys as _sys
 import heapq as _heapq
@@ -992,6 +996,551 @@ class ChainMap(_collections_abc.MutableMapping):
         self.maps[0].clear()
 
 
+################################################################################
+### SortedList and SortedDict
+################################################################################
+
+class SortedList(_collections_abc.Sequence):
+    '''List that keeps its items sorted, optionally by a key function.
+
+    The items are stored in a list of sublists of bounded size, so that
+    items are located by bisection and added or removed in O(log n) time.
+    Items comparing equal are kept in the order they were added.
+
+    >>> s = SortedList([5, 1, 4])
+    >>> s.add(3)
+    >>> s
+    SortedList([1, 3, 4, 5])
+    >>> s.bisect_left(4), s[-1]
+    (2, 5)
+    >>> list(s.irange(2, 4))
+    [3, 4]
+
+    '''
+
+    _load = 1000                # sublists are split above twice this size
+
+    def __init__(self, iterable=(), key=None):
+        '''Create a sorted list of the items of *iterable*, compared by
+        *key(item)* if a key function is given.
+
+        '''
+        self._key = key
+        self._reset([])
+        self.update(iterable)
+
+    def _reset(self, values):
+        # Rebuild from a sorted list of values.
+        load = self._load
+        self._lists = lists = [values[i:i+load]
+                               for i in range(0, len(values), load)]
+        if self._key is None:
+            self._keys = lists
+        else:
+            self._keys = [list(map(self._key, sub)) for sub in lists]
+        self._maxes = [sub[-1] for sub in self._keys]
+        self._len = len(values)
+        self._tree = None       # Fenwick tree of the sublist lengths
+
+    @property
+    def key(self):
+        'The key function, or None if the items are compared directly.'
+        return self._key
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return _chain.from_iterable(self._lists)
+
+    def __reversed__(self):
+        return _chain.from_iterable(map(reversed, reversed(self._lists)))
+
+    def __contains__(self, value):
+        return self._find(value) is not None
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step == 1:
+                return list(self._islice(start, stop))
+            return list(self)[index]
+        i, j = self._loc(index)
+        return self._lists[i][j]
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            values = list(self)
+            del values[index]
+            self._reset(values)
+        else:
+            self._delete(*self._loc(index))
+
+    def __eq__(self, other):
+        if not isinstance(other, _collections_abc.Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(map(_eq, self, other))
+
+    __hash__ = None
+
+    @_recursive_repr()
+    def __repr__(self):
+        if self._key is None:
+            return f'{self.__class__.__name__}({list(self)!r})'
+        return f'{self.__class__.__name__}({list(self)!r}, key={self._key!r})'
+
+    def __reduce__(self):
+        return self.__class__, (list(self), self._key)
+
+    def copy(self):
+        'Return a shallow copy of the sorted list.'
+        return self.__class__(self, self._key)
+
+    __copy__ = copy
+
+    def clear(self):
+        'Remove all items.'
+        self._reset([])
+
+    def add(self, value):
+        'Add *value*, after any items comparing equal to it.'
+        key = value if self._key is None else self._key(value)
+        lists = self._lists
+        maxes = self._maxes
+        if not maxes:
+            self._reset([value])
+            return
+        i = _bisect_right(maxes, key)
+        if i == len(maxes):
+            i -= 1
+            lists[i].append(value)
+            if self._key is not None:
+                self._keys[i].append(key)
+            maxes[i] = key
+        else:
+            keys = self._keys[i]
+            j = _bisect_right(keys, key)
+            lists[i].insert(j, value)
+            if self._key is not None:
+                keys.insert(j, key)
+        self._len += 1
+        if len(lists[i]) > 2 * self._load:
+            self._split(i)
+        elif self._tree is not None:
+            self._tree_add(i, 1)
+
+    def update(self, iterable):
+        'Add the items of *iterable*.'
+        values = list(iterable)
+        if not values:
+            return
+        if len(values) * 4 >= self._len:
+            # Sorting everything at once is faster than adding the new
+            # items one at a time.
+            values[:0] = self
+            values.sort(key=self._key)
+            self._reset(values)
+        else:
+            for value in values:
+                self.add(value)
+
+    def remove(self, value):
+        'Remove the first occurrence of *value*.  Raise ValueError if absent.'
+        pos = self._find(value)
+        if pos is None:
+            raise ValueError(f'{value!r} not in list')
+        self._delete(*pos)
+
+    def discard(self, value):
+        'Remove the first occurrence of *value* if it is present.'
+        pos = self._find(value)
+        if pos is not None:
+            self._delete(*pos)
+
+    def pop(self, index=-1):
+        'Remove and return the item at *index* (default last).'
+        if not self._len:
+            raise IndexError('pop from empty list')
+        i, j = self._loc(index)
+        value = self._lists[i][j]
+        self._delete(i, j)
+        return value
+
+    def bisect_left(self, value):
+        'Return the number of items less than *value*.'
+        return self._bisect_key_left(
+            value if self._key is None else self._key(value))
+
+    def bisect_right(self, value):
+        'Return the number of items less than or equal to *value*.'
+        return self._bisect_key_right(
+            value if self._key is None else self._key(value))
+
+    def index(self, value, start=0, stop=None):
+        '''Return the position of the first occurrence of *value*.
+        Raise ValueError if absent.
+
+        '''
+        key = value if self._key is None else self._key(value)
+        lo, hi = self._bisect_key_left(key), self._bisect_key_right(key)
+        start, stop, _ = slice(start, stop).indices(self._len)
+        lo, hi = max(lo, start), min(hi, stop)
+        if self._key is None:
+            if lo < hi:
+                return lo
+        else:
+            for index, item in enumerate(self._islice(lo, hi), lo):
+                if item == value:
+                    return index
+        raise ValueError(f'{value!r} is not in list')
+
+    def count(self, value):
+        'Return the number of occurrences of *value*.'
+        key = value if self._key is None else self._key(value)
+        lo, hi = self._bisect_key_left(key), self._bisect_key_right(key)
+        if self._key is None:
+            return hi - lo
+        return sum(item == value for item in self._islice(lo, hi))
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True),
+               reverse=False):
+        '''Return an iterator over the items between *minimum* and
+        *maximum*.
+
+        A bound of None leaves that end of the range open.  *inclusive* is
+        a pair of booleans telling whether items equal to the minimum and
+        to the maximum are included.  If *reverse* is true, the items are
+        generated from the largest to the smallest.
+
+        '''
+        keyfunc = self._key
+        if minimum is None:
+            lo = 0
+        else:
+            key = minimum if keyfunc is None else keyfunc(minimum)
+            if inclusive[0]:
+                lo = self._bisect_key_left(key)
+            else:
+                lo = self._bisect_key_right(key)
+        if maximum is None:
+            hi = self._len
+        else:
+            key = maximum if keyfunc is None else keyfunc(maximum)
+            if inclusive[1]:
+                hi = self._bisect_key_right(key)
+            else:
+                hi = self._bisect_key_left(key)
+        return self._islice(lo, hi, reverse)
+
+    def _bisect_key_left(self, key):
+        maxes = self._maxes
+        i = _bisect_left(maxes, key)
+        if i == len(maxes):
+            return self._len
+        return self._pos(i, _bisect_left(self._keys[i], key))
+
+    def _bisect_key_right(self, key):
+        maxes = self._maxes
+        i = _bisect_right(maxes, key)
+        if i == len(maxes):
+            return self._len
+        return self._pos(i, _bisect_right(self._keys[i], key))
+
+    def _find(self, value):
+        # Return the location (i, j) of the first item equal to value, or
+        # None.  With a key function, the items with an equal key are
+        # searched for one equal to the value.
+        key = value if self._key is None else self._key(value)
+        maxes = self._maxes
+        i = _bisect_left(maxes, key)
+        if i == len(maxes):
+            return None
+        keys = self._keys
+        j = _bisect_left(keys[i], key)
+        if self._key is None:
+            return (i, j) if keys[i][j] == value else None
+        lists = self._lists
+        while i < len(lists):
+            sub, subkeys = lists[i], keys[i]
+            while j < len(sub):
+                if key < subkeys[j]:
+                    return None
+                if sub[j] == value:
+                    return i, j
+                j += 1
+            i += 1
+            j = 0
+        return None
+
+    def _delete(self, i, j):
+        # Remove the item at location (i, j), merging small sublists.
+        lists = self._lists
+        del lists[i][j]
+        if self._key is not None:
+            del self._keys[i][j]
+        self._len -= 1
+        if len(lists[i]) > self._load // 2 or len(lists) == 1:
+            if lists[i]:
+                self._maxes[i] = self._keys[i][-1]
+                if self._tree is not None:
+                    self._tree_add(i, -1)
+            else:
+                self._reset([])
+            return
+        if not i:
+            i = 1
+        keys = self._keys
+        lists[i-1].extend(lists[i])
+        del lists[i]
+        if self._key is not None:
+            keys[i-1].extend(keys[i])
+            del keys[i]
+        del self._maxes[i]
+        self._maxes[i-1] = keys[i-1][-1]
+        self._tree = None
+        if len(lists[i-1]) > 2 * self._load:
+            self._split(i-1)
+
+    def _split(self, i):
+        lists = self._lists
+        load = self._load
+        lists.insert(i+1, lists[i][load:])
+        del lists[i][load:]
+        keys = self._keys
+        if self._key is not None:
+            keys.insert(i+1, keys[i][load:])
+            del keys[i][load:]
+        self._maxes[i] = keys[i][-1]
+        self._maxes.insert(i+1, keys[i+1][-1])
+        self._tree = None
+
+    def _build_tree(self):
+        tree = [0]
+        tree += map(len, self._lists)
+        size = len(tree)
+        for i in range(1, size):
+            parent = i + (i & -i)
+            if parent < size:
+                tree[parent] += tree[i]
+        self._tree = tree
+        return tree
+
+    def _tree_add(self, i, delta):
+        tree = self._tree
+        size = len(tree)
+        i += 1
+        while i < size:
+            tree[i] += delta
+            i += i & -i
+
+    def _pos(self, i, j):
+        # Convert the location (i, j) to an index.
+        if not i:
+            return j
+        tree = self._tree
+        if tree is None:
+            tree = self._build_tree()
+        while i:
+            j += tree[i]
+            i -= i & -i
+        return j
+
+    def _loc(self, index):
+        # Convert an index to a location (i, j).
+        size = self._len
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError('SortedList index out of range')
+        lists = self._lists
+        if index < len(lists[0]):
+            return 0, index
+        last = size - len(lists[-1])
+        if index >= last:
+            return len(lists) - 1, index - last
+        tree = self._tree
+        if tree is None:
+            tree = self._build_tree()
+        i = 0
+        bit = 1 << (len(tree) - 1).bit_length()
+        while bit:
+            k = i + bit
+            if k < len(tree) and tree[k] <= index:
+                i = k
+                index -= tree[k]
+            bit >>= 1
+        return i, index
+
+    def _islice(self, start, stop, reverse=False):
+        # Return an iterator over the items from index start to stop.
+        if start >= stop:
+            return iter(())
+        i, j = self._loc(start)
+        k, l = self._loc(stop - 1)
+        lists = self._lists
+        if i == k:
+            parts = [lists[i][j:l+1]]
+        else:
+            parts = [lists[i][j:]]
+            parts += lists[i+1:k]
+            parts.append(lists[k][:l+1])
+        if reverse:
+            return _chain.from_iterable(map(reversed, reversed(parts)))
+        return _chain.from_iterable(parts)
+
+
+class SortedDict(dict):
+    '''Dictionary that iterates over its keys in sorted order.
+
+    The keys are kept in a SortedList, so that they can also be accessed
+    by position and by range.
+
+    >>> d = SortedDict(b=2, c=3, a=1)
+    >>> list(d)
+    ['a', 'b', 'c']
+    >>> d.peekitem(0), d.index('c')
+    (('a', 1), 2)
+
+    '''
+
+    __marker = object()
+
+    def __init__(*args, key=None, **kwds):
+        '''Initialize a sorted dictionary like a dict.  The keys are
+        compared by *key(k)* if a key function is given.
+
+        '''
+        if not args:
+            raise TypeError("descriptor '__init__' of 'SortedDict' object "
+                            "needs an argument")
+        self, *args = args
+        if len(args) > 1:
+            raise TypeError(f'expected at most 1 arguments, got {len(args)}')
+        dict.clear(self)
+        self._list = SortedList(key=key)
+        self.update(*args, **kwds)
+
+    def __setitem__(self, key, value, dict_setitem=dict.__setitem__):
+        if key not in self:
+            self._list.add(key)
+        dict_setitem(self, key, value)
+
+    def __delitem__(self, key, dict_delitem=dict.__delitem__):
+        dict_delitem(self, key)
+        self._list.remove(key)
+
+    def __iter__(self):
+        return iter(self._list)
+
+    def __reversed__(self):
+        return reversed(self._list)
+
+    @_recursive_repr()
+    def __repr__(self):
+        if not self:
+            return f'{self.__class__.__name__}()'
+        return f'{self.__class__.__name__}({dict(self.items())!r})'
+
+    def __reduce__(self):
+        return (_make_sorted_dict, (self.__class__, self._list.key), None,
+                None, iter(self.items()))
+
+    def update(*args, **kwds):
+        'Update the dictionary like dict.update().'
+        if not args:
+            raise TypeError("descriptor 'update' of 'SortedDict' object "
+                            "needs an argument")
+        self, *args = args
+        if len(args) > 1:
+            raise TypeError(f'update expected at most 1 arguments, '
+                            f'got {len(args)}')
+        items = dict(*args, **kwds)
+        new = [key for key in items if key not in self]
+        self._list.update(new)
+        dict.update(self, items)
+
+    def setdefault(self, key, default=None):
+        'Insert key with a value of default if key is not in the dictionary.'
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+    def pop(self, key, default=__marker):
+        '''Remove *key* and return its value.  If *key* is not found,
+        *default* is returned if given, otherwise KeyError is raised.
+
+        '''
+        if key in self:
+            self._list.remove(key)
+            return dict.pop(self, key)
+        if default is self.__marker:
+            raise KeyError(key)
+        return default
+
+    def popitem(self, index=-1):
+        '''Remove and return the (key, value) pair at position *index*
+        (default last, the largest key).
+
+        '''
+        if not self:
+            raise KeyError('dictionary is empty')
+        key = self._list.pop(index)
+        return key, dict.pop(self, key)
+
+    def peekitem(self, index=-1):
+        'Return the (key, value) pair at position *index* (default last).'
+        key = self._list[index]
+        return key, self[key]
+
+    def clear(self):
+        'Remove all items.'
+        dict.clear(self)
+        self._list.clear()
+
+    def copy(self):
+        'Return a shallow copy of the dictionary.'
+        return self.__class__(self, key=self._list.key)
+
+    __copy__ = copy
+
+    def keys(self):
+        "D.keys() -> a set-like object providing a view on D's sorted keys"
+        return _collections_abc.KeysView(self)
+
+    def items(self):
+        "D.items() -> a set-like object providing a view on D's sorted items"
+        return _collections_abc.ItemsView(self)
+
+    def values(self):
+        "D.values() -> an object providing a view on D's values in key order"
+        return _collections_abc.ValuesView(self)
+
+    def index(self, key):
+        'Return the position of *key*.  Raise ValueError if absent.'
+        return self._list.index(key)
+
+    def bisect_left(self, key):
+        'Return the number of keys less than *key*.'
+        return self._list.bisect_left(key)
+
+    def bisect_right(self, key):
+        'Return the number of keys less than or equal to *key*.'
+        return self._list.bisect_right(key)
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True),
+               reverse=False):
+        '''Return an iterator over the keys between *minimum* and *maximum*.
+        See SortedList.irange().
+
+        '''
+        return self._list.irange(minimum, maximum, inclusive, reverse)
+
+def _make_sorted_dict(cls, key):
+    # Helper for SortedDict.__reduce__(), the key function is keyword-only.
+    return cls(key=key)
+
+
 ################################################################################
 ### UserDict
 ################################################################################
@@ -12,13 +12,14 @@ See module py_compile for details of the actual byte-compilation.
 """
 import os
 import sys
+import importlib._bootstrap_external
 import importlib.util
 import py_compile
 import struct
 
 from functools import partial
 
-__all__ = ["compile_dir","compile_file","compile_path"]
+__all__ = ["compile_dir","compile_file","compile_path","compile_code_cache"]
 
 def _walk_dir(dir, ddir=None, maxlevels=10, quiet=0):
     if quiet < 2 and isinstance(dir, os.PathLike):
@@ -217,6 +218,67 @@ def compile_path(skip_curdir=1, maxlevels=0, force=False, quiet=0,
             )
     return success
 
+def compile_code_cache(dir, maxlevels=10, rx=None, quiet=0, optimize=-1):
+    """Byte-compile all modules in the given directory tree into a code cache.
+
+    The code cache is a single file in the __pycache__ directory of dir.
+    It holds the code of all the modules found under dir and is used by
+    the import system instead of their pyc files if Python is run with
+    -X codecache or PYTHONCODECACHE set.
+
+    Arguments (only dir is required):
+
+    dir:       the directory to byte-compile, usually an entry of sys.path
+    maxlevels: maximum recursion level (default 10)
+    rx:        as for compile_dir() (default None)
+    quiet:     as for compile_dir() (default 0)
+    optimize:  as for compile_dir() (default -1)
+    """
+    if quiet < 2 and isinstance(dir, os.PathLike):
+        dir = os.fspath(dir)
+    if optimize >= 0:
+        opt = optimize if optimize >= 1 else ''
+    else:
+        opt = None
+    entries = {}
+    success = True
+    for fullname in _walk_dir(dir, maxlevels=maxlevels, quiet=quiet):
+        if not fullname.endswith('.py'):
+            continue
+        if rx is not None and rx.search(fullname):
+            continue
+        if not quiet:
+            print('Compiling {!r}...'.format(fullname))
+        try:
+            with open(fullname, 'rb') as f:
+                st = os.fstat(f.fileno())
+                source = f.read()
+            code = compile(source, fullname, 'exec', dont_inherit=True,
+                           optimize=optimize)
+        except (SyntaxError, ValueError, UnicodeError, OSError) as e:
+            success = False
+            if quiet >= 2:
+                continue
+            elif quiet:
+                print('*** Error compiling {!r}...'.format(fullname))
+            else:
+                print('*** ', end='')
+            print(e.__class__.__name__ + ':', e)
+            continue
+        name = os.path.relpath(fullname, dir).replace(os.sep, '/')
+        entries[name] = (int(st.st_mtime), st.st_size, code)
+    cfile = importlib._bootstrap_external._code_cache_path(dir,
+                                                           optimization=opt)
+    data = importlib._bootstrap_external._code_to_code_cache(entries)
+    try:
+        os.makedirs(os.path.dirname(cfile), exist_ok=True)
+        importlib._bootstrap_external._write_atomic(cfile, data)
+    except OSError as e:
+        if quiet < 2:
+            print('*** Error writing {!r}:'.format(cfile), e)
+        return False
+    return success
+
 
 def main():
     """Script main program."""
@@ -265,6 +327,11 @@ def main():
                               '"checked-hash" if the SOURCE_DATE_EPOCH '
                               'environment variable is set, and '
                               '"timestamp" otherwise.'))
+    parser.add_argument('--code-cache', action='store_true',
+                        dest='code_cache',
+                        help=('also write a code cache holding all the '
+                              'modules of each directory, used by the '
+                              'import system with -X codecache'))
 
     args = parser.parse_args()
     compile_dests = args.compile_dest
@@ -314,6 +381,10 @@ def main():
                                        args.legacy, workers=args.workers,
                                        invalidation_mode=invalidation_mode):
                         success = False
+                    if (args.code_cache and
+                            not compile_code_cache(dest, maxlevels, args.rx,
+                                                   args.quiet)):
+                        success = False
             return success
         else:
             return compile_path(legacy=args.legacy, force=args.force,
@@ -35,12 +35,17 @@ Local worker thread:
   _CallItem and put in the "Call Q". New _CallItems are put in the "Call Q"
   until "Call Q" is full. NOTE: the size of the "Call Q" is kept small because
   calls placed in the "Call Q" can no longer be cancelled with Future.cancel().
+  When many work ids are waiting, several _CallItems are sent together as a
+  single "Call Q" entry to amortize the cost of pickling and pipe transfers.
 - reads _ResultItems from "Result Q", updates the future stored in the
   "Work Items" dict and deletes the dict entry
 
 Process #1..n:
 - reads _CallItems from "Call Q", executes the calls, and puts the resulting
-  _ResultItems in "Result Q"
+  _ResultItems in "Result Q" (a batch of calls is answered with a single list
+  of _ResultItems)
+- if max_tasks_per_child is set, exits after that many calls; the local worker
+  thread then joins the process and starts a replacement
 """
 
 __author__ = 'Brian Quinlan (brian@sweetapp.com)'
@@ -53,6 +58,7 @@ from queue import Full
 import multiprocessing as mp
 from multiprocessing.connection import wait
 from multiprocessing.queues import Queue
+from multiprocessing.reduction import ForkingPickler
 import threading
 import weakref
 from functools import partial
@@ -108,6 +114,15 @@ def _python_exit():
 # (Futures in the call queue cannot be cancelled).
 EXTRA_QUEUED_CALLS = 1
 
+# Controls how many calls can be sent to a worker process as a single entry of
+# the call queue.  Batches are only formed when the backlog of submitted work
+# is large enough to fill every slot of the call queue with a full batch, so
+# that a lightly loaded executor still dispatches calls one by one.  Batching
+# amortizes the per-item pickling and pipe round trip costs for many small
+# tasks, but the futures of a batch cannot be cancelled once it is queued, and
+# the results of a batch are only reported once the whole batch has run.
+MAX_CALL_BATCH_SIZE = 32
+
 
 # Hack to embed stringification of remote traceback in local traceback
 
@@ -138,10 +153,11 @@ class _WorkItem(object):
         self.kwargs = kwargs
 
 class _ResultItem(object):
-    def __init__(self, work_id, exception=None, result=None):
+    def __init__(self, work_id, exception=None, result=None, exit_pid=None):
         self.work_id = work_id
         self.exception = exception
         self.result = result
+        self.exit_pid = exit_pid
 
 class _CallItem(object):
     def __init__(self, work_id, fn, args, kwargs):
@@ -150,6 +166,35 @@ class _CallItem(object):
         self.args = args
         self.kwargs = kwargs
 
+class _CallItemBatch(object):
+    """Several _CallItems sent to a worker as a single call queue entry.
+
+    The batch is pickled by the feeder thread of the call queue.  If some of
+    its items cannot be pickled, they are reported to *on_error* and the rest
+    of the batch is still sent, so that an unpicklable call only fails its own
+    future.  A batch is unpickled as a plain list of _CallItems.
+    """
+    def __init__(self, call_items, on_error):
+        self.call_items = call_items
+        self.on_error = on_error
+
+    def __reduce__(self):
+        try:
+            data = ForkingPickler.dumps(self.call_items)
+        except Exception:
+            data = None
+        if data is None:
+            call_items = []
+            for call_item in self.call_items:
+                try:
+                    ForkingPickler.dumps(call_item)
+                except Exception as e:
+                    self.on_error(e, call_item)
+                else:
+                    call_items.append(call_item)
+            data = ForkingPickler.dumps(call_items)
+        return ForkingPickler.loads, (bytes(data),)
+
 
 class _SafeQueue(Queue):
     """Safe Queue set exception to the future object linked to a job"""
@@ -158,14 +203,20 @@ class _SafeQueue(Queue):
         super().__init__(max_size, ctx=ctx)
 
     def _on_queue_feeder_error(self, e, obj):
-        if isinstance(obj, _CallItem):
+        if isinstance(obj, (_CallItem, _CallItemBatch)):
             tb = traceback.format_exception(type(e), e, e.__traceback__)
             e.__cause__ = _RemoteTraceback('\n"""\n{}"""'.format(''.join(tb)))
-            work_item = self.pending_work_items.pop(obj.work_id, None)
-            # work_item can be None if another process terminated. In this case,
-            # the queue_manager_thread fails all work_items with BrokenProcessPool
-            if work_item is not None:
-                work_item.future.set_exception(e)
+            if isinstance(obj, _CallItem):
+                call_items = [obj]
+            else:
+                call_items = obj.call_items
+            for call_item in call_items:
+                work_item = self.pending_work_items.pop(call_item.work_id, None)
+                # work_item can be None if another process terminated. In this
+                # case, the queue_manager_thread fails all work_items with
+                # BrokenProcessPool
+                if work_item is not None:
+                    work_item.future.set_exception(e)
         else:
             super()._on_queue_feeder_error(e, obj)
 
@@ -191,28 +242,57 @@ def _process_chunk(fn, chunk):
     return [fn(*args) for args in chunk]
 
 
-def _sendback_result(result_queue, work_id, result=None, exception=None):
+def _sendback_result(result_queue, work_id, result=None, exception=None,
+                     exit_pid=None):
     """Safely send back the given result or exception"""
     try:
         result_queue.put(_ResultItem(work_id, result=result,
-                                     exception=exception))
+                                     exception=exception, exit_pid=exit_pid))
     except BaseException as e:
         exc = _ExceptionWithTraceback(e, e.__traceback__)
-        result_queue.put(_ResultItem(work_id, exception=exc))
+        result_queue.put(_ResultItem(work_id, exception=exc,
+                                     exit_pid=exit_pid))
 
 
-def _process_worker(call_queue, result_queue, initializer, initargs):
+def _sendback_results(result_queue, result_items):
+    """Safely send back the results of a batch of calls"""
+    try:
+        result_queue.put(result_items)
+    except BaseException:
+        # Some result could not be pickled: send them one by one so that
+        # only the faulty ones are reported as failed.
+        for result_item in result_items:
+            _sendback_result(result_queue, result_item.work_id,
+                             result=result_item.result,
+                             exception=result_item.exception)
+
+
+def _run_call_item(call_item):
+    """Runs the given call and returns a _ResultItem for it"""
+    try:
+        r = call_item.fn(*call_item.args, **call_item.kwargs)
+    except BaseException as e:
+        exc = _ExceptionWithTraceback(e, e.__traceback__)
+        return _ResultItem(call_item.work_id, exception=exc)
+    else:
+        return _ResultItem(call_item.work_id, result=r)
+
+
+def _process_worker(call_queue, result_queue, initializer, initargs,
+                    max_tasks=None):
     """Evaluates calls from call_queue and places the results in result_queue.
 
     This worker is run in a separate process.
 
     Args:
-        call_queue: A ctx.Queue of _CallItems that will be read and
-            evaluated by the worker.
-        result_queue: A ctx.Queue of _ResultItems that will written
-            to by the worker.
+        call_queue: A ctx.Queue of _CallItems (or lists of _CallItems) that
+            will be read and evaluated by the worker.
+        result_queue: A ctx.Queue of _ResultItems (or lists of _ResultItems)
+            that will written to by the worker.
         initializer: A callable initializer, or None
         initargs: A tuple of args for the initializer
+        max_tasks: The maximum number of calls evaluated before the worker
+            exits, or None for no limit
     """
     if initializer is not None:
         try:
@@ -222,28 +302,42 @@ def _process_worker(call_queue, result_queue, initializer, initargs):
             # The parent will notice that the process stopped and
             # mark the pool broken
             return
+    num_tasks = 0
+    exit_pid = None
     while True:
         call_item = call_queue.get(block=True)
         if call_item is None:
             # Wake up queue management thread
             result_queue.put(os.getpid())
             return
-        try:
-            r = call_item.fn(*call_item.args, **call_item.kwargs)
-        except BaseException as e:
-            exc = _ExceptionWithTraceback(e, e.__traceback__)
-            _sendback_result(result_queue, call_item.work_id, exception=exc)
+
+        if isinstance(call_item, list):
+            _sendback_results(result_queue,
+                              [_run_call_item(c) for c in call_item])
         else:
-            _sendback_result(result_queue, call_item.work_id, result=r)
+            if max_tasks is not None:
+                num_tasks += 1
+                if num_tasks >= max_tasks:
+                    exit_pid = os.getpid()
+            result_item = _run_call_item(call_item)
+            _sendback_result(result_queue, result_item.work_id,
+                             result=result_item.result,
+                             exception=result_item.exception,
+                             exit_pid=exit_pid)
+            del result_item
 
         # Liberate the resource as soon as possible, to avoid holding onto
         # open files or shared memory that is not needed anymore
         del call_item
 
+        if exit_pid is not None:
+            return
+
 
 def _add_call_item_to_queue(pending_work_items,
                             work_ids,
-                            call_queue):
+                            call_queue,
+                            max_batch_size=1):
     """Fills call_queue with _WorkItems from pending_work_items.
 
     This function never blocks.
@@ -257,26 +351,40 @@ def _add_call_item_to_queue(pending_work_items,
             call_queue.
         call_queue: A multiprocessing.Queue that will be filled with _CallItems
             derived from _WorkItems.
+        max_batch_size: The maximum number of _CallItems put in call_queue as
+            a single _CallItemBatch.
     """
     while True:
         if call_queue.full():
             return
-        try:
-            work_id = work_ids.get(block=False)
-        except queue.Empty:
-            return
-        else:
+        # Split the backlog evenly between the slots of the call queue.
+        batch_size = min(max_batch_size,
+                         max(1, work_ids.qsize() // call_queue._maxsize))
+        call_items = []
+        exhausted = False
+        while len(call_items) < batch_size:
+            try:
+                work_id = work_ids.get(block=False)
+            except queue.Empty:
+                exhausted = True
+                break
             work_item = pending_work_items[work_id]
 
             if work_item.future.set_running_or_notify_cancel():
-                call_queue.put(_CallItem(work_id,
-                                         work_item.fn,
-                                         work_item.args,
-                                         work_item.kwargs),
-                               block=True)
+                call_items.append(_CallItem(work_id,
+                                            work_item.fn,
+                                            work_item.args,
+                                            work_item.kwargs))
             else:
                 del pending_work_items[work_id]
-                continue
+        if len(call_items) == 1:
+            call_queue.put(call_items[0], block=True)
+        elif call_items:
+            call_queue.put(_CallItemBatch(call_items,
+                                          call_queue._on_queue_feeder_error),
+                           block=True)
+        if exhausted:
+            return
 
 
 def _queue_management_worker(executor_reference,
@@ -285,7 +393,9 @@ def _queue_management_worker(executor_reference,
                              work_ids_queue,
                              call_queue,
                              result_queue,
-                             thread_wakeup):
+                             thread_wakeup,
+                             spawn_process=None,
+                             max_batch_size=1):
     """Manages the communication between this process and the worker processes.
 
     This function is run in a local thread.
@@ -306,6 +416,11 @@ def _queue_management_worker(executor_reference,
         thread_wakeup: A _ThreadWakeup to allow waking up the
             queue_manager_thread from the main Thread and avoid deadlocks
             caused by permanently locked queues.
+        spawn_process: A callable starting a new worker process and adding
+            it to processes, used to replace the workers which exited after
+            reaching max_tasks_per_child.
+        max_batch_size: The maximum number of calls sent to a worker process
+            as a single call queue entry.
     """
     executor = None
 
@@ -343,7 +458,8 @@ def _queue_management_worker(executor_reference,
     while True:
         _add_call_item_to_queue(pending_work_items,
                                 work_ids_queue,
-                                call_queue)
+                                call_queue,
+                                max_batch_size)
 
         # Wait for a result to be ready in the result_queue while checking
         # that all worker processes are still running, or for a wake up
@@ -403,17 +519,39 @@ def _queue_management_worker(executor_reference,
                 shutdown_worker()
                 return
         elif result_item is not None:
-            work_item = pending_work_items.pop(result_item.work_id, None)
-            # work_item can be None if another process terminated (see above)
-            if work_item is not None:
-                if result_item.exception:
-                    work_item.future.set_exception(result_item.exception)
-                else:
-                    work_item.future.set_result(result_item.result)
-                # Delete references to object. See issue16284
-                del work_item
-            # Delete reference to result_item
+            if isinstance(result_item, list):
+                result_items = result_item
+            else:
+                result_items = [result_item]
             del result_item
+            # Pop the items so that no reference to a result is kept once its
+            # future is done.
+            result_items.reverse()
+            while result_items:
+                result_item = result_items.pop()
+                work_item = pending_work_items.pop(result_item.work_id, None)
+                # work_item can be None if another process terminated (see
+                # above)
+                if work_item is not None:
+                    if result_item.exception:
+                        work_item.future.set_exception(result_item.exception)
+                    else:
+                        work_item.future.set_result(result_item.result)
+                    # Delete references to object. See issue16284
+                    del work_item
+                if result_item.exit_pid is not None:
+                    # The worker reached max_tasks_per_child and exited:
+                    # reap it and start a replacement if there is still
+                    # work to do.
+                    p = processes.pop(result_item.exit_pid)
+                    p.join()
+                    del p
+                    executor = executor_reference()
+                    if not shutting_down() or pending_work_items:
+                        spawn_process()
+                    executor = None
+                # Delete reference to result_item
+                del result_item
 
         # Check whether we should start shutting down.
         executor = executor_reference()
@@ -486,9 +624,16 @@ class BrokenProcessPool(_base.BrokenExecutor):
     """
 
 
+def _spawn_process(mp_context, processes, args):
+    """Starts a new worker process and registers it in processes"""
+    p = mp_context.Process(target=_process_worker, args=args)
+    p.start()
+    processes[p.pid] = p
+
+
 class ProcessPoolExecutor(_base.Executor):
     def __init__(self, max_workers=None, mp_context=None,
-                 initializer=None, initargs=()):
+                 initializer=None, initargs=(), *, max_tasks_per_child=None):
         """Initializes a new ProcessPoolExecutor instance.
 
         Args:
@@ -499,6 +644,12 @@ class ProcessPoolExecutor(_base.Executor):
                 object should provide SimpleQueue, Queue and Process.
             initializer: An callable used to initialize worker processes.
             initargs: A tuple of arguments to pass to the initializer.
+            max_tasks_per_child: The maximum number of tasks a worker process
+                can complete before it will exit and be replaced with a fresh
+                worker process. The default of None means worker processes
+                will live as long as the executor. Requires a non-'fork'
+                mp_context start method; the 'spawn' start method is used
+                when mp_context is None.
         """
         _check_system_limits()
 
@@ -511,9 +662,25 @@ class ProcessPoolExecutor(_base.Executor):
             self._max_workers = max_workers
 
         if mp_context is None:
-            mp_context = mp.get_context()
+            if max_tasks_per_child is not None:
+                mp_context = mp.get_context("spawn")
+            else:
+                mp_context = mp.get_context()
         self._mp_context = mp_context
 
+        if max_tasks_per_child is not None:
+            if not isinstance(max_tasks_per_child, int):
+                raise TypeError("max_tasks_per_child must be an integer")
+            elif max_tasks_per_child <= 0:
+                raise ValueError("max_tasks_per_child must be >= 1")
+            if self._mp_context.get_start_method(allow_none=False) == "fork":
+                # Replacement workers would be forked from a process running
+                # the queue management thread.
+                raise ValueError("max_tasks_per_child is incompatible with"
+                                 " the 'fork' multiprocessing start method;"
+                                 " supply a different mp_context.")
+        self._max_tasks_per_child = max_tasks_per_child
+
         if initializer is not None and not callable(initializer):
             raise TypeError("initializer must be a callable")
         self._initializer = initializer
@@ -547,6 +714,14 @@ class ProcessPoolExecutor(_base.Executor):
         self._result_queue = mp_context.SimpleQueue()
         self._work_ids = queue.Queue()
 
+        # Worker processes are started by the queue management thread too
+        # (to replace those exiting after max_tasks_per_child calls), so this
+        # must not hold a reference to the executor.
+        self._spawn_process = partial(
+            _spawn_process, self._mp_context, self._processes,
+            (self._call_queue, self._result_queue, self._initializer,
+             self._initargs, self._max_tasks_per_child))
+
         # _ThreadWakeup is a communication channel used to interrupt the wait
         # of the main loop of queue_manager_thread from another thread (e.g.
         # when calling executor.submit or executor.shutdown). We do not use the
@@ -575,7 +750,12 @@ class ProcessPoolExecutor(_base.Executor):
                       self._work_ids,
                       self._call_queue,
                       self._result_queue,
-                      self._queue_management_thread_wakeup),
+                      self._queue_management_thread_wakeup,
+                      self._spawn_process,
+                      # Don't batch calls if workers must not exceed
+                      # max_tasks_per_child.
+                      MAX_CALL_BATCH_SIZE
+                      if self._max_tasks_per_child is None else 1),
                 name="QueueManagerThread")
             self._queue_management_thread.daemon = True
             self._queue_management_thread.start()
@@ -584,14 +764,7 @@ class ProcessPoolExecutor(_base.Executor):
 
     def _adjust_process_count(self):
         for _ in range(len(self._processes), self._max_workers):
-            p = self._mp_context.Process(
-                target=_process_worker,
-                args=(self._call_queue,
-                      self._result_queue,
-                      self._initializer,
-                      self._initargs))
-            p.start()
-            self._processes[p.pid] = p
+            self._spawn_process()
 
     def submit(self, fn, *args, **kwargs):
         with self._shutdown_lock:
@@ -663,6 +836,7 @@ class ProcessPoolExecutor(_base.Executor):
             self._call_queue = None
         self._result_queue = None
         self._processes = None
+        self._spawn_process = None
 
         if self._queue_management_thread_wakeup:
             self._queue_management_thread_wakeup.close()
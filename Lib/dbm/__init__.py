@@ -5,11 +5,11 @@ Use
         import dbm
         d = dbm.open(file, 'w', 0o666)
 
-The returned object is a dbm.gnu, dbm.ndbm or dbm.dumb object, dependent on the
-type of database being opened (determined by the whichdb function) in the case
-of an existing dbm. If the dbm does not exist and the create or new flag ('c'
-or 'n') was specified, the dbm type will be determined by the availability of
-the modules (tested in the above order).
+The returned object is a dbm.gnu, dbm.ndbm, dbm.log or dbm.dumb object,
+dependent on the type of database being opened (determined by the whichdb
+function) in the case of an existing dbm. If the dbm does not exist and the
+create or new flag ('c' or 'n') was specified, the dbm type will be determined
+by the availability of the modules (tested in the above order).
 
 It has the following interface (key and data are strings):
 
@@ -38,7 +38,7 @@ import sys
 class error(Exception):
     pass
 
-_names = ['dbm.gnu', 'dbm.ndbm', 'dbm.dumb']
+_names = ['dbm.gnu', 'dbm.ndbm', 'dbm.log', 'dbm.dumb']
 _defaultmod = None
 _modules = {}
 
@@ -130,6 +130,14 @@ def whichdb(filename):
         except OSError:
             pass
 
+    # Check for dbm.log next -- this has a .log file starting with a magic
+    try:
+        with io.open(filename + ".log", "rb") as f:
+            if f.read(8) == b"\x89dbmlog\n":
+                return "dbm.log"
+    except OSError:
+        pass
+
     # Check for dumbdbm next -- this has a .dir and a .dat file
     try:
         # First check for presence of files
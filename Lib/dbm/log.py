@@ -0,0 +1,461 @@
+"""A log-structured dbm clone.
+
+For database spam, spam.log contains the data: each assignment or
+deletion appends a record to it, and records are never modified once
+written.  spam.idx contains checkpoints of the index, which maps each
+key to the position of its value in the log, so that opening the
+database only has to read the records appended to the log since the
+last checkpoint.  Each checkpoint appends to spam.idx only the entries
+changed since the previous one.
+
+The space used by overwritten and deleted values is reclaimed by
+reorganize(), which rewrites the log with the current values only.
+
+Records whose checksum does not match, such as a record partially
+written when a program crashed, end the log: they and anything after
+them are discarded when the database is next opened for writing.
+"""
+
+import binascii as _binascii
+import io as _io
+import os as _os
+import struct as _struct
+import collections.abc
+
+try:
+    import mmap as _mmap
+except ImportError:
+    _mmap = None
+
+__all__ = ["error", "open"]
+
+error = OSError
+
+# Each file starts with a magic number and the generation of the log,
+# which changes when reorganize() rewrites it.
+_LOG_MAGIC = b'\x89dbmlog\n'
+_IDX_MAGIC = b'\x89dbmidx\n'
+_FILE_HEADER = _struct.Struct('<8s8s')
+
+# A log record is a header (checksum, key size, value size) followed by
+# the key and the value.  Deleting a key appends a record without value
+# and with _DELETED as value size.  The checksum covers the sizes, the
+# key and the value.
+_RECORD = _struct.Struct('<III')
+_SIZES = _struct.Struct('<II')
+_DELETED = 0xffffffff
+
+# An index checkpoint is a header (size of the log it covers, size of the
+# entries, checksum of the entries) followed by the entries.  An entry is
+# a header (key size, position and size of the value) followed by the key.
+_CHECKPOINT = _struct.Struct('<QQI')
+_ENTRY = _struct.Struct('<IQI')
+
+# Values appended to the log after it was mapped in memory are read
+# with system calls, until the unmapped part reaches this size.
+_REMAP_SIZE = 1 << 20
+
+
+def _checksum(sizes, key, val=b''):
+    return _binascii.crc32(val, _binascii.crc32(key, _binascii.crc32(sizes)))
+
+
+class _Database(collections.abc.MutableMapping):
+
+    def __init__(self, filebasename, mode, flag='c'):
+        self._mode = mode
+        self._readonly = (flag == 'r')
+        self._logfile = filebasename + '.log'
+        self._idxfile = filebasename + '.idx'
+
+        # The index is an in-memory dict, mapping keys to (pos, siz)
+        # pairs giving the position and size of their value in the log.
+        self._index = None
+        # The entries of the index changed since the last checkpoint,
+        # None for deleted keys.
+        self._changes = {}
+        # Number of entries in the index file; it is rewritten from
+        # scratch when most of them are obsolete.
+        self._idx_entries = 0
+        self._idx_stale = False
+        self._log = self._reader = self._map = None
+        self._mapped = 0
+
+        if flag == 'n':
+            for filename in (self._logfile, self._idxfile):
+                try:
+                    _os.remove(filename)
+                except OSError:
+                    pass
+        try:
+            self._reader = _io.open(self._logfile, 'rb', buffering=0)
+        except FileNotFoundError:
+            if flag not in ('c', 'n'):
+                raise
+            self._generation = _os.urandom(8)
+            self._create(self._logfile,
+                         _FILE_HEADER.pack(_LOG_MAGIC, self._generation))
+            self._reader = _io.open(self._logfile, 'rb', buffering=0)
+        try:
+            magic, self._generation = _FILE_HEADER.unpack(
+                self._reader.read(_FILE_HEADER.size))
+        except _struct.error:
+            magic = None
+        if magic != _LOG_MAGIC:
+            self._reader.close()
+            raise error('%r is not a dbm.log database' % self._logfile)
+        self._end = self._reader.seek(0, 2)
+        self._load()
+        if not self._readonly:
+            self._log = _io.open(self._logfile, 'ab')
+
+    def _create(self, filename, header):
+        with _io.open(filename, 'wb') as f:
+            self._chmod(filename)
+            f.write(header)
+
+    # Read the index file, then the records appended to the log since
+    # its last valid checkpoint.
+    def _load(self):
+        self._index = {}
+        start = self._load_index()
+        if start is None:
+            self._index = {}
+            start = _FILE_HEADER.size
+        end = self._scan(start)
+        if end < self._end:
+            # The log ends with an invalid record.
+            if not self._readonly:
+                with _io.open(self._logfile, 'rb+') as f:
+                    f.truncate(end)
+            self._end = end
+        self._remap()
+
+    def _load_index(self):
+        try:
+            with _io.open(self._idxfile, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            self._idx_stale = True
+            return None
+        try:
+            magic, generation = _FILE_HEADER.unpack_from(data)
+        except _struct.error:
+            magic = generation = None
+        if magic != _IDX_MAGIC or generation != self._generation:
+            self._idx_stale = True
+            return None
+        index = self._index
+        pos = _FILE_HEADER.size
+        start = None
+        while pos + _CHECKPOINT.size <= len(data):
+            log_end, size, checksum = _CHECKPOINT.unpack_from(data, pos)
+            pos += _CHECKPOINT.size
+            payload = data[pos:pos + size]
+            if (len(payload) != size or log_end > self._end or
+                    _binascii.crc32(payload) != checksum):
+                # Partially written checkpoint: the next checkpoints
+                # must not be appended after it.
+                self._idx_stale = True
+                break
+            pos += size
+            i = 0
+            while i < size:
+                keysiz, valpos, valsiz = _ENTRY.unpack_from(payload, i)
+                i += _ENTRY.size
+                key = payload[i:i + keysiz]
+                i += keysiz
+                if valsiz == _DELETED:
+                    index.pop(key, None)
+                else:
+                    index[key] = valpos, valsiz
+                self._idx_entries += 1
+            start = log_end
+        if pos < len(data):
+            self._idx_stale = True
+        return start
+
+    # Add the records of the log from offset pos to the index.  Return
+    # the offset of the end of the last valid record.
+    def _scan(self, pos):
+        index = self._index
+        changes = self._changes
+        with _io.open(self._logfile, 'rb') as f:
+            f.seek(pos)
+            read = f.read
+            while True:
+                header = read(_RECORD.size)
+                if len(header) < _RECORD.size:
+                    return pos
+                checksum, keysiz, valsiz = _RECORD.unpack(header)
+                key = read(keysiz)
+                deleted = valsiz == _DELETED
+                val = b'' if deleted else read(valsiz)
+                if (len(key) != keysiz or
+                        len(val) != (0 if deleted else valsiz) or
+                        _checksum(header[4:], key, val) != checksum):
+                    return pos
+                pos += _RECORD.size + keysiz
+                if deleted:
+                    index.pop(key, None)
+                    changes[key] = None
+                else:
+                    index[key] = changes[key] = pos, valsiz
+                    pos += valsiz
+
+    # Map the whole log in memory, to read values without system calls.
+    def _remap(self):
+        if _mmap is None:
+            return
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._log is not None:
+            self._log.flush()
+        self._map = _mmap.mmap(self._reader.fileno(), 0,
+                               access=_mmap.ACCESS_READ)
+        self._mapped = len(self._map)
+
+    def _read(self, pos, siz):
+        if pos + siz <= self._mapped:
+            return self._map[pos:pos + siz]
+        if self._log is not None:
+            self._log.flush()
+        if _mmap is not None and self._end - self._mapped >= _REMAP_SIZE:
+            self._remap()
+            return self._map[pos:pos + siz]
+        self._reader.seek(pos)
+        return self._reader.read(siz)
+
+    # Append a checkpoint of the changes of the index to the index file,
+    # or rewrite it if it is missing or mostly obsolete.
+    def _checkpoint(self):
+        if self._readonly or not (self._changes or self._idx_stale):
+            return
+        self._log.flush()
+        rewrite = (self._idx_stale or
+                   self._idx_entries > 2 * len(self._index) + 1024)
+        entries = self._index if rewrite else self._changes
+        pack = _ENTRY.pack
+        chunks = []
+        for key, pos_and_siz_pair in entries.items():
+            if pos_and_siz_pair is None:
+                chunks.append(pack(len(key), 0, _DELETED))
+            else:
+                chunks.append(pack(len(key), *pos_and_siz_pair))
+            chunks.append(key)
+        payload = b''.join(chunks)
+        checkpoint = _CHECKPOINT.pack(self._end, len(payload),
+                                      _binascii.crc32(payload))
+        if rewrite:
+            tmpfile = self._idxfile + '.tmp'
+            self._create(tmpfile,
+                         _FILE_HEADER.pack(_IDX_MAGIC, self._generation))
+            with _io.open(tmpfile, 'ab') as f:
+                f.write(checkpoint)
+                f.write(payload)
+            _os.replace(tmpfile, self._idxfile)
+            self._idx_entries = len(entries)
+            self._idx_stale = False
+        else:
+            with _io.open(self._idxfile, 'ab') as f:
+                f.write(checkpoint)
+                f.write(payload)
+            self._idx_entries += len(entries)
+        self._changes = {}
+
+    def sync(self):
+        self._verify_open()
+        if self._log is not None:
+            self._log.flush()
+        self._checkpoint()
+
+    def reorganize(self):
+        """Rewrite the log with the current values only, reclaiming the
+        space used by overwritten and deleted values."""
+        self._verify_open()
+        if self._readonly:
+            raise ValueError('The database is opened for reading only')
+        self._log.flush()
+        generation = _os.urandom(8)
+        tmpfile = self._logfile + '.tmp'
+        self._create(tmpfile, _FILE_HEADER.pack(_LOG_MAGIC, generation))
+        index = {}
+        with _io.open(tmpfile, 'ab') as f:
+            pos = _FILE_HEADER.size
+            for key, (valpos, valsiz) in self._index.items():
+                val = self._read(valpos, valsiz)
+                sizes = _SIZES.pack(len(key), valsiz)
+                f.write(_RECORD.pack(_checksum(sizes, key, val),
+                                     len(key), valsiz))
+                f.write(key)
+                f.write(val)
+                pos += _RECORD.size + len(key)
+                index[key] = pos, valsiz
+                pos += valsiz
+        # The log cannot be replaced while it is mapped on Windows.
+        self._close_files()
+        _os.replace(tmpfile, self._logfile)
+        self._reader = _io.open(self._logfile, 'rb', buffering=0)
+        self._log = _io.open(self._logfile, 'ab')
+        self._generation = generation
+        self._index = index
+        self._end = pos
+        self._changes = {}
+        self._idx_stale = True
+        self._remap()
+        self._checkpoint()
+
+    def _verify_open(self):
+        if self._index is None:
+            raise error('DBM object has already been closed')
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            key = key.encode('utf-8')
+        self._verify_open()
+        pos, siz = self._index[key]     # may raise KeyError
+        return self._read(pos, siz)
+
+    def _append(self, key, val):
+        if val is None:
+            sizes = _SIZES.pack(len(key), _DELETED)
+            self._log.write(_RECORD.pack(_checksum(sizes, key), len(key),
+                                         _DELETED))
+            self._log.write(key)
+            self._end += _RECORD.size + len(key)
+            return None
+        if len(key) >= _DELETED or len(val) >= _DELETED:
+            raise ValueError('key or value too large')
+        sizes = _SIZES.pack(len(key), len(val))
+        self._log.write(_RECORD.pack(_checksum(sizes, key, val), len(key),
+                                     len(val)))
+        self._log.write(key)
+        self._log.write(val)
+        pos = self._end + _RECORD.size + len(key)
+        self._end = pos + len(val)
+        return pos, len(val)
+
+    def __setitem__(self, key, val):
+        if self._readonly:
+            raise ValueError('The database is opened for reading only')
+        if isinstance(key, str):
+            key = key.encode('utf-8')
+        elif isinstance(key, (bytes, bytearray)):
+            key = bytes(key)
+        else:
+            raise TypeError("keys must be bytes or strings")
+        if isinstance(val, str):
+            val = val.encode('utf-8')
+        elif not isinstance(val, (bytes, bytearray)):
+            raise TypeError("values must be bytes or strings")
+        self._verify_open()
+        self._index[key] = self._changes[key] = self._append(key, val)
+
+    def __delitem__(self, key):
+        if self._readonly:
+            raise ValueError('The database is opened for reading only')
+        if isinstance(key, str):
+            key = key.encode('utf-8')
+        self._verify_open()
+        del self._index[key]    # may raise KeyError
+        self._changes[key] = self._append(key, None)
+
+    def keys(self):
+        try:
+            return list(self._index)
+        except TypeError:
+            raise error('DBM object has already been closed') from None
+
+    def items(self):
+        self._verify_open()
+        return [(key, self[key]) for key in self._index.keys()]
+
+    def __contains__(self, key):
+        if isinstance(key, str):
+            key = key.encode('utf-8')
+        try:
+            return key in self._index
+        except TypeError:
+            if self._index is None:
+                raise error('DBM object has already been closed') from None
+            else:
+                raise
+
+    def __iter__(self):
+        try:
+            return iter(self._index)
+        except TypeError:
+            raise error('DBM object has already been closed') from None
+
+    def __len__(self):
+        try:
+            return len(self._index)
+        except TypeError:
+            raise error('DBM object has already been closed') from None
+
+    def _close_files(self):
+        try:
+            if self._map is not None:
+                self._map.close()
+            if self._log is not None:
+                self._log.close()
+        finally:
+            if self._reader is not None:
+                self._reader.close()
+            self._log = self._reader = self._map = None
+            self._mapped = 0
+
+    def close(self):
+        if self._index is None:
+            return
+        try:
+            if self._log is not None:
+                self._log.flush()
+                self._checkpoint()
+        finally:
+            self._close_files()
+            self._index = self._changes = None
+
+    def __del__(self):
+        if getattr(self, '_index', None) is not None:
+            self.close()
+
+    def _chmod(self, file):
+        if hasattr(_os, 'chmod'):
+            _os.chmod(file, self._mode)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def open(file, flag='c', mode=0o666):
+    """Open the database file, filename, and return corresponding object.
+
+    The optional flag argument can be 'c' (default) to open the database
+    for reading and writing and create it if it does not exist, 'r' to
+    open an existing database for reading only, 'w' to open an existing
+    database for reading and writing, and 'n' to always create a new,
+    empty database.
+
+    The optional mode argument is the UNIX mode of the files, used only
+    when the database has to be created.  It defaults to octal code 0o666
+    (and will be modified by the prevailing umask).
+
+    """
+
+    # Modify mode depending on the umask
+    try:
+        um = _os.umask(0)
+        _os.umask(um)
+    except AttributeError:
+        pass
+    else:
+        # Turn off any bits that are set in the umask
+        mode = mode & (~um)
+    if flag not in ('r', 'w', 'c', 'n'):
+        raise ValueError("Flag must be one of 'r', 'w', 'c', or 'n'")
+    return _Database(file, mode, flag=flag)
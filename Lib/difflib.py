@@ -32,6 +32,7 @@ __all__ = ['get_close_matches', 'ndiff', 'restore', 'SequenceMatcher',
 
 from heapq import nlargest as _nlargest
 from collections import namedtuple as _namedtuple
+from bisect import bisect_left as _bisect_left
 
 Match = _namedtuple('Match', 'a b size')
 
@@ -114,6 +115,9 @@ class SequenceMatcher:
     case.  SequenceMatcher is quadratic time for the worst case and has
     expected-case behavior dependent in a complicated way on how many
     elements the sequences have in common; best case time is linear.
+    With algorithm="myers" or algorithm="patience", matching blocks are
+    computed in O((N+M)D) time, where D is the size of the difference,
+    which is much faster on large, similar sequences.
 
     Methods:
 
@@ -148,7 +152,8 @@ class SequenceMatcher:
         Return an upper bound on ratio() very quickly.
     """
 
-    def __init__(self, isjunk=None, a='', b='', autojunk=True):
+    def __init__(self, isjunk=None, a='', b='', autojunk=True, *,
+                 algorithm=None):
         """Construct a SequenceMatcher.
 
         Optional arg isjunk is None (the default), or a one-argument
@@ -170,6 +175,14 @@ class SequenceMatcher:
         Optional arg autojunk should be set to False to disable the
         "automatic junk heuristic" that treats popular elements as junk
         (see module documentation for more information).
+
+        Optional keyword arg algorithm selects how matching blocks are
+        found: None (the default) for the Ratcliff-Obershelp algorithm
+        described above, "myers" for Myers' O(ND) difference algorithm, or
+        "patience" for the patience diff algorithm, which synchs up on the
+        elements that are unique in both sequences and falls back to
+        Myers' algorithm between them.  isjunk and autojunk only affect
+        the default algorithm.
         """
 
         # Members:
@@ -207,9 +220,12 @@ class SequenceMatcher:
         # bpopular
         #      nonjunk items in b treated as junk by the heuristic (if used).
 
+        if algorithm not in _ALGORITHMS:
+            raise ValueError("unknown algorithm %r" % (algorithm,))
         self.isjunk = isjunk
         self.a = self.b = None
         self.autojunk = autojunk
+        self.algorithm = algorithm
         self.set_seqs(a, b)
 
     def set_seqs(self, a, b):
@@ -466,6 +482,11 @@ class SequenceMatcher:
             return self.matching_blocks
         la, lb = len(self.a), len(self.b)
 
+        if self.algorithm is not None:
+            matching_blocks = _fast_matching_blocks(self.a, self.b,
+                                                    self.algorithm)
+            return self._set_matching_blocks(matching_blocks)
+
         # This is most naturally expressed as a recursive algorithm, but
         # at least one user bumped into extreme use cases that exceeded
         # the recursion limit on their box.  So, now we maintain a list
@@ -487,7 +508,9 @@ class SequenceMatcher:
                 if i+k < ahi and j+k < bhi:
                     queue.append((i+k, ahi, j+k, bhi))
         matching_blocks.sort()
+        return self._set_matching_blocks(matching_blocks)
 
+    def _set_matching_blocks(self, matching_blocks):
         # It's possible that we have adjacent equal blocks in the
         # matching_blocks list now.  Starting with 2.5, this code was added
         # to collapse them.
@@ -510,7 +533,7 @@ class SequenceMatcher:
         if k1:
             non_adjacent.append((i1, j1, k1))
 
-        non_adjacent.append( (la, lb, 0) )
+        non_adjacent.append( (len(self.a), len(self.b), 0) )
         self.matching_blocks = list(map(Match._make, non_adjacent))
         return self.matching_blocks
 
@@ -685,6 +708,174 @@ class SequenceMatcher:
         # shorter sequence
         return _calculate_ratio(min(la, lb), la + lb)
 
+_ALGORITHMS = (None, 'myers', 'patience')
+
+def _fast_matching_blocks(a, b, algorithm):
+    """Return the sorted (i, j, n) matching blocks of a and b found by
+    Myers' or the patience diff algorithm.
+
+    Adjacent blocks are not collapsed and there is no dummy last block.
+    """
+    # Work on small ints, which compare faster than arbitrary elements.
+    ids = {}
+    a = [ids.setdefault(x, len(ids)) for x in a]
+    b = [ids.setdefault(x, len(ids)) for x in b]
+    blocks = []
+    # Like in get_matching_blocks(), a stack of the ranges still to be
+    # compared is kept instead of recursing.  The last item is true if
+    # the patience algorithm should be tried on the range.
+    stack = [(0, len(a), 0, len(b), algorithm == 'patience')]
+    while stack:
+        alo, ahi, blo, bhi, patience = stack.pop()
+        # Strip the common prefix and suffix.
+        i, j = alo, blo
+        while i < ahi and j < bhi and a[i] == b[j]:
+            i += 1
+            j += 1
+        if i > alo:
+            blocks.append((alo, blo, i - alo))
+            alo, blo = i, j
+        i, j = ahi, bhi
+        while i > alo and j > blo and a[i-1] == b[j-1]:
+            i -= 1
+            j -= 1
+        if i < ahi:
+            blocks.append((i, j, ahi - i))
+            ahi, bhi = i, j
+        if alo == ahi or blo == bhi:
+            continue
+        if patience:
+            anchors = _patience_anchors(a, alo, ahi, b, blo, bhi)
+            if anchors:
+                for i, j in anchors:
+                    blocks.append((i, j, 1))
+                    stack.append((alo, i, blo, j, True))
+                    alo, blo = i + 1, j + 1
+                stack.append((alo, ahi, blo, bhi, True))
+                continue
+        point = _myers_split(a, alo, ahi, b, blo, bhi)
+        if point is not None and point != (alo, blo) and point != (ahi, bhi):
+            i, j = point
+            stack.append((alo, i, blo, j, False))
+            stack.append((i, ahi, j, bhi, False))
+    blocks.sort()
+    return blocks
+
+def _myers_split(a, alo, ahi, b, blo, bhi):
+    """Find the middle snake of the shortest edit script turning a[alo:ahi]
+    into b[blo:bhi].
+
+    Return the point (i, j) where the script can be split in two, or None
+    if the ranges have nothing in common.  This is the linear space
+    refinement of Myers' algorithm, running the search forward from the
+    start and backward from the end of the ranges until they meet.
+    """
+    n = ahi - alo
+    m = bhi - blo
+    max_d = (n + m + 1) // 2
+    offset = max_d
+    size = 2 * max_d + 2
+    # v1[offset+k] is the furthest x reached forward on diagonal k, v2 the
+    # same backward; -1 if the diagonal was not reached yet.
+    v1 = [-1] * size
+    v1[offset + 1] = 0
+    v2 = v1[:]
+    delta = n - m
+    # The paths can only meet on a forward step if delta is odd.
+    front = delta & 1
+    # Diagonals which went off the edges are not explored any further.
+    k1start = k1end = k2start = k2end = 0
+    for d in range(max_d):
+        for k1 in range(-d + k1start, d + 1 - k1end, 2):
+            k1_offset = offset + k1
+            if k1 == -d or (k1 != d and v1[k1_offset-1] < v1[k1_offset+1]):
+                x1 = v1[k1_offset + 1]
+            else:
+                x1 = v1[k1_offset - 1] + 1
+            y1 = x1 - k1
+            while x1 < n and y1 < m and a[alo + x1] == b[blo + y1]:
+                x1 += 1
+                y1 += 1
+            v1[k1_offset] = x1
+            if x1 > n:
+                k1end += 2
+            elif y1 > m:
+                k1start += 2
+            elif front:
+                k2_offset = offset + delta - k1
+                if 0 <= k2_offset < size and v2[k2_offset] != -1:
+                    if x1 >= n - v2[k2_offset]:
+                        return alo + x1, blo + y1
+        for k2 in range(-d + k2start, d + 1 - k2end, 2):
+            k2_offset = offset + k2
+            if k2 == -d or (k2 != d and v2[k2_offset-1] < v2[k2_offset+1]):
+                x2 = v2[k2_offset + 1]
+            else:
+                x2 = v2[k2_offset - 1] + 1
+            y2 = x2 - k2
+            while (x2 < n and y2 < m and
+                   a[ahi - x2 - 1] == b[bhi - y2 - 1]):
+                x2 += 1
+                y2 += 1
+            v2[k2_offset] = x2
+            if x2 > n:
+                k2end += 2
+            elif y2 > m:
+                k2start += 2
+            elif not front:
+                k1_offset = offset + delta - k2
+                if 0 <= k1_offset < size and v1[k1_offset] != -1:
+                    x1 = v1[k1_offset]
+                    y1 = offset + x1 - k1_offset
+                    if x1 >= n - x2:
+                        return alo + x1, blo + y1
+    return None
+
+def _patience_anchors(a, alo, ahi, b, blo, bhi):
+    """Return the (i, j) pairs of elements a[i] == b[j] which occur once in
+    a[alo:ahi] and once in b[blo:bhi], keeping the longest sequence of
+    them that is increasing in both i and j.
+    """
+    # For each element: [count in a, index in a, count in b, index in b]
+    counts = {}
+    for i in range(alo, ahi):
+        c = counts.get(a[i])
+        if c is None:
+            counts[a[i]] = [1, i, 0, 0]
+        else:
+            c[0] += 1
+    for j in range(blo, bhi):
+        c = counts.get(b[j])
+        if c is not None:
+            c[2] += 1
+            c[3] = j
+    pairs = sorted((i, j) for acount, i, bcount, j in counts.values()
+                   if acount == 1 and bcount == 1)
+    if not pairs:
+        return pairs
+    # Longest increasing subsequence of the j's, by patience sorting:
+    # tops[k] is the smallest j ending an increasing run of length k+1,
+    # and back[p] the index in pairs of the predecessor of pairs[p].
+    tops = []
+    top_indices = []
+    back = []
+    for p, (i, j) in enumerate(pairs):
+        k = _bisect_left(tops, j)
+        back.append(top_indices[k-1] if k else None)
+        if k == len(tops):
+            tops.append(j)
+            top_indices.append(p)
+        else:
+            tops[k] = j
+            top_indices[k] = p
+    result = []
+    p = top_indices[-1]
+    while p is not None:
+        result.append(pairs[p])
+        p = back[p]
+    result.reverse()
+    return result
+
 def get_close_matches(word, possibilities, n=3, cutoff=0.6):
     """Use SequenceMatcher to return list of the best "good enough" matches.
 
@@ -748,6 +939,11 @@ def _count_leading(line, ch):
         i += 1
     return i
 
+# Differ only searches blocks of replaced lines for similar lines if the
+# number of pairs of lines to compare is at most this, when a fast
+# algorithm was selected.
+_MAX_FANCY_PAIRS = 10000
+
 class Differ:
     r"""
     Differ is a class for comparing sequences of lines of text, and
@@ -835,14 +1031,14 @@ class Differ:
 
     Methods:
 
-    __init__(linejunk=None, charjunk=None)
+    __init__(linejunk=None, charjunk=None, *, algorithm=None)
         Construct a text differencer, with optional filters.
 
     compare(a, b)
         Compare two sequences of lines; generate the resulting delta.
     """
 
-    def __init__(self, linejunk=None, charjunk=None):
+    def __init__(self, linejunk=None, charjunk=None, *, algorithm=None):
         """
         Construct a text differencer, with optional filters.
 
@@ -860,10 +1056,19 @@ class Differ:
           module-level function `IS_CHARACTER_JUNK` may be used to filter out
           whitespace characters (a blank or tab; **note**: bad idea to include
           newline in this!).  Use of IS_CHARACTER_JUNK is recommended.
+
+        The optional keyword parameter `algorithm` is passed to the
+        SequenceMatcher comparing the sequences of lines.  When it is not
+        None, blocks of replaced lines are only searched for similar lines
+        if they are small enough, since that search takes time quadratic
+        in the size of the blocks.
         """
 
+        if algorithm not in _ALGORITHMS:
+            raise ValueError("unknown algorithm %r" % (algorithm,))
         self.linejunk = linejunk
         self.charjunk = charjunk
+        self.algorithm = algorithm
 
     def compare(self, a, b):
         r"""
@@ -891,10 +1096,15 @@ class Differ:
         + emu
         """
 
-        cruncher = SequenceMatcher(self.linejunk, a, b)
+        cruncher = SequenceMatcher(self.linejunk, a, b,
+                                   algorithm=self.algorithm)
         for tag, alo, ahi, blo, bhi in cruncher.get_opcodes():
             if tag == 'replace':
-                g = self._fancy_replace(a, alo, ahi, b, blo, bhi)
+                if (self.algorithm is not None and
+                        (ahi - alo) * (bhi - blo) > _MAX_FANCY_PAIRS):
+                    g = self._plain_replace(a, alo, ahi, b, blo, bhi)
+                else:
+                    g = self._fancy_replace(a, alo, ahi, b, blo, bhi)
             elif tag == 'delete':
                 g = self._dump('-', a, alo, ahi)
             elif tag == 'insert':
@@ -1134,7 +1344,7 @@ def _format_range_unified(start, stop):
     return '{},{}'.format(beginning, length)
 
 def unified_diff(a, b, fromfile='', tofile='', fromfiledate='',
-                 tofiledate='', n=3, lineterm='\n'):
+                 tofiledate='', n=3, lineterm='\n', *, algorithm=None):
     r"""
     Compare two sequences of lines; generate the delta as a unified diff.
 
@@ -1156,6 +1366,9 @@ def unified_diff(a, b, fromfile='', tofile='', fromfiledate='',
     'fromfile', 'tofile', 'fromfiledate', and 'tofiledate'.
     The modification times are normally expressed in the ISO 8601 format.
 
+    The algorithm argument is passed to SequenceMatcher; "myers" or
+    "patience" is much faster than the default on large inputs.
+
     Example:
 
     >>> for line in unified_diff('one two three four'.split(),
@@ -1176,7 +1389,8 @@ def unified_diff(a, b, fromfile='', tofile='', fromfiledate='',
 
     _check_types(a, b, fromfile, tofile, fromfiledate, tofiledate, lineterm)
     started = False
-    for group in SequenceMatcher(None,a,b).get_grouped_opcodes(n):
+    for group in SequenceMatcher(None, a, b,
+                                 algorithm=algorithm).get_grouped_opcodes(n):
         if not started:
             started = True
             fromdate = '\t{}'.format(fromfiledate) if fromfiledate else ''
@@ -1219,7 +1433,8 @@ def _format_range_context(start, stop):
 
 # See http://www.unix.org/single_unix_specification/
 def context_diff(a, b, fromfile='', tofile='',
-                 fromfiledate='', tofiledate='', n=3, lineterm='\n'):
+                 fromfiledate='', tofiledate='', n=3, lineterm='\n', *,
+                 algorithm=None):
     r"""
     Compare two sequences of lines; generate the delta as a context diff.
 
@@ -1242,6 +1457,9 @@ def context_diff(a, b, fromfile='', tofile='',
     The modification times are normally expressed in the ISO 8601 format.
     If not specified, the strings default to blanks.
 
+    The algorithm argument is passed to SequenceMatcher, as for
+    unified_diff().
+
     Example:
 
     >>> print(''.join(context_diff('one\ntwo\nthree\nfour\n'.splitlines(True),
@@ -1265,7 +1483,8 @@ def context_diff(a, b, fromfile='', tofile='',
     _check_types(a, b, fromfile, tofile, fromfiledate, tofiledate, lineterm)
     prefix = dict(insert='+ ', delete='- ', replace='! ', equal='  ')
     started = False
-    for group in SequenceMatcher(None,a,b).get_grouped_opcodes(n):
+    for group in SequenceMatcher(None, a, b,
+                                 algorithm=algorithm).get_grouped_opcodes(n):
         if not started:
             started = True
             fromdate = '\t{}'.format(fromfiledate) if fromfiledate else ''
@@ -1341,7 +1560,8 @@ def diff_bytes(dfunc, a, b, fromfile=b'', tofile=b'',
     for line in lines:
         yield line.encode('ascii', 'surrogateescape')
 
-def ndiff(a, b, linejunk=None, charjunk=IS_CHARACTER_JUNK):
+def ndiff(a, b, linejunk=None, charjunk=IS_CHARACTER_JUNK, *,
+          algorithm=None):
     r"""
     Compare `a` and `b` (lists of strings); return a `Differ`-style delta.
 
@@ -1359,6 +1579,8 @@ def ndiff(a, b, linejunk=None, charjunk=IS_CHARACTER_JUNK):
       whitespace characters (a blank or tab; note: it's a bad idea to
       include newline in this!).
 
+    The optional keyword parameter `algorithm` is passed to Differ.
+
     Tools/scripts/ndiff.py is a command-line front-end to this function.
 
     Example:
@@ -1376,7 +1598,7 @@ def ndiff(a, b, linejunk=None, charjunk=IS_CHARACTER_JUNK):
     + tree
     + emu
     """
-    return Differ(linejunk, charjunk).compare(a, b)
+    return Differ(linejunk, charjunk, algorithm=algorithm).compare(a, b)
 
 def _mdiff(fromlines, tolines, context=None, linejunk=None,
            charjunk=IS_CHARACTER_JUNK):
@@ -45,6 +45,17 @@ def _compile_pattern(pat):
         res = translate(pat)
     return re.compile(res).match
 
+# Compile a tuple of patterns into a single regular expression matching any
+# of them, so that a name is scanned once whatever the number of patterns.
+@functools.lru_cache(maxsize=256, typed=True)
+def _compile_patterns(pats):
+    if isinstance(pats[0], bytes):
+        res_str = '|'.join(translate(str(pat, 'ISO-8859-1')) for pat in pats)
+        res = bytes(res_str, 'ISO-8859-1')
+    else:
+        res = '|'.join(map(translate, pats))
+    return re.compile(res).match
+
 def filter(names, pat):
     """Return the subset of the list NAMES that match PAT."""
     result = []
@@ -14,10 +14,10 @@ __all__ = ['update_wrapper', 'wraps', 'WRAPPER_ASSIGNMENTS', 'WRAPPER_UPDATES',
            'partialmethod', 'singledispatch', 'singledispatchmethod']
 
 from abc import get_cache_token
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
 # import types, weakref  # Deferred to single_dispatch()
 from reprlib import recursive_repr
-from _thread import RLock
+from _thread import RLock, allocate_lock, get_ident
 
 
 ################################################################################
@@ -435,6 +435,9 @@ def _unwrap_partial(func):
 ################################################################################
 
 _CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+_CacheStats = namedtuple("CacheStats", ["hits", "misses", "maxsize",
+                                        "currsize", "evictions", "expired",
+                                        "maxcost", "currcost"])
 
 class _HashedSeq(list):
     """ This class guarantees that hash() will be called no more than once
@@ -483,7 +486,8 @@ def _make_key(args, kwds, typed,
         return key[0]
     return _HashedSeq(key)
 
-def lru_cache(maxsize=128, typed=False):
+def lru_cache(maxsize=128, typed=False, *, maxcost=None, cost=None,
+              ttl=None):
     """Least-recently-used cache decorator.
 
     If *maxsize* is set to None, the LRU features are disabled and the cache
@@ -493,12 +497,25 @@ def lru_cache(maxsize=128, typed=False):
     For example, f(3.0) and f(3) will be treated as distinct calls with
     distinct results.
 
+    If *maxcost* is set, the least recently used results are discarded when
+    the sum of their costs exceeds it.  The cost of a result is given by
+    the *cost* function, sys.getsizeof() by default.
+
+    If *ttl* is set, results expire after that many seconds.
+
     Arguments to the cached function must be hashable.
 
     View the cache statistics named tuple (hits, misses, maxsize, currsize)
     with f.cache_info().  Clear the cache and statistics with f.cache_clear().
     Access the underlying function with f.__wrapped__.
 
+    When *maxcost*, *cost* or *ttl* is used, or when the decorated function
+    is a coroutine function, a thread calling f() with the arguments of a
+    call being computed in another thread waits for its result, and
+    f.cache_info() also reports (evictions, expired, maxcost, currcost).
+    The result of a coroutine function is cached, not the coroutine, and
+    tasks awaiting a call in progress share its result or exception.
+
     See:  http://en.wikipedia.org/wiki/Cache_algorithms#Least_Recently_Used
 
     """
@@ -513,9 +530,24 @@ def lru_cache(maxsize=128, typed=False):
     # integer or None.
     if maxsize is not None and not isinstance(maxsize, int):
         raise TypeError('Expected maxsize to be an integer or None')
+    if maxcost is not None:
+        if maxcost < 0:
+            raise ValueError('maxcost must be non-negative')
+        if cost is None:
+            from sys import getsizeof as cost
+    if cost is not None and not callable(cost):
+        raise TypeError('Expected cost to be a callable')
+    if ttl is not None and not ttl > 0:
+        raise ValueError('ttl must be positive')
+    bounded = maxcost is not None or cost is not None or ttl is not None
 
     def decorating_function(user_function):
-        wrapper = _lru_cache_wrapper(user_function, maxsize, typed, _CacheInfo)
+        if bounded or _is_coroutine_function(user_function):
+            wrapper = _bounded_lru_cache_wrapper(user_function, maxsize, typed,
+                                                 maxcost, cost, ttl)
+        else:
+            wrapper = _lru_cache_wrapper(user_function, maxsize, typed,
+                                         _CacheInfo)
         return update_wrapper(wrapper, user_function)
 
     return decorating_function
@@ -641,6 +673,184 @@ try:
 except ImportError:
     pass
 
+def _is_coroutine_function(func):
+    code = getattr(func, '__code__', None)
+    return code is not None and bool(code.co_flags & 0x80)  # CO_COROUTINE
+
+def _bounded_lru_cache_wrapper(user_function, maxsize, typed, maxcost, cost,
+                               ttl):
+    # Variant of _lru_cache_wrapper() accounting for the cost and the age of
+    # the results, and letting a single thread compute the result for a key.
+    sentinel = object()          # unique object used to signal cache misses
+    make_key = _make_key         # build a key from the function arguments
+    RESULT, COST, DEADLINE = 0, 1, 2   # names for the entry fields
+
+    if maxsize is not None and maxsize < 0:
+        maxsize = 0
+    if ttl is not None:
+        from time import monotonic as timer
+
+    cache = OrderedDict()        # key -> [result, cost, deadline], LRU first
+    computing = {}               # key -> (lock held, thread computing it),
+                                 # or (task computing it, waiting futures)
+    hits = misses = evictions = expired = 0
+    currcost = 0
+    lock = RLock()
+
+    def lookup(key):
+        # Return the result for key or sentinel, called with the lock held.
+        nonlocal hits, expired, currcost
+        entry = cache.get(key)
+        if entry is None:
+            return sentinel
+        if ttl is not None and entry[DEADLINE] <= timer():
+            del cache[key]
+            currcost -= entry[COST]
+            expired += 1
+            return sentinel
+        cache.move_to_end(key)
+        hits += 1
+        return entry[RESULT]
+
+    def store(key, result, result_cost):
+        # Add a result to the cache, called with the lock held.
+        nonlocal evictions, currcost
+        if maxsize == 0 or (maxcost is not None and result_cost > maxcost):
+            return
+        old = cache.pop(key, None)
+        if old is not None:
+            currcost -= old[COST]
+        deadline = timer() + ttl if ttl is not None else None
+        cache[key] = [result, result_cost, deadline]
+        currcost += result_cost
+        while ((maxsize is not None and len(cache) > maxsize) or
+               (maxcost is not None and currcost > maxcost)):
+            _, old = cache.popitem(last=False)
+            currcost -= old[COST]
+            evictions += 1
+
+    if _is_coroutine_function(user_function):
+        from asyncio import (CancelledError, current_task, get_event_loop,
+                             _get_running_loop)
+
+        def settle(waiter, result, exc):
+            if not waiter.done():
+                if exc is not None:
+                    waiter.set_exception(exc)
+                else:
+                    waiter.set_result(result)
+
+        async def wrapper(*args, **kwds):
+            nonlocal hits, misses
+            key = make_key(args, kwds, typed)
+            loop = _get_running_loop()
+            task = current_task(loop) if loop is not None else None
+            while True:
+                with lock:
+                    result = lookup(key)
+                    if result is not sentinel:
+                        return result
+                    busy = computing.get(key)
+                    if busy is None:
+                        # Compute the result in this task.
+                        busy = computing[key] = (task, [])
+                        misses += 1
+                        break
+                    if busy[0] is task:
+                        # A recursive call with the same arguments.
+                        busy = None
+                        misses += 1
+                        break
+                    # Another task is computing the result: wait for it
+                    # and share its result or exception.
+                    hits += 1
+                    waiter = get_event_loop().create_future()
+                    busy[1].append(waiter)
+                result = await waiter
+                if result is not sentinel:
+                    return result
+                # The task computing the result was cancelled: look the
+                # key up again.
+                with lock:
+                    hits -= 1
+            result = exc = None
+            try:
+                result = await user_function(*args, **kwds)
+                result_cost = cost(result) if cost is not None else 0
+                with lock:
+                    store(key, result, result_cost)
+            except CancelledError:
+                # Let a waiting task compute the result.
+                result = sentinel
+                raise
+            except BaseException as e:
+                exc = e
+                raise
+            finally:
+                if busy is not None:
+                    with lock:
+                        del computing[key]
+                    for waiter in busy[1]:
+                        waiter.get_loop().call_soon_threadsafe(
+                            settle, waiter, result, exc)
+            return result
+
+    else:
+
+        def wrapper(*args, **kwds):
+            nonlocal misses
+            key = make_key(args, kwds, typed)
+            while True:
+                with lock:
+                    result = lookup(key)
+                    if result is not sentinel:
+                        return result
+                    busy = computing.get(key)
+                    if busy is None:
+                        # Compute the result in this thread.
+                        busy = allocate_lock()
+                        busy.acquire()
+                        computing[key] = (busy, get_ident())
+                        misses += 1
+                        break
+                    if busy[1] == get_ident():
+                        # A recursive call with the same arguments.
+                        busy = None
+                        misses += 1
+                        break
+                # Another thread is computing the result: wait for it to
+                # finish, then look the key up again.
+                busy[0].acquire()
+                busy[0].release()
+            try:
+                result = user_function(*args, **kwds)
+                result_cost = cost(result) if cost is not None else 0
+                with lock:
+                    store(key, result, result_cost)
+            finally:
+                if busy is not None:
+                    with lock:
+                        del computing[key]
+                    busy.release()
+            return result
+
+    def cache_info():
+        """Report cache statistics"""
+        with lock:
+            return _CacheStats(hits, misses, maxsize, len(cache), evictions,
+                               expired, maxcost, currcost)
+
+    def cache_clear():
+        """Clear the cache and cache statistics"""
+        nonlocal hits, misses, evictions, expired, currcost
+        with lock:
+            cache.clear()
+            hits = misses = evictions = expired = currcost = 0
+
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
+    return wrapper
+
 
 ################################################################################
 ### singledispatch() - single-dispatch generic function decorator
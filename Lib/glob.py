@@ -4,9 +4,9 @@ import os
 import re
 import fnmatch
 
-__all__ = ["glob", "iglob", "escape"]
+__all__ = ["glob", "iglob", "escape", "GlobSet"]
 
-def glob(pathname, *, recursive=False):
+def glob(pathname, *, recursive=False, workers=None):
     """Return a list of paths matching a pathname pattern.
 
     The pattern may contain simple shell-style wildcards a la
@@ -16,10 +16,13 @@ def glob(pathname, *, recursive=False):
 
     If recursive is true, the pattern '**' will match any files and
     zero or more directories and subdirectories.
+
+    If workers is given, the directories matched by '**' are listed
+    by a pool of at most workers threads, as with os.walk().
     """
-    return list(iglob(pathname, recursive=recursive))
+    return list(iglob(pathname, recursive=recursive, workers=workers))
 
-def iglob(pathname, *, recursive=False):
+def iglob(pathname, *, recursive=False, workers=None):
     """Return an iterator which yields the paths matching a pathname pattern.
 
     The pattern may contain simple shell-style wildcards a la
@@ -29,14 +32,17 @@ def iglob(pathname, *, recursive=False):
 
     If recursive is true, the pattern '**' will match any files and
     zero or more directories and subdirectories.
+
+    If workers is given, the directories matched by '**' are listed
+    by a pool of at most workers threads, as with os.walk().
     """
-    it = _iglob(pathname, recursive, False)
+    it = _iglob(pathname, recursive, False, workers)
     if recursive and _isrecursive(pathname):
         s = next(it)  # skip empty string
         assert not s
     return it
 
-def _iglob(pathname, recursive, dironly):
+def _iglob(pathname, recursive, dironly, workers=None):
     dirname, basename = os.path.split(pathname)
     if not has_magic(pathname):
         assert not dironly
@@ -50,7 +56,7 @@ def _iglob(pathname, recursive, dironly):
         return
     if not dirname:
         if recursive and _isrecursive(basename):
-            yield from _glob2(dirname, basename, dironly)
+            yield from _glob2(dirname, basename, dironly, workers)
         else:
             yield from _glob1(dirname, basename, dironly)
         return
@@ -58,12 +64,13 @@ def _iglob(pathname, recursive, dironly):
     # drive or UNC path.  Prevent an infinite recursion if a drive or UNC path
     # contains magic characters (i.e. r'\\?\C:').
     if dirname != pathname and has_magic(dirname):
-        dirs = _iglob(dirname, recursive, True)
+        dirs = _iglob(dirname, recursive, True, workers)
     else:
         dirs = [dirname]
     if has_magic(basename):
         if recursive and _isrecursive(basename):
-            glob_in_dir = _glob2
+            def glob_in_dir(dirname, basename, dironly):
+                return _glob2(dirname, basename, dironly, workers)
         else:
             glob_in_dir = _glob1
     else:
@@ -104,10 +111,13 @@ def glob1(dirname, pattern):
 # This helper function recursively yields relative pathnames inside a literal
 # directory.
 
-def _glob2(dirname, pattern, dironly):
+def _glob2(dirname, pattern, dironly, workers=None):
     assert _isrecursive(pattern)
     yield pattern[:0]
-    yield from _rlistdir(dirname, dironly)
+    if workers is None:
+        yield from _rlistdir(dirname, dironly)
+    else:
+        yield from _rwalk(dirname, dironly, workers)
 
 # If dironly is false, yields all file names inside a directory.
 # If dironly is true, yields only directory names.
@@ -138,6 +148,29 @@ def _rlistdir(dirname, dironly):
             for y in _rlistdir(path, dironly):
                 yield os.path.join(x, y)
 
+# Same as _rlistdir(), but lists the directories in parallel with os.walk().
+# The pathnames are yielded a directory at a time.
+def _rwalk(dirname, dironly, workers):
+    top = dirname
+    if not top:
+        if isinstance(top, bytes):
+            top = bytes(os.curdir, 'ASCII')
+        else:
+            top = os.curdir
+    # Relative pathnames of the directories being walked.
+    prefixes = {top: dirname[:0]}
+    for root, dirs, files in os.walk(top, followlinks=True, workers=workers):
+        prefix = prefixes.pop(root)
+        dirs[:] = [x for x in dirs if not _ishidden(x)]
+        for x in dirs:
+            path = os.path.join(prefix, x) if prefix else x
+            prefixes[os.path.join(root, x)] = path
+            yield path
+        if not dironly:
+            for x in files:
+                if not _ishidden(x):
+                    yield os.path.join(prefix, x) if prefix else x
+
 
 magic_check = re.compile('([*?[])')
 magic_check_bytes = re.compile(b'([*?[])')
@@ -169,3 +202,237 @@ def escape(pathname):
     else:
         pathname = magic_check.sub(r'[\1]', pathname)
     return drive + pathname
+
+
+
+class GlobSet:
+    """A set of glob patterns matched against the paths of a directory tree.
+
+    A path matches the set if it matches one of the patterns and neither
+    it nor any of its parent directories matches one of the exclude
+    patterns.  Patterns are relative paths whose components are fnmatch
+    patterns; the component '**' matches zero or more directories and
+    files, and a pattern ending with a separator matches only
+    directories.  Unless include_hidden is true, wildcards do not match
+    names starting with a dot, as with glob().
+
+    The patterns are compiled once.  When walking a tree, directories
+    which cannot contain a match and excluded directories are not
+    listed, and a name is matched against all the patterns at once.
+    """
+
+    def __init__(self, patterns, exclude=(), *, include_hidden=False):
+        self.patterns = tuple(map(os.fspath, patterns))
+        self.exclude = tuple(map(os.fspath, exclude))
+        all_patterns = self.patterns + self.exclude
+        if len({type(pattern) for pattern in all_patterns}) > 1:
+            raise TypeError("cannot mix str and bytes patterns")
+        self._bytes = bool(all_patterns) and isinstance(all_patterns[0], bytes)
+        self._include_hidden = include_hidden
+        # The state (i, k) of the set means that the component k of the
+        # pattern i has to match the next name.
+        self._components = []
+        self._dironly = []
+        for pattern in all_patterns:
+            if os.path.isabs(pattern) or os.path.splitdrive(pattern)[0]:
+                raise ValueError("non-relative patterns are unsupported")
+            components, dironly = self._split(pattern)
+            if not components:
+                raise ValueError("empty pattern: %r" % (pattern,))
+            self._components.append(components)
+            self._dironly.append(dironly)
+        self._closures = {}
+        self._states = {}
+        start = set()
+        for i in range(len(all_patterns)):
+            start |= self._closure(i, 0)
+        self._start = self._state(frozenset(start))
+
+    def __repr__(self):
+        args = [repr(list(self.patterns))]
+        if self.exclude:
+            args.append('exclude=%r' % (list(self.exclude),))
+        if self._include_hidden:
+            args.append('include_hidden=True')
+        return '%s(%s)' % (type(self).__name__, ', '.join(args))
+
+    def match(self, path):
+        """Return whether path, relative to the top of the tree, matches
+        the set.  A path ending with a separator is a directory.
+        """
+        components, is_dir = self._split(os.fspath(path))
+        state = self._start
+        last = len(components) - 1
+        for depth, name in enumerate(components):
+            state = state.step(name)
+            if state is None or state.rejects(is_dir or depth < last):
+                return False
+        return bool(components) and state.accepts(is_dir)
+
+    def glob(self, root_dir=None):
+        """Return the list of the paths matching the set in the tree rooted
+        at root_dir, the current directory by default.
+        """
+        return list(self.iglob(root_dir))
+
+    def iglob(self, root_dir=None):
+        """Iterate over the paths matching the set in the tree rooted at
+        root_dir, the current directory by default.
+
+        The paths are relative to root_dir.  Symbolic links to
+        directories are followed.
+        """
+        if root_dir is None:
+            root_dir = bytes(os.curdir, 'ASCII') if self._bytes else os.curdir
+        else:
+            root_dir = os.fspath(root_dir)
+        return self._iglob(root_dir, root_dir[:0], self._start)
+
+    def _iglob(self, dirname, prefix, state):
+        if state.literal_only:
+            # The directory does not need to be listed.
+            entries = [(name, None) for name in state.names]
+        else:
+            try:
+                with os.scandir(dirname) as it:
+                    entries = [(entry.name, entry) for entry in it]
+            except OSError:
+                return
+        normcase = os.path.normcase
+        for name, entry in entries:
+            child = state.step(normcase(name))
+            if child is None:
+                continue
+            path = os.path.join(dirname, name)
+            is_dir = False
+            if child.need_is_dir:
+                try:
+                    if entry is None:
+                        is_dir = os.path.isdir(path)
+                    else:
+                        is_dir = entry.is_dir()
+                except OSError:
+                    pass
+            if entry is None and not is_dir and not os.path.lexists(path):
+                continue
+            if child.rejects(is_dir):
+                continue
+            relpath = os.path.join(prefix, name) if prefix else name
+            if child.accepts(is_dir):
+                yield relpath
+            if is_dir and child.alive:
+                yield from self._iglob(path, relpath, child)
+
+    def _split(self, path):
+        # Return the components of a pattern or a path, and whether it
+        # ends with a separator.
+        path = os.path.normcase(path)
+        sep, altsep, curdir = os.sep, os.altsep, os.curdir
+        if isinstance(path, bytes):
+            sep = bytes(sep, 'ASCII')
+            altsep = altsep and bytes(altsep, 'ASCII')
+            curdir = bytes(curdir, 'ASCII')
+        if altsep:
+            path = path.replace(altsep, sep)
+        components = [c for c in path.split(sep) if c and c != curdir]
+        return components, path.endswith(sep)
+
+    def _closure(self, i, k):
+        # The state (i, k), and the following states if '**' matches no
+        # directory.
+        key = i, k
+        try:
+            return self._closures[key]
+        except KeyError:
+            pass
+        components = self._components[i]
+        states = {key}
+        while k < len(components) and _isrecursive(components[k]):
+            k += 1
+            states.add((i, k))
+        states = self._closures[key] = frozenset(states)
+        return states
+
+    def _state(self, states):
+        try:
+            return self._states[states]
+        except KeyError:
+            state = self._states[states] = _GlobState(self, states)
+            return state
+
+
+class _GlobState:
+    # A set of states of a GlobSet, with the transitions compiled from them.
+
+    def __init__(self, globset, states):
+        self.globset = globset
+        self.include_hidden = globset._include_hidden
+        count = len(globset.patterns)
+        components = globset._components
+        dironly = globset._dironly
+        self.accept_any = self.accept_dir = False
+        self.reject_any = self.reject_dir = False
+        self.literals = {}
+        wildcards = {}
+        recursive = set()
+        # Only the include patterns decide which directories are listed
+        # and descended into; exclude patterns only reject paths.
+        self.names = []
+        include_wildcards = include_recursive = False
+        for i, k in states:
+            if k == len(components[i]):
+                if i < count:
+                    self.accept_dir = True
+                    self.accept_any |= not dironly[i]
+                else:
+                    self.reject_dir = True
+                    self.reject_any |= not dironly[i]
+                continue
+            component = components[i][k]
+            if _isrecursive(component):
+                recursive |= globset._closure(i, k)
+                include_recursive |= i < count
+            elif has_magic(component):
+                wildcards.setdefault(component, set()).update(
+                    globset._closure(i, k + 1))
+                include_wildcards |= i < count
+            else:
+                if i < count and component not in self.names:
+                    self.names.append(component)
+                self.literals.setdefault(component, set()).update(
+                    globset._closure(i, k + 1))
+        self.recursive = recursive
+        self.wildcards = [(component, fnmatch._compile_pattern(component),
+                           next_states)
+                          for component, next_states in wildcards.items()]
+        if len(self.wildcards) > 1:
+            self.match_any = fnmatch._compile_patterns(tuple(wildcards))
+        else:
+            self.match_any = None
+        self.literal_only = not include_wildcards and not include_recursive
+        self.alive = bool(self.names or include_wildcards or include_recursive)
+        self.need_is_dir = (self.alive or
+                            (self.accept_dir and not self.accept_any) or
+                            (self.accept_any and
+                             self.reject_dir and not self.reject_any))
+
+    def accepts(self, is_dir):
+        return self.accept_any or (is_dir and self.accept_dir)
+
+    def rejects(self, is_dir):
+        return self.reject_any or (is_dir and self.reject_dir)
+
+    def step(self, name):
+        """Return the state after name, or None if nothing can match."""
+        hidden = not self.include_hidden and _ishidden(name)
+        states = self.literals.get(name)
+        states = set(states) if states else set()
+        if self.wildcards and (self.match_any is None or self.match_any(name)):
+            for component, match, next_states in self.wildcards:
+                if match(name) and (not hidden or _ishidden(component)):
+                    states |= next_states
+        if self.recursive and not hidden:
+            states |= self.recursive
+        if not states:
+            return None
+        return self.globset._state(frozenset(states))
@@ -6,12 +6,14 @@ but random access is not allowed."""
 # based on Andrew Kuchling's minigzip.py distributed with the zlib module
 
 import struct, sys, time, os
+import bisect
+import functools
 import zlib
 import builtins
 import io
 import _compression
 
-__all__ = ["GzipFile", "open", "compress", "decompress"]
+__all__ = ["GzipFile", "GzipIndex", "open", "compress", "decompress"]
 
 FTEXT, FHCRC, FEXTRA, FNAME, FCOMMENT = 1, 2, 4, 8, 16
 
@@ -21,9 +23,16 @@ _COMPRESS_LEVEL_FAST = 1
 _COMPRESS_LEVEL_TRADEOFF = 6
 _COMPRESS_LEVEL_BEST = 9
 
+# Size of the blocks compressed in parallel when threads > 1
+_PARALLEL_BLOCK_SIZE = 128 * 1024
+_DEFLATE_WINDOW_SIZE = 32 * 1024
+
+# Default distance between the seek points of a GzipIndex
+_INDEX_SPACING = 1024 * 1024
+
 
 def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_BEST,
-         encoding=None, errors=None, newline=None):
+         encoding=None, errors=None, newline=None, *, threads=1, index=None):
     """Open a gzip-compressed file in binary or text mode.
 
     The filename argument can be an actual filename (a str or bytes object), or
@@ -34,8 +43,8 @@ def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_BEST,
     "rb", and the default compresslevel is 9.
 
     For binary mode, this function is equivalent to the GzipFile constructor:
-    GzipFile(filename, mode, compresslevel). In this case, the encoding, errors
-    and newline arguments must not be provided.
+    GzipFile(filename, mode, compresslevel, threads=threads, index=index). In
+    this case, the encoding, errors and newline arguments must not be provided.
 
     For text mode, a GzipFile object is created, and wrapped in an
     io.TextIOWrapper instance with the specified encoding, error handling
@@ -55,9 +64,11 @@ def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_BEST,
 
     gz_mode = mode.replace("t", "")
     if isinstance(filename, (str, bytes, os.PathLike)):
-        binary_file = GzipFile(filename, gz_mode, compresslevel)
+        binary_file = GzipFile(filename, gz_mode, compresslevel,
+                               threads=threads, index=index)
     elif hasattr(filename, "read") or hasattr(filename, "write"):
-        binary_file = GzipFile(None, gz_mode, compresslevel, filename)
+        binary_file = GzipFile(None, gz_mode, compresslevel, filename,
+                               threads=threads, index=index)
     else:
         raise TypeError("filename must be a str or bytes object, or a file")
 
@@ -109,9 +120,113 @@ class _PaddedFile:
         self._buffer = None
         return self.file.seek(off)
 
+    def tell(self):
+        if self._read is None:
+            return self.file.tell()
+        return self.file.tell() - self._length + self._read
+
     def seekable(self):
         return True  # Allows fast-forwarding even in unseekable streams
 
+
+class GzipIndex:
+    """Seek points into the uncompressed data of a gzip file.
+
+    An index is filled in while a GzipFile created with it reads the
+    file: roughly every *spacing* bytes of uncompressed data, the
+    position in the compressed stream and the last 32 KiB of data
+    needed to resume decompressing there are recorded.  Once the file
+    has been read (or seeked) to its end, seeking anywhere only
+    decompresses the data from the nearest preceding seek point.
+
+    An index can be saved with save() and reused with any GzipFile
+    reading the same file, after it is read back with load().
+    """
+
+    _MAGIC = b'GZIX\x01'
+    _HEADER = struct.Struct('<QQqQ')
+    _POINT = struct.Struct('<QQBBIQI')
+
+    def __init__(self, spacing=_INDEX_SPACING):
+        if spacing <= 0:
+            raise ValueError("spacing must be greater than 0")
+        self.spacing = spacing
+        # Seek points are (uncompressed offset, compressed offset, bits,
+        # crc, member size, window) tuples.  The window is None for the
+        # start of a member, which needs no state to resume.
+        self._points = []
+        self._offsets = []
+        # Uncompressed offset up to which the file has been indexed
+        self._end = 0
+        self._size = None
+
+    def __len__(self):
+        return len(self._points)
+
+    def __repr__(self):
+        return '<%s spacing=%d points=%d%s>' % (
+            type(self).__name__, self.spacing, len(self._points),
+            '' if self._size is None else ' size=%d' % self._size)
+
+    @property
+    def size(self):
+        """Size of the uncompressed data, or None if not indexed yet"""
+        return self._size
+
+    def _accepts(self, uoffset):
+        return uoffset >= self._end and (
+            not self._offsets or
+            uoffset - self._offsets[-1] >= self.spacing)
+
+    def _add(self, point):
+        self._points.append(point)
+        self._offsets.append(point[0])
+
+    def _find(self, uoffset):
+        i = bisect.bisect_right(self._offsets, uoffset)
+        return self._points[i - 1] if i else None
+
+    def save(self, file):
+        """Write the index to the binary file object *file*."""
+        file.write(self._MAGIC)
+        file.write(self._HEADER.pack(
+            self.spacing, self._end,
+            -1 if self._size is None else self._size, len(self._points)))
+        for uoffset, offset, bits, crc, stream_size, window in self._points:
+            if window is None:
+                file.write(self._POINT.pack(uoffset, offset, 0, bits, crc,
+                                            stream_size, 0))
+            else:
+                window = zlib.compress(window)
+                file.write(self._POINT.pack(uoffset, offset, 1, bits, crc,
+                                            stream_size, len(window)))
+                file.write(window)
+
+    @classmethod
+    def load(cls, file):
+        """Read an index written by save() from the binary file object
+        *file*."""
+        def read_exact(n):
+            data = file.read(n)
+            if len(data) != n:
+                raise EOFError("Index file ended unexpectedly")
+            return data
+
+        if read_exact(len(cls._MAGIC)) != cls._MAGIC:
+            raise ValueError("Not a gzip index file")
+        spacing, end, size, count = cls._HEADER.unpack(
+            read_exact(cls._HEADER.size))
+        self = cls(spacing)
+        self._end = end
+        self._size = None if size < 0 else size
+        for i in range(count):
+            (uoffset, offset, kind, bits, crc, stream_size,
+             wlen) = cls._POINT.unpack(read_exact(cls._POINT.size))
+            window = zlib.decompress(read_exact(wlen)) if kind else None
+            self._add((uoffset, offset, bits, crc, stream_size, window))
+        return self
+
+
 class GzipFile(_compression.BaseStream):
     """The GzipFile class simulates most of the methods of a file object with
     the exception of the truncate() method.
@@ -126,7 +241,8 @@ class GzipFile(_compression.BaseStream):
     myfileobj = None
 
     def __init__(self, filename=None, mode=None,
-                 compresslevel=_COMPRESS_LEVEL_BEST, fileobj=None, mtime=None):
+                 compresslevel=_COMPRESS_LEVEL_BEST, fileobj=None, mtime=None,
+                 *, threads=1, index=None):
         """Constructor for the GzipFile class.
 
         At least one of fileobj and filename must be given a
@@ -158,10 +274,24 @@ class GzipFile(_compression.BaseStream):
         to the last modification time field in the stream when compressing.
         If omitted or None, the current time is used.
 
+        The threads argument is the number of threads used for compressing
+        or decompressing; 0 means one per CPU.  When writing with more than
+        one thread, the data is split into blocks compressed in parallel,
+        each primed with the end of the previous block, into a single
+        gzip member.  When reading with more than one thread, the data is
+        decompressed ahead of time in a background thread.  The default
+        is 1.
+
+        The index argument is an optional GzipIndex used for seeking in
+        read mode.  Seek points are added to it while the file is read,
+        and seek() resumes decompressing from the nearest one instead of
+        from the beginning of the file.
+
         """
 
         if mode and ('t' in mode or 'U' in mode):
             raise ValueError("Invalid mode: {!r}".format(mode))
+        threads = _compression.thread_count(threads)
         if mode and 'b' not in mode:
             mode += 'b'
         if fileobj is None:
@@ -177,18 +307,28 @@ class GzipFile(_compression.BaseStream):
 
         if mode.startswith('r'):
             self.mode = READ
-            raw = _GzipReader(fileobj)
+            raw = self._reader = _GzipReader(fileobj, index)
+            if threads > 1:
+                raw = _compression.ReadAheadReader(raw, 2 * threads)
             self._buffer = io.BufferedReader(raw)
             self.name = filename
 
         elif mode.startswith(('w', 'a', 'x')):
+            if index is not None:
+                raise ValueError("index is only supported in read mode")
             self.mode = WRITE
             self._init_write(filename)
-            self.compress = zlib.compressobj(compresslevel,
-                                             zlib.DEFLATED,
-                                             -zlib.MAX_WBITS,
-                                             zlib.DEF_MEM_LEVEL,
-                                             0)
+            if threads > 1:
+                self.compress = _compression.ParallelCompressor(
+                    functools.partial(_compress_block, compresslevel),
+                    threads, _PARALLEL_BLOCK_SIZE,
+                    history_size=_DEFLATE_WINDOW_SIZE)
+            else:
+                self.compress = zlib.compressobj(compresslevel,
+                                                 zlib.DEFLATED,
+                                                 -zlib.MAX_WBITS,
+                                                 zlib.DEF_MEM_LEVEL,
+                                                 0)
             self._write_mtime = mtime
         else:
             raise ValueError("Invalid mode: {!r}".format(mode))
@@ -209,7 +349,7 @@ class GzipFile(_compression.BaseStream):
     @property
     def mtime(self):
         """Last modification time read from stream, or None"""
-        return self._buffer.raw._last_mtime
+        return self._reader._last_mtime
 
     def __repr__(self):
         s = repr(self.fileobj)
@@ -327,7 +467,11 @@ class GzipFile(_compression.BaseStream):
         self._check_not_closed()
         if self.mode == WRITE:
             # Ensure the compressor's buffer is flushed
-            self.fileobj.write(self.compress.flush(zlib_mode))
+            if isinstance(self.compress, _compression.ParallelCompressor):
+                data = self.compress.flush(last=zlib_mode == zlib.Z_FINISH)
+            else:
+                data = self.compress.flush(zlib_mode)
+            self.fileobj.write(data)
             self.fileobj.flush()
 
     def fileno(self):
@@ -379,13 +523,42 @@ class GzipFile(_compression.BaseStream):
         return self._buffer.readline(size)
 
 
+def _compress_block(compresslevel, data, history, last):
+    # Compress a block for ParallelCompressor.  Priming the compressor
+    # with the preceding data lets matches reach back into it, as with a
+    # single compressor.  Non-final blocks end with a sync flush, which
+    # aligns them to a byte boundary, so that the blocks concatenate into
+    # a single deflate stream.
+    if history:
+        compress = zlib.compressobj(compresslevel, zlib.DEFLATED,
+                                    -zlib.MAX_WBITS, zlib.DEF_MEM_LEVEL,
+                                    0, history)
+    else:
+        compress = zlib.compressobj(compresslevel, zlib.DEFLATED,
+                                    -zlib.MAX_WBITS, zlib.DEF_MEM_LEVEL,
+                                    0)
+    return compress.compress(data) + compress.flush(
+        zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+
+
 class _GzipReader(_compression.DecompressReader):
-    def __init__(self, fp):
+    def __init__(self, fp, index=None):
         super().__init__(_PaddedFile(fp), zlib.decompressobj,
                          wbits=-zlib.MAX_WBITS)
         # Set flag indicating start of a new member
         self._new_member = True
         self._last_mtime = None
+        self._index = index
+        self._reset_window()
+
+    def _reset_window(self, window=b''):
+        # The last 32 KiB of decompressed data of the current member are
+        # kept as long as the index is not complete, to record them in
+        # the seek points.
+        if self._index is None or self._index._size is not None:
+            self._window = None
+        else:
+            self._window = bytearray(window)
 
     def _init_read(self):
         self._crc = zlib.crc32(b"")
@@ -465,21 +638,38 @@ class _GzipReader(_compression.DecompressReader):
                 # If the _new_member flag is set, we have to
                 # jump to the next member, if there is one.
                 self._init_read()
+                if self._window is not None:
+                    offset = self._fp.tell()
                 if not self._read_gzip_header():
                     self._size = self._pos
+                    if self._window is not None:
+                        self._index._size = self._pos
+                        self._window = None
                     return b""
                 self._new_member = False
+                if self._window is not None:
+                    self._window = bytearray()
+                    if self._index._accepts(self._pos):
+                        self._index._add((self._pos, offset, 0, 0, 0, None))
 
             # Read a chunk of data from the file
             buf = self._fp.read(io.DEFAULT_BUFFER_SIZE)
 
-            uncompress = self._decompressor.decompress(buf, size)
+            if self._window is None:
+                uncompress = self._decompressor.decompress(buf, size)
+            else:
+                # Stop at the end of each deflate block, where decompression
+                # can be resumed given the preceding 32 KiB of data.
+                uncompress = self._decompressor.decompress(
+                    buf, size, mode=zlib.Z_BLOCK)
             if self._decompressor.unconsumed_tail != b"":
                 self._fp.prepend(self._decompressor.unconsumed_tail)
             elif self._decompressor.unused_data != b"":
                 # Prepend the already read bytes to the fileobj so they can
                 # be seen by _read_eof() and _read_gzip_header()
                 self._fp.prepend(self._decompressor.unused_data)
+            if self._window is not None:
+                self._index_block(uncompress)
 
             if uncompress != b"":
                 break
@@ -489,8 +679,23 @@ class _GzipReader(_compression.DecompressReader):
 
         self._add_read_data( uncompress )
         self._pos += len(uncompress)
+        if self._window is not None and self._pos > self._index._end:
+            self._index._end = self._pos
         return uncompress
 
+    def _index_block(self, data):
+        window = self._window
+        window += data
+        del window[:-_DEFLATE_WINDOW_SIZE]
+        data_type = self._decompressor.data_type
+        if not data_type & 128 or data_type & 64 or self._decompressor.eof:
+            return  # Not at a block boundary
+        pos = self._pos + len(data)
+        if self._index._accepts(pos):
+            self._index._add((pos, self._fp.tell(), data_type & 7,
+                              zlib.crc32(data, self._crc),
+                              self._stream_size + len(data), bytes(window)))
+
     def _add_read_data(self, data):
         self._crc = zlib.crc32(data, self._crc)
         self._stream_size = self._stream_size + len(data)
@@ -519,6 +724,58 @@ class _GzipReader(_compression.DecompressReader):
     def _rewind(self):
         super()._rewind()
         self._new_member = True
+        self._reset_window()
+
+    def _restore(self, point):
+        # Resume decompressing at a seek point of the index.
+        uoffset, offset, bits, crc, stream_size, window = point
+        self._eof = False
+        self._pos = uoffset
+        self._reset_window(window or b'')
+        if window is None:
+            self._fp.seek(offset)
+            self._new_member = True
+            self._decompressor = self._decomp_factory(**self._decomp_args)
+            return
+        self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS,
+                                                zdict=window)
+        if bits:
+            # The block starts in the middle of the previous byte.
+            self._fp.seek(offset - 1)
+            byte = self._read_exact(1)[0]
+            self._decompressor.prime(bits, byte >> (8 - bits))
+        else:
+            self._fp.seek(offset)
+        self._new_member = False
+        self._crc = crc
+        self._stream_size = stream_size
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if self._index is None:
+            return super().seek(offset, whence)
+        # Recalculate offset as an absolute file position.
+        if whence == io.SEEK_SET:
+            pass
+        elif whence == io.SEEK_CUR:
+            offset = self._pos + offset
+        elif whence == io.SEEK_END:
+            if self._size < 0:
+                if self._index._size is not None:
+                    self._size = self._index._size
+                else:
+                    self._restore_nearest(self._index._end)
+                    while self.read(io.DEFAULT_BUFFER_SIZE):
+                        pass
+            offset = self._size + offset
+        else:
+            raise ValueError("Invalid value for whence: {}".format(whence))
+        self._restore_nearest(offset)
+        return super().seek(offset)
+
+    def _restore_nearest(self, offset):
+        point = self._index._find(offset)
+        if point is not None and (offset < self._pos or point[0] > self._pos):
+            self._restore(point)
 
 def compress(data, compresslevel=_COMPRESS_LEVEL_BEST, *, mtime=None):
     """Compress data in one shot and return the compressed string.
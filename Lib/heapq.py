@@ -125,7 +125,7 @@ From all times, sorting has always been a Great Art! :-)
 """
 
 __all__ = ['heappush', 'heappop', 'heapify', 'heapreplace', 'merge',
-           'nlargest', 'nsmallest', 'heappushpop']
+           'nlargest', 'nsmallest', 'heappushpop', 'IndexedHeap']
 
 def heappush(heap, item):
     """Push item onto heap, maintaining the heap invariant."""
@@ -576,6 +576,147 @@ def nlargest(n, iterable, key=None):
     result.sort(reverse=True)
     return [elem for (k, order, elem) in result]
 
+class HeapHandle:
+    """Handle of an item pushed on an IndexedHeap."""
+
+    __slots__ = ('_item', '_index')
+
+    def __init__(self, item, index):
+        self._item = item
+        self._index = index         # -1 once removed from the heap
+
+    @property
+    def item(self):
+        """The item the handle refers to."""
+        return self._item
+
+
+class IndexedHeap:
+    """Heap whose items can be removed or changed through handles.
+
+    push() returns a handle which can later be passed to remove() or
+    update(), both taking O(log n) time, like push() and pop().  The
+    items are compared with the < operator, as for heappush().
+
+    >>> heap = IndexedHeap([5, 1, 4])
+    >>> handle = heap.push(3)
+    >>> heap.update(handle, 0)
+    >>> heap.pop(), heap.pop()
+    (0, 1)
+    """
+
+    def __init__(self, iterable=()):
+        self._heap = heap = [HeapHandle(item, index)
+                             for index, item in enumerate(iterable)]
+        for i in reversed(range(len(heap)//2)):
+            self._siftup(i)
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __iter__(self):
+        """Iterate over the items in arbitrary order."""
+        return iter([handle._item for handle in self._heap])
+
+    def __contains__(self, handle):
+        if not isinstance(handle, HeapHandle):
+            return False
+        index = handle._index
+        return 0 <= index < len(self._heap) and self._heap[index] is handle
+
+    def push(self, item):
+        """Push item onto the heap and return its handle."""
+        heap = self._heap
+        handle = HeapHandle(item, len(heap))
+        heap.append(handle)
+        self._siftdown(0, handle._index)
+        return handle
+
+    def peek(self):
+        """Return the smallest item without removing it."""
+        if not self._heap:
+            raise IndexError('peek at empty heap')
+        return self._heap[0]._item
+
+    def pop(self):
+        """Remove and return the smallest item."""
+        if not self._heap:
+            raise IndexError('pop from empty heap')
+        return self._remove(0)
+
+    def remove(self, handle):
+        """Remove the item of handle from the heap and return it."""
+        if handle not in self:
+            raise ValueError('handle is not in the heap')
+        return self._remove(handle._index)
+
+    def update(self, handle, item):
+        """Replace the item of handle and restore the heap invariant."""
+        if handle not in self:
+            raise ValueError('handle is not in the heap')
+        handle._item = item
+        self._siftup(handle._index)
+        self._siftdown(0, handle._index)
+
+    def clear(self):
+        """Remove all items."""
+        for handle in self._heap:
+            handle._index = -1
+        self._heap.clear()
+
+    def _remove(self, pos):
+        heap = self._heap
+        last = heap.pop()
+        if pos < len(heap):
+            handle = heap[pos]
+            heap[pos] = last
+            last._index = pos
+            self._siftup(pos)
+            self._siftdown(0, last._index)
+        else:
+            handle = last
+        handle._index = -1
+        return handle._item
+
+    # Same algorithms as _siftdown() and _siftup() on a list of handles,
+    # keeping the index of each handle up to date.
+
+    def _siftdown(self, startpos, pos):
+        heap = self._heap
+        newhandle = heap[pos]
+        newitem = newhandle._item
+        while pos > startpos:
+            parentpos = (pos - 1) >> 1
+            parent = heap[parentpos]
+            if newitem < parent._item:
+                heap[pos] = parent
+                parent._index = pos
+                pos = parentpos
+                continue
+            break
+        heap[pos] = newhandle
+        newhandle._index = pos
+
+    def _siftup(self, pos):
+        heap = self._heap
+        endpos = len(heap)
+        startpos = pos
+        newhandle = heap[pos]
+        childpos = 2*pos + 1
+        while childpos < endpos:
+            rightpos = childpos + 1
+            if (rightpos < endpos and
+                    not heap[childpos]._item < heap[rightpos]._item):
+                childpos = rightpos
+            child = heap[childpos]
+            heap[pos] = child
+            child._index = pos
+            pos = childpos
+            childpos = 2*pos + 1
+        heap[pos] = newhandle
+        newhandle._index = pos
+        self._siftdown(startpos, pos)
+
 # If available, use C implementation
 try:
     from _heapq import *
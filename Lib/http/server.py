@@ -83,8 +83,11 @@ XXX To do:
 __version__ = "0.6"
 
 __all__ = [
-    "HTTPServer", "ThreadingHTTPServer", "BaseHTTPRequestHandler",
+    "HTTPServer", "ThreadingHTTPServer", "ThreadPoolHTTPServer",
+    "BaseHTTPRequestHandler",
     "SimpleHTTPRequestHandler", "CGIHTTPRequestHandler",
+    "AsyncHTTPServer", "AsyncHTTPRequestHandler",
+    "AsyncSimpleHTTPRequestHandler",
 ]
 
 import copy
@@ -144,6 +147,17 @@ class ThreadingHTTPServer(socketserver.ThreadingMixIn, HTTPServer):
     daemon_threads = True
 
 
+class ThreadPoolHTTPServer(socketserver.ThreadPoolMixIn, HTTPServer):
+    daemon_threads = True
+
+
+if hasattr(os, "fork"):
+    __all__.append("PreforkHTTPServer")
+
+    class PreforkHTTPServer(socketserver.PreforkMixIn, HTTPServer):
+        pass
+
+
 class BaseHTTPRequestHandler(socketserver.StreamRequestHandler):
 
     """HTTP request handler base class.
@@ -682,6 +696,7 @@ class SimpleHTTPRequestHandler(BaseHTTPRequestHandler):
                              parts[3], parts[4])
                 new_url = urllib.parse.urlunsplit(new_parts)
                 self.send_header("Location", new_url)
+                self.send_header("Content-Length", "0")
                 self.end_headers()
                 return None
             for index in "index.html", "index.htm":
@@ -728,17 +743,20 @@ class SimpleHTTPRequestHandler(BaseHTTPRequestHandler):
                             f.close()
                             return None
 
-            self.send_response(HTTPStatus.OK)
-            self.send_header("Content-type", ctype)
-            self.send_header("Content-Length", str(fs[6]))
-            self.send_header("Last-Modified",
-                self.date_time_string(fs.st_mtime))
-            self.end_headers()
-            return f
+            return self._send_file_head(f, fs, ctype)
         except:
             f.close()
             raise
 
+    def _send_file_head(self, f, fs, ctype):
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-type", ctype)
+        self.send_header("Content-Length", str(fs[6]))
+        self.send_header("Last-Modified",
+            self.date_time_string(fs.st_mtime))
+        self.end_headers()
+        return f
+
     def list_directory(self, path):
         """Helper to produce a directory listing (absent index.html).
 
@@ -878,6 +896,376 @@ class SimpleHTTPRequestHandler(BaseHTTPRequestHandler):
         })
 
 
+class AsyncHTTPServer:
+
+    """HTTP server running on an asyncio event loop.
+
+    Connections are handled by tasks of the event loop rather than by
+    threads.  RequestHandlerClass is called with the stream reader and
+    writer of each connection and the server, and is normally a subclass
+    of AsyncHTTPRequestHandler.
+
+    Example:
+
+        async def main():
+            async with AsyncHTTPServer(('', 8000),
+                                       AsyncSimpleHTTPRequestHandler) as httpd:
+                await httpd.serve_forever()
+
+        asyncio.run(main())
+
+    """
+
+    def __init__(self, server_address, RequestHandlerClass, *, ssl=None):
+        self.server_address = server_address
+        self.RequestHandlerClass = RequestHandlerClass
+        self.ssl = ssl
+        self._server = None
+
+    async def start(self):
+        """Start listening for connections."""
+        import asyncio
+        host, port = self.server_address[:2]
+        self._server = await asyncio.start_server(
+            self._handle_connection, host or None, port, ssl=self.ssl,
+            reuse_address=True)
+        self.server_address = self._server.sockets[0].getsockname()
+        host, port = self.server_address[:2]
+        self.server_name = socket.getfqdn(host)
+        self.server_port = port
+
+    async def serve_forever(self):
+        """Handle connections until the server is closed or the task is
+        cancelled."""
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    def close(self):
+        """Stop listening for connections."""
+        if self._server is not None:
+            self._server.close()
+
+    async def wait_closed(self):
+        """Wait until the server is closed."""
+        if self._server is not None:
+            await self._server.wait_closed()
+
+    async def __aenter__(self):
+        if self._server is None:
+            await self.start()
+        return self
+
+    async def __aexit__(self, *args):
+        self.close()
+        await self.wait_closed()
+
+    async def _handle_connection(self, reader, writer):
+        client_address = writer.get_extra_info('peername')
+        try:
+            handler = self.RequestHandlerClass(reader, writer, self)
+            await handler.handle()
+        except ConnectionError:
+            pass
+        except Exception:
+            self.handle_error(writer, client_address)
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    def handle_error(self, writer, client_address):
+        """Handle an error gracefully.  May be overridden.
+
+        The default is to print a traceback and continue.
+
+        """
+        print('-'*40, file=sys.stderr)
+        print('Exception happened during processing of request from',
+            client_address, file=sys.stderr)
+        import traceback
+        traceback.print_exc()
+        print('-'*40, file=sys.stderr)
+
+
+class AsyncHTTPRequestHandler(BaseHTTPRequestHandler):
+
+    """HTTP request handler for AsyncHTTPServer.
+
+    A handler is created for each connection and handles its requests
+    one after another, so that the requests pipelined by a client are
+    answered in order.  The request line and headers are parsed by
+    BaseHTTPRequestHandler.parse_request().  The body of the request is
+    then read, decoding the chunked transfer coding, so that rfile
+    holds it when do_SPAM() is called.
+
+    do_SPAM() methods may be coroutine functions.  What they write to
+    wfile is sent once they return, or when they await flush().
+
+    The connection is kept alive between requests when the client
+    supports it; since protocol_version is HTTP/1.1, each response must
+    then have a Content-Length header.  If timeout is not None, a
+    connection idle for timeout seconds is closed.
+
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    # The body of a request is held in memory: larger bodies are refused
+    # with a 413 error.  None means no limit.
+    max_body_size = 64 * 1024 * 1024
+
+    def __init__(self, reader, writer, server):
+        self.reader = reader
+        self.writer = writer
+        self.server = server
+        self.connection = self.request = writer.get_extra_info('socket')
+        self.client_address = writer.get_extra_info('peername')
+        self.rfile = io.BytesIO()
+        self.wfile = io.BytesIO()
+
+    async def handle(self):
+        """Handle requests until the connection is closed."""
+        self.close_connection = True
+
+        await self.handle_one_request()
+        while not self.close_connection:
+            await self.handle_one_request()
+
+    async def handle_one_request(self):
+        """Handle a single HTTP request."""
+        import asyncio
+        try:
+            try:
+                self.raw_requestline = await asyncio.wait_for(
+                    self.reader.readline(), self.timeout)
+            except ValueError:
+                # The line exceeds the limit of the stream.
+                self.raw_requestline = b'x' * 65537
+            except asyncio.TimeoutError:
+                self.close_connection = True
+                return
+            if len(self.raw_requestline) > 65536:
+                self.requestline = ''
+                self.request_version = ''
+                self.command = ''
+                self.send_error(HTTPStatus.REQUEST_URI_TOO_LONG)
+                return
+            if not self.raw_requestline:
+                self.close_connection = True
+                return
+            lines = []
+            line_too_long = False
+            while len(lines) <= http.client._MAXHEADERS:
+                try:
+                    line = await self.reader.readline()
+                except ValueError:
+                    line_too_long = True
+                    break
+                lines.append(line)
+                if line in (b'\r\n', b'\n', b''):
+                    break
+            self.rfile = io.BytesIO(b''.join(lines))
+            if not self.parse_request():
+                return
+            if line_too_long:
+                self.send_error(
+                    HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
+                    "Line too long")
+                return
+            # Send the 100 Continue response if any before reading the body.
+            await self.flush()
+            body = await self.read_body()
+            if body is None:
+                return
+            self.rfile = io.BytesIO(body)
+            mname = 'do_' + self.command
+            if not hasattr(self, mname):
+                self.send_error(
+                    HTTPStatus.NOT_IMPLEMENTED,
+                    "Unsupported method (%r)" % self.command)
+                return
+            method = getattr(self, mname)
+            result = method()
+            if asyncio.iscoroutine(result):
+                await result
+        except asyncio.IncompleteReadError:
+            self.close_connection = True
+        finally:
+            await self.flush()
+
+    async def read_body(self):
+        """Read the body of the request.
+
+        Return it as bytes, or return None after sending an error
+        response or if the client closed the connection.
+
+        """
+        import asyncio
+        try:
+            return await self._read_body()
+        except asyncio.IncompleteReadError:
+            self.close_connection = True
+            return None
+
+    async def _read_body(self):
+        max_size = self.max_body_size
+        encoding = self.headers.get('Transfer-Encoding', '').lower()
+        if encoding and encoding != 'identity':
+            if encoding != 'chunked':
+                self.send_error(
+                    HTTPStatus.NOT_IMPLEMENTED,
+                    "Unsupported transfer encoding (%r)" % encoding)
+                return None
+            chunks = []
+            total = 0
+            while True:
+                line = await self.reader.readline()
+                try:
+                    size = int(line.split(b';', 1)[0], 16)
+                    if size < 0:
+                        raise ValueError
+                except ValueError:
+                    self.send_error(HTTPStatus.BAD_REQUEST,
+                                    "Bad chunk size (%r)" % line)
+                    return None
+                if size == 0:
+                    break
+                total += size
+                if max_size is not None and total > max_size:
+                    self.send_error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+                    return None
+                chunks.append(await self.reader.readexactly(size))
+                await self.reader.readline()
+            # Skip the trailer.
+            while True:
+                line = await self.reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+            return b''.join(chunks)
+        length = self.headers.get('Content-Length')
+        if length is None:
+            return b''
+        try:
+            length = int(length)
+            if length < 0:
+                raise ValueError
+        except ValueError:
+            self.send_error(HTTPStatus.BAD_REQUEST,
+                            "Bad Content-Length (%r)" % length)
+            return None
+        if max_size is not None and length > max_size:
+            self.send_error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+            return None
+        return await self.reader.readexactly(length)
+
+    async def flush(self):
+        """Send what was written to wfile."""
+        data = self.wfile.getvalue()
+        if data:
+            self.wfile.seek(0)
+            self.wfile.truncate()
+            self.writer.write(data)
+            await self.writer.drain()
+
+
+class AsyncSimpleHTTPRequestHandler(AsyncHTTPRequestHandler,
+                                    SimpleHTTPRequestHandler):
+
+    """Simple HTTP request handler for AsyncHTTPServer.
+
+    This serves files like SimpleHTTPRequestHandler, sending them with
+    loop.sendfile().  It also answers requests for a single byte range
+    of a file (Range header) with a partial content response.
+
+    """
+
+    def __init__(self, reader, writer, server, *, directory=None):
+        if directory is None:
+            directory = os.getcwd()
+        self.directory = directory
+        AsyncHTTPRequestHandler.__init__(self, reader, writer, server)
+
+    async def do_GET(self):
+        """Serve a GET request."""
+        import asyncio
+        f = self.send_head()
+        if f:
+            try:
+                await self.flush()
+                offset, count = self._range
+                loop = asyncio.get_running_loop()
+                await loop.sendfile(self.writer.transport, f, offset, count)
+            finally:
+                f.close()
+
+    def send_head(self):
+        # Range of the file to send, as (offset, count).
+        self._range = 0, None
+        return super().send_head()
+
+    def _send_file_head(self, f, fs, ctype):
+        size = fs.st_size
+        byte_range = _parse_byte_range(self.headers.get('Range'), size)
+        if byte_range is None:
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Length", str(size))
+        else:
+            start, stop = byte_range
+            if start >= size:
+                self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                self.send_header("Content-Range", "bytes */%d" % size)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                f.close()
+                return None
+            self.send_response(HTTPStatus.PARTIAL_CONTENT)
+            self.send_header("Content-Range",
+                             "bytes %d-%d/%d" % (start, stop - 1, size))
+            self.send_header("Content-Length", str(stop - start))
+            self._range = start, stop - start
+        self.send_header("Content-type", ctype)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Last-Modified",
+            self.date_time_string(fs.st_mtime))
+        self.end_headers()
+        return f
+
+
+def _parse_byte_range(value, size):
+    """Parse the value of a Range header for a resource of size bytes.
+
+    Return (start, stop) for a single byte range, with start >= size if
+    the range cannot be satisfied, or None if the header is absent,
+    invalid or asks for several ranges.
+
+    """
+    if value is None:
+        return None
+    unit, sep, spec = value.partition('=')
+    if unit.strip().lower() != 'bytes' or ',' in spec:
+        return None
+    first, sep, last = spec.strip().partition('-')
+    if not sep or not last.isascii() or not first.isascii():
+        return None
+    if first:
+        if not first.isdigit() or (last and not last.isdigit()):
+            return None
+        start = int(first)
+        stop = int(last) + 1 if last else size
+        if stop <= start:
+            return None if last else (start, start)
+        return start, min(stop, size)
+    if not last.isdigit():
+        return None
+    suffix = int(last)
+    if not suffix:
+        return size, size
+    return max(0, size - suffix), size
+
+
 # Utilities for CGIHTTPRequestHandler
 
 def _url_collapse_path(path):
@@ -603,6 +603,106 @@ def _code_to_hash_pyc(code, source_hash, checked=True):
     return data
 
 
+# Code caches hold the compiled code of all the modules under a sys.path
+# entry in a single file, which is read at once instead of opening one pyc
+# per module.  They are built by compileall and used if Python is run with
+# -X codecache or PYTHONCODECACHE set.
+_CODE_CACHE_NAME = '__codecache__'
+_CODE_CACHE_SUFFIX = '.cache'
+_CODE_CACHE_MAGIC = b'PYCA'
+
+# Maps the sys.path entries already looked at to the path of their code
+# cache, or None.
+_code_caches = {}
+
+# Maps source paths to the (mtime, source size, marshalled code, cache path)
+# found for them in the code caches.
+_cached_code = {}
+
+
+def _use_code_caches():
+    """Return True if code caches were enabled with -X codecache or the
+    PYTHONCODECACHE environment variable."""
+    if 'codecache' in sys._xoptions:
+        return True
+    if sys.platform.startswith(_CASE_INSENSITIVE_PLATFORMS_STR_KEY):
+        key = 'PYTHONCODECACHE'
+    else:
+        key = b'PYTHONCODECACHE'
+    return not sys.flags.ignore_environment and key in _os.environ
+
+
+def _code_cache_path(directory, optimization=None):
+    """Return the path of the code cache of a directory.
+
+    The optimization parameter has the same meaning as for cache_from_source.
+    """
+    path = cache_from_source(
+        _path_join(directory, _CODE_CACHE_NAME + SOURCE_SUFFIXES[0]),
+        optimization=optimization)
+    return path[:-len(BYTECODE_SUFFIXES[0])] + _CODE_CACHE_SUFFIX
+
+
+def _code_to_code_cache(entries):
+    """Produce the data for a code cache.
+
+    entries maps the paths of the source files relative to the directory of
+    the cache, with '/' separators, to (mtime, source size, code) tuples.
+    """
+    index = {}
+    chunks = []
+    offset = 0
+    for name, (mtime, source_size, code) in entries.items():
+        data = marshal.dumps(code)
+        index[name] = (mtime, source_size, offset, len(data))
+        chunks.append(data)
+        offset += len(data)
+    index_data = marshal.dumps(index)
+    data = bytearray(_CODE_CACHE_MAGIC)
+    data.extend(MAGIC_NUMBER)
+    data.extend(_pack_uint32(len(index_data)))
+    data.extend(index_data)
+    for chunk in chunks:
+        data.extend(chunk)
+    return data
+
+
+def _load_code_cache(entry):
+    """Read the code cache of a sys.path entry, if any, and return its path."""
+    directory = entry
+    if not directory:
+        try:
+            directory = _os.getcwd()
+        except FileNotFoundError:
+            return None
+    try:
+        path = _code_cache_path(directory)
+        with _io.FileIO(path, 'r') as file:
+            data = file.read()
+    except (NotImplementedError, OSError):
+        return None
+    if data[:8] != _CODE_CACHE_MAGIC + MAGIC_NUMBER:
+        _bootstrap._verbose_message('bad magic number in {!r}', path)
+        return None
+    view = memoryview(data)
+    start = 12 + _unpack_uint32(data[8:12])
+    try:
+        index = marshal.loads(view[12:start])
+        entries = [(_path_join(directory, name.replace('/', path_sep)),
+                    mtime, source_size, view[start+offset:start+offset+size])
+                   for name, (mtime, source_size, offset, size)
+                   in index.items()]
+    except (EOFError, ValueError, TypeError, AttributeError):
+        _bootstrap._verbose_message('bad index in {!r}', path)
+        return None
+    for source_path, mtime, source_size, code_data in entries:
+        if source_path not in _cached_code:
+            _cached_code[source_path] = (mtime, source_size, code_data, path)
+    _bootstrap._verbose_message('code cache {!r} holds {} modules', path,
+                                len(entries))
+    return path
+
+
 def decode_source(source_bytes):
     """Decode bytes representing source code and return the string.
 
@@ -864,6 +964,14 @@ class SourceLoader(_LoaderBasics):
                 pass
             else:
                 source_mtime = int(st['mtime'])
+                cached = _cached_code.get(source_path)
+                if (cached is not None and cached[0] == source_mtime and
+                        cached[1] == st.get('size')):
+                    _bootstrap._verbose_message('{} matches {}', cached[3],
+                                                source_path)
+                    return _compile_bytecode(cached[2], name=fullname,
+                                             bytecode_path=cached[3],
+                                             source_path=source_path)
                 try:
                     data = self.get_data(bytecode_path)
                 except OSError:
@@ -1230,6 +1338,8 @@ class PathFinder:
     def invalidate_caches(cls):
         """Call the invalidate_caches() method on all path entry finders
         stored in sys.path_importer_caches (where implemented)."""
+        _code_caches.clear()
+        _cached_code.clear()
         for name, finder in list(sys.path_importer_cache.items()):
             if finder is None:
                 del sys.path_importer_cache[name]
@@ -1326,6 +1436,10 @@ class PathFinder:
         """
         if path is None:
             path = sys.path
+            if _use_code_caches():
+                for entry in path:
+                    if isinstance(entry, str) and entry not in _code_caches:
+                        _code_caches[entry] = _load_code_cache(entry)
         spec = cls._get_spec(fullname, path, target)
         if spec is None:
             return None
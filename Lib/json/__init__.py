@@ -97,13 +97,13 @@ Using json.tool from the shell to validate and pretty-print::
 """
 __version__ = '2.0.9'
 __all__ = [
-    'dump', 'dumps', 'load', 'loads',
-    'JSONDecoder', 'JSONDecodeError', 'JSONEncoder',
+    'dump', 'dumps', 'load', 'loads', 'iterload',
+    'JSONDecoder', 'JSONDecodeError', 'JSONEncoder', 'JSONStreamDecoder',
 ]
 
 __author__ = 'Bob Ippolito <bob@redivi.com>'
 
-from .decoder import JSONDecoder, JSONDecodeError
+from .decoder import JSONDecoder, JSONDecodeError, JSONStreamDecoder
 from .encoder import JSONEncoder
 import codecs
 
@@ -166,18 +166,19 @@ def dump(obj, fp, *, skipkeys=False, ensure_ascii=True, check_circular=True,
         check_circular and allow_nan and
         cls is None and indent is None and separators is None and
         default is None and not sort_keys and not kw):
-        iterable = _default_encoder.iterencode(obj)
+        encoder = _default_encoder
     else:
         if cls is None:
             cls = JSONEncoder
-        iterable = cls(skipkeys=skipkeys, ensure_ascii=ensure_ascii,
+        encoder = cls(skipkeys=skipkeys, ensure_ascii=ensure_ascii,
             check_circular=check_circular, allow_nan=allow_nan, indent=indent,
             separators=separators,
-            default=default, sort_keys=sort_keys, **kw).iterencode(obj)
-    # could accelerate with writelines in some versions of Python, at
-    # a debuggability cost
-    for chunk in iterable:
-        fp.write(chunk)
+            default=default, sort_keys=sort_keys, **kw)
+    if isinstance(encoder, JSONEncoder):
+        encoder._dump(obj, fp)
+    else:
+        for chunk in encoder.iterencode(obj):
+            fp.write(chunk)
 
 
 def dumps(obj, *, skipkeys=False, ensure_ascii=True, check_circular=True,
@@ -240,6 +241,9 @@ def dumps(obj, *, skipkeys=False, ensure_ascii=True, check_circular=True,
 
 _default_decoder = JSONDecoder(object_hook=None, object_pairs_hook=None)
 
+# Size of the chunks read by iterload()
+_ITERLOAD_CHUNK_SIZE = 64 * 1024
+
 
 def detect_encoding(b):
     bstartswith = b.startswith
@@ -359,3 +363,46 @@ def loads(s, *, encoding=None, cls=None, object_hook=None, parse_float=None,
     if parse_constant is not None:
         kw['parse_constant'] = parse_constant
     return cls(**kw).decode(s)
+
+
+def iterload(fp, *, items=False, cls=None, object_hook=None,
+        parse_float=None, parse_int=None, parse_constant=None,
+        object_pairs_hook=None, **kw):
+    """Incrementally deserialize ``fp`` (a ``.read()``-supporting file-like
+    object containing a stream of JSON documents separated by whitespace,
+    e.g. newline-delimited JSON) and return an iterator over the resulting
+    Python objects.  ``fp`` is read by chunks, so that the whole stream is
+    never held in memory.
+
+    If ``items`` is true, each document must be an array, and its items are
+    returned one by one instead of the array itself.
+
+    The other arguments have the same meaning as in ``load()``.
+    """
+    if (cls is None and object_hook is None and
+            parse_int is None and parse_float is None and
+            parse_constant is None and object_pairs_hook is None and not kw):
+        decoder = _default_decoder
+    else:
+        if cls is None:
+            cls = JSONDecoder
+        if object_hook is not None:
+            kw['object_hook'] = object_hook
+        if object_pairs_hook is not None:
+            kw['object_pairs_hook'] = object_pairs_hook
+        if parse_float is not None:
+            kw['parse_float'] = parse_float
+        if parse_int is not None:
+            kw['parse_int'] = parse_int
+        if parse_constant is not None:
+            kw['parse_constant'] = parse_constant
+        decoder = cls(**kw)
+    stream_decoder = JSONStreamDecoder(items=items, decoder=decoder)
+    while True:
+        data = fp.read(_ITERLOAD_CHUNK_SIZE)
+        if not data:
+            break
+        stream_decoder.feed(data)
+        yield from stream_decoder.read_values()
+    stream_decoder.close()
+    yield from stream_decoder.read_values()
@@ -1,14 +1,20 @@
 """Implementation of JSONDecoder
 """
+import codecs
 import re
+from collections import deque
 
 from json import scanner
 try:
     from _json import scanstring as c_scanstring
 except ImportError:
     c_scanstring = None
+try:
+    from _json import scan_structure as c_scan_structure
+except ImportError:
+    c_scan_structure = None
 
-__all__ = ['JSONDecoder', 'JSONDecodeError']
+__all__ = ['JSONDecoder', 'JSONDecodeError', 'JSONStreamDecoder']
 
 FLAGS = re.VERBOSE | re.MULTILINE | re.DOTALL
 
@@ -354,3 +360,225 @@ class JSONDecoder(object):
         except StopIteration as err:
             raise JSONDecodeError("Expecting value", s, err.value) from None
         return obj, end
+
+
+STRUCTURE = re.compile(r'[^"\[\]{}]*', FLAGS)
+STRINGBODY = re.compile(r'[^"\\]*', FLAGS)
+
+def py_scan_structure(s, end, depth=0, state=0,
+        _structure=STRUCTURE.match, _stringbody=STRINGBODY.match):
+    """Scan the string s from index end, following the nesting of JSON
+    arrays, objects and strings without decoding them.  depth is the number
+    of arrays and objects currently open and state is 0 outside strings,
+    1 inside a string and 2 after a backslash inside a string.
+
+    Returns a tuple of the index after the character which completes the
+    value being scanned (the closing bracket or quote bringing depth back
+    to 0), the depth and the state.  The index is -1 if s ends before the
+    value does; scanning the rest of the value can then be resumed with the
+    returned depth and state.
+    """
+    n = len(s)
+    while end < n:
+        if state == 2:
+            end += 1
+            state = 1
+        elif state == 1:
+            end = _stringbody(s, end).end()
+            if end == n:
+                break
+            if s[end] == '\\':
+                state = 2
+            else:
+                state = 0
+                if depth == 0:
+                    return end + 1, 0, 0
+            end += 1
+        else:
+            end = _structure(s, end).end()
+            if end == n:
+                break
+            c = s[end]
+            end += 1
+            if c == '"':
+                state = 1
+            elif c in '[{':
+                depth += 1
+            else:
+                depth -= 1
+                if depth <= 0:
+                    return end, 0, 0
+    return -1, depth, state
+
+scan_structure = c_scan_structure or py_scan_structure
+
+# Characters which can be part of a number or of a constant
+SCALAR = re.compile(r'[-+.0-9A-Za-z]*', FLAGS)
+
+
+class JSONStreamDecoder(object):
+    """Incremental decoder for a stream of JSON documents.
+
+    Data is pushed with ``feed()`` as it becomes available, and the
+    documents completed so far are pulled with ``read_values()``.  The
+    documents may be separated by any amount of whitespace, so that
+    newline-delimited JSON is supported.
+
+    If ``items`` is true, each document must be an array, and its items are
+    returned one by one instead of the array itself, so that a huge array
+    of objects can be decoded without holding all of it in memory.
+
+    ``decoder`` is the ``JSONDecoder`` instance used to decode the values.
+    """
+
+    def __init__(self, *, items=False, decoder=None):
+        if decoder is None:
+            decoder = JSONDecoder()
+        self._raw_decode = decoder.raw_decode
+        self._items = items
+        self._values = deque()
+        # Text not consumed yet starts at self._buffer[self._pos].  While
+        # the value starting there is incomplete, the text fed afterwards is
+        # only scanned (resuming from the (depth, state) in self._scan) and
+        # kept in self._pending, to avoid copying the buffer at each feed().
+        self._buffer = ''
+        self._pos = 0
+        self._pending = []
+        self._scan = None
+        # With items, 0: expecting '[', 1: expecting an item or ']',
+        # 2: expecting an item, 3: expecting ',' or ']'
+        self._array = 0
+        self._bytes = b''
+        self._bytes_decoder = None
+        self._start = True
+        self._closed = False
+
+    def feed(self, data):
+        """Feed data (a ``str``, ``bytes`` or ``bytearray``) to the decoder.
+
+        The encoding of binary data is detected as for ``json.loads()``.
+        """
+        if self._closed:
+            raise ValueError("feed() called after close()")
+        if isinstance(data, str):
+            text = data
+        elif isinstance(data, (bytes, bytearray)):
+            text = self._decode_bytes(data, False)
+        else:
+            raise TypeError(f'the JSON data must be str, bytes or bytearray, '
+                            f'not {data.__class__.__name__}')
+        if not text:
+            return
+        if self._start:
+            self._start = False
+            if text.startswith('\ufeff'):
+                raise JSONDecodeError("Unexpected UTF-8 BOM "
+                                      "(decode using utf-8-sig)", text, 0)
+        if self._scan is not None:
+            end, depth, state = scan_structure(text, 0, *self._scan)
+            if end < 0:
+                self._scan = depth, state
+                self._pending.append(text)
+                return
+        self._pending.append(text)
+        self._flush_pending()
+        self._parse(False)
+
+    def read_values(self):
+        """Return an iterator over the values decoded since the last call.
+
+        Values are removed from the decoder as they are returned.
+        """
+        values = self._values
+        while values:
+            yield values.popleft()
+
+    def close(self):
+        """Signal the end of the stream.
+
+        Raises ``JSONDecodeError`` if the stream ends with an incomplete
+        document.  The remaining values can still be retrieved with
+        ``read_values()``.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._bytes or self._bytes_decoder is not None:
+            self._pending.append(self._decode_bytes(b'', True))
+        self._flush_pending()
+        self._parse(True)
+        s = self._buffer
+        pos = self._pos
+        if pos < len(s):
+            # Raises the appropriate error for the incomplete value
+            self._raw_decode(s, pos)
+        if self._array == 3:
+            raise JSONDecodeError("Expecting ',' delimiter", s, len(s))
+        elif self._array:
+            raise JSONDecodeError("Expecting value", s, len(s))
+
+    def _decode_bytes(self, data, final):
+        if self._bytes_decoder is None:
+            data = self._bytes = self._bytes + data
+            # Four bytes are needed to detect the encoding
+            if len(data) < 4 and not final:
+                return ''
+            from json import detect_encoding
+            self._bytes_decoder = codecs.getincrementaldecoder(
+                detect_encoding(data))('surrogatepass')
+            self._bytes = b''
+        return self._bytes_decoder.decode(data, final)
+
+    def _flush_pending(self):
+        self._buffer = self._buffer[self._pos:] + ''.join(self._pending)
+        self._pos = 0
+        self._pending = []
+        self._scan = None
+
+    def _parse(self, final, _w=WHITESPACE.match, _scalar=SCALAR.match):
+        s = self._buffer
+        pos = self._pos
+        n = len(s)
+        try:
+            while True:
+                pos = _w(s, pos).end()
+                if pos == n:
+                    break
+                nextchar = s[pos]
+                if self._items:
+                    array = self._array
+                    if array == 0:
+                        if nextchar != '[':
+                            raise JSONDecodeError("Expecting '['", s, pos)
+                        self._array = 1
+                        pos += 1
+                        continue
+                    elif array == 3:
+                        if nextchar == ',':
+                            self._array = 2
+                        elif nextchar == ']':
+                            self._array = 0
+                        else:
+                            raise JSONDecodeError("Expecting ',' delimiter",
+                                                  s, pos)
+                        pos += 1
+                        continue
+                    elif array == 1 and nextchar == ']':
+                        self._array = 0
+                        pos += 1
+                        continue
+                if nextchar in '[{"':
+                    end, depth, state = scan_structure(s, pos)
+                    if end < 0:
+                        if not final:
+                            self._scan = depth, state
+                        break
+                elif _scalar(s, pos).end() == n and not final:
+                    # More digits may follow
+                    break
+                value, pos = self._raw_decode(s, pos)
+                self._values.append(value)
+                if self._items:
+                    self._array = 3
+        finally:
+            self._pos = pos
@@ -256,6 +256,34 @@ class JSONEncoder(object):
                 self.skipkeys, _one_shot)
         return _iterencode(o, 0)
 
+    def _dump(self, o, fp):
+        """Write the JSON representation of ``o`` to ``fp``.
+
+        When possible, the C encoder is used: it passes the output to
+        ``fp.write()`` in large chunks instead of one small string at a time.
+
+        """
+        if (c_make_encoder is None or self.indent is not None
+                or type(self).iterencode is not JSONEncoder.iterencode):
+            # could accelerate with writelines in some versions of Python, at
+            # a debuggability cost
+            for chunk in self.iterencode(o):
+                fp.write(chunk)
+            return
+        if self.check_circular:
+            markers = {}
+        else:
+            markers = None
+        if self.ensure_ascii:
+            _encoder = encode_basestring_ascii
+        else:
+            _encoder = encode_basestring
+        _iterencode = c_make_encoder(
+            markers, self.default, _encoder, self.indent,
+            self.key_separator, self.item_separator, self.sort_keys,
+            self.skipkeys, self.allow_nan)
+        _iterencode(o, 0, fp.write)
+
 def _make_iterencode(markers, _default, _encoder, _indent, _floatstr,
         _key_separator, _item_separator, _sort_keys, _skipkeys, _one_shot,
         ## HACK: hand-optimized bytecode; turn globals into locals
@@ -24,6 +24,7 @@ To use, simply 'import logging' and log away!
 """
 
 import sys, os, time, io, re, traceback, warnings, weakref, collections.abc
+from operator import itemgetter
 
 from string import Template
 from string import Formatter as StrFormatter
@@ -280,6 +281,43 @@ else:  # The os.register_at_fork API exists
 #   The logging record
 #---------------------------------------------------------------------------
 
+# The (filename, module) pairs computed from the pathnames of the records,
+# there is usually one per source file which logs.
+_pathnameParts = {}
+_MAX_PATHNAME_PARTS = 1000
+
+def _splitPathname(pathname):
+    try:
+        return _pathnameParts[pathname]
+    except (KeyError, TypeError):
+        pass
+    try:
+        filename = os.path.basename(pathname)
+        parts = filename, os.path.splitext(filename)[0]
+    except (TypeError, ValueError, AttributeError):
+        return pathname, "Unknown module"
+    if len(_pathnameParts) >= _MAX_PATHNAME_PARTS:
+        _pathnameParts.clear()
+    _pathnameParts[pathname] = parts
+    return parts
+
+# The process id, updated in child processes.
+if hasattr(os, 'getpid'):
+    _pid = os.getpid()
+    if hasattr(os, 'register_at_fork'):
+        def _getpid():
+            return _pid
+
+        def _after_at_fork_update_pid():
+            global _pid
+            _pid = os.getpid()
+
+        os.register_at_fork(after_in_child=_after_at_fork_update_pid)
+    else:
+        _getpid = os.getpid
+else:
+    _getpid = None
+
 class LogRecord(object):
     """
     A LogRecord instance represents an event being logged.
@@ -325,12 +363,7 @@ class LogRecord(object):
         self.levelname = getLevelName(level)
         self.levelno = level
         self.pathname = pathname
-        try:
-            self.filename = os.path.basename(pathname)
-            self.module = os.path.splitext(self.filename)[0]
-        except (TypeError, ValueError, AttributeError):
-            self.filename = pathname
-            self.module = "Unknown module"
+        self.filename, self.module = _splitPathname(pathname)
         self.exc_info = exc_info
         self.exc_text = None      # used to cache the traceback text
         self.stack_info = sinfo
@@ -359,8 +392,8 @@ class LogRecord(object):
                     self.processName = mp.current_process().name
                 except Exception: #pragma: no cover
                     pass
-        if logProcesses and hasattr(os, 'getpid'):
-            self.process = os.getpid()
+        if logProcesses and _getpid is not None:
+            self.process = _getpid()
         else:
             self.process = None
 
@@ -430,18 +463,77 @@ class PercentStyle(object):
     asctime_search = '%(asctime)'
     validation_pattern = re.compile(r'%\(\w+\)[#0+ -]*(\*|\d+)?(\.(\*|\d+))?[diouxefgcrsa%]', re.I)
 
+    # The (format string, compiled format string, getter of the values from
+    # the record's __dict__) of the last format string used.
+    _compiled = None
+
     def __init__(self, fmt):
         self._fmt = fmt or self.default_format
 
     def usesTime(self):
         return self._fmt.find(self.asctime_search) >= 0
 
+    _conversion = re.compile(r'%(?:%|\(([^()]*)\))?')
+
+    def _compile(self, fmt):
+        """
+        Return a format string with positional fields equivalent to fmt, and
+        the names of the record attributes to fill them with, or None if
+        fmt cannot be converted.
+        """
+        names = []
+        def replace(m):
+            if m.group() == '%':
+                # A conversion without a mapping key.
+                raise ValueError
+            if m.group(1) is not None:
+                names.append(m.group(1))
+                return '%'
+            return m.group()
+        try:
+            return self._conversion.sub(replace, fmt), names
+        except ValueError:
+            return None
+
+    def _fetch(self, record):
+        """
+        Return the compiled format string and the values to format, or None
+        if the format string could not be compiled.
+        """
+        fmt = self._fmt
+        compiled = self._compiled
+        if compiled is None or compiled[0] is not fmt:
+            result = self._compile(fmt)
+            if result is None:
+                self._compiled = compiled = (fmt, None, None)
+            else:
+                cfmt, names = result
+                if not names:
+                    getter = lambda values: ()
+                elif len(names) == 1:
+                    getter = itemgetter(names[0])
+                    getter = lambda values, getter=getter: (getter(values),)
+                else:
+                    getter = itemgetter(*names)
+                self._compiled = compiled = (fmt, cfmt, getter)
+        if compiled[1] is None:
+            return None
+        try:
+            return compiled[1], compiled[2](record.__dict__)
+        except KeyError:
+            # Let _format() report the missing field.
+            return None
+
     def validate(self):
         """Validate the input format, ensure it matches the correct style"""
         if not self.validation_pattern.search(self._fmt):
             raise ValueError("Invalid format '%s' for '%s' style" % (self._fmt, self.default_format[0]))
 
     def _format(self, record):
+        fetched = self._fetch(record)
+        if fetched is not None:
+            fmt, values = fetched
+            return fmt % values
         return self._fmt % record.__dict__
 
     def format(self, record):
@@ -459,7 +551,36 @@ class StrFormatStyle(PercentStyle):
     fmt_spec = re.compile(r'^(.?[<>=^])?[+ -]?#?0?(\d+|{\w+})?[,_]?(\.(\d+|{\w+}))?[bcdefgnosx%]?$', re.I)
     field_spec = re.compile(r'^(\d+|\w+)(\.\w+|\[[^]]+\])*$')
 
+    _field_name = re.compile(r'([^.[]+)(.*)', re.S)
+
+    def _compile(self, fmt):
+        names = []
+        parts = []
+        try:
+            for literal, fieldname, spec, conversion in (
+                    _str_formatter.parse(fmt)):
+                parts.append(literal.replace('{', '{{').replace('}', '}}'))
+                if fieldname is None:
+                    continue
+                m = self._field_name.fullmatch(fieldname)
+                if m is None or m.group(1).isdigit() or '{' in spec:
+                    return None
+                names.append(m.group(1))
+                parts.append('{%d%s' % (len(names) - 1, m.group(2)))
+                if conversion:
+                    parts.append('!' + conversion)
+                if spec:
+                    parts.append(':' + spec)
+                parts.append('}')
+        except ValueError:
+            return None
+        return ''.join(parts), names
+
     def _format(self, record):
+        fetched = self._fetch(record)
+        if fetched is not None:
+            fmt, values = fetched
+            return fmt.format(*values)
         return self._fmt.format(**record.__dict__)
 
     def validate(self):
@@ -859,6 +980,19 @@ def _addHandlerRef(handler):
     finally:
         _releaseLock()
 
+def _emits_batches(cls):
+    """
+    Return whether the emitBatch() method of a handler class was written
+    with its emit() method in mind.
+    """
+    for klass in cls.__mro__:
+        attrs = vars(klass)
+        if 'emitBatch' in attrs:
+            return True
+        if 'emit' in attrs:
+            return False
+    return False
+
 class Handler(Filterer):
     """
     Handler instances dispatch logging events to specific destinations.
@@ -965,6 +1099,39 @@ class Handler(Filterer):
                 self.release()
         return rv
 
+    def emitBatch(self, records):
+        """
+        Emit several logging records.
+
+        The base implementation calls emit() for each record. Subclasses
+        may override this method to output the records at once.
+        """
+        for record in records:
+            self.emit(record)
+
+    def handleBatch(self, records):
+        """
+        Conditionally emit several logging records at once.
+
+        The records which pass the filters of the handler are emitted with
+        a single acquisition/release of the I/O thread lock. emitBatch()
+        is only used if it is not overridden by a less derived class than
+        emit(), otherwise the records are emitted one by one. Returns the
+        list of records which were emitted.
+        """
+        records = [record for record in records if self.filter(record)]
+        if records:
+            self.acquire()
+            try:
+                if _emits_batches(type(self)):
+                    self.emitBatch(records)
+                else:
+                    for record in records:
+                        self.emit(record)
+            finally:
+                self.release()
+        return records
+
     def setFormatter(self, fmt):
         """
         Set the formatter for this handler.
@@ -1097,6 +1264,26 @@ class StreamHandler(Handler):
         except Exception:
             self.handleError(record)
 
+    def emitBatch(self, records):
+        """
+        Emit several records.
+
+        The records are formatted as by emit(), then written to the stream
+        with a single write, which is followed by a single flush.
+        """
+        msgs = []
+        for record in records:
+            try:
+                msgs.append(self.format(record) + self.terminator)
+            except Exception:
+                self.handleError(record)
+        if msgs:
+            try:
+                self.stream.write(''.join(msgs))
+                self.flush()
+            except Exception:
+                self.handleError(records[-1])
+
     def setStream(self, stream):
         """
         Sets the StreamHandler's stream to the specified value,
@@ -1189,6 +1376,17 @@ class FileHandler(StreamHandler):
             self.stream = self._open()
         StreamHandler.emit(self, record)
 
+    def emitBatch(self, records):
+        """
+        Emit several records.
+
+        If the stream was not opened because 'delay' was specified in the
+        constructor, open it before calling the superclass's emitBatch.
+        """
+        if self.stream is None:
+            self.stream = self._open()
+        StreamHandler.emitBatch(self, records)
+
     def __repr__(self):
         level = getLevelName(self.level)
         return '<%s %s (%s)>' % (self.__class__.__name__, self.baseFilename, level)
@@ -23,8 +23,9 @@ Copyright (C) 2001-2016 Vinay Sajip. All Rights Reserved.
 To use, simply 'import logging.handlers' and log away!
 """
 
-import logging, socket, os, pickle, struct, time, re
+import logging, socket, os, pickle, struct, time, re, sys
 from stat import ST_DEV, ST_INO, ST_MTIME
+import collections
 import queue
 import threading
 
@@ -1502,3 +1503,212 @@ class QueueListener(object):
         self.enqueue_sentinel()
         self._thread.join()
         self._thread = None
+
+
+def _in_event_loop():
+    """
+    Return whether the current thread runs an asyncio event loop.
+    """
+    asyncio = sys.modules.get('asyncio')
+    return asyncio is not None and asyncio._get_running_loop() is not None
+
+class AsyncHandler(logging.Handler):
+    """
+    This handler passes records to other handlers from a background thread.
+
+    Records are appended to a bounded buffer without taking the handler
+    lock nor formatting them.  The background thread takes them from the
+    buffer by batches of up to batch_size records, and hands each batch
+    to the handleBatch() method of the target handlers, so that a stream
+    handler writes and flushes a whole batch at once.
+
+    When the buffer holds capacity records, overflow tells what happens to
+    a new record: with 'block' (the default) the logging call waits for
+    room in the buffer, with 'drop' the new record is discarded, and with
+    'drop_oldest' the oldest record of the buffer is discarded.  A logging
+    call made from a thread running an asyncio event loop never waits:
+    'block' behaves like 'drop' there.  Discarded records are counted in
+    the dropped attribute.
+    """
+
+    _OVERFLOW_POLICIES = ('block', 'drop', 'drop_oldest')
+
+    def __init__(self, *handlers, capacity=10000, overflow='block',
+                 batch_size=100, respect_handler_level=False):
+        """
+        Initialise an instance with the specified handlers, and start the
+        background thread.
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be greater than 0")
+        if batch_size <= 0:
+            raise ValueError("batch_size must be greater than 0")
+        if overflow not in self._OVERFLOW_POLICIES:
+            raise ValueError("overflow must be one of %s, not %r" %
+                             (', '.join(map(repr, self._OVERFLOW_POLICIES)),
+                              overflow))
+        logging.Handler.__init__(self)
+        self.handlers = handlers
+        self.capacity = capacity
+        self.overflow = overflow
+        self.batch_size = batch_size
+        self.respect_handler_level = respect_handler_level
+        self.dropped = 0
+        self._records = collections.deque()
+        self._unfinished = 0
+        self._closing = False
+        mutex = threading.Lock()
+        self._not_empty = threading.Condition(mutex)
+        self._not_full = threading.Condition(mutex)
+        self._all_done = threading.Condition(mutex)
+        self._thread = t = threading.Thread(target=self._monitor)
+        t.daemon = True
+        t.start()
+
+    def __repr__(self):
+        level = logging.getLevelName(self.level)
+        return '<%s (%s)>' % (self.__class__.__name__, level)
+
+    def prepare(self, record):
+        """
+        Prepare a record for buffering. The object returned by this method is
+        passed to the handlers.
+
+        The base implementation returns the record unchanged: the message
+        is merged with its arguments by the target handlers, in the
+        background thread.  You may want to override this method to merge
+        them beforehand if the arguments are mutated after the logging call.
+        """
+        return record
+
+    def handle(self, record):
+        """
+        Conditionally buffer the specified record.
+
+        Unlike the base implementation, this does not acquire the I/O
+        thread lock.
+        """
+        rv = self.filter(record)
+        if rv:
+            self.emit(record)
+        return rv
+
+    def emit(self, record):
+        """
+        Emit a record.
+
+        Appends the prepared record to the buffer.
+        """
+        try:
+            self.enqueue(self.prepare(record))
+        except Exception:
+            self.handleError(record)
+
+    def emitBatch(self, records):
+        """
+        Emit several records.
+
+        Appends the prepared records to the buffer.
+        """
+        for record in records:
+            self.emit(record)
+
+    def enqueue(self, record):
+        """
+        Append a record to the buffer, applying the overflow policy if
+        the buffer is full.
+        """
+        with self._not_full:
+            if self._closing:
+                self.dropped += 1
+                return
+            if len(self._records) >= self.capacity:
+                if self.overflow == 'drop_oldest':
+                    self._records.popleft()
+                    self._unfinished -= 1
+                    self.dropped += 1
+                elif self.overflow == 'drop' or _in_event_loop():
+                    self.dropped += 1
+                    return
+                else:
+                    while len(self._records) >= self.capacity:
+                        self._not_full.wait()
+                        if self._closing:
+                            self.dropped += 1
+                            return
+            self._records.append(record)
+            self._unfinished += 1
+            self._not_empty.notify()
+
+    def handleRecords(self, records):
+        """
+        Pass a batch of records to the handlers.
+
+        This method runs on the background thread.
+        """
+        for handler in self.handlers:
+            if self.respect_handler_level:
+                batch = [record for record in records
+                         if record.levelno >= handler.level]
+            else:
+                batch = records
+            if batch:
+                handler.handleBatch(batch)
+
+    def _monitor(self):
+        """
+        Take the records from the buffer by batches, and ask the handlers
+        to deal with them.
+
+        This method runs on the background thread, which terminates when
+        the handler is closed and the buffer is empty.
+        """
+        records = self._records
+        while True:
+            with self._not_empty:
+                while not records and not self._closing:
+                    self._not_empty.wait()
+                if not records:
+                    break
+                batch = [records.popleft()
+                         for _ in range(min(self.batch_size, len(records)))]
+                self._not_full.notify(len(batch))
+            try:
+                self.handleRecords(batch)
+            except Exception:
+                self.handleError(batch[-1])
+            finally:
+                with self._all_done:
+                    self._unfinished -= len(batch)
+                    if self._unfinished <= 0:
+                        self._all_done.notify_all()
+
+    def flush(self):
+        """
+        Wait for the records buffered so far to be handled, then flush the
+        handlers.
+        """
+        thread = self._thread
+        if thread is not None and threading.current_thread() is not thread:
+            with self._all_done:
+                while self._unfinished > 0 and thread.is_alive():
+                    self._all_done.wait()
+        for handler in self.handlers:
+            handler.flush()
+
+    def close(self):
+        """
+        Close the handler.
+
+        This handles the records left in the buffer and stops the background
+        thread. Records emitted afterwards are dropped.
+        """
+        with self._not_empty:
+            self._closing = True
+            self._not_empty.notify()
+            self._not_full.notify_all()
+        thread = self._thread
+        if thread is not None and threading.current_thread() is not thread:
+            thread.join()
+            self._thread = None
+        logging.Handler.close(self)
@@ -22,6 +22,7 @@ __all__ = [
 ]
 
 import builtins
+import functools
 import io
 import os
 from _lzma import *
@@ -34,6 +35,9 @@ _MODE_READ     = 1
 # Value 2 no longer used
 _MODE_WRITE    = 3
 
+# Size of the blocks compressed in parallel when threads > 1
+_PARALLEL_BLOCK_SIZE = 8 * 1024 * 1024
+
 
 class LZMAFile(_compression.BaseStream):
 
@@ -47,7 +51,8 @@ class LZMAFile(_compression.BaseStream):
     """
 
     def __init__(self, filename=None, mode="r", *,
-                 format=None, check=-1, preset=None, filters=None):
+                 format=None, check=-1, preset=None, filters=None,
+                 threads=1):
         """Open an LZMA-compressed file in binary mode.
 
         filename can be either an actual file name (given as a str,
@@ -89,10 +94,18 @@ class LZMAFile(_compression.BaseStream):
         filters (if provided) should be a sequence of dicts. Each dict
         should have an entry for "id" indicating ID of the filter, plus
         additional entries for options to the filter.
+
+        threads is the number of threads used for compressing or
+        decompressing; 0 means one per CPU.  When writing with more than
+        one thread, the data is split into blocks compressed in parallel
+        as separate streams, which requires FORMAT_XZ.  When reading with
+        more than one thread, the data is decompressed ahead of time in a
+        background thread.  The default is 1.
         """
         self._fp = None
         self._closefp = False
         self._mode = _MODE_CLOSED
+        threads = _compression.thread_count(threads)
 
         if mode in ("r", "rb"):
             if check != -1:
@@ -108,8 +121,21 @@ class LZMAFile(_compression.BaseStream):
             if format is None:
                 format = FORMAT_XZ
             mode_code = _MODE_WRITE
-            self._compressor = LZMACompressor(format=format, check=check,
-                                              preset=preset, filters=filters)
+            if threads == 1:
+                self._compressor = LZMACompressor(format=format, check=check,
+                                                  preset=preset,
+                                                  filters=filters)
+            elif format == FORMAT_XZ:
+                # Check the arguments before starting any thread.
+                LZMACompressor(format=format, check=check, preset=preset,
+                               filters=filters)
+                self._compressor = _compression.ParallelCompressor(
+                    functools.partial(_compress_block, check=check,
+                                      preset=preset, filters=filters),
+                    threads, _PARALLEL_BLOCK_SIZE)
+            else:
+                raise ValueError("Compressing with several threads requires "
+                                 "FORMAT_XZ")
             self._pos = 0
         else:
             raise ValueError("Invalid mode: {!r}".format(mode))
@@ -129,6 +155,8 @@ class LZMAFile(_compression.BaseStream):
         if self._mode == _MODE_READ:
             raw = _compression.DecompressReader(self._fp, LZMADecompressor,
                 trailing_error=LZMAError, format=format, filters=filters)
+            if threads > 1:
+                raw = _compression.ReadAheadReader(raw, 2 * threads)
             self._buffer = io.BufferedReader(raw)
 
     def close(self):
@@ -262,7 +290,7 @@ class LZMAFile(_compression.BaseStream):
 
 def open(filename, mode="rb", *,
          format=None, check=-1, preset=None, filters=None,
-         encoding=None, errors=None, newline=None):
+         encoding=None, errors=None, newline=None, threads=1):
     """Open an LZMA-compressed file in binary or text mode.
 
     filename can be either an actual file name (given as a str, bytes,
@@ -275,7 +303,7 @@ def open(filename, mode="rb", *,
 
     The format, check, preset and filters arguments specify the
     compression settings, as for LZMACompressor, LZMADecompressor and
-    LZMAFile.
+    LZMAFile.  The threads argument is passed to LZMAFile.
 
     For binary mode, this function is equivalent to the LZMAFile
     constructor: LZMAFile(filename, mode, ...). In this case, the
@@ -299,7 +327,7 @@ def open(filename, mode="rb", *,
 
     lz_mode = mode.replace("t", "")
     binary_file = LZMAFile(filename, lz_mode, format=format, check=check,
-                           preset=preset, filters=filters)
+                           preset=preset, filters=filters, threads=threads)
 
     if "t" in mode:
         return io.TextIOWrapper(binary_file, encoding, errors, newline)
@@ -307,6 +335,14 @@ def open(filename, mode="rb", *,
         return binary_file
 
 
+def _compress_block(data, history, last, *, check, preset, filters):
+    # Compress a block for ParallelCompressor as a complete .xz stream.
+    # The decompressor reads the concatenated streams as a single file.
+    if not data and history is not None:
+        return b""
+    return compress(data, FORMAT_XZ, check, preset, filters)
+
+
 def compress(data, format=FORMAT_XZ, check=-1, preset=None, filters=None):
     """Compress a block of data.
 
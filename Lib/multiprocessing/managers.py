@@ -19,6 +19,7 @@ import threading
 import array
 import queue
 import time
+import os
 
 from traceback import format_exc
 
@@ -28,6 +29,12 @@ from . import pool
 from . import process
 from . import util
 from . import get_context
+try:
+    from . import shared_memory
+    HAS_SHMEM = True
+    __all__.append('SharedMemoryManager')
+except ImportError:
+    HAS_SHMEM = False
 
 #
 # Register some things for pickling
@@ -501,8 +508,8 @@ class BaseManager(object):
             else:
                 raise ProcessError(
                     "Unknown state {!r}".format(self._state.value))
-        return Server(self._registry, self._address,
-                      self._authkey, self._serializer)
+        return self._Server(self._registry, self._address,
+                            self._authkey, self._serializer)
 
     def connect(self):
         '''
@@ -1200,3 +1207,141 @@ SyncManager.register('Namespace', Namespace, NamespaceProxy)
 # types returned by methods of PoolProxy
 SyncManager.register('Iterator', proxytype=IteratorProxy, create_method=False)
 SyncManager.register('AsyncResult', create_method=False)
+
+#
+# Definition of SharedMemoryManager and SharedMemoryServer
+#
+
+if HAS_SHMEM:
+    class _SharedMemoryTracker:
+        "Manages one or more shared memory segments."
+
+        def __init__(self, name, segment_names=None):
+            self.shared_memory_context_name = name
+            self.segment_names = [] if segment_names is None else segment_names
+
+        def register_segment(self, segment_name):
+            "Adds the supplied shared memory block name to tracker."
+            util.debug('register segment %r in pid %d',
+                       segment_name, os.getpid())
+            self.segment_names.append(segment_name)
+
+        def destroy_segment(self, segment_name):
+            """Calls unlink() on the shared memory block with the supplied name
+            and removes it from the list of blocks being tracked."""
+            util.debug('destroy segment %r in pid %d',
+                       segment_name, os.getpid())
+            self.segment_names.remove(segment_name)
+            segment = shared_memory.SharedMemory(segment_name)
+            segment.close()
+            segment.unlink()
+
+        def unlink(self):
+            "Calls destroy_segment() on all tracked shared memory blocks."
+            for segment_name in self.segment_names[:]:
+                self.destroy_segment(segment_name)
+
+        def __del__(self):
+            util.debug('call %s.__del__ in %d',
+                       self.__class__.__name__, os.getpid())
+            self.unlink()
+
+        def __getstate__(self):
+            return (self.shared_memory_context_name, self.segment_names)
+
+        def __setstate__(self, state):
+            self.__init__(*state)
+
+
+    class SharedMemoryServer(Server):
+        '''
+        Server which unlinks every tracked shared memory block on shutdown
+        '''
+        public = Server.public + \
+                 ['track_segment', 'release_segment', 'list_segments']
+
+        def __init__(self, *args, **kwargs):
+            Server.__init__(self, *args, **kwargs)
+            self.shared_memory_context = \
+                _SharedMemoryTracker('shm_%s_%d' % (self.address, os.getpid()))
+            util.debug('SharedMemoryServer started by pid %d', os.getpid())
+
+        def shutdown(self, c):
+            '''
+            Unlink all tracked shared memory blocks, then shutdown
+            '''
+            self.shared_memory_context.unlink()
+            return Server.shutdown(self, c)
+
+        def track_segment(self, c, segment_name):
+            '''
+            Adds the supplied shared memory block name to Server's tracker
+            '''
+            self.shared_memory_context.register_segment(segment_name)
+
+        def release_segment(self, c, segment_name):
+            '''
+            Calls unlink() on the shared memory block with the supplied name
+            and removes it from the tracker instance inside the Server
+            '''
+            self.shared_memory_context.destroy_segment(segment_name)
+
+        def list_segments(self, c):
+            '''
+            Returns a list of names of shared memory blocks that the Server
+            is currently tracking
+            '''
+            return self.shared_memory_context.segment_names
+
+
+    class SharedMemoryManager(BaseManager):
+        '''
+        Subclass of `BaseManager` which creates and tracks shared memory
+        blocks.
+
+        Blocks are created in the calling process and attached to by name
+        from any other process, so their contents are never pickled.  The
+        manager's server process unlinks every block still being tracked
+        when the manager is shut down.
+        '''
+
+        _Server = SharedMemoryServer
+
+        def __init__(self, *args, **kwargs):
+            if os.name == "posix":
+                # Make sure the tracker is started before the server is
+                # forked so that both share it, otherwise segments unlinked
+                # by the server would be reported as leaked.
+                from . import semaphore_tracker
+                semaphore_tracker.ensure_running()
+            BaseManager.__init__(self, *args, **kwargs)
+            util.debug('%s created by pid %d',
+                       self.__class__.__name__, os.getpid())
+
+        def SharedMemory(self, size):
+            '''
+            Returns a new SharedMemory instance with the specified size in
+            bytes, to be tracked by the manager
+            '''
+            with self._Client(self._address, authkey=self._authkey) as conn:
+                sms = shared_memory.SharedMemory(None, create=True, size=size)
+                try:
+                    dispatch(conn, None, 'track_segment', (sms.name,))
+                except BaseException:
+                    sms.unlink()
+                    raise
+            return sms
+
+        def ShareableList(self, sequence):
+            '''
+            Returns a new ShareableList instance populated with the values
+            from the input sequence, to be tracked by the manager
+            '''
+            with self._Client(self._address, authkey=self._authkey) as conn:
+                sl = shared_memory.ShareableList(sequence)
+                try:
+                    dispatch(conn, None, 'track_segment', (sl.shm.name,))
+                except BaseException:
+                    sl.shm.unlink()
+                    raise
+            return sl
@@ -10,6 +10,10 @@
 # the next reboot.  Without this semaphore tracker process, "killall
 # python" would probably leave unlinked semaphores.
 #
+# The same mechanism is used to track POSIX shared memory segments
+# created by multiprocessing.shared_memory, which would otherwise
+# persist in /dev/shm until the next reboot.
+#
 
 import os
 import signal
@@ -26,6 +30,20 @@ __all__ = ['ensure_running', 'register', 'unregister']
 _HAVE_SIGMASK = hasattr(signal, 'pthread_sigmask')
 _IGNORED_SIGNALS = (signal.SIGINT, signal.SIGTERM)
 
+# Maps the type of a tracked resource to the plural used in warnings and
+# to the function used to release a leaked instance of it.
+_CLEANUP_FUNCS = {
+    'semaphore': ('semaphores', _multiprocessing.sem_unlink),
+}
+
+try:
+    import _posixshmem
+except ImportError:
+    pass
+else:
+    _CLEANUP_FUNCS['shared_memory'] = ('shared memory segments',
+                                       _posixshmem.shm_unlink)
+
 
 class SemaphoreTracker(object):
 
@@ -44,20 +62,25 @@ class SemaphoreTracker(object):
         This can be run from any process.  Usually a child process will use
         the semaphore created by its parent.'''
         with self._lock:
-            if self._pid is not None:
+            if self._fd is not None:
                 # semaphore tracker was launched before, is it still running?
-                try:
-                    pid, _ = os.waitpid(self._pid, os.WNOHANG)
-                except ChildProcessError:
-                    # The process terminated
-                    pass
-                else:
-                    if not pid:
-                        # => still alive
-                        return
+                # The pipe is checked rather than the pid since processes
+                # forked or spawned from the one which launched the tracker
+                # share it without being its parent.
+                if self._check_alive():
+                    # => still alive
+                    return
 
                 # => dead, launch it again
                 os.close(self._fd)
+                try:
+                    # _pid is None if this process is a child of the process
+                    # which launched the semaphore tracker.
+                    if self._pid is not None:
+                        os.waitpid(self._pid, 0)
+                except ChildProcessError:
+                    # The process was already reaped
+                    pass
                 self._fd = None
                 self._pid = None
 
@@ -99,17 +122,30 @@ class SemaphoreTracker(object):
             finally:
                 os.close(r)
 
-    def register(self, name):
-        '''Register name of semaphore with semaphore tracker.'''
-        self._send('REGISTER', name)
-
-    def unregister(self, name):
-        '''Unregister name of semaphore with semaphore tracker.'''
-        self._send('UNREGISTER', name)
-
-    def _send(self, cmd, name):
+    def _check_alive(self):
+        '''Check that the pipe has not been closed by sending a probe.'''
+        try:
+            # We cannot use _send() here as it calls ensure_running(),
+            # creating a cycle.
+            os.write(self._fd, b'PROBE:0:noop\n')
+        except OSError:
+            return False
+        else:
+            return True
+
+    def register(self, name, rtype='semaphore'):
+        '''Register name of resource with semaphore tracker.'''
+        self._send('REGISTER', name, rtype)
+
+    def unregister(self, name, rtype='semaphore'):
+        '''Unregister name of resource with semaphore tracker.'''
+        self._send('UNREGISTER', name, rtype)
+
+    def _send(self, cmd, name, rtype):
+        if rtype not in _CLEANUP_FUNCS:
+            raise ValueError('unknown resource type %r' % rtype)
         self.ensure_running()
-        msg = '{0}:{1}\n'.format(cmd, name).encode('ascii')
+        msg = '{0}:{1}:{2}\n'.format(cmd, name, rtype).encode('ascii')
         if len(name) > 512:
             # posix guarantees that writes to a pipe of less than PIPE_BUF
             # bytes are atomic, and that PIPE_BUF >= 512
@@ -139,17 +175,21 @@ def main(fd):
         except Exception:
             pass
 
-    cache = set()
+    cache = {rtype: set() for rtype in _CLEANUP_FUNCS}
     try:
-        # keep track of registered/unregistered semaphores
+        # keep track of registered/unregistered resources
         with open(fd, 'rb') as f:
             for line in f:
                 try:
-                    cmd, name = line.strip().split(b':')
-                    if cmd == b'REGISTER':
-                        cache.add(name)
-                    elif cmd == b'UNREGISTER':
-                        cache.remove(name)
+                    cmd, name, rtype = line.strip().decode('ascii').split(':')
+                    if cmd == 'PROBE':
+                        continue
+                    if rtype not in cache:
+                        raise ValueError('unknown resource type %r' % rtype)
+                    if cmd == 'REGISTER':
+                        cache[rtype].add(name)
+                    elif cmd == 'UNREGISTER':
+                        cache[rtype].remove(name)
                     else:
                         raise RuntimeError('unrecognized command %r' % cmd)
                 except Exception:
@@ -158,23 +198,21 @@ def main(fd):
                     except:
                         pass
     finally:
-        # all processes have terminated; cleanup any remaining semaphores
-        if cache:
-            try:
-                warnings.warn('semaphore_tracker: There appear to be %d '
-                              'leaked semaphores to clean up at shutdown' %
-                              len(cache))
-            except Exception:
-                pass
-        for name in cache:
-            # For some reason the process which created and registered this
-            # semaphore has failed to unregister it. Presumably it has died.
-            # We therefore unlink it.
-            try:
-                name = name.decode('ascii')
+        # all processes have terminated; cleanup any remaining resources
+        for rtype, rtype_cache in cache.items():
+            description, cleanup_func = _CLEANUP_FUNCS[rtype]
+            if rtype_cache:
                 try:
-                    _multiprocessing.sem_unlink(name)
+                    warnings.warn('semaphore_tracker: There appear to be %d '
+                                  'leaked %s to clean up at shutdown' %
+                                  (len(rtype_cache), description))
+                except Exception:
+                    pass
+            for name in rtype_cache:
+                # For some reason the process which created and registered
+                # this resource has failed to unregister it. Presumably it
+                # has died.  We therefore unlink it.
+                try:
+                    cleanup_func(name)
                 except Exception as e:
                     warnings.warn('semaphore_tracker: %r: %s' % (name, e))
-            finally:
-                pass
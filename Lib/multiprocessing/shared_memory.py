@@ -0,0 +1,513 @@
+#
+# Module which provides named shared memory segments which can be
+# attached to by any process on the same host
+#
+# multiprocessing/shared_memory.py
+#
+# Licensed to PSF under a Contributor Agreement.
+#
+
+__all__ = [ 'SharedMemory', 'ShareableList' ]
+
+import errno
+from functools import partial
+import mmap
+import os
+import secrets
+import struct
+import sys
+
+if sys.platform == 'win32':
+    import _winapi
+    _USE_POSIX = False
+else:
+    import _posixshmem
+    _USE_POSIX = True
+
+#
+# Names of segments created by this module
+#
+
+_O_CREX = os.O_CREAT | os.O_EXCL
+
+# FreeBSD (and perhaps other BSDs) limit names to 14 characters.
+_SHM_SAFE_NAME_LENGTH = 14
+
+# Shared memory block name prefix
+if _USE_POSIX:
+    _SHM_NAME_PREFIX = '/psm_'
+else:
+    _SHM_NAME_PREFIX = 'wnsm_'
+
+
+def _make_filename():
+    "Create a random filename for the shared memory object."
+    # number of random bytes to use for name
+    nbytes = (_SHM_SAFE_NAME_LENGTH - len(_SHM_NAME_PREFIX)) // 2
+    assert nbytes >= 2, '_SHM_NAME_PREFIX too long'
+    name = _SHM_NAME_PREFIX + secrets.token_hex(nbytes)
+    assert len(name) <= _SHM_SAFE_NAME_LENGTH
+    return name
+
+#
+# Named shared memory segment
+#
+
+class SharedMemory(object):
+    '''
+    A named block of shared memory which can be attached to by name.
+
+    Creates a new shared memory block or attaches to an existing one.
+    Every process which attaches to the block sees the same bytes through
+    the `buf` memoryview, so large read-mostly tables can be published
+    once per host instead of being copied into every worker.  Use
+    `memoryview.cast()` on `buf` to get a typed, multi-dimensional view.
+
+    On POSIX the block is backed by a shm_open() object and, when
+    created, registered with the semaphore tracker so that it is unlinked
+    even if the creating process dies without calling `unlink()`.  On
+    Windows the block is a named file mapping which is released by the
+    system once the last handle to it is closed; attaching to it requires
+    `size` to be given since the size cannot be queried.
+    '''
+
+    # Defaults; enables close() and unlink() to run without errors.
+    _name = None
+    _fd = -1
+    _mmap = None
+    _buf = None
+    _flags = os.O_RDWR
+    _mode = 0o600
+    _prepend_leading_slash = _USE_POSIX
+
+    def __init__(self, name=None, create=False, size=0):
+        if not size >= 0:
+            raise ValueError("'size' must be a positive integer")
+        if create:
+            self._flags = _O_CREX | os.O_RDWR
+            if size == 0:
+                raise ValueError("'size' must be a positive number different "
+                                 "from zero")
+        if name is None and not self._flags & os.O_EXCL:
+            raise ValueError("'name' can only be None if create=True")
+
+        if _USE_POSIX:
+            self._init_posix(name, create, size)
+        else:
+            self._init_windows(name, create, size)
+        self._buf = memoryview(self._mmap)
+
+    def _init_posix(self, name, create, size):
+        if name is None:
+            while True:
+                name = _make_filename()
+                try:
+                    self._fd = _posixshmem.shm_open(
+                        name, self._flags, mode=self._mode)
+                except FileExistsError:
+                    continue
+                self._name = name
+                break
+        else:
+            name = '/' + name if self._prepend_leading_slash else name
+            self._fd = _posixshmem.shm_open(name, self._flags,
+                                            mode=self._mode)
+            self._name = name
+        try:
+            if create:
+                os.ftruncate(self._fd, size)
+            stats = os.fstat(self._fd)
+            size = stats.st_size
+            self._mmap = mmap.mmap(self._fd, size)
+        except OSError:
+            os.close(self._fd)
+            self._fd = -1
+            if create:
+                _posixshmem.shm_unlink(self._name)
+            raise
+        self._size = size
+        if create:
+            from .semaphore_tracker import register
+            register(self._name, 'shared_memory')
+
+    def _init_windows(self, name, create, size):
+        # Mirrors heap.Arena: a named mapping backed by the paging file.
+        if create:
+            while True:
+                temp_name = _make_filename() if name is None else name
+                buf = mmap.mmap(-1, size, tagname=temp_name)
+                if _winapi.GetLastError() == 0:
+                    break
+                # We have reopened a preexisting mmap.
+                buf.close()
+                if name is not None:
+                    raise FileExistsError(
+                        errno.EEXIST, os.strerror(errno.EEXIST), name)
+            self._name = temp_name
+        else:
+            if size == 0:
+                raise ValueError("'size' must be given to attach to an "
+                                 "existing block on Windows")
+            self._name = name
+            buf = mmap.mmap(-1, size, tagname=name)
+        self._mmap = buf
+        self._size = size
+
+    def __del__(self):
+        try:
+            self.close()
+        except OSError:
+            pass
+
+    def __reduce__(self):
+        return (
+            self.__class__,
+            (
+                self.name,
+                False,
+                self.size,
+            ),
+        )
+
+    def __repr__(self):
+        return '%s(%r, size=%r)' % (self.__class__.__name__, self.name,
+                                    self.size)
+
+    @property
+    def buf(self):
+        "A memoryview of contents of the shared memory block."
+        return self._buf
+
+    @property
+    def name(self):
+        "Unique name that identifies the shared memory block."
+        reported_name = self._name
+        if _USE_POSIX and self._prepend_leading_slash:
+            if self._name.startswith('/'):
+                reported_name = self._name[1:]
+        return reported_name
+
+    @property
+    def size(self):
+        "Size in bytes."
+        return self._size
+
+    def close(self):
+        '''
+        Closes access to the shared memory from this instance but does
+        not destroy the shared memory block.
+        '''
+        if self._buf is not None:
+            self._buf.release()
+            self._buf = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if _USE_POSIX and self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def unlink(self):
+        '''
+        Requests that the underlying shared memory block be destroyed.
+
+        In order to ensure proper cleanup of resources, unlink should be
+        called once (and only once) across all processes which have access
+        to the shared memory block.  This is a no-op on Windows.
+        '''
+        if _USE_POSIX and self._name:
+            from .semaphore_tracker import unregister
+            _posixshmem.shm_unlink(self._name)
+            unregister(self._name, 'shared_memory')
+
+#
+# List of simple values stored in a shared memory block
+#
+
+_encoding = 'utf8'
+
+class ShareableList(object):
+    '''
+    Pattern for a mutable list-like object shareable via a shared
+    memory block.
+
+    It differs from the built-in list type in that these lists can not
+    change their overall length (i.e. no append, insert, etc.), and that
+    they only support the int (signed 64-bit), float, bool, str (less than
+    10M bytes each when encoded as utf-8), bytes (less than 10M bytes
+    each) and None types.  Each item occupies a fixed slot sized when the
+    list is created, so str and bytes values may later only be replaced
+    by values which fit in the original slot.
+
+    The layout of the block is: the number of items, the offsets of each
+    item, the packed items themselves, their struct formats and finally
+    a code telling how to convert each packed item back into a Python
+    value.
+    '''
+
+    _types_mapping = {
+        int: 'q',
+        float: 'd',
+        bool: 'xxxxxxx?',
+        str: '%ds',
+        bytes: '%ds',
+        None.__class__: 'xxxxxx?x',
+    }
+    _alignment = 8
+    _back_transforms_mapping = {
+        0: lambda value: value,                   # int, float, bool
+        1: lambda value: value.rstrip(b'\x00').decode(_encoding),  # str
+        2: lambda value: value.rstrip(b'\x00'),   # bytes
+        3: lambda _value: None,                   # None
+    }
+
+    @staticmethod
+    def _extract_recreation_code(value):
+        '''Used in concert with _back_transforms_mapping to convert values
+        into the appropriate Python objects when retrieving them from
+        the list as well as when storing them.'''
+        if not isinstance(value, (str, bytes, None.__class__)):
+            return 0
+        elif isinstance(value, str):
+            return 1
+        elif isinstance(value, bytes):
+            return 2
+        else:
+            return 3  # NoneType
+
+    def __init__(self, sequence=None, *, name=None):
+        if name is None or sequence is not None:
+            sequence = sequence or ()
+            _formats = [
+                self._types_mapping[type(item)]
+                    if not isinstance(item, (str, bytes))
+                    else self._types_mapping[type(item)] % (
+                        self._alignment * (len(self._encode(item)) //
+                                           self._alignment + 1),
+                    )
+                for item in sequence
+            ]
+            self._list_len = len(_formats)
+            assert sum(len(fmt) <= 8 for fmt in _formats) == self._list_len
+            offset = 0
+            # The offsets of each list element into the shared memory's
+            # data area (0 meaning the start of the data area, not the start
+            # of the shared memory area).
+            self._allocated_offsets = [0]
+            for fmt in _formats:
+                offset += self._alignment if fmt[-1] != 's' else int(fmt[:-1])
+                self._allocated_offsets.append(offset)
+            _recreation_codes = [
+                self._extract_recreation_code(item) for item in sequence
+            ]
+            requested_size = struct.calcsize(
+                'q' + self._format_size_metainfo +
+                ''.join(_formats) +
+                self._format_packing_metainfo +
+                self._format_back_transform_codes
+            )
+            self.shm = SharedMemory(name, create=True, size=requested_size)
+        else:
+            self.shm = SharedMemory(name)
+
+        if sequence is not None:
+            _enc = _encoding
+            struct.pack_into(
+                'q' + self._format_size_metainfo,
+                self.shm.buf,
+                0,
+                self._list_len,
+                *(self._allocated_offsets)
+            )
+            struct.pack_into(
+                ''.join(_formats),
+                self.shm.buf,
+                self._offset_data_start,
+                *(self._encode(v) for v in sequence)
+            )
+            struct.pack_into(
+                self._format_packing_metainfo,
+                self.shm.buf,
+                self._offset_packing_formats,
+                *(v.encode(_enc) for v in _formats)
+            )
+            struct.pack_into(
+                self._format_back_transform_codes,
+                self.shm.buf,
+                self._offset_back_transform_codes,
+                *(_recreation_codes)
+            )
+        else:
+            self._list_len = len(self)  # Obtains size from offset 0 in buffer.
+            self._allocated_offsets = list(
+                struct.unpack_from(
+                    self._format_size_metainfo,
+                    self.shm.buf,
+                    1 * 8
+                )
+            )
+
+    @staticmethod
+    def _encode(value):
+        if isinstance(value, str):
+            return value.encode(_encoding)
+        return value
+
+    def _get_packing_format(self, position):
+        "Gets the packing format for a single value stored in the list."
+        position = position if position >= 0 else position + self._list_len
+        if (position >= self._list_len) or (self._list_len < 0):
+            raise IndexError('Requested position out of range.')
+
+        v = struct.unpack_from(
+            '8s',
+            self.shm.buf,
+            self._offset_packing_formats + position * 8
+        )[0]
+        fmt = v.rstrip(b'\x00')
+        fmt_as_str = fmt.decode(_encoding)
+
+        return fmt_as_str
+
+    def _get_back_transform(self, position):
+        "Gets the back transformation function for a single value."
+        if (position >= self._list_len) or (self._list_len < 0):
+            raise IndexError('Requested position out of range.')
+
+        transform_code = struct.unpack_from(
+            'b',
+            self.shm.buf,
+            self._offset_back_transform_codes + position
+        )[0]
+        transform_function = self._back_transforms_mapping[transform_code]
+
+        return transform_function
+
+    def _set_packing_format_and_transform(self, position, fmt_as_str, value):
+        '''Sets the packing format and back transformation code for a
+        single value in the list at the specified position.'''
+        if (position >= self._list_len) or (self._list_len < 0):
+            raise IndexError('Requested position out of range.')
+
+        struct.pack_into(
+            '8s',
+            self.shm.buf,
+            self._offset_packing_formats + position * 8,
+            fmt_as_str.encode(_encoding)
+        )
+
+        transform_code = self._extract_recreation_code(value)
+        struct.pack_into(
+            'b',
+            self.shm.buf,
+            self._offset_back_transform_codes + position,
+            transform_code
+        )
+
+    def __getitem__(self, position):
+        position = position if position >= 0 else position + self._list_len
+        if not 0 <= position < self._list_len:
+            raise IndexError('index out of range')
+        offset = self._offset_data_start + self._allocated_offsets[position]
+        (v,) = struct.unpack_from(
+            self._get_packing_format(position),
+            self.shm.buf,
+            offset
+        )
+
+        back_transform = self._get_back_transform(position)
+        v = back_transform(v)
+
+        return v
+
+    def __setitem__(self, position, value):
+        position = position if position >= 0 else position + self._list_len
+        if not 0 <= position < self._list_len:
+            raise IndexError('assignment index out of range')
+        item_offset = self._allocated_offsets[position]
+        offset = self._offset_data_start + item_offset
+        current_format = self._get_packing_format(position)
+
+        if not isinstance(value, (str, bytes)):
+            new_format = self._types_mapping[type(value)]
+            encoded_value = value
+        else:
+            allocated_length = (self._allocated_offsets[position + 1] -
+                                item_offset)
+            encoded_value = self._encode(value)
+            if len(encoded_value) > allocated_length:
+                raise ValueError('bytes/str item exceeds available storage')
+            if current_format[-1] == 's':
+                new_format = current_format
+            else:
+                new_format = self._types_mapping[str] % (
+                    allocated_length,
+                )
+
+        self._set_packing_format_and_transform(
+            position,
+            new_format,
+            value
+        )
+        struct.pack_into(new_format, self.shm.buf, offset, encoded_value)
+
+    def __reduce__(self):
+        return partial(self.__class__, name=self.shm.name), ()
+
+    def __len__(self):
+        return struct.unpack_from('q', self.shm.buf, 0)[0]
+
+    def __repr__(self):
+        return '%s(%r, name=%r)' % (self.__class__.__name__, list(self),
+                                    self.shm.name)
+
+    @property
+    def format(self):
+        'The struct packing format used by all currently stored items.'
+        return ''.join(
+            self._get_packing_format(i) for i in range(self._list_len)
+        )
+
+    @property
+    def _format_size_metainfo(self):
+        'The struct packing format used for the items\' storage offsets.'
+        return 'q' * (self._list_len + 1)
+
+    @property
+    def _format_packing_metainfo(self):
+        'The struct packing format used for the items\' packing formats.'
+        return '8s' * self._list_len
+
+    @property
+    def _format_back_transform_codes(self):
+        'The struct packing format used for the items\' back transforms.'
+        return 'b' * self._list_len
+
+    @property
+    def _offset_data_start(self):
+        # - 8 bytes for the list length
+        # - (N + 1) * 8 bytes for the element offsets
+        return (self._list_len + 2) * 8
+
+    @property
+    def _offset_packing_formats(self):
+        return self._offset_data_start + self._allocated_offsets[-1]
+
+    @property
+    def _offset_back_transform_codes(self):
+        return self._offset_packing_formats + self._list_len * 8
+
+    def count(self, value):
+        'L.count(value) -> integer -- return number of occurrences of value.'
+
+        return sum(value == entry for entry in self)
+
+    def index(self, value):
+        '''L.index(value) -> integer -- return first index of value.
+        Raises ValueError if the value is not present.'''
+
+        for position, entry in enumerate(self):
+            if value == entry:
+                return position
+        else:
+            raise ValueError('%r not in this container' % (value,))
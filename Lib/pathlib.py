@@ -464,7 +464,7 @@ class _Selector:
             self.successor = _TerminatingSelector()
             self.dironly = False
 
-    def select_from(self, parent_path):
+    def select_from(self, parent_path, workers=None):
         """Iterate over all child paths of `parent_path` matched by this
         selector.  This can contain parent_path itself."""
         path_cls = type(parent_path)
@@ -473,12 +473,13 @@ class _Selector:
         scandir = parent_path._accessor.scandir
         if not is_dir(parent_path):
             return iter([])
-        return self._select_from(parent_path, is_dir, exists, scandir)
+        return self._select_from(parent_path, is_dir, exists, scandir,
+                                 workers)
 
 
 class _TerminatingSelector:
 
-    def _select_from(self, parent_path, is_dir, exists, scandir):
+    def _select_from(self, parent_path, is_dir, exists, scandir, workers):
         yield parent_path
 
 
@@ -488,11 +489,12 @@ class _PreciseSelector(_Selector):
         self.name = name
         _Selector.__init__(self, child_parts)
 
-    def _select_from(self, parent_path, is_dir, exists, scandir):
+    def _select_from(self, parent_path, is_dir, exists, scandir, workers):
         try:
             path = parent_path._make_child_relpath(self.name)
             if (is_dir if self.dironly else exists)(path):
-                for p in self.successor._select_from(path, is_dir, exists, scandir):
+                for p in self.successor._select_from(path, is_dir, exists,
+                                                     scandir, workers):
                     yield p
         except PermissionError:
             return
@@ -501,10 +503,10 @@ class _PreciseSelector(_Selector):
 class _WildcardSelector(_Selector):
 
     def __init__(self, pat, child_parts):
-        self.pat = re.compile(fnmatch.translate(pat))
+        self.match = fnmatch._compile_pattern(pat)
         _Selector.__init__(self, child_parts)
 
-    def _select_from(self, parent_path, is_dir, exists, scandir):
+    def _select_from(self, parent_path, is_dir, exists, scandir, workers):
         try:
             cf = parent_path._flavour.casefold
             entries = list(scandir(parent_path))
@@ -512,9 +514,10 @@ class _WildcardSelector(_Selector):
                 if not self.dironly or entry.is_dir():
                     name = entry.name
                     casefolded = cf(name)
-                    if self.pat.match(casefolded):
+                    if self.match(casefolded):
                         path = parent_path._make_child_relpath(name)
-                        for p in self.successor._select_from(path, is_dir, exists, scandir):
+                        for p in self.successor._select_from(
+                                path, is_dir, exists, scandir, workers):
                             yield p
         except PermissionError:
             return
@@ -544,13 +547,35 @@ class _RecursiveWildcardSelector(_Selector):
         except PermissionError:
             return
 
-    def _select_from(self, parent_path, is_dir, exists, scandir):
+    def _walk_directories(self, parent_path, workers):
+        # Same as _iterate_directories(), but lists the directories in
+        # parallel with os.walk().
+        def onerror(error):
+            if not isinstance(error, PermissionError):
+                raise error
+        paths = {str(parent_path): parent_path}
+        for root, dirs, files in os.walk(str(parent_path), onerror=onerror,
+                                         workers=workers):
+            path = paths.pop(root)
+            yield path
+            for name in dirs:
+                paths[os.path.join(root, name)] = \
+                    path._make_child_relpath(name)
+
+    def _select_from(self, parent_path, is_dir, exists, scandir, workers):
         try:
             yielded = set()
             try:
                 successor_select = self.successor._select_from
-                for starting_point in self._iterate_directories(parent_path, is_dir, scandir):
-                    for p in successor_select(starting_point, is_dir, exists, scandir):
+                if workers is None:
+                    starting_points = self._iterate_directories(
+                        parent_path, is_dir, scandir)
+                else:
+                    starting_points = self._walk_directories(parent_path,
+                                                             workers)
+                for starting_point in starting_points:
+                    for p in successor_select(starting_point, is_dir, exists,
+                                              scandir, workers):
                         if p not in yielded:
                             yield p
                             yielded.add(p)
@@ -1079,9 +1104,12 @@ class Path(PurePath):
             if self._closed:
                 self._raise_closed()
 
-    def glob(self, pattern):
+    def glob(self, pattern, *, workers=None):
         """Iterate over this subtree and yield all existing files (of any
         kind, including directories) matching the given pattern.
+
+        If workers is given, the directories matched by '**' are listed
+        by a pool of at most workers threads, as with os.walk().
         """
         if not pattern:
             raise ValueError("Unacceptable pattern: {!r}".format(pattern))
@@ -1090,19 +1118,22 @@ class Path(PurePath):
         if drv or root:
             raise NotImplementedError("Non-relative patterns are unsupported")
         selector = _make_selector(tuple(pattern_parts))
-        for p in selector.select_from(self):
+        for p in selector.select_from(self, workers):
             yield p
 
-    def rglob(self, pattern):
+    def rglob(self, pattern, *, workers=None):
         """Recursively yield all existing files (of any kind, including
         directories) matching the given pattern, anywhere in this subtree.
+
+        If workers is given, the directories are listed by a pool of at
+        most workers threads, as with os.walk().
         """
         pattern = self._flavour.casefold(pattern)
         drv, root, pattern_parts = self._flavour.parse_parts((pattern,))
         if drv or root:
             raise NotImplementedError("Non-relative patterns are unsupported")
         selector = _make_selector(("**",) + tuple(pattern_parts))
-        for p in selector.select_from(self):
+        for p in selector.select_from(self, workers):
             yield p
 
     def absolute(self):
@@ -94,7 +94,10 @@ This module exports the following functions:
     findall   Find all occurrences of a pattern in a string.
     finditer  Return an iterator yielding a Match object for each match.
     compile   Compile a pattern into a Pattern object.
+    compile_linear  Compile a pattern for linear-time matching.
     purge     Clear the regular expression cache.
+    dump_cache  Save compiled patterns to a file.
+    load_cache  Load compiled patterns saved by dump_cache.
     escape    Backslash all non-alphanumerics in a string.
 
 Some of the functions in this module takes flags as optional parameters:
@@ -115,7 +118,8 @@ Some of the functions in this module takes flags as optional parameters:
     U  UNICODE     For compatibility only. Ignored for string patterns (it
                    is the default), and forbidden for bytes patterns.
 
-This module also defines an exception 'error'.
+This module also defines an exception 'error' and a class 'PatternSet'
+for matching a string against many patterns at once.
 
 """
 
@@ -123,6 +127,8 @@ import enum
 import sre_compile
 import sre_parse
 import functools
+import marshal
+import sys
 try:
     import _locale
 except ImportError:
@@ -132,7 +138,9 @@ except ImportError:
 # public symbols
 __all__ = [
     "match", "fullmatch", "search", "sub", "subn", "split",
-    "findall", "finditer", "compile", "purge", "template", "escape",
+    "findall", "finditer", "compile", "compile_linear", "purge",
+    "template", "escape",
+    "dump_cache", "load_cache", "PatternSet",
     "error", "Pattern", "Match", "A", "I", "L", "M", "S", "X", "U",
     "ASCII", "IGNORECASE", "LOCALE", "MULTILINE", "DOTALL", "VERBOSE",
     "UNICODE",
@@ -233,11 +241,79 @@ def compile(pattern, flags=0):
     "Compile a regular expression pattern, returning a Pattern object."
     return _compile(pattern, flags)
 
+def compile_linear(pattern, flags=0, *, maxstates=None):
+    """Compile a regular expression pattern for linear-time matching,
+    returning a pattern object.
+
+    The time needed to match the pattern is proportional to the length of
+    the string, which makes it safe to use with untrusted patterns and
+    strings.  Backreferences, conditional groups and lookahead and
+    lookbehind assertions are not supported.  maxstates bounds the number
+    of cached transitions kept by the pattern object."""
+    import sre_linear
+    if isinstance(flags, RegexFlag):
+        flags = flags.value
+    if maxstates is None:
+        maxstates = sre_linear.MAXSTATES
+    return sre_linear.compile(pattern, flags, maxstates)
+
 def purge():
     "Clear the regular expression caches"
     _cache.clear()
+    _loaded.clear()
     _compile_repl.cache_clear()
 
+def dump_cache(file, patterns=()):
+    """Write the compiled form of the cached patterns to file.
+
+    file must be a writable binary file.  The patterns currently in the
+    cache, the patterns previously loaded with load_cache() and the
+    given patterns (pattern strings or (pattern, flags) pairs) are
+    written.  Return the number of patterns written."""
+    keys = dict.fromkeys(_cache)
+    keys.update(dict.fromkeys(_loaded))
+    for pattern in patterns:
+        if isinstance(pattern, tuple):
+            pattern, flags = pattern
+        else:
+            flags = 0
+        if isinstance(flags, RegexFlag):
+            flags = flags.value
+        if not sre_compile.isstring(pattern):
+            raise TypeError("patterns must be strings or "
+                            "(pattern, flags) pairs")
+        keys[type(pattern), pattern, flags] = None
+    entries = []
+    for _, pattern, flags in keys:
+        if flags & DEBUG:
+            continue
+        p = sre_parse.parse(pattern, flags)
+        args = sre_compile._compile_args(p, pattern, flags)
+        # the code contains named opcode constants, marshal plain ints
+        code = list(map(int, args[2]))
+        entries.append((flags, args[:2] + (code,) + args[3:]))
+    marshal.dump(_cache_header(), file)
+    marshal.dump(entries, file)
+    return len(entries)
+
+def load_cache(file):
+    """Load compiled patterns written by dump_cache() from file.
+
+    Loaded patterns are used by compile() and the module-level functions
+    without parsing them again.  Return the number of patterns loaded;
+    this is 0 if the file was written by a different version of the
+    regular expression engine."""
+    header = marshal.load(file)
+    if not (isinstance(header, tuple) and header[:1] == _cache_header()[:1]):
+        raise ValueError("not a regular expression cache")
+    if header != _cache_header():
+        return 0
+    loaded = {}
+    for flags, args in marshal.load(file):
+        loaded[type(args[0]), args[0], flags] = sre_compile._sre.compile(*args)
+    _loaded.update(loaded)
+    return len(loaded)
+
 def template(pattern, flags=0):
     "Compile a template pattern, returning a Pattern object"
     return _compile(pattern, flags|T)
@@ -266,6 +342,7 @@ Match = type(sre_compile.compile('', 0).match(''))
 # internals
 
 _cache = {}  # ordered!
+_loaded = {}  # patterns loaded by load_cache()
 
 _MAXCACHE = 512
 def _compile(pattern, flags):
@@ -283,7 +360,9 @@ def _compile(pattern, flags):
         return pattern
     if not sre_compile.isstring(pattern):
         raise TypeError("first argument must be string or compiled pattern")
-    p = sre_compile.compile(pattern, flags)
+    p = _loaded.get((type(pattern), pattern, flags))
+    if p is None:
+        p = sre_compile.compile(pattern, flags)
     if not (flags & DEBUG):
         if len(_cache) >= _MAXCACHE:
             # Drop the oldest item
@@ -294,6 +373,11 @@ def _compile(pattern, flags):
         _cache[type(pattern), pattern, flags] = p
     return p
 
+def _cache_header():
+    # internal: identify the engine that compiled the patterns of a cache
+    return ('sre', sre_compile.MAGIC, sre_compile._sre.CODESIZE,
+            sre_compile._sre.MAXREPEAT, sys.hexversion)
+
 @functools.lru_cache(_MAXCACHE)
 def _compile_repl(repl, pattern):
     # internal: compile replacement pattern
@@ -323,6 +407,139 @@ def _pickle(p):
 
 copyreg.pickle(Pattern, _pickle, _compile)
 
+# --------------------------------------------------------------------
+# pattern sets
+
+_MAXPREFIX = 32
+
+class PatternSet:
+    """A set of patterns matched against a string at once.
+
+    The literal prefixes of the patterns are combined into a single
+    pattern, so that a string is scanned once to find the candidate
+    patterns; only the candidates are then tried in full.
+    """
+
+    def __init__(self, patterns, flags=0):
+        self.patterns = tuple(_compile(p, flags) for p in patterns)
+        types = {type(p.pattern) for p in self.patterns}
+        if len(types) > 1:
+            raise TypeError("cannot mix str and bytes patterns")
+        self._always = []
+        self._prefixes = {}
+        for i, p in enumerate(self.patterns):
+            prefix = _literal_prefix(p)
+            if prefix:
+                self._prefixes.setdefault(prefix, []).append(i)
+            else:
+                self._always.append(i)
+        self._lengths = sorted({len(prefix) for prefix in self._prefixes})
+        if self._prefixes:
+            trie = _trie_pattern(list(self._prefixes))
+            if bytes in types:
+                trie = trie.encode('latin-1')
+            self._trie = _compile(trie, 0)
+            lookahead = '(?=(%s))' if str in types else b'(?=(%s))'
+            self._scanner = _compile(lookahead % trie, 0)
+        else:
+            self._trie = self._scanner = None
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def __repr__(self):
+        return '<%s.%s with %d patterns>' % (type(self).__module__,
+                                             type(self).__qualname__,
+                                             len(self.patterns))
+
+    def _candidates(self, literals):
+        found = set(self._always)
+        prefixes = self._prefixes
+        for literal in literals:
+            for n in self._lengths:
+                if n > len(literal):
+                    break
+                found.update(prefixes.get(literal[:n], ()))
+        return sorted(found)
+
+    def search(self, string, pos=0, endpos=None):
+        """Return the sorted list of indices of the patterns which match
+        somewhere in string."""
+        if endpos is None:
+            endpos = len(string)
+        literals = ()
+        if self._scanner is not None:
+            literals = {m.group(1)
+                        for m in self._scanner.finditer(string, pos, endpos)}
+        return [i for i in self._candidates(literals)
+                if self.patterns[i].search(string, pos, endpos)]
+
+    def _match(self, method, string, pos, endpos):
+        if endpos is None:
+            endpos = len(string)
+        literals = ()
+        if self._trie is not None:
+            m = self._trie.match(string, pos, endpos)
+            if m:
+                literals = (m.group(),)
+        return [i for i in self._candidates(literals)
+                if method(self.patterns[i], string, pos, endpos)]
+
+    def match(self, string, pos=0, endpos=None):
+        """Return the sorted list of indices of the patterns which match
+        at the beginning of string."""
+        return self._match(Pattern.match, string, pos, endpos)
+
+    def fullmatch(self, string, pos=0, endpos=None):
+        """Return the sorted list of indices of the patterns which match
+        all of string."""
+        return self._match(Pattern.fullmatch, string, pos, endpos)
+
+def _literal_prefix(p):
+    # internal: return the literal every match of a compiled pattern
+    # starts with, truncated to _MAXPREFIX characters
+    flags = p.flags & ~DEBUG
+    if flags & IGNORECASE and flags & LOCALE:
+        return p.pattern[:0]
+    code = sre_parse.parse(p.pattern, flags)
+    prefix = sre_compile._get_literal_prefix(code, code.state.flags)[0]
+    prefix = prefix[:_MAXPREFIX]
+    if isinstance(p.pattern, bytes):
+        return bytes(prefix)
+    return ''.join(map(chr, prefix))
+
+def _trie_pattern(literals):
+    # internal: return a pattern matching the longest of the literals
+    # at a given position.  Bytes literals are built as latin-1 strings.
+    trie = {}
+    for literal in literals:
+        if isinstance(literal, bytes):
+            literal = literal.decode('latin-1')
+        node = trie
+        for c in literal:
+            node = node.setdefault(c, {})
+        node[''] = None
+    def build(node):
+        end = '' in node
+        alternatives = []
+        for c in sorted(c for c in node if c):
+            child = node[c]
+            chain = [c]
+            # collapse chains of single children
+            while len(child) == 1 and '' not in child:
+                c, child = next(iter(child.items()))
+                chain.append(c)
+            alternatives.append(escape(''.join(chain)) + build(child))
+        if not alternatives:
+            return ''
+        if len(alternatives) == 1 and not end:
+            return alternatives[0]
+        result = '(?:%s)' % '|'.join(alternatives)
+        if end:
+            result += '?'
+        return result
+    return build(trie)
+
 # --------------------------------------------------------------------
 # experimental stuff (see python-dev discussions for details)
 
@@ -57,7 +57,8 @@ class scheduler:
     def __init__(self, timefunc=_time, delayfunc=time.sleep):
         """Initialize a new instance, passing the time and delay
         functions"""
-        self._queue = []
+        self._queue = heapq.IndexedHeap()
+        self._handles = {}      # id(event) -> handle in the queue
         self._lock = threading.RLock()
         self.timefunc = timefunc
         self.delayfunc = delayfunc
@@ -73,7 +74,7 @@ class scheduler:
             kwargs = {}
         event = Event(time, priority, action, argument, kwargs)
         with self._lock:
-            heapq.heappush(self._queue, event)
+            self._handles[id(event)] = self._queue.push(event)
         return event # The ID
 
     def enter(self, delay, priority, action, argument=(), kwargs=_sentinel):
@@ -93,8 +94,16 @@ class scheduler:
 
         """
         with self._lock:
-            self._queue.remove(event)
-            heapq.heapify(self._queue)
+            handle = self._handles.pop(id(event), None)
+            if handle is None:
+                # Like list.remove(), accept an equal event.
+                for queued in self._queue:
+                    if queued == event:
+                        handle = self._handles.pop(id(queued))
+                        break
+                else:
+                    raise ValueError('event is not in the queue')
+            self._queue.remove(handle)
 
     def empty(self):
         """Check whether the queue is empty."""
@@ -129,20 +138,22 @@ class scheduler:
         # and to improve thread safety
         lock = self._lock
         q = self._queue
+        handles = self._handles
         delayfunc = self.delayfunc
         timefunc = self.timefunc
-        pop = heapq.heappop
         while True:
             with lock:
                 if not q:
                     break
-                time, priority, action, argument, kwargs = q[0]
+                event = q.peek()
+                time, priority, action, argument, kwargs = event
                 now = timefunc()
                 if time > now:
                     delay = True
                 else:
                     delay = False
-                    pop(q)
+                    q.pop()
+                    del handles[id(event)]
             if delay:
                 if not blocking:
                     return time - now
@@ -163,5 +174,5 @@ class scheduler:
         # With heapq, two events scheduled at the same time will show in
         # the actual order they would be retrieved.
         with self._lock:
-            events = self._queue[:]
+            events = list(self._queue)
         return list(map(heapq.heappop, [events]*len(events)))
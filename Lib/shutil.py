@@ -424,15 +424,16 @@ def ignore_patterns(*patterns):
 
     Patterns is a sequence of glob-style patterns
     that are used to exclude files"""
+    if not patterns:
+        return lambda path, names: set()
+    # The patterns are compiled once into a single regular expression.
+    match = fnmatch._compile_patterns(tuple(map(os.path.normcase, patterns)))
     def _ignore_patterns(path, names):
-        ignored_names = []
-        for pattern in patterns:
-            ignored_names.extend(fnmatch.filter(names, pattern))
-        return set(ignored_names)
+        return {name for name in names if match(os.path.normcase(name))}
     return _ignore_patterns
 
 def _copytree(entries, src, dst, symlinks, ignore, copy_function,
-              ignore_dangling_symlinks):
+              ignore_dangling_symlinks, executor=None):
     if ignore is not None:
         ignored_names = ignore(src, set(os.listdir(src)))
     else:
@@ -440,6 +441,8 @@ def _copytree(entries, src, dst, symlinks, ignore, copy_function,
 
     os.makedirs(dst)
     errors = []
+    # Files copied by the executor, with their names.
+    copies = []
     use_srcentry = copy_function is copy2 or copy_function is copy
 
     for srcentry in entries:
@@ -463,12 +466,19 @@ def _copytree(entries, src, dst, symlinks, ignore, copy_function,
                         continue
                     # otherwise let the copy occurs. copy2 will raise an error
                     if srcentry.is_dir():
-                        copytree(srcobj, dstname, symlinks, ignore,
-                                 copy_function)
+                        _copysubtree(srcobj, dstname, symlinks, ignore,
+                                     copy_function, executor)
+                    elif executor is not None:
+                        copies.append((srcname, dstname, executor.submit(
+                            copy_function, srcobj, dstname)))
                     else:
                         copy_function(srcobj, dstname)
             elif srcentry.is_dir():
-                copytree(srcobj, dstname, symlinks, ignore, copy_function)
+                _copysubtree(srcobj, dstname, symlinks, ignore, copy_function,
+                             executor)
+            elif executor is not None:
+                copies.append((srcname, dstname, executor.submit(
+                    copy_function, srcentry, dstname)))
             else:
                 # Will raise a SpecialFileError for unsupported file types
                 copy_function(srcentry, dstname)
@@ -478,6 +488,14 @@ def _copytree(entries, src, dst, symlinks, ignore, copy_function,
             errors.extend(err.args[0])
         except OSError as why:
             errors.append((srcname, dstname, str(why)))
+    # The files have to be copied before the directory times are set.
+    for srcname, dstname, future in copies:
+        try:
+            future.result()
+        except Error as err:
+            errors.extend(err.args[0])
+        except OSError as why:
+            errors.append((srcname, dstname, str(why)))
     try:
         copystat(src, dst)
     except OSError as why:
@@ -488,8 +506,16 @@ def _copytree(entries, src, dst, symlinks, ignore, copy_function,
         raise Error(errors)
     return dst
 
+def _copysubtree(src, dst, symlinks, ignore, copy_function, executor):
+    if executor is None:
+        copytree(src, dst, symlinks, ignore, copy_function)
+    else:
+        with os.scandir(src) as entries:
+            _copytree(entries, src, dst, symlinks, ignore, copy_function,
+                      False, executor)
+
 def copytree(src, dst, symlinks=False, ignore=None, copy_function=copy2,
-             ignore_dangling_symlinks=False):
+             ignore_dangling_symlinks=False, *, workers=None):
     """Recursively copy a directory tree.
 
     The destination directory must not already exist.
@@ -523,7 +549,20 @@ def copytree(src, dst, symlinks=False, ignore=None, copy_function=copy2,
     destination path as arguments. By default, copy2() is used, but any
     function that supports the same signature (like copy()) can be used.
 
+    If the optional workers argument is given, the files are copied by a
+    pool of at most workers threads, several at a time.  copy_function
+    must then be safe to call from several threads.
+
     """
+    if workers is not None:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(workers) as executor, \
+             os.scandir(src) as entries:
+            return _copytree(entries=entries, src=src, dst=dst,
+                             symlinks=symlinks, ignore=ignore,
+                             copy_function=copy_function,
+                             ignore_dangling_symlinks=ignore_dangling_symlinks,
+                             executor=executor)
     with os.scandir(src) as entries:
         return _copytree(entries=entries, src=src, dst=dst, symlinks=symlinks,
                          ignore=ignore, copy_function=copy_function,
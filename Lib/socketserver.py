@@ -21,6 +21,8 @@ For request-based servers (including socket-based):
         - synchronous (one request is handled at a time)
         - forking (each request is handled by a new process)
         - threading (each request is handled by a new thread)
+        - thread pool (requests are handled by reusable worker threads)
+        - prefork (requests are handled by a fixed set of processes)
 
 The classes in this module favor the server type that is simplest to
 write: a synchronous TCP/IP server.  This is bad class design, but
@@ -50,8 +52,10 @@ stream server is the address family, which is simply repeated in both
 unix server classes.
 
 Forking and threading versions of each type of server can be created
-using the ForkingMixIn and ThreadingMixIn mix-in classes.  For
-instance, a threading UDP server class is created as follows:
+using the ForkingMixIn and ThreadingMixIn mix-in classes, and versions
+using a pool of worker threads or processes with the ThreadPoolMixIn and
+PreforkMixIn mix-in classes.  For instance, a threading UDP server class
+is created as follows:
 
         class ThreadingUDPServer(ThreadingMixIn, UDPServer): pass
 
@@ -126,6 +130,7 @@ __version__ = "0.4"
 import socket
 import selectors
 import os
+import queue
 import sys
 import threading
 from io import BufferedIOBase
@@ -134,9 +139,11 @@ from time import monotonic as time
 __all__ = ["BaseServer", "TCPServer", "UDPServer",
            "ThreadingUDPServer", "ThreadingTCPServer",
            "BaseRequestHandler", "StreamRequestHandler",
-           "DatagramRequestHandler", "ThreadingMixIn"]
+           "DatagramRequestHandler", "ThreadingMixIn",
+           "ThreadPoolUDPServer", "ThreadPoolTCPServer", "ThreadPoolMixIn"]
 if hasattr(os, "fork"):
-    __all__.extend(["ForkingUDPServer","ForkingTCPServer", "ForkingMixIn"])
+    __all__.extend(["ForkingUDPServer","ForkingTCPServer", "ForkingMixIn",
+                    "PreforkUDPServer", "PreforkTCPServer", "PreforkMixIn"])
 if hasattr(socket, "AF_UNIX"):
     __all__.extend(["UnixStreamServer","UnixDatagramServer",
                     "ThreadingUnixStreamServer",
@@ -628,6 +635,147 @@ if hasattr(os, "fork"):
             self.collect_children(blocking=self.block_on_close)
 
 
+    class PreforkMixIn:
+        """Mix-in class to handle requests in a fixed set of processes.
+
+        serve_forever() forks the worker processes, which accept and
+        handle the requests, and restarts those which exit until
+        shutdown() is called.
+        """
+
+        # Number of worker processes, os.cpu_count() if None.
+        processes = None
+        # If true, the worker processes but the first one listen on their
+        # own socket bound with SO_REUSEPORT, and the kernel balances the
+        # requests between them.  Otherwise the workers share the socket
+        # of the server.
+        reuse_port = False
+        _worker_pids = None
+
+        def __init__(self, *args, **kwargs):
+            self._shutdown_request = threading.Event()
+            self._is_shut_down = threading.Event()
+            super().__init__(*args, **kwargs)
+
+        def server_bind(self):
+            if self.reuse_port:
+                if not hasattr(socket, 'SO_REUSEPORT'):
+                    raise ValueError(
+                        'reuse_port not supported by socket module')
+                self.socket.setsockopt(socket.SOL_SOCKET,
+                                       socket.SO_REUSEPORT, 1)
+            super().server_bind()
+
+        def serve_forever(self, poll_interval=0.5):
+            """Run the worker processes until shutdown.
+
+            Exited workers are replaced every poll_interval seconds.
+            """
+            self._is_shut_down.clear()
+            # Maps the pid of each worker process to its index.
+            self._worker_pids = {}
+            # The workers stop when the parent closes the write end of
+            # this pipe, or exits.
+            stop_r, stop_w = os.pipe()
+            try:
+                processes = self.processes or os.cpu_count() or 1
+                while not self._shutdown_request.is_set():
+                    indexes = set(self._worker_pids.values())
+                    for index in range(processes):
+                        if index not in indexes:
+                            self._start_worker(index, stop_r, stop_w,
+                                               poll_interval)
+                    if self._shutdown_request.wait(poll_interval):
+                        break
+                    self.collect_workers()
+            finally:
+                os.close(stop_w)
+                self.collect_workers(blocking=True)
+                os.close(stop_r)
+                self._worker_pids = None
+                self._shutdown_request.clear()
+                self._is_shut_down.set()
+
+        def shutdown(self):
+            """Stops the serve_forever loop and the worker processes.
+
+            Blocks until the workers have exited.
+            """
+            self._shutdown_request.set()
+            self._is_shut_down.wait()
+
+        def collect_workers(self, *, blocking=False):
+            """Internal routine to wait for workers that have exited."""
+            for pid in list(self._worker_pids):
+                try:
+                    pid, _ = os.waitpid(pid, 0 if blocking else os.WNOHANG)
+                except ChildProcessError:
+                    # someone else reaped it
+                    pass
+                except OSError:
+                    continue
+                self._worker_pids.pop(pid, None)
+
+        def get_request(self):
+            request, client_address = super().get_request()
+            # An accepted socket may inherit the non-blocking mode of the
+            # listening socket.
+            if self.socket_type == socket.SOCK_STREAM:
+                request.setblocking(True)
+            return request, client_address
+
+        def _start_worker(self, index, stop_r, stop_w, poll_interval):
+            pid = os.fork()
+            if pid:
+                # Parent process
+                self._worker_pids[pid] = index
+                return
+            # Child process.
+            # This must never return, hence os._exit()!
+            status = 1
+            try:
+                os.close(stop_w)
+                self._worker_pids = None
+                # The socket of the server is kept open by the parent, so
+                # that no request is lost while the workers start.
+                if self.reuse_port and index:
+                    self.socket.close()
+                    self.socket = socket.socket(self.address_family,
+                                                self.socket_type)
+                    if self.allow_reuse_address:
+                        self.socket.setsockopt(socket.SOL_SOCKET,
+                                               socket.SO_REUSEADDR, 1)
+                    self.socket.setsockopt(socket.SOL_SOCKET,
+                                           socket.SO_REUSEPORT, 1)
+                    self.socket.bind(self.server_address)
+                    if self.socket_type == socket.SOCK_STREAM:
+                        self.socket.listen(self.request_queue_size)
+                # Several workers may wake up for the same request: the
+                # others must not block in accept() or recvfrom().
+                self.socket.setblocking(False)
+                try:
+                    self._serve_worker(stop_r, poll_interval)
+                finally:
+                    self.server_close()
+                status = 0
+            except Exception:
+                self.handle_error(None, None)
+            finally:
+                os._exit(status)
+
+        def _serve_worker(self, stop_fd, poll_interval):
+            with _ServerSelector() as selector:
+                selector.register(self, selectors.EVENT_READ)
+                selector.register(stop_fd, selectors.EVENT_READ)
+                while True:
+                    ready = selector.select(poll_interval)
+                    if any(key.fileobj == stop_fd for key, _ in ready):
+                        break
+                    if ready:
+                        self._handle_request_noblock()
+                    self.service_actions()
+
+
 class ThreadingMixIn:
     """Mix-in class to handle each request in a new thread."""
 
@@ -674,12 +822,86 @@ class ThreadingMixIn:
                     thread.join()
 
 
+class ThreadPoolMixIn:
+    """Mix-in class to handle requests in a pool of worker threads."""
+
+    # Maximum number of worker threads; they are started as needed.
+    max_workers = 16
+    # Maximum number of requests waiting for a worker, or 0 for no
+    # limit.  When it is reached, process_request() blocks so that no
+    # new request is accepted until a worker is available.
+    queue_size = 64
+    # Decides how threads will act upon termination of the
+    # main process
+    daemon_threads = False
+    # If true, server_close() waits until all non-daemonic threads terminate.
+    block_on_close = True
+    _workers = None
+    _work_queue = None
+    _idle_workers = None
+
+    def process_request_thread(self, request, client_address):
+        """Same as in BaseServer but in a worker thread.
+
+        In addition, exception handling is done here.
+
+        """
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def process_request(self, request, client_address):
+        """Queue the request for a worker thread."""
+        if self._work_queue is None:
+            self._work_queue = queue.Queue(self.queue_size)
+            self._workers = []
+            self._idle_workers = threading.Semaphore(0)
+        # Start a new worker only if none is waiting for a request.
+        if (not self._idle_workers.acquire(blocking=False) and
+                len(self._workers) < self.max_workers):
+            t = threading.Thread(target=self._worker)
+            t.daemon = self.daemon_threads
+            self._workers.append(t)
+            t.start()
+        self._work_queue.put((request, client_address))
+
+    def _worker(self):
+        work_queue = self._work_queue
+        idle_workers = self._idle_workers
+        while True:
+            item = work_queue.get()
+            if item is None:
+                break
+            self.process_request_thread(*item)
+            idle_workers.release()
+
+    def server_close(self):
+        super().server_close()
+        workers = self._workers
+        work_queue = self._work_queue
+        self._workers = self._work_queue = self._idle_workers = None
+        if workers:
+            for _ in workers:
+                work_queue.put(None)
+            if self.block_on_close:
+                for thread in workers:
+                    if not thread.daemon:
+                        thread.join()
+
+
 if hasattr(os, "fork"):
     class ForkingUDPServer(ForkingMixIn, UDPServer): pass
     class ForkingTCPServer(ForkingMixIn, TCPServer): pass
+    class PreforkUDPServer(PreforkMixIn, UDPServer): pass
+    class PreforkTCPServer(PreforkMixIn, TCPServer): pass
 
 class ThreadingUDPServer(ThreadingMixIn, UDPServer): pass
 class ThreadingTCPServer(ThreadingMixIn, TCPServer): pass
+class ThreadPoolUDPServer(ThreadPoolMixIn, UDPServer): pass
+class ThreadPoolTCPServer(ThreadPoolMixIn, TCPServer): pass
 
 if hasattr(socket, 'AF_UNIX'):
 
@@ -0,0 +1,721 @@
+#
+# Secret Labs' Regular Expression Engine
+#
+# linear-time matching of the patterns parsed by sre_parse
+#
+# See the sre.py file for information on usage and redistribution.
+#
+
+"""Linear-time matching of regular expressions.
+
+Patterns are compiled to a Thompson NFA which is run as a Pike VM: all
+the possible matches are tried at once, one character at a time, so the
+time needed to match is proportional to the length of the string and the
+size of the pattern, whatever they are.  The transitions between sets of
+NFA states are cached as they are computed, like in a lazy DFA.
+
+The order of the alternatives is honoured, and like in the backtracking
+engine of the _sre module an optional iteration matching the empty string
+ends a repetition, so the matches found are the same.  The groups are the
+same too, except that a repeated group which can match the empty string
+may capture a different substring.
+Backreferences, conditional groups and lookahead and lookbehind
+assertions cannot be matched in linear time and are not supported.
+"""
+
+import sys
+import _sre
+import sre_parse
+from sre_constants import *
+from sre_compile import _combine_flags, _ignorecase_fixes
+
+# instructions of the compiled program
+_CHAR = 0       # consume a character matching the predicate argument
+_MATCH = 1      # the pattern matched
+_SPLIT = 2      # try both targets of the argument, the first one first
+_JMP = 3        # continue at the target
+_SAVE = 4       # save the position in the capture slot
+_ASSERT = 5     # continue if the context has one of the argument bits
+_LOOP = 6       # end of an optional iteration: continue at the exit if the
+                # iteration was empty, else at the next target
+
+# bits of the context of a position, for the assertions
+_BEGINNING = 1 << 0
+_BEGINNING_LINE = 1 << 1
+_END = 1 << 2
+_END_LINE = 1 << 3
+_END_STRING = 1 << 4
+_BOUNDARY = 1 << 5
+_NON_BOUNDARY = 1 << 6
+_UNI_BOUNDARY = 1 << 7
+_UNI_NON_BOUNDARY = 1 << 8
+
+_AT_BITS = {
+    AT_BEGINNING_STRING: _BEGINNING,
+    AT_END_STRING: _END_STRING,
+    AT_BEGINNING: _BEGINNING,
+    AT_END: _END,
+    AT_BOUNDARY: _BOUNDARY,
+    AT_NON_BOUNDARY: _NON_BOUNDARY,
+}
+_AT_MULTILINE_BITS = {
+    AT_BEGINNING: _BEGINNING_LINE,
+    AT_END: _END_LINE,
+}
+_AT_UNICODE_BITS = {
+    AT_BOUNDARY: _UNI_BOUNDARY,
+    AT_NON_BOUNDARY: _UNI_NON_BOUNDARY,
+}
+
+_UNSUPPORTED = {
+    GROUPREF: "backreferences",
+    GROUPREF_EXISTS: "conditional groups",
+    ASSERT: "lookahead and lookbehind assertions",
+    ASSERT_NOT: "lookahead and lookbehind assertions",
+}
+
+# maximal number of instructions of a compiled pattern
+MAXPROGRAM = 100000
+# default maximal number of cached transitions
+MAXSTATES = 10000
+
+_NEWLINE = ord('\n')
+_UNDERSCORE = ord('_')
+_UNI_LINEBREAKS = frozenset(map(ord,
+                                  '\n\x0b\x0c\r\x1c\x1d\x1e\x85\u2028\u2029'))
+_ASCII_SPACES = frozenset(b' \t\n\r\x0b\x0c')
+
+def _is_word(c):
+    return c < 128 and (chr(c).isalnum() or c == _UNDERSCORE)
+
+def _is_uni_word(c):
+    return chr(c).isalnum() or c == _UNDERSCORE
+
+_CATEGORIES = {
+    CATEGORY_DIGIT: lambda c: 48 <= c <= 57,
+    CATEGORY_NOT_DIGIT: lambda c: not 48 <= c <= 57,
+    CATEGORY_SPACE: _ASCII_SPACES.__contains__,
+    CATEGORY_NOT_SPACE: lambda c: c not in _ASCII_SPACES,
+    CATEGORY_WORD: _is_word,
+    CATEGORY_NOT_WORD: lambda c: not _is_word(c),
+    CATEGORY_LINEBREAK: _NEWLINE.__eq__,
+    CATEGORY_NOT_LINEBREAK: _NEWLINE.__ne__,
+}
+_UNI_CATEGORIES = {
+    CATEGORY_DIGIT: lambda c: chr(c).isdecimal(),
+    CATEGORY_NOT_DIGIT: lambda c: not chr(c).isdecimal(),
+    CATEGORY_SPACE: lambda c: chr(c).isspace(),
+    CATEGORY_NOT_SPACE: lambda c: not chr(c).isspace(),
+    CATEGORY_WORD: _is_uni_word,
+    CATEGORY_NOT_WORD: lambda c: not _is_uni_word(c),
+    CATEGORY_LINEBREAK: _UNI_LINEBREAKS.__contains__,
+    CATEGORY_NOT_LINEBREAK: lambda c: c not in _UNI_LINEBREAKS,
+}
+
+def _ascii_toupper(c):
+    if 97 <= c <= 122:
+        return c - 32
+    return c
+
+def _unicode_toupper(c):
+    upper = chr(c).upper()
+    if len(upper) == 1:
+        return ord(upper)
+    return c
+
+def _literal(av, flags):
+    # return the predicate of a literal character
+    if flags & SRE_FLAG_IGNORECASE:
+        if flags & SRE_FLAG_UNICODE:
+            if _sre.unicode_iscased(av):
+                lower = _sre.unicode_tolower
+                lowers = {lower(av)}
+                lowers.update(_ignorecase_fixes.get(lower(av), ()))
+                lowers = frozenset(lowers)
+                return lambda c: lower(c) in lowers
+        elif _sre.ascii_iscased(av):
+            lower = _sre.ascii_tolower(av)
+            return lambda c: _sre.ascii_tolower(c) == lower
+    return av.__eq__
+
+def _charset(items, flags):
+    # return the predicate of a character set
+    negate = False
+    literals = set()
+    ranges = []
+    categories = []
+    unicode = flags & SRE_FLAG_UNICODE
+    categories_table = _UNI_CATEGORIES if unicode else _CATEGORIES
+    for op, av in items:
+        if op is NEGATE:
+            negate = True
+        elif op is LITERAL:
+            literals.add(av)
+        elif op is RANGE:
+            ranges.append(av)
+        elif op is CATEGORY:
+            categories.append(categories_table[av])
+        else:
+            raise error("internal: unsupported set operator %r" % (op,))
+    literals = frozenset(literals)
+    def contains(c):
+        if c in literals:
+            return True
+        for lo, hi in ranges:
+            if lo <= c <= hi:
+                return True
+        for category in categories:
+            if category(c):
+                return True
+        return False
+    if flags & SRE_FLAG_IGNORECASE:
+        if unicode:
+            lower = _sre.unicode_tolower
+            upper = _unicode_toupper
+            fixes = _ignorecase_fixes
+        else:
+            lower = _sre.ascii_tolower
+            upper = _ascii_toupper
+            fixes = {}
+        contains1 = contains
+        def contains(c):
+            if contains1(c):
+                return True
+            lo = lower(c)
+            if contains1(lo) or contains1(upper(lo)):
+                return True
+            for c in fixes.get(lo, ()):
+                if contains1(c) or contains1(upper(c)):
+                    return True
+            return False
+    if negate:
+        return lambda c: not contains(c)
+    return contains
+
+def _any(c):
+    return True
+
+def _compile(prog, pattern, flags):
+    # internal: append the program of a parsed pattern to prog
+    for op, av in pattern:
+        if len(prog) > MAXPROGRAM:
+            raise error("pattern too large for linear-time matching")
+        if flags & SRE_FLAG_LOCALE:
+            raise error("the LOCALE flag is not supported by linear-time "
+                        "matching")
+        if op is LITERAL:
+            prog.append((_CHAR, _literal(av, flags)))
+        elif op is NOT_LITERAL:
+            predicate = _literal(av, flags)
+            prog.append((_CHAR, lambda c, predicate=predicate:
+                                    not predicate(c)))
+        elif op is ANY:
+            if flags & SRE_FLAG_DOTALL:
+                prog.append((_CHAR, _any))
+            else:
+                prog.append((_CHAR, _NEWLINE.__ne__))
+        elif op is IN:
+            prog.append((_CHAR, _charset(av, flags)))
+        elif op is BRANCH:
+            alternatives = av[1]
+            jumps = []
+            for alternative in alternatives[:-1]:
+                split = len(prog)
+                prog.append(None)
+                _compile(prog, alternative, flags)
+                jumps.append(len(prog))
+                prog.append(None)
+                prog[split] = (_SPLIT, (split + 1, len(prog)))
+            _compile(prog, alternatives[-1], flags)
+            for jump in jumps:
+                prog[jump] = (_JMP, len(prog))
+        elif op is SUBPATTERN:
+            group, add_flags, del_flags, p = av
+            if group is not None:
+                prog.append((_SAVE, 2 * group))
+            _compile(prog, p, _combine_flags(flags, add_flags, del_flags))
+            if group is not None:
+                prog.append((_SAVE, 2 * group + 1))
+        elif op is MAX_REPEAT or op is MIN_REPEAT:
+            lo, hi, item = av
+            greedy = op is MAX_REPEAT
+            for i in range(lo):
+                _compile(prog, item, flags)
+                if len(prog) > MAXPROGRAM:
+                    raise error("pattern too large for linear-time matching")
+            # Like in sre, an optional iteration matching the empty
+            # string ends the repetition.
+            if hi == MAXREPEAT:
+                split = len(prog)
+                prog.append(None)
+                _compile(prog, item, flags)
+                prog.append((_LOOP, (split, split, len(prog) + 1)))
+                targets = (split + 1, len(prog))
+                prog[split] = (_SPLIT, targets if greedy else targets[::-1])
+            else:
+                splits = []
+                for i in range(hi - lo):
+                    splits.append(len(prog))
+                    prog.append(None)
+                    _compile(prog, item, flags)
+                    prog.append(None)
+                    if len(prog) > MAXPROGRAM:
+                        raise error("pattern too large for linear-time "
+                                    "matching")
+                exit = len(prog)
+                for i, split in enumerate(splits):
+                    end = (splits[i + 1] if i + 1 < len(splits) else exit) - 1
+                    prog[end] = (_LOOP, (split, end + 1, exit))
+                    targets = (split + 1, exit)
+                    prog[split] = (_SPLIT,
+                                   targets if greedy else targets[::-1])
+        elif op is AT:
+            if flags & SRE_FLAG_MULTILINE and av in _AT_MULTILINE_BITS:
+                bit = _AT_MULTILINE_BITS[av]
+            elif flags & SRE_FLAG_UNICODE and av in _AT_UNICODE_BITS:
+                bit = _AT_UNICODE_BITS[av]
+            else:
+                bit = _AT_BITS[av]
+            prog.append((_ASSERT, bit))
+        elif op in _UNSUPPORTED:
+            raise error("%s are not supported by linear-time matching" %
+                        _UNSUPPORTED[op])
+        else:
+            raise error("internal: unsupported operand type %r" % (op,))
+
+def _context(codes, pos, end, mask):
+    # return the bits of mask which hold at pos
+    ctx = 0
+    prev = codes[pos - 1] if pos > 0 else None
+    this = codes[pos] if pos < end else None
+    if pos == 0:
+        ctx |= _BEGINNING | _BEGINNING_LINE
+    elif prev == _NEWLINE:
+        ctx |= _BEGINNING_LINE
+    if pos == end:
+        ctx |= _END | _END_LINE | _END_STRING
+    elif this == _NEWLINE:
+        ctx |= _END_LINE
+        if pos + 1 == end:
+            ctx |= _END
+    if end > 0:
+        if mask & (_BOUNDARY | _NON_BOUNDARY):
+            before = prev is not None and _is_word(prev)
+            after = this is not None and _is_word(this)
+            ctx |= _BOUNDARY if before != after else _NON_BOUNDARY
+        if mask & (_UNI_BOUNDARY | _UNI_NON_BOUNDARY):
+            before = prev is not None and _is_uni_word(prev)
+            after = this is not None and _is_uni_word(this)
+            ctx |= _UNI_BOUNDARY if before != after else _UNI_NON_BOUNDARY
+    return ctx & mask
+
+def _save(caps, slots, pos):
+    # return the captures of a thread after saving pos in slots
+    if not slots:
+        return caps
+    caps = list(caps)
+    for slot in slots:
+        caps[slot] = pos
+        if slot > 1 and slot & 1:
+            caps[-1] = slot >> 1
+    return tuple(caps)
+
+_FLAG_NAMES = [
+    (SRE_FLAG_TEMPLATE, 'TEMPLATE'),
+    (SRE_FLAG_IGNORECASE, 'IGNORECASE'),
+    (SRE_FLAG_LOCALE, 'LOCALE'),
+    (SRE_FLAG_MULTILINE, 'MULTILINE'),
+    (SRE_FLAG_DOTALL, 'DOTALL'),
+    (SRE_FLAG_UNICODE, 'UNICODE'),
+    (SRE_FLAG_VERBOSE, 'VERBOSE'),
+    (SRE_FLAG_DEBUG, 'DEBUG'),
+    (SRE_FLAG_ASCII, 'ASCII'),
+]
+
+if sys.byteorder == 'little':
+    _UTF32 = 'utf-32-le'
+else:
+    _UTF32 = 'utf-32-be'
+
+
+class Pattern:
+    """A regular expression compiled for linear-time matching.
+
+    Supports the methods and attributes of the compiled regular
+    expression objects of the re module, except scanner().
+    """
+
+    def __init__(self, pattern, flags=0, maxstates=MAXSTATES):
+        if not isinstance(pattern, (str, bytes)):
+            raise TypeError("first argument must be a string")
+        if maxstates <= 0:
+            raise ValueError("maxstates must be greater than 0")
+        p = sre_parse.parse(pattern, flags)
+        flags = p.state.flags
+        prog = [(_SAVE, 0)]
+        _compile(prog, p, flags)
+        prog.append((_SAVE, 1))
+        prog.append((_MATCH, None))
+        self.pattern = pattern
+        self.flags = flags
+        self.groups = p.state.groups - 1
+        self.groupindex = dict(p.state.groupdict)
+        self._indexgroup = {i: name for name, i in self.groupindex.items()}
+        self._prog = prog
+        self._mask = 0
+        for op, arg in prog:
+            if op == _ASSERT:
+                self._mask |= arg
+        self._maxstates = maxstates
+        self._closures = {}
+        self._transitions = {}
+
+    def __repr__(self):
+        flags = self.flags
+        if isinstance(self.pattern, str):
+            flags &= ~SRE_FLAG_UNICODE
+        names = ['re.' + name for flag, name in _FLAG_NAMES if flags & flag]
+        if names:
+            return 're.compile_linear(%r, %s)' % (self.pattern,
+                                                  '|'.join(names))
+        return 're.compile_linear(%r)' % (self.pattern,)
+
+    def __reduce__(self):
+        return type(self), (self.pattern, self.flags, self._maxstates)
+
+    def _codes(self, string):
+        # return the code points of string as a sequence of ints
+        if isinstance(self.pattern, str):
+            if not isinstance(string, str):
+                raise TypeError("cannot use a string pattern on a "
+                                "bytes-like object")
+            return memoryview(string.encode(_UTF32, 'surrogatepass')).cast('I')
+        if isinstance(string, str):
+            raise TypeError("cannot use a bytes pattern on a string-like "
+                            "object")
+        return memoryview(string).cast('B')
+
+    def _closure(self, pc, ctx):
+        # return the (pc, slots) of the instructions consuming a character
+        # or matching reached from pc, in order of priority
+        key = pc, ctx
+        try:
+            return self._closures[key]
+        except KeyError:
+            pass
+        prog = self._prog
+        result = []
+        # A thread is also told apart by the splits it went through since
+        # the last character, which tell whether an iteration is empty.
+        visited = set()
+        consumers = set()
+        stack = [(pc, (), frozenset())]
+        while stack:
+            pc, slots, splits = stack.pop()
+            op, arg = prog[pc]
+            if op == _CHAR or op == _MATCH:
+                if pc not in consumers:
+                    consumers.add(pc)
+                    result.append((pc, slots))
+                continue
+            if (pc, splits) in visited:
+                continue
+            visited.add((pc, splits))
+            if op == _JMP:
+                stack.append((arg, slots, splits))
+            elif op == _SPLIT:
+                stack.append((arg[1], slots, splits | {pc}))
+                stack.append((arg[0], slots, splits | {pc}))
+            elif op == _LOOP:
+                split, next, exit = arg
+                if split in splits:
+                    # The iteration was empty.
+                    stack.append((exit, slots, splits - {split}))
+                else:
+                    stack.append((next, slots, splits))
+            elif op == _SAVE:
+                stack.append((pc + 1, slots + (arg,), splits))
+            elif op == _ASSERT:
+                if ctx & arg:
+                    stack.append((pc + 1, slots, splits))
+        result = self._closures[key] = tuple(result)
+        return result
+
+    def _transition(self, pcs, c, ctx, accept):
+        # return the index of the thread which matches, if any, and the
+        # (thread, pc, slots) of the threads after consuming c
+        key = pcs, c, ctx, accept
+        try:
+            return self._transitions[key]
+        except KeyError:
+            pass
+        prog = self._prog
+        matched = None
+        moves = []
+        seen = set()
+        for i, pc in enumerate(pcs):
+            op, predicate = prog[pc]
+            if op == _MATCH:
+                if accept:
+                    matched = i
+                    break
+            elif c is not None and predicate(c):
+                for target, slots in self._closure(pc + 1, ctx):
+                    if target not in seen:
+                        seen.add(target)
+                        moves.append((i, target, slots))
+        if len(self._transitions) >= self._maxstates:
+            self._transitions.clear()
+        result = self._transitions[key] = matched, tuple(moves)
+        return result
+
+    def _run(self, codes, pos, end, search, fullmatch=False,
+             must_advance=False):
+        # return the captures of the first match, or None
+        mask = self._mask
+        nocaps = (None,) * (2 * self.groups + 3)
+        threads = []
+        pcs = []
+        match = None
+        start = pos
+        while True:
+            ctx = _context(codes, pos, end, mask) if mask else 0
+            if match is None and (search or pos == start):
+                seen = set(pcs)
+                for target, slots in self._closure(0, ctx):
+                    if target not in seen:
+                        seen.add(target)
+                        pcs.append(target)
+                        threads.append(_save(nocaps, slots, pos))
+            if not pcs:
+                if match is not None or not search or pos >= end:
+                    return match
+                pos += 1
+                continue
+            if pos < end:
+                c = codes[pos]
+                nctx = _context(codes, pos + 1, end, mask) if mask else 0
+            else:
+                c = None
+                nctx = 0
+            accept = ((not fullmatch or pos == end) and
+                      not (must_advance and pos == start))
+            matched, moves = self._transition(tuple(pcs), c, nctx, accept)
+            if matched is not None:
+                match = threads[matched]
+            if c is None:
+                return match
+            pos += 1
+            threads = [_save(threads[i], slots, pos) for i, _, slots in moves]
+            pcs = [pc for _, pc, _ in moves]
+
+    def _prepare(self, string, pos, endpos):
+        codes = self._codes(string)
+        n = len(codes)
+        if endpos is None or endpos > n:
+            endpos = n
+        elif endpos < 0:
+            endpos = 0
+        if pos < 0:
+            pos = 0
+        elif pos > n:
+            pos = n
+        return codes, pos, endpos
+
+    def _match(self, string, caps, pos, endpos):
+        if caps is None:
+            return None
+        return Match(self, string, caps, pos, endpos)
+
+    def match(self, string, pos=0, endpos=None):
+        """Matches zero or more characters at the beginning of the string."""
+        codes, pos, endpos = self._prepare(string, pos, endpos)
+        return self._match(string, self._run(codes, pos, endpos, False),
+                           pos, endpos)
+
+    def fullmatch(self, string, pos=0, endpos=None):
+        """Matches against all of the string."""
+        codes, pos, endpos = self._prepare(string, pos, endpos)
+        return self._match(string, self._run(codes, pos, endpos, False, True),
+                           pos, endpos)
+
+    def search(self, string, pos=0, endpos=None):
+        """Scan through string looking for a match, and return a
+        corresponding match object instance.
+
+        Return None if no position in the string matches."""
+        codes, pos, endpos = self._prepare(string, pos, endpos)
+        return self._match(string, self._run(codes, pos, endpos, True),
+                           pos, endpos)
+
+    def finditer(self, string, pos=0, endpos=None):
+        """Return an iterator over all non-overlapping matches for the
+        pattern in string.  For each match, the iterator returns a match
+        object."""
+        codes, pos, endpos = self._prepare(string, pos, endpos)
+        start = pos
+        must_advance = False
+        while pos <= endpos:
+            caps = self._run(codes, pos, endpos, True,
+                             must_advance=must_advance)
+            if caps is None:
+                break
+            yield Match(self, string, caps, start, endpos)
+            must_advance = caps[0] == caps[1]
+            pos = caps[1]
+
+    def findall(self, string, pos=0, endpos=None):
+        """Return a list of all non-overlapping matches of pattern in
+        string."""
+        result = []
+        empty = string[:0]
+        for m in self.finditer(string, pos, endpos):
+            if self.groups == 0:
+                result.append(m.group())
+            elif self.groups == 1:
+                result.append(m.group(1) or empty)
+            else:
+                result.append(m.groups(empty))
+        return result
+
+    def split(self, string, maxsplit=0):
+        """Split string by the occurrences of pattern."""
+        result = []
+        last = 0
+        for n, m in enumerate(self.finditer(string)):
+            if maxsplit and n >= maxsplit:
+                break
+            result.append(string[last:m.start()])
+            result.extend(m.groups())
+            last = m.end()
+        result.append(string[last:])
+        return result
+
+    def subn(self, repl, string, count=0):
+        """Return the tuple (new_string, number_of_subs_made) found by
+        replacing the leftmost non-overlapping occurrences of pattern with
+        the replacement repl."""
+        if callable(repl):
+            filter = repl
+        else:
+            template = sre_parse.parse_template(repl, self)
+            if not template[0] and len(template[1]) == 1:
+                literal = template[1][0]
+                filter = lambda m: literal
+            else:
+                filter = lambda m: sre_parse.expand_template(template, m)
+        pieces = []
+        last = 0
+        n = 0
+        for m in self.finditer(string):
+            if count and n >= count:
+                break
+            pieces.append(string[last:m.start()])
+            item = filter(m)
+            if item is not None:
+                pieces.append(item)
+            last = m.end()
+            n += 1
+        pieces.append(string[last:])
+        return string[:0].join(pieces), n
+
+    def sub(self, repl, string, count=0):
+        """Return the string obtained by replacing the leftmost
+        non-overlapping occurrences of pattern in string by the
+        replacement repl."""
+        return self.subn(repl, string, count)[0]
+
+
+class Match:
+    """The result of a successful match of a linear-time pattern.
+
+    Supports the methods and attributes of the match objects of the re
+    module.
+    """
+
+    def __init__(self, pattern, string, caps, pos, endpos):
+        self.re = pattern
+        self.string = string
+        self.pos = pos
+        self.endpos = endpos
+        self._caps = caps
+        self.lastindex = caps[-1]
+        self.lastgroup = pattern._indexgroup.get(self.lastindex)
+
+    def __repr__(self):
+        return '<%s.%s object; span=%r, match=%r>' % (
+            type(self).__module__, type(self).__qualname__,
+            self.span(), self.group())
+
+    def _index(self, group):
+        if isinstance(group, int):
+            if 0 <= group <= self.re.groups:
+                return group
+        else:
+            try:
+                return self.re.groupindex[group]
+            except (KeyError, TypeError):
+                pass
+        raise IndexError("no such group")
+
+    def span(self, group=0):
+        """For match object m, return the 2-tuple (m.start(group),
+        m.end(group))."""
+        i = self._index(group)
+        start, end = self._caps[2 * i], self._caps[2 * i + 1]
+        if start is None or end is None:
+            return -1, -1
+        return start, end
+
+    def start(self, group=0):
+        """Return index of the start of the substring matched by group."""
+        return self.span(group)[0]
+
+    def end(self, group=0):
+        """Return index of the end of the substring matched by group."""
+        return self.span(group)[1]
+
+    @property
+    def regs(self):
+        return tuple(self.span(i) for i in range(self.re.groups + 1))
+
+    def _group(self, group, default=None):
+        start, end = self.span(group)
+        if start < 0:
+            return default
+        return self.string[start:end]
+
+    def group(self, *groups):
+        """Return subgroup(s) of the match by indices or names.
+        For 0 returns the entire match."""
+        if not groups:
+            return self._group(0)
+        if len(groups) == 1:
+            return self._group(groups[0])
+        return tuple(self._group(group) for group in groups)
+
+    def __getitem__(self, group):
+        return self._group(group)
+
+    def groups(self, default=None):
+        """Return a tuple containing all the subgroups of the match, from
+        1."""
+        return tuple(self._group(i, default)
+                     for i in range(1, self.re.groups + 1))
+
+    def groupdict(self, default=None):
+        """Return a dictionary containing all the named subgroups of the
+        match, keyed by the subgroup name."""
+        return {name: self._group(name, default)
+                for name in self.re.groupindex}
+
+    def expand(self, template):
+        """Return the string obtained by doing backslash substitution on
+        the string template, as done by the sub() method."""
+        template = sre_parse.parse_template(template, self.re)
+        return sre_parse.expand_template(template, self)
+
+
+def compile(pattern, flags=0, maxstates=MAXSTATES):
+    # internal: compile a pattern for linear-time matching
+    return Pattern(pattern, flags, maxstates)
@@ -11,12 +11,14 @@ Calculating averages
 Function            Description
 ==================  =============================================
 mean                Arithmetic mean (average) of data.
+fmean               Fast, floating point arithmetic mean of data.
 harmonic_mean       Harmonic mean of data.
 median              Median (middle value) of data.
 median_low          Low median of data.
 median_high         High median of data.
 median_grouped      Median, or 50th percentile, of grouped data.
 mode                Mode (most common value) of data.
+quantiles           Divide data into intervals with equal probability.
 ==================  =============================================
 
 Calculate the arithmetic mean ("the average") of data:
@@ -53,6 +55,8 @@ pvariance           Population variance of data.
 variance            Sample variance of data.
 pstdev              Population standard deviation of data.
 stdev               Sample standard deviation of data.
+fpvariance          Fast, floating point population variance of data.
+fvariance           Fast, floating point sample variance of data.
 ==================  =============================================
 
 Calculate the standard deviation of sample data:
@@ -69,6 +73,20 @@ second argument to the four "spread" functions to avoid recalculating it:
 2.5
 
 
+Streaming statistics
+--------------------
+
+A RunningStats object accumulates the count, mean, variance, minimum and
+maximum of data in a single pass, without storing it:
+
+>>> stats = RunningStats([2, 4, 4, 4])
+>>> stats.update([5, 5, 7, 9])
+>>> stats.mean, stats.pvariance, stats.max
+(5.0, 4.0, 9.0)
+
+Objects accumulating different parts of the data can be merged.
+
+
 Exceptions
 ----------
 
@@ -80,6 +98,7 @@ __all__ = [ 'StatisticsError',
             'pstdev', 'pvariance', 'stdev', 'variance',
             'median',  'median_low', 'median_high', 'median_grouped',
             'mean', 'mode', 'harmonic_mean',
+            'fmean', 'fvariance', 'fpvariance', 'quantiles', 'RunningStats',
           ]
 
 import collections
@@ -90,6 +109,8 @@ from fractions import Fraction
 from decimal import Decimal
 from itertools import groupby
 from bisect import bisect_left, bisect_right
+from math import fsum
+from operator import mul
 
 
 
@@ -313,6 +334,39 @@ def mean(data):
     return _convert(total/n, T)
 
 
+def fmean(data, weights=None):
+    """Convert data to floats and compute the arithmetic mean.
+
+    This runs faster than the mean() function and it always returns a
+    float.  The data may be any iterable of numbers, such as a list or
+    an array.array.
+
+    >>> fmean([3.5, 4.0, 5.25])
+    4.25
+
+    If ``weights`` is given, it is an iterable of the weights of the
+    data points, and the weighted mean is returned:
+
+    >>> fmean([3.5, 4.0, 5.25], weights=[1, 2, 1])
+    4.1875
+
+    If ``data`` is empty, StatisticsError will be raised.
+    """
+    if weights is None:
+        try:
+            n = len(data)
+        except TypeError:
+            data = list(data)
+            n = len(data)
+        if n < 1:
+            raise StatisticsError('fmean requires at least one data point')
+        return fsum(data) / n
+    data, weights, total_weight = _weighted(data, weights)
+    if not data:
+        raise StatisticsError('fmean requires at least one data point')
+    return fsum(map(mul, data, weights)) / total_weight
+
+
 def harmonic_mean(data):
     """Return the harmonic mean of data.
 
@@ -509,6 +563,53 @@ def mode(data):
         raise StatisticsError('no mode for empty data')
 
 
+def quantiles(data, *, n=4, method='exclusive'):
+    """Divide data into n continuous intervals with equal probability.
+
+    Returns a list of (n - 1) cut points separating the intervals.
+
+    Set n to 4 for quartiles (the default).  Set n to 10 for deciles.
+    Set n to 100 for percentiles which gives the 99 cuts points that
+    separate data into 100 equal sized groups.
+
+    The data can be any iterable containing sample data.  The cut points
+    are linearly interpolated between data points.
+
+    If method is set to 'inclusive', data is treated as population data.
+    The minimum value is treated as the 0th percentile and the maximum
+    value is treated as the 100th percentile.
+
+    >>> quantiles([1, 3, 4, 6, 8, 9, 10, 12], n=4)
+    [3.25, 7.0, 9.75]
+    """
+    if n < 1:
+        raise StatisticsError('n must be at least 1')
+    data = sorted(data)
+    ld = len(data)
+    if ld < 2:
+        raise StatisticsError('must have at least two data points')
+    if method == 'inclusive':
+        m = ld - 1
+        result = []
+        for i in range(1, n):
+            j = i * m // n
+            delta = i * m - j * n
+            interpolated = (data[j] * (n - delta) + data[j + 1] * delta) / n
+            result.append(interpolated)
+        return result
+    if method == 'exclusive':
+        m = ld + 1
+        result = []
+        for i in range(1, n):
+            j = i * m // n                          # rescale i to m/n
+            j = 1 if j < 1 else ld - 1 if j > ld - 1 else j  # clamp
+            delta = i * m - j * n                   # exact integer math
+            interpolated = (data[j - 1] * (n - delta) + data[j] * delta) / n
+            result.append(interpolated)
+        return result
+    raise ValueError('Unknown method: %r' % (method,))
+
+
 # === Measures of spread ===
 
 # See http://mathworld.wolfram.com/Variance.html
@@ -542,6 +643,99 @@ def _ss(data, c=None):
     return (T, total)
 
 
+def _weighted(data, weights):
+    """Return data and weights as lists, and the sum of the weights."""
+    data = list(data)
+    weights = list(weights)
+    if len(data) != len(weights):
+        raise StatisticsError('data and weights must be the same length')
+    total_weight = fsum(weights)
+    if data and not total_weight:
+        raise StatisticsError('sum of weights must be non-zero')
+    return data, weights, total_weight
+
+
+def _fss(data, weights=None, c=None):
+    """Return the sum of square deviations of the floats in data from c,
+    or from their mean if c is None, and the count of data points (the
+    sum of the weights, if given).
+
+    The loops run in C over the data, see _ss() for the method.
+    """
+    if weights is None:
+        n = len(data)
+        if c is None:
+            c = fsum(data) / n
+        d = list(map(float(c).__rsub__, data))     # x - c for x in data
+        total = fsum(map(mul, d, d))
+        total2 = fsum(d)
+    else:
+        n = fsum(weights)
+        if c is None:
+            c = fsum(map(mul, data, weights)) / n
+        d = list(map(float(c).__rsub__, data))
+        total = fsum(map(mul, map(mul, d, d), weights))
+        total2 = fsum(map(mul, d, weights))
+    total -= total2 * total2 / n
+    return (max(total, 0.0), n)
+
+
+def fvariance(data, xbar=None, weights=None):
+    """Convert data to floats and compute the sample variance.
+
+    This runs faster than the variance() function and it always returns
+    a float.  The data may be any iterable of numbers, such as a list or
+    an array.array.  The optional argument xbar, if given, should be the
+    mean of the data.
+
+    >>> fvariance([2.75, 1.75, 1.25, 0.25, 0.5, 1.25, 3.5])
+    1.3720238095238095
+
+    If ``weights`` is given, it is an iterable of the frequencies of the
+    data points:
+
+    >>> fvariance([1.0, 2.0, 4.0], weights=[2, 1, 1])
+    2.0
+
+    """
+    if weights is None:
+        data = list(map(float, data))
+        if len(data) < 2:
+            raise StatisticsError('fvariance requires at least two '
+                                  'data points')
+    else:
+        data, weights, total_weight = _weighted(map(float, data), weights)
+        if total_weight <= 1:
+            raise StatisticsError('fvariance requires a sum of weights '
+                                  'greater than one')
+    ss, n = _fss(data, weights, xbar)
+    return ss / (n - 1)
+
+
+def fpvariance(data, mu=None, weights=None):
+    """Convert data to floats and compute the population variance.
+
+    This runs faster than the pvariance() function and it always returns
+    a float.  See fvariance() for the arguments.
+
+    >>> fpvariance([0.0, 0.25, 0.25, 1.25, 1.5, 1.75, 2.75, 3.25])
+    1.25
+
+    """
+    if weights is None:
+        data = list(map(float, data))
+        if not data:
+            raise StatisticsError('fpvariance requires at least one '
+                                  'data point')
+    else:
+        data, weights, total_weight = _weighted(map(float, data), weights)
+        if not data:
+            raise StatisticsError('fpvariance requires at least one '
+                                  'data point')
+    ss, n = _fss(data, weights, mu)
+    return ss / n
+
+
 def variance(data, xbar=None):
     """Return the sample variance of data.
 
@@ -667,3 +861,128 @@ def pstdev(data, mu=None):
         return var.sqrt()
     except AttributeError:
         return math.sqrt(var)
+
+
+# === Streaming statistics ===
+
+class RunningStats:
+    """Accumulate statistics of a stream of data in a single pass.
+
+    The count, mean, variance, minimum and maximum of the data added with
+    add() or update() are kept up to date, using Welford's algorithm, but
+    the data itself is not stored.  Objects accumulating different parts
+    of the data, for example in different processes, can be combined with
+    merge() or the + operator.
+
+    >>> stats = RunningStats([1.0, 2.0])
+    >>> stats.add(6.0)
+    >>> stats.count, stats.mean, stats.variance
+    (3, 3.0, 7.0)
+    >>> (stats + RunningStats([3.0])).mean
+    3.0
+
+    """
+
+    def __init__(self, data=()):
+        self.count = 0
+        self.min = self.max = None
+        self._mean = 0.0
+        self._ss = 0.0      # sum of square deviations from the mean
+        self.update(data)
+
+    def __repr__(self):
+        if not self.count:
+            return '%s()' % (type(self).__name__,)
+        return '<%s count=%d mean=%r min=%r max=%r>' % (
+            type(self).__name__, self.count, self._mean, self.min, self.max)
+
+    def add(self, x):
+        """Add the data point x."""
+        x = float(x)
+        self.count += 1
+        delta = x - self._mean
+        self._mean += delta / self.count
+        self._ss += delta * (x - self._mean)
+        if self.count == 1:
+            self.min = self.max = x
+        elif x < self.min:
+            self.min = x
+        elif x > self.max:
+            self.max = x
+
+    def update(self, data):
+        """Add the data points of the iterable data.
+
+        The statistics of data are computed first, with loops running in C,
+        and then merged into the accumulated ones.
+        """
+        data = list(map(float, data))
+        if not data:
+            return
+        batch = type(self)()
+        batch._ss, batch.count = _fss(data)
+        batch._mean = fsum(data) / batch.count
+        batch.min = min(data)
+        batch.max = max(data)
+        self.merge(batch)
+
+    def merge(self, other):
+        """Add the data points accumulated by the RunningStats other."""
+        if not other.count:
+            return
+        if not self.count:
+            self.count = other.count
+            self._mean = other._mean
+            self._ss = other._ss
+            self.min = other.min
+            self.max = other.max
+            return
+        count = self.count + other.count
+        delta = other._mean - self._mean
+        self._mean += delta * other.count / count
+        self._ss += (other._ss +
+                     delta * delta * self.count * other.count / count)
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def __add__(self, other):
+        if not isinstance(other, RunningStats):
+            return NotImplemented
+        result = type(self)()
+        result.merge(self)
+        result.merge(other)
+        return result
+
+    @property
+    def mean(self):
+        """Arithmetic mean of the data."""
+        if not self.count:
+            raise StatisticsError('mean requires at least one data point')
+        return self._mean
+
+    @property
+    def variance(self):
+        """Sample variance of the data."""
+        if self.count < 2:
+            raise StatisticsError('variance requires at least two '
+                                  'data points')
+        return self._ss / (self.count - 1)
+
+    @property
+    def pvariance(self):
+        """Population variance of the data."""
+        if not self.count:
+            raise StatisticsError('pvariance requires at least one '
+                                  'data point')
+        return self._ss / self.count
+
+    @property
+    def stdev(self):
+        """Sample standard deviation of the data."""
+        return math.sqrt(self.variance)
+
+    @property
+    def pstdev(self):
+        """Population standard deviation of the data."""
+        return math.sqrt(self.pvariance)
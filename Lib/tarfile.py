@@ -46,6 +46,7 @@ import time
 import struct
 import copy
 import re
+import collections
 
 try:
     import pwd
@@ -698,6 +699,24 @@ class _FileInFile(object):
         self.closed = True
 #class _FileInFile
 
+class _PositionalFile(object):
+    """Read-only view of a file descriptor using os.pread(), which does
+       not move the file position shared with other threads.
+    """
+
+    def __init__(self, fd):
+        self.fd = fd
+        self.position = 0
+
+    def seek(self, position):
+        self.position = position
+
+    def read(self, size):
+        buf = os.pread(self.fd, size, self.position)
+        self.position += len(buf)
+        return buf
+#class _PositionalFile
+
 class ExFileObject(io.BufferedReader):
 
     def __init__(self, tarfile, tarinfo):
@@ -1457,6 +1476,7 @@ class TarFile(object):
 
         # Init datastructures.
         self.copybufsize = copybufsize
+        self._pread_fd = None   # file descriptor makefile() reads from
         self.closed = False
         self.members = []       # list of members as TarInfo objects
         self._loaded = False    # flag if all members have been read
@@ -1965,28 +1985,68 @@ class TarFile(object):
 
         self.members.append(tarinfo)
 
-    def extractall(self, path=".", members=None, *, numeric_owner=False):
+    def extractall(self, path=".", members=None, *, numeric_owner=False,
+                   workers=1):
         """Extract all members from the archive to the current working
            directory and set owner, modification time and permissions on
            directories afterwards. `path' specifies a different directory
            to extract to. `members' is optional and must be a subset of the
            list returned by getmembers(). If `numeric_owner` is True, only
            the numbers for user/group names are used and not the names.
+           If `workers' is greater than 1 and the archive is an uncompressed
+           regular file, that many threads extract regular files
+           concurrently.
         """
+        if workers < 1:
+            raise ValueError("workers must be greater than 0")
         directories = []
 
         if members is None:
             members = self
 
-        for tarinfo in members:
-            if tarinfo.isdir():
-                # Extract directories with a safe mode.
-                directories.append(tarinfo)
-                tarinfo = copy.copy(tarinfo)
-                tarinfo.mode = 0o700
-            # Do not set_attrs directories, as we will do that further down
-            self.extract(tarinfo, path, set_attrs=not tarinfo.isdir(),
-                         numeric_owner=numeric_owner)
+        executor = None
+        if (workers > 1 and hasattr(os, "pread") and
+            isinstance(self.fileobj, (io.FileIO, io.BufferedReader,
+                                      io.BufferedRandom))):
+            from concurrent.futures import ThreadPoolExecutor
+            executor = ThreadPoolExecutor(workers)
+            self._pread_fd = self.fileobj.fileno()
+        pending = collections.deque()
+        names = set()
+        try:
+            for tarinfo in members:
+                if executor is not None:
+                    if (tarinfo.name in names or tarinfo.islnk() or
+                        tarinfo.issym()):
+                        # Links may point to files being extracted, and a
+                        # member overwrites previous members of that name.
+                        while pending:
+                            pending.popleft().result()
+                        names.clear()
+                    if tarinfo.isreg():
+                        while len(pending) >= 2 * workers:
+                            pending.popleft().result()
+                        names.add(tarinfo.name)
+                        pending.append(executor.submit(
+                            self.extract, tarinfo, path,
+                            numeric_owner=numeric_owner))
+                        continue
+                if tarinfo.isdir():
+                    # Extract directories with a safe mode.
+                    directories.append(tarinfo)
+                    tarinfo = copy.copy(tarinfo)
+                    tarinfo.mode = 0o700
+                # Do not set_attrs directories, as we will do that further down
+                self.extract(tarinfo, path, set_attrs=not tarinfo.isdir(),
+                             numeric_owner=numeric_owner)
+            while pending:
+                pending.popleft().result()
+        finally:
+            if executor is not None:
+                for future in pending:
+                    future.cancel()
+                executor.shutdown()
+                self._pread_fd = None
 
         # Reverse sort directories.
         directories.sort(key=lambda a: a.name)
@@ -2089,8 +2149,9 @@ class TarFile(object):
         upperdirs = os.path.dirname(targetpath)
         if upperdirs and not os.path.exists(upperdirs):
             # Create directories that are not part of the archive with
-            # default permissions.
-            os.makedirs(upperdirs)
+            # default permissions.  Other threads of extractall() may be
+            # creating them too.
+            os.makedirs(upperdirs, exist_ok=True)
 
         if tarinfo.islnk() or tarinfo.issym():
             self._dbg(1, "%s -> %s" % (tarinfo.name, tarinfo.linkname))
@@ -2136,7 +2197,10 @@ class TarFile(object):
     def makefile(self, tarinfo, targetpath):
         """Make a file called targetpath.
         """
-        source = self.fileobj
+        if self._pread_fd is not None:
+            source = _PositionalFile(self._pread_fd)
+        else:
+            source = self.fileobj
         source.seek(tarinfo.offset_data)
         bufsize = self.copybufsize
         with bltn_open(targetpath, "wb") as target:
@@ -16,6 +16,8 @@ import signal
 import array
 import socket
 import random
+import pickle
+import subprocess
 import logging
 import struct
 import operator
@@ -53,6 +55,12 @@ try:
 except ImportError:
     HAS_SHAREDCTYPES = False
 
+try:
+    from multiprocessing import shared_memory
+    HAS_SHMEM = True
+except ImportError:
+    HAS_SHMEM = False
+
 try:
     import msvcrt
 except ImportError:
@@ -3580,6 +3588,235 @@ class _TestSharedCTypes(BaseTestCase):
 #
 #
 
+@unittest.skipUnless(HAS_SHMEM, "requires multiprocessing.shared_memory")
+class _TestSharedMemory(BaseTestCase):
+
+    ALLOWED_TYPES = ('processes',)
+
+    @staticmethod
+    def _attach_existing_shmem_then_write(shmem_name_or_obj, binary_data):
+        if isinstance(shmem_name_or_obj, str):
+            local_sms = shared_memory.SharedMemory(shmem_name_or_obj)
+        else:
+            local_sms = shmem_name_or_obj
+        local_sms.buf[:len(binary_data)] = binary_data
+        local_sms.close()
+
+    def test_shared_memory_basics(self):
+        sms = shared_memory.SharedMemory(create=True, size=512)
+        self.addCleanup(sms.unlink)
+        self.addCleanup(sms.close)
+
+        # Verify attributes are readable.
+        self.assertGreaterEqual(sms.size, 512)
+        self.assertGreaterEqual(len(sms.buf), sms.size)
+        self.assertIn(sms.name, repr(sms))
+
+        # Modify contents of shared memory segment through memoryview.
+        sms.buf[0] = 42
+        self.assertEqual(sms.buf[0], 42)
+
+        # Attach to existing shared memory segment by name.
+        also_sms = shared_memory.SharedMemory(sms.name)
+        self.assertEqual(also_sms.buf[0], 42)
+        also_sms.close()
+
+        # Creating a segment with an existing name must fail.
+        with self.assertRaises(FileExistsError):
+            shared_memory.SharedMemory(sms.name, create=True, size=512)
+
+        with self.assertRaises(ValueError):
+            shared_memory.SharedMemory(create=True, size=-2)
+        with self.assertRaises(ValueError):
+            shared_memory.SharedMemory(create=False)
+
+    def test_shared_memory_across_processes(self):
+        sms = shared_memory.SharedMemory(create=True, size=512)
+        self.addCleanup(sms.unlink)
+        self.addCleanup(sms.close)
+
+        # Verify remote attachment to existing block by name is working.
+        p = self.Process(
+            target=self._attach_existing_shmem_then_write,
+            args=(sms.name, b'howdy')
+        )
+        p.daemon = True
+        p.start()
+        p.join()
+        self.assertEqual(bytes(sms.buf[:5]), b'howdy')
+
+        # Verify pickling of SharedMemory instance also works.
+        p = self.Process(
+            target=self._attach_existing_shmem_then_write,
+            args=(sms, b'HELLO')
+        )
+        p.daemon = True
+        p.start()
+        p.join()
+        self.assertEqual(bytes(sms.buf[:5]), b'HELLO')
+
+    def test_shared_memory_unlink(self):
+        sms = shared_memory.SharedMemory(create=True, size=512)
+        name = sms.name
+        sms.close()
+        sms.unlink()
+        if sys.platform != 'win32':
+            with self.assertRaises(FileNotFoundError):
+                shared_memory.SharedMemory(name)
+
+    def test_shared_memory_cast(self):
+        sms = shared_memory.SharedMemory(create=True, size=8 * 10)
+        self.addCleanup(sms.unlink)
+        self.addCleanup(sms.close)
+        view = sms.buf.cast('q', (2, 5))
+        view[1, 2] = 7
+        also_sms = shared_memory.SharedMemory(sms.name)
+        self.assertEqual(also_sms.buf.cast('q')[7], 7)
+        view.release()
+        also_sms.close()
+
+    def test_shared_memory_SharedMemoryManager_basics(self):
+        smm1 = multiprocessing.managers.SharedMemoryManager()
+        with self.assertRaises(ValueError):
+            smm1.SharedMemory(size=9)  # Fails if SharedMemoryServer not started
+        smm1.start()
+        lol = [ smm1.ShareableList(range(i)) for i in range(5, 10) ]
+        lom = [ smm1.SharedMemory(size=j) for j in range(32, 128, 16) ]
+        doppleganger_list0 = shared_memory.ShareableList(name=lol[0].shm.name)
+        self.assertEqual(len(doppleganger_list0), 5)
+        doppleganger_shm0 = shared_memory.SharedMemory(name=lom[0].name)
+        self.assertGreaterEqual(len(doppleganger_shm0.buf), 32)
+        held_name = lom[0].name
+        doppleganger_list0.shm.close()
+        doppleganger_shm0.close()
+        for sl in lol:
+            sl.shm.close()
+        for sm in lom:
+            sm.close()
+        smm1.shutdown()
+        if sys.platform != "win32":
+            # Calls to unlink() have no effect on Windows platform; shared
+            # memory will only be released once final process exits.
+            with self.assertRaises(FileNotFoundError):
+                # No longer there to be attached to again.
+                absent_shm = shared_memory.SharedMemory(name=held_name)
+
+        with multiprocessing.managers.SharedMemoryManager() as smm2:
+            sl = smm2.ShareableList("howdy")
+            shm = smm2.SharedMemory(size=128)
+            held_name = sl.shm.name
+            sl.shm.close()
+            shm.close()
+        if sys.platform != "win32":
+            with self.assertRaises(FileNotFoundError):
+                # No longer there to be attached to again.
+                absent_sl = shared_memory.ShareableList(name=held_name)
+
+    def test_shared_memory_ShareableList_basics(self):
+        sl = shared_memory.ShareableList(
+            ['howdy', b'HoWdY', -273.154, 100, None, True, 42]
+        )
+        self.addCleanup(sl.shm.unlink)
+        self.addCleanup(sl.shm.close)
+
+        # Verify attributes are readable.
+        self.assertEqual(sl.format, '8s8sdqxxxxxx?xxxxxxxx?q')
+
+        # Exercise len().
+        self.assertEqual(len(sl), 7)
+
+        # Exercise index().
+        self.assertEqual(sl.index(b'HoWdY'), 1)
+        with self.assertRaises(ValueError):
+            sl.index('100')
+
+        # Exercise retrieving individual values.
+        self.assertEqual(sl[0], 'howdy')
+        self.assertEqual(sl[-2], True)
+        self.assertIsNone(sl[4])
+
+        # Exercise iterability.
+        self.assertEqual(
+            tuple(sl),
+            ('howdy', b'HoWdY', -273.154, 100, None, True, 42)
+        )
+
+        # Exercise modifying individual values.
+        sl[3] = 42
+        self.assertEqual(sl[3], 42)
+        sl[4] = 'some'  # Change type at a given position.
+        self.assertEqual(sl[4], 'some')
+        self.assertEqual(sl.format, '8s8sdq8sxxxxxxx?q')
+        with self.assertRaisesRegex(ValueError, "exceeds available storage"):
+            sl[4] = 'far too many'
+        self.assertEqual(sl[4], 'some')
+        sl[0] = 'encodés'  # Exactly 8 bytes of UTF-8 data
+        self.assertEqual(sl[0], 'encodés')
+        self.assertEqual(sl[1], b'HoWdY')  # no spillage
+        with self.assertRaises(IndexError):
+            sl[7]
+        with self.assertRaises(IndexError):
+            sl[7] = 2
+
+        # Exercise count().
+        self.assertEqual(sl.count(42), 2)
+        self.assertEqual(sl.count(b'HoWdY'), 1)
+
+        # Attach to existing ShareableList by name, directly and by pickle.
+        also_sl = shared_memory.ShareableList(name=sl.shm.name)
+        self.assertEqual(list(also_sl), list(sl))
+        also_sl.shm.close()
+        unpickled_sl = pickle.loads(pickle.dumps(sl))
+        self.assertEqual(list(unpickled_sl), list(sl))
+        unpickled_sl.shm.close()
+
+        # Exercise creating an empty ShareableList.
+        empty_sl = shared_memory.ShareableList()
+        try:
+            self.assertEqual(len(empty_sl), 0)
+            self.assertEqual(empty_sl.format, '')
+            self.assertEqual(empty_sl.count('any'), 0)
+            with self.assertRaises(ValueError):
+                empty_sl.index(None)
+        finally:
+            empty_sl.shm.close()
+            empty_sl.shm.unlink()
+
+    def test_shared_memory_cleaned_after_process_termination(self):
+        cmd = '''if 1:
+            import os, time, sys
+            from multiprocessing import shared_memory
+
+            # Create a shared_memory segment, and send the segment name
+            sm = shared_memory.SharedMemory(create=True, size=10)
+            sys.stdout.write(sm.name + '\\n')
+            sys.stdout.flush()
+            time.sleep(100)
+        '''
+        with subprocess.Popen([sys.executable, '-E', '-c', cmd],
+                              stdout=subprocess.PIPE,
+                              stderr=subprocess.PIPE) as p:
+            name = p.stdout.readline().strip().decode()
+
+            # killing abruptly processes holding reference to a shared memory
+            # segment should not leak the given memory segment.
+            p.terminate()
+            p.wait()
+            time.sleep(1.0)  # wait for the OS to collect the segment
+
+            if sys.platform != "win32":
+                with self.assertRaises(FileNotFoundError):
+                    smm = shared_memory.SharedMemory(name, create=False)
+
+                err = p.stderr.read().decode()
+                self.assertIn(
+                    "There appear to be 1 leaked shared memory segments",
+                    err)
+
+#
+#
+#
+
 class _TestFinalize(BaseTestCase):
 
     ALLOWED_TYPES = ('processes',)
@@ -3,8 +3,8 @@
 import concurrent.futures
 import errno
 import logging
-import math
 import os
+import random
 import socket
 import sys
 import threading
@@ -247,7 +247,7 @@ class BaseEventLoopTests(test_utils.TestCase):
 
         h = self.loop.call_later(10.0, cb)
         self.assertIsInstance(h, asyncio.TimerHandle)
-        self.assertIn(h, self.loop._scheduled)
+        self.assertIn(h, list(self.loop._scheduled))
         self.assertNotIn(h, self.loop._ready)
 
     def test_call_later_negative_delays(self):
@@ -356,13 +356,13 @@ class BaseEventLoopTests(test_utils.TestCase):
         h1.cancel()
 
         self.loop._process_events = mock.Mock()
-        self.loop._scheduled.append(h1)
-        self.loop._scheduled.append(h2)
+        self.loop._scheduled.push(h1)
+        self.loop._scheduled.push(h2)
         self.loop._run_once()
 
         t = self.loop._selector.select.call_args[0][0]
         self.assertTrue(9.5 < t < 10.5, t)
-        self.assertEqual([h2], self.loop._scheduled)
+        self.assertEqual([h2], list(self.loop._scheduled))
         self.assertTrue(self.loop._process_events.called)
 
     def test_set_debug(self):
@@ -384,87 +384,61 @@ class BaseEventLoopTests(test_utils.TestCase):
                                 self.loop, None)
 
         self.loop._process_events = mock.Mock()
-        self.loop._scheduled.append(h)
+        self.loop._scheduled.push(h)
         self.loop._run_once()
 
         self.assertTrue(processed)
         self.assertEqual([handle], list(self.loop._ready))
 
-    def test__run_once_cancelled_event_cleanup(self):
-        self.loop._process_events = mock.Mock()
-
-        self.assertTrue(
-            0 < base_events._MIN_CANCELLED_TIMER_HANDLES_FRACTION < 1.0)
-
+    def test_cancelled_timer_handle_removed(self):
         def cb():
             pass
 
-        # Set up one "blocking" event that will not be cancelled to
-        # ensure later cancelled events do not make it to the head
-        # of the queue and get cleaned.
-        not_cancelled_count = 1
-        self.loop.call_later(3000, cb)
-
-        # Add less than threshold (base_events._MIN_SCHEDULED_TIMER_HANDLES)
-        # cancelled handles, ensure they aren't removed
-
-        cancelled_count = 2
-        for x in range(2):
-            h = self.loop.call_later(3600, cb)
-            h.cancel()
+        handles = [self.loop.call_later(3600 + i, cb) for i in range(10)]
+        self.assertEqual(len(self.loop._scheduled), 10)
 
-        # Add some cancelled events that will be at head and removed
-        cancelled_count += 2
-        for x in range(2):
-            h = self.loop.call_later(100, cb)
+        # Cancelled handles are removed at once, wherever they are in
+        # the heap.
+        for h in handles[::2]:
             h.cancel()
+            self.assertIsNone(h._scheduled)
+        self.assertEqual(len(self.loop._scheduled), 5)
+        self.assertEqual(sorted(self.loop._scheduled), handles[1::2])
 
-        # This test is invalid if _MIN_SCHEDULED_TIMER_HANDLES is too low
-        self.assertLessEqual(cancelled_count + not_cancelled_count,
-            base_events._MIN_SCHEDULED_TIMER_HANDLES)
-
-        self.assertEqual(self.loop._timer_cancelled_count, cancelled_count)
-
-        self.loop._run_once()
-
-        cancelled_count -= 2
-
-        self.assertEqual(self.loop._timer_cancelled_count, cancelled_count)
-
-        self.assertEqual(len(self.loop._scheduled),
-            cancelled_count + not_cancelled_count)
+        handles[1].cancel()
+        handles[1].cancel()
+        self.assertEqual(len(self.loop._scheduled), 4)
+        self.assertEqual(self.loop._scheduled.peek(), handles[3])
 
-        # Need enough events to pass _MIN_CANCELLED_TIMER_HANDLES_FRACTION
-        # so that deletion of cancelled events will occur on next _run_once
-        add_cancel_count = int(math.ceil(
-            base_events._MIN_SCHEDULED_TIMER_HANDLES *
-            base_events._MIN_CANCELLED_TIMER_HANDLES_FRACTION)) + 1
+        # Cancelling a handle of a closed loop does nothing.
+        self.loop.close()
+        self.assertEqual(len(self.loop._scheduled), 0)
+        handles[3].cancel()
 
-        add_not_cancel_count = max(base_events._MIN_SCHEDULED_TIMER_HANDLES -
-            add_cancel_count, 0)
+    def test_set_timer_queue(self):
+        def cb():
+            pass
 
-        # Add some events that will not be cancelled
-        not_cancelled_count += add_not_cancel_count
-        for x in range(add_not_cancel_count):
-            self.loop.call_later(3600, cb)
+        handles = [self.loop.call_later(3600 + i, cb) for i in range(3)]
+        wheel = base_events.TimerWheel()
+        self.loop.set_timer_queue(wheel)
+        self.assertIs(self.loop._scheduled, wheel)
+        self.assertEqual(sorted(wheel), handles)
 
-        # Add enough cancelled events
-        cancelled_count += add_cancel_count
-        for x in range(add_cancel_count):
-            h = self.loop.call_later(3600, cb)
-            h.cancel()
+        handles[0].cancel()
+        self.assertIsNone(handles[0]._scheduled)
+        self.assertEqual(sorted(wheel), handles[1:])
 
-        # Ensure all handles are still scheduled
-        self.assertEqual(len(self.loop._scheduled),
-            cancelled_count + not_cancelled_count)
+        with self.assertRaises(ValueError):
+            self.loop.set_timer_queue(wheel)
 
-        self.loop._run_once()
-
-        # Ensure cancelled events were removed
-        self.assertEqual(len(self.loop._scheduled), not_cancelled_count)
+        self.loop.set_timer_queue(None)
+        self.assertIsNot(self.loop._scheduled, wheel)
+        self.assertEqual(len(wheel), 0)
+        self.assertEqual(sorted(self.loop._scheduled), handles[1:])
 
-        # Ensure only uncancelled events remain scheduled
-        self.assertTrue(all([not x._cancelled for x in self.loop._scheduled]))
+        self.loop.close()
+        self.assertRaises(RuntimeError, self.loop.set_timer_queue, None)
 
     def test_run_until_complete_type_error(self):
         self.assertRaises(TypeError,
@@ -995,6 +969,154 @@ class BaseEventLoopTests(test_utils.TestCase):
             self.assertTrue(status['finalized'])
 
 
+class FakeTimer:
+
+    def __init__(self, when):
+        self._when = when
+
+    def __repr__(self):
+        return f'FakeTimer({self._when})'
+
+
+class TimerWheelTests(unittest.TestCase):
+
+    def test_invalid_arguments(self):
+        self.assertRaises(ValueError, base_events.TimerWheel, granularity=0)
+        self.assertRaises(ValueError, base_events.TimerWheel, slots=1)
+        self.assertRaises(ValueError, base_events.TimerWheel, levels=0)
+
+    def test_empty(self):
+        wheel = base_events.TimerWheel()
+        self.assertEqual(len(wheel), 0)
+        self.assertEqual(list(wheel), [])
+        self.assertIsNone(wheel.next_deadline())
+        self.assertEqual(wheel.pop_due(100.0), [])
+        self.assertEqual(wheel.granularity, 0.001)
+
+    def test_pop_due(self):
+        wheel = base_events.TimerWheel(granularity=0.5, slots=4, levels=2)
+        whens = [0.7, 1.2, 2.0, 3.4, 9.9, 10.3, 50.0]
+        timers = [FakeTimer(when) for when in whens]
+        for timer in reversed(timers):
+            wheel.push(timer)
+        self.assertEqual(len(wheel), len(timers))
+        self.assertEqual(wheel.next_deadline(), 0.7)
+
+        popped = []
+        now = 0.0
+        while wheel:
+            deadline = wheel.next_deadline()
+            self.assertGreaterEqual(deadline, now)
+            now = deadline
+            for timer in wheel.pop_due(now):
+                # Timers are never called early, and at most one
+                # granularity late.
+                self.assertLess(timer._when, now)
+                self.assertLessEqual(now, timer._when + 0.5)
+                popped.append(timer)
+        self.assertEqual(popped, timers)
+
+        stats = wheel.stats()
+        self.assertEqual(stats['pending'], 0)
+        self.assertEqual(stats['scheduled'], len(timers))
+        self.assertEqual(stats['expired'], len(timers))
+        self.assertEqual(stats['cancelled'], 0)
+        self.assertGreater(stats['cascaded'], 0)
+
+    def test_pop_due_late(self):
+        wheel = base_events.TimerWheel(granularity=1, slots=4, levels=2)
+        wheel.pop_due(10)
+        timers = [FakeTimer(when) for when in (5, 11.5, 12, 30, 100)]
+        for timer in timers:
+            wheel.push(timer)
+        self.assertEqual(wheel.next_deadline(), 11)
+        # A timer added when already due is popped at the next call.
+        self.assertEqual(wheel.pop_due(10.5), [timers[0]])
+        self.assertEqual(wheel.pop_due(11), [])
+        self.assertEqual(sorted(wheel.pop_due(40), key=lambda t: t._when),
+                         timers[1:4])
+        self.assertEqual(wheel.pop_due(1000), [timers[4]])
+        self.assertEqual(len(wheel), 0)
+
+    def test_remove(self):
+        wheel = base_events.TimerWheel(granularity=1, slots=4, levels=2)
+        timers = [FakeTimer(when) for when in range(0, 100, 5)]
+        tokens = [wheel.push(timer) for timer in timers]
+        wheel.pop_due(2)
+        for token in tokens[1::2]:
+            wheel.remove(token)
+        self.assertRaises(ValueError, wheel.remove, tokens[1])
+        self.assertEqual(len(wheel), 9)
+        self.assertEqual(sorted(wheel, key=lambda t: t._when), timers[2::2])
+
+        popped = []
+        while wheel:
+            popped.extend(wheel.pop_due(wheel.next_deadline()))
+        self.assertEqual(popped, timers[2::2])
+        self.assertEqual(wheel.stats()['cancelled'], 10)
+
+    def test_far_timers(self):
+        # Timers far beyond the last wheel are reached in a number of
+        # steps independent of their distance.
+        wheel = base_events.TimerWheel(granularity=1, slots=2, levels=1)
+        rng = random.Random(42)
+        whens = sorted(rng.uniform(0, 1e9) for i in range(300))
+        timers = [FakeTimer(when) for when in whens]
+        tokens = [wheel.push(timer) for timer in reversed(timers)]
+        wheel.pop_due(0)
+        # The earliest timer of the overflow is cancelled.
+        wheel.remove(tokens[-1])
+        del timers[0]
+
+        popped = []
+        steps = 0
+        while wheel:
+            now = wheel.next_deadline()
+            for timer in wheel.pop_due(now):
+                self.assertLess(timer._when, now)
+                self.assertLessEqual(now, timer._when + 1)
+                popped.append(timer)
+            steps += 1
+        self.assertEqual(popped, timers)
+        self.assertLessEqual(steps, 2 * len(timers) + 2)
+
+        for timer in timers:
+            wheel.push(timer)
+        self.assertCountEqual(wheel.pop_due(2e9), timers)
+
+    def test_clear(self):
+        wheel = base_events.TimerWheel()
+        token = wheel.push(FakeTimer(1.0))
+        wheel.pop_due(0.5)
+        wheel.push(FakeTimer(1000.0))
+        wheel.clear()
+        self.assertEqual(len(wheel), 0)
+        self.assertIsNone(wheel.next_deadline())
+        self.assertRaises(ValueError, wheel.remove, token)
+
+    def test_repr(self):
+        wheel = base_events.TimerWheel(granularity=0.01)
+        wheel.push(FakeTimer(1.0))
+        self.assertEqual(repr(wheel),
+                         '<TimerWheel granularity=0.01 pending=1>')
+
+    def test_event_loop(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        loop.set_timer_queue(asyncio.TimerWheel(granularity=0.01))
+
+        calls = []
+        for delay in (0.03, 0.01, 0.02, 0.05):
+            loop.call_later(delay, calls.append, delay)
+        loop.call_later(0.04, calls.append, 'cancelled').cancel()
+        loop.call_later(0.06, loop.stop)
+        start = loop.time()
+        loop.run_forever()
+        self.assertGreaterEqual(loop.time() - start, 0.06)
+        self.assertEqual(calls, [0.01, 0.02, 0.03, 0.05])
+        self.assertEqual(len(loop._scheduled), 0)
+
+
 class MyProto(asyncio.Protocol):
     done = None
 
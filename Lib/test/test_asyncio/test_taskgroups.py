@@ -0,0 +1,291 @@
+"""Tests for taskgroups.py."""
+
+import asyncio
+import gc
+import unittest
+import weakref
+from unittest import mock
+
+from test.test_asyncio import utils as test_utils
+
+
+def tearDownModule():
+    asyncio.set_event_loop_policy(None)
+
+
+class MyExc(Exception):
+    pass
+
+
+class TaskGroupTests(test_utils.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(None)
+
+    def tearDown(self):
+        self.loop.close()
+        self.loop = None
+        super().tearDown()
+
+    def run_coro(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def test_children_complete(self):
+        async def foo(value):
+            await asyncio.sleep(0.01)
+            return value
+
+        async def main():
+            async with asyncio.TaskGroup() as g:
+                t1 = g.create_task(foo(1))
+                t2 = g.create_task(foo(2), name='two')
+            self.assertEqual(t2.get_name(), 'two')
+            return t1.result(), t2.result()
+
+        self.assertEqual(self.run_coro(main()), (1, 2))
+
+    def test_children_complete_after_body(self):
+        async def main():
+            async with asyncio.TaskGroup() as g:
+                t = g.create_task(asyncio.sleep(0.01, result='done'))
+                self.assertFalse(t.done())
+            self.assertTrue(t.done())
+            return t.result()
+
+        self.assertEqual(self.run_coro(main()), 'done')
+
+    def test_child_failure_cancels_siblings(self):
+        cancelled = False
+
+        async def crash_soon():
+            await asyncio.sleep(0.01)
+            raise MyExc('boom')
+
+        async def long_running():
+            nonlocal cancelled
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+
+        async def main():
+            async with asyncio.TaskGroup() as g:
+                t = g.create_task(long_running())
+                g.create_task(crash_soon())
+            return t
+
+        with self.assertRaisesRegex(MyExc, 'boom'):
+            self.run_coro(main())
+        self.assertTrue(cancelled)
+
+    def test_child_failure_cancels_body(self):
+        body_cancelled = False
+
+        async def crash_soon():
+            await asyncio.sleep(0.01)
+            raise MyExc
+
+        async def main():
+            nonlocal body_cancelled
+            try:
+                async with asyncio.TaskGroup() as g:
+                    g.create_task(crash_soon())
+                    try:
+                        await asyncio.sleep(10)
+                    except asyncio.CancelledError:
+                        body_cancelled = True
+                        raise
+            except MyExc:
+                pass
+            # The parent task is not cancelled anymore.
+            await asyncio.sleep(0)
+            return 'ok'
+
+        self.assertEqual(self.run_coro(main()), 'ok')
+        self.assertTrue(body_cancelled)
+
+    def test_other_errors_are_reported(self):
+        handler = mock.Mock()
+        self.loop.set_exception_handler(handler)
+
+        async def crash(exc):
+            try:
+                await asyncio.sleep(10)
+            finally:
+                raise exc
+
+        async def crash_soon():
+            await asyncio.sleep(0.01)
+            raise MyExc('first')
+
+        async def main():
+            async with asyncio.TaskGroup() as g:
+                g.create_task(crash(ZeroDivisionError()))
+                g.create_task(crash_soon())
+
+        with self.assertRaisesRegex(MyExc, 'first'):
+            self.run_coro(main())
+        self.assertEqual(handler.call_count, 1)
+        context = handler.call_args[0][1]
+        self.assertIsInstance(context['exception'], ZeroDivisionError)
+
+    def test_body_error(self):
+        cancelled = False
+
+        async def long_running():
+            nonlocal cancelled
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+
+        async def main():
+            async with asyncio.TaskGroup() as g:
+                g.create_task(long_running())
+                await asyncio.sleep(0)
+                raise MyExc('body')
+
+        with self.assertRaisesRegex(MyExc, 'body'):
+            self.run_coro(main())
+        self.assertTrue(cancelled)
+
+    def test_parent_cancelled(self):
+        child_cancelled = False
+
+        async def long_running():
+            nonlocal child_cancelled
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                child_cancelled = True
+                raise
+
+        async def main():
+            async with asyncio.TaskGroup() as g:
+                g.create_task(long_running())
+                await asyncio.sleep(10)
+
+        async def runner():
+            t = asyncio.create_task(main())
+            await asyncio.sleep(0.01)
+            t.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await t
+
+        self.run_coro(runner())
+        self.assertTrue(child_cancelled)
+
+    def test_parent_cancelled_while_exiting(self):
+        async def main():
+            async with asyncio.TaskGroup() as g:
+                g.create_task(asyncio.sleep(10))
+
+        async def runner():
+            t = asyncio.create_task(main())
+            await asyncio.sleep(0.01)
+            t.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await t
+
+        self.run_coro(runner())
+
+    def test_limit(self):
+        running = 0
+        max_running = 0
+
+        async def foo(i):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.001 * (i % 3))
+            running -= 1
+            return i
+
+        async def main():
+            async with asyncio.TaskGroup(limit=3) as g:
+                tasks = [g.create_task(foo(i)) for i in range(20)]
+            return [t.result() for t in tasks]
+
+        self.assertEqual(self.run_coro(main()), list(range(20)))
+        self.assertEqual(max_running, 3)
+
+    def test_limit_cancel_waiting(self):
+        async def crash_soon():
+            await asyncio.sleep(0.01)
+            raise MyExc
+
+        async def main():
+            async with asyncio.TaskGroup(limit=1) as g:
+                g.create_task(crash_soon())
+                # These never start.
+                tasks = [g.create_task(asyncio.sleep(10)) for _ in range(3)]
+            return tasks
+
+        with self.assertRaises(MyExc):
+            self.run_coro(main())
+
+    def test_tasks_are_released(self):
+        class Value:
+            pass
+
+        refs = []
+
+        async def foo():
+            value = Value()
+            refs.append(weakref.ref(value))
+            return value
+
+        async def main():
+            async with asyncio.TaskGroup() as g:
+                for _ in range(3):
+                    g.create_task(foo())
+                await asyncio.sleep(0.01)
+                self.assertEqual(len(g._tasks), 0)
+                gc.collect()
+                self.assertEqual([ref() for ref in refs], [None] * 3)
+
+        self.run_coro(main())
+
+    def test_create_task_errors(self):
+        async def coro():
+            pass
+
+        async def main():
+            g = asyncio.TaskGroup()
+            c = coro()
+            with self.assertRaisesRegex(RuntimeError, 'not been entered'):
+                g.create_task(c)
+            c.close()
+            async with g:
+                pass
+            c = coro()
+            with self.assertRaisesRegex(RuntimeError, 'is finished'):
+                g.create_task(c)
+            c.close()
+            with self.assertRaisesRegex(RuntimeError, 'already entered'):
+                async with g:
+                    pass
+
+        self.run_coro(main())
+
+    def test_invalid_limit(self):
+        with self.assertRaises(ValueError):
+            asyncio.TaskGroup(limit=0)
+
+    def test_repr(self):
+        async def main():
+            g = asyncio.TaskGroup(limit=2)
+            self.assertEqual(repr(g), '<TaskGroup limit=2>')
+            async with g:
+                g.create_task(asyncio.sleep(0))
+                self.assertEqual(repr(g), '<TaskGroup limit=2 tasks=1 entered>')
+
+        self.run_coro(main())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3275,6 +3275,117 @@ class WaitTests(test_utils.TestCase):
                 asyncio.wait_for(coroutine_function(), 0.01, loop=self.loop))
 
 
+class IterCompletedTests(test_utils.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(None)
+
+    def tearDown(self):
+        self.loop.close()
+        self.loop = None
+        super().tearDown()
+
+    def collect(self, aws, **kwargs):
+        async def main():
+            return [f async for f in asyncio.iter_completed(aws, **kwargs)]
+        return self.loop.run_until_complete(main())
+
+    def test_order(self):
+        async def coro(delay, value):
+            await asyncio.sleep(delay)
+            return value
+
+        futs = self.collect([coro(0.03, 'c'), coro(0.01, 'a'),
+                             coro(0.02, 'b')])
+        self.assertEqual([f.result() for f in futs], ['a', 'b', 'c'])
+
+    def test_exception(self):
+        async def fail():
+            raise ZeroDivisionError
+
+        async def ok():
+            return 42
+
+        futs = self.collect([fail(), ok()])
+        self.assertEqual(len(futs), 2)
+        self.assertIsInstance(futs[0].exception(), ZeroDivisionError)
+        self.assertEqual(futs[1].result(), 42)
+
+    def test_futures(self):
+        fut = self.loop.create_future()
+        self.loop.call_soon(fut.set_result, 'fut')
+        futs = self.collect([fut, fut])
+        self.assertEqual(futs, [fut])
+
+    def test_empty(self):
+        self.assertEqual(self.collect([]), [])
+        self.assertEqual(self.collect([], limit=1), [])
+
+    def test_limit(self):
+        running = 0
+        max_running = 0
+        created = 0
+
+        async def coro(i):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.001 * (i % 3))
+            running -= 1
+            return i
+
+        def gen():
+            nonlocal created
+            for i in range(20):
+                created += 1
+                yield coro(i)
+
+        async def main():
+            results = []
+            async for f in asyncio.iter_completed(gen(), limit=3):
+                if not results:
+                    # The generator is consumed lazily.
+                    self.assertEqual(created, 3)
+                results.append(f.result())
+            return results
+
+        results = self.loop.run_until_complete(main())
+        self.assertEqual(sorted(results), list(range(20)))
+        self.assertEqual(max_running, 3)
+
+    def test_early_exit_cancels_pending(self):
+        started = []
+
+        async def coro(i):
+            started.append(i)
+            await asyncio.sleep(10 if i else 0)
+
+        async def main():
+            it = asyncio.iter_completed((coro(i) for i in range(5)), limit=2)
+            async for f in it:
+                break
+            await it.aclose()
+            await asyncio.sleep(0)
+            self.assertEqual(asyncio.all_tasks(), {asyncio.current_task()})
+            return f
+
+        f = self.loop.run_until_complete(main())
+        self.assertTrue(f.done())
+        self.assertEqual(started, [0, 1])
+
+    def test_invalid_arguments(self):
+        async def coro():
+            pass
+
+        with self.assertRaises(ValueError):
+            self.collect([], limit=0)
+        c = coro()
+        with self.assertRaises(TypeError):
+            self.collect(c)
+        c.close()
+
+
 class CompatibilityTests(test_utils.TestCase):
     # Tests for checking a bridge between old-styled coroutines
     # and async/await syntax
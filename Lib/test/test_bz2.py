@@ -264,6 +264,43 @@ class BZ2FileTest(BaseTest):
         with open(self.filename, "rb") as f:
             self.assertEqual(f.read(), expected)
 
+    def testWriteThreads(self):
+        with BZ2File(self.filename, "w", compresslevel=1, threads=2) as bz2f:
+            for i in range(0, len(self.BIG_TEXT), 10000):
+                bz2f.write(self.BIG_TEXT[i:i + 10000])
+        with open(self.filename, 'rb') as f:
+            data = f.read()
+        # The blocks are written as separate streams.
+        self.assertEqual(data.count(b'BZh1'), 2)
+        self.assertEqual(ext_decompress(data), self.BIG_TEXT)
+
+    def testWriteThreadsEmpty(self):
+        with BZ2File(self.filename, "w", threads=2) as bz2f:
+            pass
+        with open(self.filename, 'rb') as f:
+            self.assertEqual(f.read(), self.EMPTY_DATA)
+
+    def testReadThreads(self):
+        self.createTempFile(streams=5)
+        with BZ2File(self.filename, threads=2) as bz2f:
+            self.assertEqual(bz2f.readline(), self.TEXT_LINES[0])
+            self.assertEqual(bz2f.read(), self.TEXT[len(self.TEXT_LINES[0]):] +
+                                          self.TEXT * 4)
+            bz2f.seek(-len(self.TEXT) - 5, 2)
+            self.assertEqual(bz2f.read(10), self.TEXT[-5:] + self.TEXT[:5])
+            bz2f.seek(0)
+            self.assertEqual(bz2f.read(10), self.TEXT[:10])
+            self.assertEqual(bz2f.tell(), 10)
+
+    def testReadThreadsBadFile(self):
+        self.createTempFile(streams=0, suffix=self.BAD_DATA)
+        with BZ2File(self.filename, threads=2) as bz2f:
+            self.assertRaises(OSError, bz2f.read)
+
+    def testBadThreads(self):
+        self.assertRaises(TypeError, BZ2File, os.devnull, threads=1.0)
+        self.assertRaises(ValueError, BZ2File, os.devnull, threads=-1)
+
     def testWriteLines(self):
         with BZ2File(self.filename, "w") as bz2f:
             self.assertRaises(TypeError, bz2f.writelines)
@@ -15,6 +15,7 @@ import unittest
 from collections import namedtuple, Counter, OrderedDict, _count_elements
 from collections import UserDict, UserString, UserList
 from collections import ChainMap
+from collections import SortedList, SortedDict
 from collections import deque
 from collections.abc import Awaitable, Coroutine
 from collections.abc import AsyncIterator, AsyncIterable, AsyncGenerator
@@ -1993,6 +1994,178 @@ class TestCounter(unittest.TestCase):
         self.assertEqual(dict(c), {'a': 5, 'b': 2, 'c': 1, 'd': 1, 'r':2 })
 
 
+################################################################################
+### SortedList and SortedDict
+################################################################################
+
+class TestSortedList(unittest.TestCase):
+
+    def make(self, iterable=(), key=None, load=4):
+        s = SortedList(key=key)
+        s._load = load                  # exercise splitting and merging
+        s.update(iterable)
+        return s
+
+    def test_basics(self):
+        s = SortedList([5, 1, 4, 1])
+        self.assertEqual(list(s), [1, 1, 4, 5])
+        self.assertEqual(len(s), 4)
+        self.assertIn(4, s)
+        self.assertNotIn(2, s)
+        self.assertEqual(s, [1, 1, 4, 5])
+        self.assertEqual(list(reversed(s)), [5, 4, 1, 1])
+        self.assertEqual(repr(s), 'SortedList([1, 1, 4, 5])')
+        self.assertIsInstance(s, Sequence)
+        self.assertRaises(TypeError, hash, s)
+
+    def test_random_operations(self):
+        for key in None, operator.neg:
+            s = self.make(key=key)
+            model = []
+            for i in range(2000):
+                op = randrange(5)
+                value = randrange(100)
+                if op < 2 or not model:
+                    s.add(value)
+                    model.append(value)
+                elif op == 2:
+                    s.remove(model[value % len(model)])
+                    model.remove(model[value % len(model)])
+                elif op == 3:
+                    model.sort(key=key)
+                    index = value % len(model) - len(model) // 2
+                    self.assertEqual(s.pop(index), model.pop(index))
+                else:
+                    values = [randrange(100) for j in range(value % 10)]
+                    s.update(values)
+                    model.extend(values)
+                model.sort(key=key)
+                self.assertEqual(list(s), model)
+            self.assertEqual([s[i] for i in range(-len(s), len(s))],
+                             model + model)
+            self.assertEqual(s[3:50], model[3:50])
+            self.assertEqual(s[::-3], model[::-3])
+
+    def test_key(self):
+        s = self.make(['b', 'A', 'c', 'a', 'B'], key=str.lower)
+        self.assertEqual(list(s), ['A', 'a', 'b', 'B', 'c'])
+        self.assertIs(s.key, str.lower)
+        self.assertIn('B', s)
+        self.assertNotIn('C', s)
+        self.assertEqual(s.index('a'), 1)
+        self.assertEqual(s.count('a'), 1)
+        self.assertEqual(s.bisect_left('B'), 2)
+        self.assertEqual(s.bisect_right('b'), 4)
+        s.remove('B')
+        self.assertEqual(list(s), ['A', 'a', 'b', 'c'])
+        self.assertRaises(ValueError, s.remove, 'C')
+
+    def test_remove(self):
+        s = self.make(range(20))
+        s.remove(7)
+        s.discard(8)
+        s.discard(8)
+        self.assertRaises(ValueError, s.remove, 8)
+        del s[0]
+        del s[-1]
+        del s[::2]
+        self.assertEqual(list(s), [2, 4, 6, 10, 12, 14, 16, 18])
+        s.clear()
+        self.assertEqual(len(s), 0)
+        self.assertRaises(IndexError, s.pop)
+        self.assertRaises(IndexError, s.__getitem__, 0)
+
+    def test_rank(self):
+        s = self.make([10, 20, 20, 30] * 5)
+        self.assertEqual(s.bisect_left(20), 5)
+        self.assertEqual(s.bisect_right(20), 15)
+        self.assertEqual(s.bisect_left(25), 15)
+        self.assertEqual(s.bisect_right(40), 20)
+        self.assertEqual(s.index(20), 5)
+        self.assertEqual(s.index(20, 7), 7)
+        self.assertRaises(ValueError, s.index, 20, 15)
+        self.assertRaises(ValueError, s.index, 25)
+        self.assertEqual(s.count(20), 10)
+        self.assertEqual(s.count(25), 0)
+
+    def test_irange(self):
+        s = self.make(range(0, 100, 5))
+        self.assertEqual(list(s.irange(12, 31)), [15, 20, 25, 30])
+        self.assertEqual(list(s.irange(15, 30)), [15, 20, 25, 30])
+        self.assertEqual(list(s.irange(15, 30, (False, False))), [20, 25])
+        self.assertEqual(list(s.irange(15, 30, reverse=True)),
+                         [30, 25, 20, 15])
+        self.assertEqual(list(s.irange(maximum=10)), [0, 5, 10])
+        self.assertEqual(list(s.irange(minimum=90)), [90, 95])
+        self.assertEqual(list(s.irange(50, 40)), [])
+
+    def test_copy_and_pickle(self):
+        s = self.make([3, 1, 2], key=operator.neg)
+        for t in (s.copy(), copy.copy(s)):
+            self.assertEqual(list(t), [3, 2, 1])
+            t.add(0)
+            self.assertEqual(len(s), 3)
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            t = pickle.loads(pickle.dumps(self.make([3, 1, 2]), proto))
+            self.assertEqual(t, [1, 2, 3])
+
+
+class TestSortedDict(unittest.TestCase):
+
+    def test_basics(self):
+        d = SortedDict({'c': 3, 'a': 1}, b=2)
+        self.assertIsInstance(d, dict)
+        self.assertEqual(list(d), ['a', 'b', 'c'])
+        self.assertEqual(list(reversed(d)), ['c', 'b', 'a'])
+        self.assertEqual(list(d.keys()), ['a', 'b', 'c'])
+        self.assertEqual(list(d.values()), [1, 2, 3])
+        self.assertEqual(list(d.items()), [('a', 1), ('b', 2), ('c', 3)])
+        self.assertEqual(d, {'a': 1, 'b': 2, 'c': 3})
+        self.assertEqual(repr(d), "SortedDict({'a': 1, 'b': 2, 'c': 3})")
+        self.assertEqual(repr(SortedDict()), 'SortedDict()')
+
+    def test_mutation(self):
+        d = SortedDict()
+        d['b'] = 2
+        d['a'] = 1
+        d['b'] = 3
+        self.assertEqual(list(d.items()), [('a', 1), ('b', 3)])
+        self.assertEqual(d.setdefault('c', 4), 4)
+        self.assertEqual(d.setdefault('a', 5), 1)
+        del d['b']
+        self.assertEqual(list(d), ['a', 'c'])
+        self.assertEqual(d.pop('a'), 1)
+        self.assertEqual(d.pop('a', None), None)
+        self.assertRaises(KeyError, d.pop, 'a')
+        d.update([('e', 5)], d=4)
+        self.assertEqual(list(d), ['c', 'd', 'e'])
+        self.assertEqual(d.popitem(), ('e', 5))
+        self.assertEqual(d.popitem(0), ('c', 4))
+        d.clear()
+        self.assertEqual(list(d), [])
+        self.assertRaises(KeyError, d.popitem)
+
+    def test_positions(self):
+        d = SortedDict.fromkeys(range(0, 20, 2))
+        self.assertEqual(d.peekitem(), (18, None))
+        self.assertEqual(d.peekitem(1), (2, None))
+        self.assertEqual(d.index(6), 3)
+        self.assertRaises(ValueError, d.index, 7)
+        self.assertEqual(d.bisect_left(7), 4)
+        self.assertEqual(d.bisect_right(8), 5)
+        self.assertEqual(list(d.irange(5, 11)), [6, 8, 10])
+
+    def test_key(self):
+        d = SortedDict({'b': 1, 'C': 2, 'a': 3}, key=str.lower)
+        self.assertEqual(list(d), ['a', 'b', 'C'])
+        self.assertEqual(list(d.copy()), ['a', 'b', 'C'])
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            e = pickle.loads(pickle.dumps(d, proto))
+            self.assertEqual(list(e.items()), list(d.items()))
+            e['B'] = 4
+            self.assertEqual(list(e), ['a', 'b', 'B', 'C'])
+
+
 ################################################################################
 ### Run tests
 ################################################################################
@@ -2001,7 +2174,7 @@ def test_main(verbose=None):
     NamedTupleDocs = doctest.DocTestSuite(module=collections)
     test_classes = [TestNamedTuple, NamedTupleDocs, TestOneTrickPonyABCs,
                     TestCollectionABCs, TestCounter, TestChainMap,
-                    TestUserObjects,
+                    TestUserObjects, TestSortedList, TestSortedDict,
                     ]
     support.run_unittest(*test_classes)
     support.run_doctest(collections, verbose)
@@ -233,6 +233,74 @@ class EncodingTest(unittest.TestCase):
             sys.stdout = orig_stdout
 
 
+class CodeCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(support.rmtree, self.directory)
+        self.pkgdir = os.path.join(self.directory, 'pkg')
+        os.mkdir(self.pkgdir)
+        self.modfn = self.make_module(self.directory, 'mod', 'X = 1\n')
+        self.initfn = self.make_module(self.pkgdir, '__init__', 'Y = 1\n')
+        self.subfn = self.make_module(self.pkgdir, 'sub', 'Z = 1\n')
+        self.cache = importlib._bootstrap_external._code_cache_path(
+            self.directory)
+
+    def make_module(self, directory, name, source):
+        fn = script_helper.make_script(directory, name, source)
+        os.utime(fn, (1000000000, 1000000000))
+        return fn
+
+    def get_values(self, *args, **env_vars):
+        code = 'import mod, pkg.sub; print(mod.X, pkg.Y, pkg.sub.Z)'
+        rc, out, err = script_helper.assert_python_ok(
+            *args, '-c', code, __cwd=self.directory, __isolated=False,
+            **env_vars)
+        return out.strip()
+
+    def test_compile_code_cache(self):
+        self.assertTrue(compileall.compile_code_cache(self.directory,
+                                                      quiet=2))
+        self.assertTrue(os.path.isfile(self.cache))
+        self.assertFalse(os.path.exists(
+            importlib.util.cache_from_source(self.modfn)))
+        with open(self.cache, 'rb') as f:
+            self.assertEqual(f.read(8),
+                             b'PYCA' + importlib.util.MAGIC_NUMBER)
+
+    def test_import_from_code_cache(self):
+        compileall.compile_code_cache(self.directory, quiet=2)
+        # Same size and mtime: only the code cache tells them apart.
+        self.make_module(self.directory, 'mod', 'X = 2\n')
+        self.make_module(self.pkgdir, '__init__', 'Y = 2\n')
+        self.assertEqual(self.get_values('-X', 'codecache'), b'1 1 1')
+        self.assertEqual(self.get_values(PYTHONCODECACHE='1'), b'1 1 1')
+        self.assertEqual(self.get_values(), b'2 2 1')
+        self.assertEqual(self.get_values('-E', PYTHONCODECACHE='1'),
+                         b'2 2 1')
+
+    def test_stale_code_cache(self):
+        compileall.compile_code_cache(self.directory, quiet=2)
+        with open(self.modfn, 'w') as f:
+            f.write('X = 22\n')
+        # Same mtime but a different size.
+        self.make_module(self.pkgdir, '__init__', 'Y = 22\n')
+        self.assertEqual(self.get_values('-X', 'codecache'), b'22 22 1')
+
+    def test_bad_code_cache(self):
+        os.mkdir(os.path.dirname(self.cache))
+        with open(self.cache, 'wb') as f:
+            f.write(b'PYCA\0\0\0\0')
+        self.assertEqual(self.get_values('-X', 'codecache'), b'1 1 1')
+
+    def test_compile_error(self):
+        badfn = script_helper.make_script(self.directory, 'bad', 'x(')
+        self.assertFalse(compileall.compile_code_cache(self.directory,
+                                                       quiet=2))
+        self.assertTrue(os.path.isfile(self.cache))
+        self.assertEqual(self.get_values('-X', 'codecache'), b'1 1 1')
+
+
 class CommandLineTestsBase:
     """Test compileall's CLI."""
 
@@ -555,6 +623,12 @@ class CommandLineTestsBase:
             data = fp.read()
         self.assertEqual(int.from_bytes(data[4:8], 'little'), 0b01)
 
+    def test_code_cache(self):
+        self.assertRunOK('-q', '--code-cache', self.directory)
+        self.assertCompiled(self.barfn)
+        cache = importlib._bootstrap_external._code_cache_path(self.directory)
+        self.assertTrue(os.path.isfile(cache))
+
     @skipUnless(_have_multiprocessing, "requires multiprocessing")
     def test_workers(self):
         bar2fn = script_helper.make_script(self.directory, 'bar2', '')
@@ -808,6 +808,87 @@ class ProcessPoolExecutorTest(ExecutorTest):
 
         self.assertTrue(obj.event.wait(timeout=1))
 
+    def test_batched_calls(self):
+        # A large backlog of small tasks is sent to the workers in batches.
+        n = 20 * futures.process.MAX_CALL_BATCH_SIZE * self.worker_count
+        self.assertEqual(list(self.executor.map(abs, range(-n, 0))),
+                         list(range(n, 0, -1)))
+        fs = [self.executor.submit(abs, i) for i in range(n)]
+        self.assertEqual([f.result() for f in fs], list(range(n)))
+
+    def test_batched_calls_pickling_error(self):
+        # An unpicklable call or result only fails its own future, even if
+        # it is part of a batch.
+        n = 20 * futures.process.MAX_CALL_BATCH_SIZE * self.worker_count
+        bad_call = n // 2
+        bad_result = n // 2 + 1
+        fs = []
+        for i in range(n):
+            if i == bad_call:
+                fs.append(self.executor.submit(id, ErrorAtPickle()))
+            elif i == bad_result:
+                fs.append(self.executor.submit(_return_instance,
+                                               ErrorAtPickle))
+            else:
+                fs.append(self.executor.submit(abs, -i))
+        with self.assertRaises(PicklingError):
+            fs[bad_call].result()
+        with self.assertRaises(PicklingError):
+            fs[bad_result].result()
+        for i, f in enumerate(fs):
+            if i not in (bad_call, bad_result):
+                self.assertEqual(f.result(), i)
+
+    def test_max_tasks_per_child(self):
+        context = self.get_context()
+        if context.get_start_method(allow_none=False) == "fork":
+            with self.assertRaises(ValueError):
+                self.executor_type(1, mp_context=context,
+                                   max_tasks_per_child=3)
+            return
+        executor = self.executor_type(1, mp_context=context,
+                                      max_tasks_per_child=3)
+        f1 = executor.submit(os.getpid)
+        original_pid = f1.result()
+        # The worker pid remains the same as the worker could be reused
+        f2 = executor.submit(os.getpid)
+        self.assertEqual(f2.result(), original_pid)
+        self.assertEqual(len(executor._processes), 1)
+        f3 = executor.submit(os.getpid)
+        self.assertEqual(f3.result(), original_pid)
+
+        # A new worker is spawned, with a statistically different pid,
+        # while the previous was reaped.
+        f4 = executor.submit(os.getpid)
+        new_pid = f4.result()
+        self.assertNotEqual(original_pid, new_pid)
+        self.assertEqual(len(executor._processes), 1)
+
+        executor.shutdown()
+
+    def test_max_tasks_per_child_defaults_to_spawn_context(self):
+        executor = self.executor_type(1, max_tasks_per_child=3)
+        self.assertEqual(executor._mp_context.get_start_method(), "spawn")
+        executor.shutdown()
+
+    def test_max_tasks_per_child_invalid(self):
+        with self.assertRaises(ValueError):
+            self.executor_type(1, max_tasks_per_child=0)
+        with self.assertRaises(TypeError):
+            self.executor_type(1, max_tasks_per_child=1.5)
+
+    def test_max_tasks_early_shutdown(self):
+        context = self.get_context()
+        if context.get_start_method(allow_none=False) == "fork":
+            raise unittest.SkipTest("Incompatible with the fork start method.")
+        # Each worker runs a single task, while many more are pending.
+        executor = self.executor_type(3, mp_context=context,
+                                      max_tasks_per_child=1)
+        fs = [executor.submit(mul, i, i) for i in range(20)]
+        executor.shutdown()
+        self.assertEqual([f.result() for f in fs],
+                         [i * i for i in range(20)])
+
 
 create_executor_tests(ProcessPoolExecutorTest,
                       executor_mixins=(ProcessPoolForkMixin,
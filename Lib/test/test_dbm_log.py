@@ -0,0 +1,379 @@
+"""Test script for the dbm.log module"""
+
+import operator
+import os
+import stat
+import unittest
+import dbm.log
+from test import support
+from functools import partial
+
+_fname = support.TESTFN
+
+def _delete_files():
+    for ext in [".log", ".idx", ".log.tmp", ".idx.tmp", ".old"]:
+        try:
+            os.unlink(_fname + ext)
+        except OSError:
+            pass
+
+class LogDBMTestCase(unittest.TestCase):
+    _dict = {b'0': b'',
+             b'a': b'Python:',
+             b'b': b'Programming',
+             b'c': b'the',
+             b'd': b'way',
+             b'f': b'Guido',
+             b'g': b'intended',
+             '\u00fc'.encode('utf-8') : b'!',
+             }
+
+    def test_creation(self):
+        f = dbm.log.open(_fname, 'c')
+        self.assertEqual(list(f.keys()), [])
+        for key in self._dict:
+            f[key] = self._dict[key]
+        self.read_helper(f)
+        f.close()
+
+    @unittest.skipUnless(hasattr(os, 'umask'), 'test needs os.umask()')
+    @unittest.skipUnless(hasattr(os, 'chmod'), 'test needs os.chmod()')
+    def test_creation_mode(self):
+        try:
+            old_umask = os.umask(0o002)
+            f = dbm.log.open(_fname, 'c', 0o637)
+            f[b'a'] = b'b'
+            f.close()
+        finally:
+            os.umask(old_umask)
+
+        expected_mode = 0o635
+        if os.name != 'posix':
+            # Windows only supports setting the read-only attribute.
+            # This shouldn't fail, but doesn't work like Unix either.
+            expected_mode = 0o666
+
+        st = os.stat(_fname + '.log')
+        self.assertEqual(stat.S_IMODE(st.st_mode), expected_mode)
+        st = os.stat(_fname + '.idx')
+        self.assertEqual(stat.S_IMODE(st.st_mode), expected_mode)
+
+    def test_close_twice(self):
+        f = dbm.log.open(_fname)
+        f[b'a'] = b'b'
+        self.assertEqual(f[b'a'], b'b')
+        f.close()
+        f.close()
+
+    def test_modification(self):
+        self.init_db()
+        f = dbm.log.open(_fname, 'w')
+        self._dict[b'g'] = f[b'g'] = b"indented"
+        self.read_helper(f)
+        self.assertEqual(f.setdefault(b'xxx', b'foo'), b'foo')
+        self.assertEqual(f[b'xxx'], b'foo')
+        del f[b'xxx']
+        with self.assertRaises(KeyError):
+            del f[b'xxx']
+        f.close()
+        with dbm.log.open(_fname, 'r') as f:
+            self.read_helper(f)
+
+    def test_read(self):
+        self.init_db()
+        f = dbm.log.open(_fname, 'r')
+        self.read_helper(f)
+        with self.assertRaisesRegex(ValueError,
+                                   'The database is opened for reading only'):
+            f[b'g'] = b'x'
+        with self.assertRaisesRegex(ValueError,
+                                   'The database is opened for reading only'):
+            del f[b'a']
+        with self.assertRaisesRegex(ValueError,
+                                   'The database is opened for reading only'):
+            f.reorganize()
+        self.assertEqual(f.get(b'a'), self._dict[b'a'])
+        self.assertIsNone(f.get(b'xxx'))
+        with self.assertRaises(KeyError):
+            f[b'xxx']
+        f.close()
+
+    def test_str_write_contains(self):
+        self.init_db()
+        f = dbm.log.open(_fname)
+        f['\u00fc'] = b'!'
+        f['1'] = 'a'
+        f.close()
+        f = dbm.log.open(_fname, 'r')
+        self.assertIn('\u00fc', f)
+        self.assertEqual(f['\u00fc'.encode('utf-8')], b'!')
+        self.assertEqual(f[b'1'], b'a')
+        f.close()
+
+    def test_invalid_types(self):
+        with dbm.log.open(_fname, 'n') as f:
+            with self.assertRaises(TypeError):
+                f[1] = b'a'
+            with self.assertRaises(TypeError):
+                f[b'a'] = 1
+            f[bytearray(b'a')] = bytearray(b'b')
+            self.assertEqual(f[b'a'], b'b')
+
+    # Perform randomized operations.  This doesn't make assumptions about
+    # what *might* fail.
+    def test_random(self):
+        import random
+        d = {}  # mirror the database
+        for dummy in range(5):
+            f = dbm.log.open(_fname)
+            for dummy in range(100):
+                k = random.choice('abcdefghijklm')
+                if random.random() < 0.2:
+                    if k in d:
+                        del d[k]
+                        del f[k]
+                else:
+                    v = (random.choice((b'a', b'b', b'c')) *
+                         random.randrange(10000))
+                    d[k] = v
+                    f[k] = v
+                    self.assertEqual(f[k], v)
+            if random.random() < 0.5:
+                f.reorganize()
+            f.close()
+
+            f = dbm.log.open(_fname)
+            expected = sorted((k.encode("latin-1"), v) for k, v in d.items())
+            got = sorted(f.items())
+            self.assertEqual(expected, got)
+            f.close()
+
+    def test_large_values(self):
+        # Values appended after the log is mapped in memory are read
+        # from the file, then from a new mapping.
+        value = b'x' * 100000
+        with dbm.log.open(_fname, 'n') as f:
+            for i in range(30):
+                f[str(i)] = value + str(i).encode()
+                self.assertEqual(f[str(i)], value + str(i).encode())
+            for i in range(30):
+                self.assertEqual(f[str(i)], value + str(i).encode())
+
+    def test_incremental_checkpoint(self):
+        with dbm.log.open(_fname, 'n') as f:
+            for i in range(100):
+                f[str(i)] = str(i)
+        size = os.path.getsize(_fname + '.idx')
+        with dbm.log.open(_fname, 'w') as f:
+            f['1'] = 'one'
+            del f['2']
+        # Only the changed entries were appended to the index file.
+        self.assertLess(os.path.getsize(_fname + '.idx') - size, size / 10)
+        with dbm.log.open(_fname, 'r') as f:
+            self.assertEqual(len(f), 99)
+            self.assertEqual(f['1'], b'one')
+            self.assertNotIn('2', f)
+            self.assertEqual(f['3'], b'3')
+
+    def test_missing_checkpoint(self):
+        # The records appended after the last checkpoint are read from
+        # the log.
+        with dbm.log.open(_fname, 'n') as f:
+            f['a'] = 'b'
+            f.sync()
+            f['c'] = 'd'
+            del f['a']
+            f._log.flush()
+            with dbm.log.open(_fname, 'r') as g:
+                self.assertEqual(g.keys(), [b'c'])
+        os.unlink(_fname + '.idx')
+        with dbm.log.open(_fname, 'r') as f:
+            self.assertEqual(f.keys(), [b'c'])
+        with dbm.log.open(_fname, 'w') as f:
+            self.assertEqual(f.keys(), [b'c'])
+        self.assertTrue(os.path.exists(_fname + '.idx'))
+
+    def test_truncated_record(self):
+        with dbm.log.open(_fname, 'n') as f:
+            f['a'] = 'b'
+            f.sync()
+            f['c'] = 'd' * 100
+        size = os.path.getsize(_fname + '.log')
+        with open(_fname + '.log', 'rb+') as file:
+            file.truncate(size - 1)
+        with dbm.log.open(_fname, 'r') as f:
+            self.assertEqual(f.keys(), [b'a'])
+        with dbm.log.open(_fname, 'w') as f:
+            self.assertEqual(f.keys(), [b'a'])
+            f['e'] = 'f'
+        with dbm.log.open(_fname, 'r') as f:
+            self.assertEqual(sorted(f.keys()), [b'a', b'e'])
+            self.assertEqual(f['e'], b'f')
+
+    def test_corrupted_record(self):
+        with dbm.log.open(_fname, 'n') as f:
+            f['a'] = 'b'
+            f.sync()
+            f['c'] = 'd'
+        with open(_fname + '.log', 'rb+') as file:
+            file.seek(-1, os.SEEK_END)
+            file.write(b'e')
+        # The record is not checked if it is covered by a checkpoint.
+        os.unlink(_fname + '.idx')
+        with dbm.log.open(_fname, 'r') as f:
+            self.assertEqual(f.keys(), [b'a'])
+
+    def test_torn_checkpoint(self):
+        with dbm.log.open(_fname, 'n') as f:
+            f['a'] = 'b'
+        with dbm.log.open(_fname, 'w') as f:
+            f['c'] = 'd'
+        size = os.path.getsize(_fname + '.idx')
+        with open(_fname + '.idx', 'rb+') as file:
+            file.truncate(size - 1)
+        with dbm.log.open(_fname, 'w') as f:
+            self.assertEqual(sorted(f.keys()), [b'a', b'c'])
+            # The record after the last valid checkpoint was read again.
+            self.assertEqual(list(f._changes), [b'c'])
+        # The index file was rewritten, and the next open reads a
+        # checkpoint covering the whole log.
+        with dbm.log.open(_fname, 'w') as f:
+            self.assertEqual(sorted(f.keys()), [b'a', b'c'])
+            self.assertEqual(f._changes, {})
+            self.assertFalse(f._idx_stale)
+
+    def test_reorganize(self):
+        with dbm.log.open(_fname, 'n') as f:
+            for i in range(100):
+                f[str(i)] = str(i) * 100
+            for i in range(100):
+                if i % 4:
+                    del f[str(i)]
+            size = os.path.getsize(_fname + '.log')
+            f.reorganize()
+            self.assertLess(os.path.getsize(_fname + '.log'), size / 2)
+            self.assertEqual(len(f), 25)
+            self.assertEqual(f['0'], b'0' * 100)
+            f['0'] = 'zero'
+        with dbm.log.open(_fname, 'r') as f:
+            self.assertEqual(len(f), 25)
+            self.assertEqual(f['0'], b'zero')
+            self.assertEqual(f['96'], b'96' * 100)
+            self.assertNotIn('97', f)
+
+    def test_stale_index(self):
+        # An index file left from another log is ignored.
+        with dbm.log.open(_fname, 'n') as f:
+            f['a'] = 'b'
+        os.rename(_fname + '.idx', _fname + '.old')
+        with dbm.log.open(_fname, 'n') as f:
+            f['c'] = 'd'
+        os.replace(_fname + '.old', _fname + '.idx')
+        with dbm.log.open(_fname, 'r') as f:
+            self.assertEqual(f.keys(), [b'c'])
+
+    def test_not_a_database(self):
+        with open(_fname + '.log', 'wb') as file:
+            file.write(b'spam and eggs')
+        with self.assertRaises(dbm.log.error):
+            dbm.log.open(_fname)
+
+    def test_context_manager(self):
+        with dbm.log.open(_fname, 'c') as db:
+            db["dbm.log context manager"] = "context manager"
+
+        with dbm.log.open(_fname, 'r') as db:
+            self.assertEqual(list(db.keys()), [b"dbm.log context manager"])
+
+        with self.assertRaises(dbm.log.error):
+            db.keys()
+
+    def test_check_closed(self):
+        f = dbm.log.open(_fname, 'c')
+        f.close()
+
+        for meth in (partial(operator.delitem, f),
+                     partial(operator.setitem, f, 'b'),
+                     partial(operator.getitem, f),
+                     partial(operator.contains, f)):
+            with self.assertRaises(dbm.log.error) as cm:
+                meth('test')
+            self.assertEqual(str(cm.exception),
+                             "DBM object has already been closed")
+
+        for meth in (operator.methodcaller('keys'),
+                     operator.methodcaller('items'),
+                     operator.methodcaller('sync'),
+                     operator.methodcaller('reorganize'),
+                     iter,
+                     len):
+            with self.assertRaises(dbm.log.error) as cm:
+                meth(f)
+            self.assertEqual(str(cm.exception),
+                             "DBM object has already been closed")
+
+    def test_create_new(self):
+        with dbm.log.open(_fname, 'n') as f:
+            for k in self._dict:
+                f[k] = self._dict[k]
+
+        with dbm.log.open(_fname, 'n') as f:
+            self.assertEqual(f.keys(), [])
+
+    def test_missing_data(self):
+        for value in ('r', 'w'):
+            _delete_files()
+            with self.assertRaises(FileNotFoundError):
+                dbm.log.open(_fname, value)
+            self.assertFalse(os.path.exists(_fname + '.log'))
+            self.assertFalse(os.path.exists(_fname + '.idx'))
+
+    def test_invalid_flag(self):
+        for flag in ('x', 'rf', None):
+            with self.assertRaisesRegex(ValueError,
+                                        "Flag must be one of "
+                                        "'r', 'w', 'c', or 'n'"):
+                dbm.log.open(_fname, flag)
+
+    @unittest.skipUnless(hasattr(os, 'chmod'), 'test needs os.chmod()')
+    def test_readonly_files(self):
+        with support.temp_dir() as dir:
+            fname = os.path.join(dir, 'db')
+            with dbm.log.open(fname, 'n') as f:
+                for key in self._dict:
+                    f[key] = self._dict[key]
+            os.chmod(fname + ".log", stat.S_IRUSR)
+            os.chmod(fname + ".idx", stat.S_IRUSR)
+            os.chmod(dir, stat.S_IRUSR|stat.S_IXUSR)
+            try:
+                with dbm.log.open(fname, 'r') as f:
+                    self.assertEqual(sorted(f.keys()), sorted(self._dict))
+            finally:
+                os.chmod(dir, stat.S_IRWXU)
+
+    def read_helper(self, f):
+        keys = self.keys_helper(f)
+        for key in self._dict:
+            self.assertEqual(self._dict[key], f[key])
+
+    def init_db(self):
+        f = dbm.log.open(_fname, 'n')
+        for k in self._dict:
+            f[k] = self._dict[k]
+        f.close()
+
+    def keys_helper(self, f):
+        keys = sorted(f.keys())
+        dkeys = sorted(self._dict.keys())
+        self.assertEqual(keys, dkeys)
+        return keys
+
+    def tearDown(self):
+        _delete_files()
+
+    def setUp(self):
+        _delete_files()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -495,12 +495,120 @@ class TestJunkAPIs(unittest.TestCase):
         for char in ['a', '#', '\n', '\f', '\r', '\v']:
             self.assertFalse(difflib.IS_CHARACTER_JUNK(char), repr(char))
 
+class TestAlgorithms(unittest.TestCase):
+
+    algorithms = ['myers', 'patience']
+
+    def lcs_length(self, a, b):
+        previous = [0] * (len(b) + 1)
+        for x in a:
+            current = [0]
+            for j, y in enumerate(b):
+                if x == y:
+                    current.append(previous[j] + 1)
+                else:
+                    current.append(max(previous[j + 1], current[j]))
+            previous = current
+        return previous[-1]
+
+    def check_blocks(self, a, b, algorithm):
+        sm = difflib.SequenceMatcher(None, a, b, algorithm=algorithm)
+        blocks = sm.get_matching_blocks()
+        self.assertEqual(blocks[-1], (len(a), len(b), 0))
+        i1 = j1 = 0
+        for i, j, n in blocks:
+            self.assertEqual(a[i:i+n], b[j:j+n])
+            self.assertGreaterEqual(i, i1)
+            self.assertGreaterEqual(j, j1)
+            i1, j1 = i + n, j + n
+        # the opcodes rebuild b from a
+        result = []
+        for tag, i1, i2, j1, j2 in sm.get_opcodes():
+            if tag == 'equal':
+                result.extend(a[i1:i2])
+            else:
+                result.extend(b[j1:j2])
+        self.assertEqual(result, list(b))
+        return sum(n for i, j, n in blocks)
+
+    def test_matching_blocks(self):
+        import random
+        r = random.Random(42)
+        for _ in range(300):
+            a = ''.join(r.choice('abc') for _ in range(r.randrange(12)))
+            b = ''.join(r.choice('abcd') for _ in range(r.randrange(12)))
+            with self.subTest(a=a, b=b):
+                # Myers' algorithm finds a longest common subsequence
+                self.assertEqual(self.check_blocks(a, b, 'myers'),
+                                 self.lcs_length(a, b))
+                self.check_blocks(a, b, 'patience')
+
+    def test_examples(self):
+        for algorithm in self.algorithms:
+            sm = difflib.SequenceMatcher(None, 'abxcd', 'abcd',
+                                         algorithm=algorithm)
+            self.assertEqual(sm.get_matching_blocks(),
+                             [(0, 0, 2), (3, 2, 2), (5, 4, 0)])
+            self.assertEqual(sm.ratio(), 8 / 9)
+            sm = difflib.SequenceMatcher(None, '', 'abc',
+                                         algorithm=algorithm)
+            self.assertEqual(sm.get_opcodes(), [('insert', 0, 0, 0, 3)])
+            sm.set_seqs('abc', 'abc')
+            self.assertEqual(sm.get_opcodes(), [('equal', 0, 3, 0, 3)])
+
+    def test_patience(self):
+        # The unique lines are used as synch points, rather than the
+        # repeated braces
+        a = ['f() {\n', '  x\n', '}\n', 'g() {\n', '  y\n', '}\n']
+        b = ['f() {\n', '  x\n', '}\n', 'h() {\n', '  z\n', '}\n',
+             'g() {\n', '  y\n', '}\n']
+        sm = difflib.SequenceMatcher(None, a, b, algorithm='patience')
+        self.assertEqual(sm.get_opcodes(),
+                         [('equal', 0, 3, 0, 3), ('insert', 3, 3, 3, 6),
+                          ('equal', 3, 6, 6, 9)])
+
+    def test_large_input(self):
+        a = ['line %d\n' % i for i in range(20000)]
+        b = a[:]
+        for i in range(0, len(b), 1000):
+            b[i] = 'changed\n'
+        del b[5000:5010]
+        expected = list(difflib.unified_diff(a, b))
+        for algorithm in self.algorithms:
+            self.assertEqual(list(difflib.unified_diff(a, b,
+                                                       algorithm=algorithm)),
+                             expected)
+            self.assertEqual(list(difflib.context_diff(a, b,
+                                                       algorithm=algorithm)),
+                             list(difflib.context_diff(a, b)))
+
+    def test_ndiff(self):
+        a = 'one\ntwo\nthree\n'.splitlines(keepends=True)
+        b = 'ore\ntree\nemu\n'.splitlines(keepends=True)
+        expected = list(difflib.ndiff(a, b))
+        for algorithm in self.algorithms:
+            self.assertEqual(list(difflib.ndiff(a, b, algorithm=algorithm)),
+                             expected)
+        # Big replaced blocks are not searched for similar lines
+        a = ['line %d\n' % i for i in range(200)]
+        b = ['Line %d\n' % i for i in range(200)]
+        result = list(difflib.ndiff(a, b, algorithm='myers'))
+        self.assertEqual(result, ['- ' + line for line in a] +
+                                 ['+ ' + line for line in b])
+
+    def test_invalid_algorithm(self):
+        with self.assertRaises(ValueError):
+            difflib.SequenceMatcher(None, 'a', 'b', algorithm='spam')
+        with self.assertRaises(ValueError):
+            difflib.Differ(algorithm='spam')
+
+
 def test_main():
     difflib.HtmlDiff._default_prefix = 0
     Doctests = doctest.DocTestSuite(difflib)
     run_unittest(
         TestWithAscii, TestAutojunk, TestSFpatches, TestSFbugs,
-        TestOutputFormat, TestBytes, TestJunkAPIs, Doctests)
+        TestOutputFormat, TestBytes, TestJunkAPIs, TestAlgorithms, Doctests)
 
 if __name__ == '__main__':
     test_main()
@@ -1593,6 +1593,212 @@ class TestLRU:
                 f_copy = copy.deepcopy(f)
                 self.assertIs(f_copy, f)
 
+    def test_lru_maxcost(self):
+        f = self.module.lru_cache(maxsize=None, maxcost=10, cost=len)(
+            lambda x: 'x' * x)
+        for x in 3, 4, 2:
+            f(x)
+        self.assertEqual(f.cache_info(), (0, 3, None, 3, 0, 0, 10, 9))
+        f(3)                    # 3 becomes the most recently used result
+        f(6)                    # evicts 4 and 2
+        self.assertEqual(f.cache_info(), (1, 4, None, 2, 2, 0, 10, 9))
+        f(11)                   # too costly to be cached
+        self.assertEqual(f.cache_info(), (1, 5, None, 2, 2, 0, 10, 9))
+        f(3)
+        f(6)
+        self.assertEqual(f.cache_info().hits, 3)
+        f.cache_clear()
+        self.assertEqual(f.cache_info(), (0, 0, None, 0, 0, 0, 10, 0))
+
+        f = self.module.lru_cache(maxcost=1000)(lambda x: bytes(x))
+        f(100)
+        self.assertEqual(f.cache_info().currcost, sys.getsizeof(bytes(100)))
+
+        f = self.module.lru_cache(maxsize=2, cost=len)(lambda x: 'x' * x)
+        for x in 1, 2, 3:
+            f(x)
+        self.assertEqual(f.cache_info(), (0, 3, 2, 2, 1, 0, None, 5))
+
+    def test_lru_ttl(self):
+        now = 100.0
+        with unittest.mock.patch('time.monotonic', lambda: now):
+            f = self.module.lru_cache(ttl=10)(lambda x: [x])
+        a = f(1)
+        now += 5
+        self.assertIs(f(1), a)
+        c = f(2)
+        now += 6
+        b = f(1)
+        self.assertIsNot(b, a)
+        self.assertEqual(f.cache_info(), (1, 3, 128, 2, 0, 1, None, 0))
+        now += 20
+        self.assertIsNot(f(2), c)
+        self.assertEqual(f.cache_info().expired, 2)
+
+    def test_lru_bounded_errors(self):
+        lru_cache = self.module.lru_cache
+        self.assertRaises(ValueError, lru_cache, ttl=0)
+        self.assertRaises(ValueError, lru_cache, ttl=-1)
+        self.assertRaises(ValueError, lru_cache, maxcost=-1)
+        self.assertRaises(TypeError, lru_cache, cost=42)
+        f = lru_cache(maxcost=10, cost=len)(lambda x: x)
+        self.assertRaises(TypeError, f, 42)
+        self.assertRaises(TypeError, f, [])
+        self.assertEqual(f('abc'), 'abc')
+        self.assertEqual(f.cache_info().currsize, 1)
+
+    def test_lru_bounded_recursion(self):
+        @self.module.lru_cache(ttl=10)
+        def fib(n):
+            if n < 2:
+                return n
+            return fib(n - 1) + fib(n - 2)
+        self.assertEqual(fib(30), 832040)
+        self.assertEqual(fib.cache_info().misses, 31)
+
+        @self.module.lru_cache(ttl=10)
+        def same(n, depth=0):
+            return depth if depth == 3 else same(n, depth=depth + 1)
+        self.assertEqual(same(1), 3)
+
+    @support.reap_threads
+    def test_lru_single_flight(self):
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+        @self.module.lru_cache(ttl=60)
+        def f(x):
+            calls.append(x)
+            started.set()
+            release.wait()
+            return x * 2
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(f(21)))
+                   for _ in range(5)]
+        threads[0].start()
+        started.wait()
+        for t in threads[1:]:
+            t.start()
+        time.sleep(0.05)
+        release.set()
+        for t in threads:
+            t.join()
+        self.assertEqual(calls, [21])
+        self.assertEqual(results, [42] * 5)
+        self.assertEqual(f.cache_info()[:2], (4, 1))
+
+    @support.reap_threads
+    def test_lru_single_flight_error(self):
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+        @self.module.lru_cache(ttl=60)
+        def f(x):
+            calls.append(x)
+            started.set()
+            release.wait()
+            if len(calls) == 1:
+                raise ValueError
+            return x
+        errors = []
+        def call():
+            try:
+                f(1)
+            except ValueError:
+                errors.append(True)
+        t1 = threading.Thread(target=call)
+        t1.start()
+        started.wait()
+        t2 = threading.Thread(target=call)
+        t2.start()
+        time.sleep(0.05)
+        release.set()
+        t1.join()
+        t2.join()
+        # The second thread computed the result again.
+        self.assertEqual(calls, [1, 1])
+        self.assertEqual(errors, [True])
+        self.assertEqual(f(1), 1)
+        self.assertEqual(f.cache_info()[:2], (1, 2))
+
+    def test_lru_coroutine(self):
+        calls = []
+        @self.module.lru_cache()
+        async def coro(x):
+            calls.append(x)
+            return [x]
+
+        def run(coro):
+            try:
+                coro.send(None)
+            except StopIteration as e:
+                return e.value
+            self.fail('coroutine did not finish')
+
+        a = run(coro(1))
+        self.assertEqual(a, [1])
+        self.assertIs(run(coro(1)), a)
+        self.assertEqual(calls, [1])
+        self.assertEqual(coro.cache_info()[:4], (1, 1, 128, 1))
+        self.assertTrue(self.module._is_coroutine_function(coro))
+
+    def test_lru_coroutine_single_flight(self):
+        asyncio = support.import_module('asyncio')
+        calls = []
+        @self.module.lru_cache()
+        async def coro(x):
+            calls.append(x)
+            await asyncio.sleep(0.01)
+            if x < 0:
+                raise ValueError(x)
+            return [x]
+
+        async def main():
+            results = await asyncio.gather(coro(1), coro(1), coro(1))
+            errors = await asyncio.gather(coro(-1), coro(-1),
+                                          return_exceptions=True)
+            return results, errors
+
+        loop = asyncio.new_event_loop()
+        self.addCleanup(asyncio.set_event_loop_policy, None)
+        self.addCleanup(loop.close)
+        results, errors = loop.run_until_complete(main())
+        self.assertEqual(results, [[1]] * 3)
+        self.assertIs(results[1], results[0])
+        self.assertIs(results[2], results[0])
+        self.assertEqual(len(errors), 2)
+        self.assertIsInstance(errors[0], ValueError)
+        self.assertIs(errors[1], errors[0])
+        self.assertEqual(calls, [1, -1])
+        self.assertEqual(coro.cache_info()[:4], (3, 2, 128, 1))
+
+    def test_lru_coroutine_cancelled(self):
+        asyncio = support.import_module('asyncio')
+        calls = []
+        @self.module.lru_cache()
+        async def coro(x):
+            calls.append(x)
+            await asyncio.sleep(0.01)
+            return [x]
+
+        async def main():
+            first = asyncio.ensure_future(coro(1))
+            await asyncio.sleep(0)
+            second = asyncio.ensure_future(coro(1))
+            await asyncio.sleep(0)
+            first.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await first
+            # The waiting task computes the result itself.
+            return await second
+
+        loop = asyncio.new_event_loop()
+        self.addCleanup(asyncio.set_event_loop_policy, None)
+        self.addCleanup(loop.close)
+        self.assertEqual(loop.run_until_complete(main()), [1])
+        self.assertEqual(calls, [1, 1])
+        self.assertEqual(coro.cache_info()[:4], (0, 2, 128, 1))
+
 
 @py_functools.lru_cache()
 def py_cached_func(x, y):
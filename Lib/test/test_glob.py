@@ -4,7 +4,7 @@ import shutil
 import sys
 import unittest
 
-from test.support import (TESTFN, skip_unless_symlink,
+from test.support import (TESTFN, skip_unless_symlink, swap_attr,
                           can_symlink, create_empty_file, change_cwd)
 
 
@@ -264,6 +264,126 @@ class GlobTests(unittest.TestCase):
                 expect += [join('sym3', 'EF')]
             eq(glob.glob(join('**', 'EF'), recursive=True), expect)
 
+    def test_recursive_glob_workers(self):
+        eq = self.assertSequencesEqual_noorder
+        join = os.path.join
+        for parts in [('**',), (os.curdir, '**'), ('**', ''), ('a', '**'),
+                      ('**', 'EF'), ('**', '*F'), ('**', 'bcd', '*'),
+                      ('a', '**', 'bcd'), ('**', 'zymurgy')]:
+            with self.subTest(parts=parts):
+                eq(self.rglob(*parts, workers=4), self.rglob(*parts))
+        with change_cwd(self.tempdir):
+            for pattern in ['**', join('**', ''), join(os.curdir, '**')]:
+                eq(glob.glob(pattern, recursive=True, workers=4),
+                   glob.glob(pattern, recursive=True))
+
+
+class GlobSetTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = TESTFN + "_dir"
+        for parts in [('a', 'D'), ('aab', 'F'), ('.aa', 'G'), ('EF',),
+                      ('a', 'bcd', 'EF'), ('a', 'bcd', 'efg', 'ha'),
+                      ('a', 'node', 'x', 'EF')]:
+            path = os.path.join(self.tempdir, *parts)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            create_empty_file(path)
+        self.addCleanup(shutil.rmtree, self.tempdir)
+
+    def check(self, globset, expected):
+        join = os.path.join
+        expected = [join(*parts) for parts in expected]
+        self.assertCountEqual(globset.glob(self.tempdir), expected)
+        bglobset = glob.GlobSet(map(os.fsencode, globset.patterns),
+                                map(os.fsencode, globset.exclude),
+                                include_hidden=globset._include_hidden)
+        self.assertCountEqual(bglobset.glob(os.fsencode(self.tempdir)),
+                              map(os.fsencode, expected))
+        with change_cwd(self.tempdir):
+            self.assertCountEqual(globset.glob(), expected)
+        for path in expected:
+            self.assertTrue(globset.match(path) or globset.match(path + '/'),
+                            path)
+
+    def test_patterns(self):
+        GlobSet = glob.GlobSet
+        self.check(GlobSet(['*']), [('a',), ('aab',), ('EF',)])
+        self.check(GlobSet(['*/']), [('a',), ('aab',)])
+        self.check(GlobSet(['a/*', 'aab/F']),
+                   [('a', 'D'), ('a', 'bcd'), ('a', 'node'), ('aab', 'F')])
+        self.check(GlobSet(['**/EF']),
+                   [('EF',), ('a', 'bcd', 'EF'), ('a', 'node', 'x', 'EF')])
+        self.check(GlobSet(['a/**/h?', './E*']),
+                   [('a', 'bcd', 'efg', 'ha'), ('EF',)])
+        self.check(GlobSet(['a/**']),
+                   [('a',), ('a', 'D'), ('a', 'bcd'), ('a', 'bcd', 'EF'),
+                    ('a', 'bcd', 'efg'), ('a', 'bcd', 'efg', 'ha'),
+                    ('a', 'node'), ('a', 'node', 'x'),
+                    ('a', 'node', 'x', 'EF')])
+        self.check(GlobSet(['zymurgy', 'a/zymurgy/*', 'a/D/*']), [])
+
+    def test_hidden(self):
+        GlobSet = glob.GlobSet
+        self.check(GlobSet(['**/G']), [])
+        self.check(GlobSet(['.*/G']), [('.aa', 'G')])
+        self.check(GlobSet(['**/G'], include_hidden=True), [('.aa', 'G')])
+
+    def test_exclude(self):
+        GlobSet = glob.GlobSet
+        self.check(GlobSet(['**/EF'], exclude=['**/node']),
+                   [('EF',), ('a', 'bcd', 'EF')])
+        self.check(GlobSet(['**/EF'], exclude=['a/*/']), [('EF',)])
+        self.check(GlobSet(['**/*'], exclude=['**/*F', 'a']),
+                   [('aab',)])
+
+    def test_exclude_does_not_scan(self):
+        # Exclude patterns must not make glob() list directories that
+        # no include pattern can match in.
+        scanned = []
+        real_scandir = os.scandir
+        def scandir(path):
+            scanned.append(os.path.relpath(path, self.tempdir))
+            return real_scandir(path)
+        GlobSet = glob.GlobSet
+        with swap_attr(os, 'scandir', scandir):
+            self.assertCountEqual(GlobSet(['a/*'], exclude=['**/build']).glob(
+                                      self.tempdir),
+                                  GlobSet(['a/*']).glob(self.tempdir))
+        self.assertEqual(scanned, ['a', 'a'])
+        del scanned[:]
+        with swap_attr(os, 'scandir', scandir):
+            self.assertEqual(GlobSet(['a/bcd/EF'], exclude=['**/x/*']).glob(
+                                 self.tempdir),
+                             [os.path.join('a', 'bcd', 'EF')])
+        self.assertEqual(scanned, [])
+
+    def test_match(self):
+        globset = glob.GlobSet(['src/**/*.py', '*.txt'],
+                               exclude=['**/build/'])
+        self.assertTrue(globset.match('src/a.py'))
+        self.assertTrue(globset.match('src/a/b/c.py'))
+        self.assertTrue(globset.match('./src/a.py'))
+        self.assertTrue(globset.match('README.txt'))
+        self.assertFalse(globset.match('src/a/build/c.py'))
+        self.assertTrue(globset.match('src/a/build.py'))
+        self.assertFalse(globset.match('doc/README.txt'))
+        self.assertFalse(globset.match('src'))
+        self.assertFalse(globset.match(''))
+
+        globset = glob.GlobSet(['*'], exclude=['b/'])
+        self.assertTrue(globset.match('b'))
+        self.assertFalse(globset.match('b/'))
+
+    def test_errors(self):
+        self.assertRaises(TypeError, glob.GlobSet, ['*', b'*'])
+        self.assertRaises(ValueError, glob.GlobSet, [''])
+        self.assertRaises(ValueError, glob.GlobSet, [os.sep + '*'])
+        self.assertEqual(glob.GlobSet([]).glob(self.tempdir), [])
+
+    def test_repr(self):
+        self.assertEqual(repr(glob.GlobSet(['*.py'], exclude=['build'])),
+                         "GlobSet(['*.py'], exclude=['build'])")
+
 
 @skip_unless_symlink
 class SymlinkLoopGlobTests(unittest.TestCase):
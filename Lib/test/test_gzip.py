@@ -6,6 +6,7 @@ import functools
 import io
 import os
 import pathlib
+import random
 import struct
 import sys
 import unittest
@@ -15,6 +16,7 @@ from test.support import _4G, bigmemtest
 from test.support.script_helper import assert_python_ok, assert_python_failure
 
 gzip = support.import_module('gzip')
+zlib = support.import_module('zlib')
 
 data1 = b"""  int length=DEFAULTALLOC, err = Z_OK;
   PyObject *RetVal;
@@ -549,6 +551,156 @@ class TestGzip(BaseTest):
         with gzip.open(self.filename, "rb") as f:
             f._buffer.raw._fp.prepend()
 
+    def test_write_threads(self):
+        data = (data1 * 50 + data2 * 50) * 60
+        self.assertGreater(len(data), 4 * gzip._PARALLEL_BLOCK_SIZE)
+        buf = io.BytesIO()
+        with gzip.GzipFile(fileobj=buf, mode="wb", mtime=0, threads=3) as f:
+            for i in range(0, len(data), 10000):
+                f.write(data[i:i + 10000])
+                if i == 300000:
+                    f.flush()
+        datac = buf.getvalue()
+        self.assertEqual(gzip.decompress(datac), data)
+        # The blocks form a single member.
+        d = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        self.assertEqual(d.decompress(datac), data)
+        self.assertTrue(d.eof)
+        self.assertEqual(d.unused_data, b"")
+        # Priming each block with the previous one keeps the ratio.
+        size = gzip._PARALLEL_BLOCK_SIZE
+        unprimed = sum(len(zlib.compress(data[i:i + size]))
+                       for i in range(0, len(data), size))
+        self.assertLess(len(datac), unprimed)
+
+    def test_write_threads_empty(self):
+        for data in (b"", data1):
+            buf = io.BytesIO()
+            with gzip.GzipFile(fileobj=buf, mode="wb", threads=2) as f:
+                f.write(data)
+            self.assertEqual(gzip.decompress(buf.getvalue()), data)
+
+    def test_read_threads(self):
+        data = (data1 * 50 + data2 * 50) * 10
+        datac = gzip.compress(data, mtime=123456789) * 2
+        with gzip.GzipFile(fileobj=io.BytesIO(datac), threads=2) as f:
+            line = f.readline()
+            self.assertEqual(line, data.splitlines(True)[0])
+            self.assertEqual(f.mtime, 123456789)
+            self.assertEqual(f.read(), data[len(line):] + data)
+
+    def test_read_threads_seek(self):
+        data = (data1 * 50 + data2 * 50) * 10
+        datac = gzip.compress(data) * 2
+        with gzip.open(io.BytesIO(datac), "rb", threads=2) as f:
+            self.assertEqual(f.read(), data * 2)
+            self.assertEqual(f.seek(100), 100)
+            self.assertEqual(f.read(10), data[100:110])
+            self.assertEqual(f.seek(len(data) + 5), len(data) + 5)
+            self.assertEqual(f.read(10), data[5:15])
+            self.assertEqual(f.seek(-10, io.SEEK_END), 2 * len(data) - 10)
+            self.assertEqual(f.read(), data[-10:])
+
+    def test_read_threads_truncated(self):
+        data = data1 * 50
+        truncated = gzip.compress(data)[:-8]
+        with gzip.GzipFile(fileobj=io.BytesIO(truncated), threads=2) as f:
+            self.assertRaises(EOFError, f.read)
+
+    def test_bad_threads(self):
+        with self.assertRaises(TypeError):
+            gzip.GzipFile(fileobj=io.BytesIO(), mode="wb", threads="2")
+        with self.assertRaises(ValueError):
+            gzip.GzipFile(fileobj=io.BytesIO(), mode="wb", threads=-1)
+
+    def make_index_data(self):
+        # Text that compresses to many deflate blocks.
+        rand = random.Random(42)
+        data = bytes(rand.choices(b"abcdefghij \n", k=200000))
+        return data, gzip.compress(data[:150000]) + gzip.compress(data[150000:])
+
+    def test_index_seek(self):
+        data, datac = self.make_index_data()
+        index = gzip.GzipIndex(spacing=10000)
+        self.assertIsNone(index.size)
+        with gzip.GzipFile(fileobj=io.BytesIO(datac), index=index) as f:
+            self.assertEqual(f.seek(0, io.SEEK_END), len(data))
+            self.assertEqual(index.size, len(data))
+            self.assertGreater(len(index), 2)
+            rand = random.Random(0)
+            for i in range(50):
+                offset = rand.randrange(len(data))
+                self.assertEqual(f.seek(offset), offset)
+                self.assertEqual(f.read(1000), data[offset:offset+1000])
+            self.assertEqual(f.seek(-10, io.SEEK_END), len(data) - 10)
+            self.assertEqual(f.read(), data[-10:])
+            f.seek(0)
+            self.assertEqual(f.read(), data)
+
+    def test_index_partial(self):
+        data, datac = self.make_index_data()
+        index = gzip.GzipIndex(spacing=10000)
+        with gzip.GzipFile(fileobj=io.BytesIO(datac), index=index) as f:
+            self.assertEqual(f.read(50000), data[:50000])
+            count = len(index)
+            self.assertGreater(count, 1)
+            self.assertIsNone(index.size)
+            self.assertEqual(f.seek(20000), 20000)
+            self.assertEqual(f.read(100), data[20000:20100])
+            self.assertEqual(len(index), count)
+            self.assertEqual(f.seek(120000), 120000)
+            self.assertEqual(f.read(100), data[120000:120100])
+            self.assertGreater(len(index), count)
+            self.assertEqual(f.read(), data[120100:])
+            self.assertEqual(index.size, len(data))
+
+    def test_index_seek_backward(self):
+        # Seeking backward restarts from a seek point, not from the start.
+        data, datac = self.make_index_data()
+        seeks = []
+        class SeekRecordingIO(io.BytesIO):
+            def seek(self, offset, whence=io.SEEK_SET):
+                seeks.append(offset)
+                return super().seek(offset, whence)
+        index = gzip.GzipIndex(spacing=10000)
+        fileobj = SeekRecordingIO(datac)
+        with gzip.GzipFile(fileobj=fileobj, index=index) as f:
+            f.read()
+            del seeks[:]
+            self.assertEqual(f.seek(len(data) - 100), len(data) - 100)
+            self.assertEqual(f.read(), data[-100:])
+            self.assertGreater(min(seeks), len(datac) // 2)
+
+    def test_index_save_load(self):
+        data, datac = self.make_index_data()
+        index = gzip.GzipIndex(spacing=10000)
+        with gzip.GzipFile(fileobj=io.BytesIO(datac), index=index) as f:
+            f.read()
+        buf = io.BytesIO()
+        index.save(buf)
+        buf.seek(0)
+        loaded = gzip.GzipIndex.load(buf)
+        self.assertEqual(loaded.spacing, 10000)
+        self.assertEqual(loaded.size, len(data))
+        self.assertEqual(len(loaded), len(index))
+        with gzip.open(io.BytesIO(datac), index=loaded) as f:
+            for offset in (190000, 5, 151000, 149999, 70000):
+                self.assertEqual(f.seek(offset), offset)
+                self.assertEqual(f.read(100), data[offset:offset+100])
+        self.assertEqual(len(loaded), len(index))
+
+        with self.assertRaises(ValueError):
+            gzip.GzipIndex.load(io.BytesIO(b"not an index"))
+        with self.assertRaises(EOFError):
+            gzip.GzipIndex.load(io.BytesIO(buf.getvalue()[:100]))
+
+    def test_index_errors(self):
+        with self.assertRaises(ValueError):
+            gzip.GzipIndex(spacing=0)
+        with self.assertRaises(ValueError):
+            gzip.GzipFile(fileobj=io.BytesIO(), mode="wb",
+                          index=gzip.GzipIndex())
+
 class TestOpen(BaseTest):
     def test_binary_modes(self):
         uncompressed = data1 * 50
@@ -2,6 +2,7 @@
 
 import random
 import unittest
+import weakref
 
 from test import support
 from unittest import TestCase, skipUnless
@@ -242,6 +243,101 @@ class TestHeapC(TestHeap, TestCase):
     module = c_heapq
 
 
+class TestIndexedHeap:
+
+    def test_push_pop(self):
+        data = [random.random() for i in range(200)]
+        heap = self.module.IndexedHeap(data[:50])
+        for item in data[50:]:
+            heap.push(item)
+        self.assertEqual(len(heap), 200)
+        self.assertEqual(sorted(heap), sorted(data))
+        self.assertEqual(heap.peek(), min(data))
+        result = [heap.pop() for i in range(200)]
+        self.assertEqual(result, sorted(data))
+        self.assertEqual(len(heap), 0)
+        self.assertRaises(IndexError, heap.pop)
+        self.assertRaises(IndexError, heap.peek)
+
+    def test_remove_update(self):
+        heap = self.module.IndexedHeap()
+        model = {}
+        for i in range(1000):
+            if i % 4 == 3:
+                handle = random.choice(list(model))
+                self.assertIn(handle, heap)
+                self.assertEqual(heap.remove(handle), model.pop(handle))
+                self.assertNotIn(handle, heap)
+                self.assertRaises(ValueError, heap.remove, handle)
+                self.assertRaises(ValueError, heap.update, handle, 0)
+            elif i % 4 == 2:
+                handle = random.choice(list(model))
+                model[handle] = random.random()
+                heap.update(handle, model[handle])
+                self.assertIs(handle.item, model[handle])
+            else:
+                item = random.random()
+                handle = heap.push(item)
+                self.assertIs(handle.item, item)
+                model[handle] = item
+        self.assertEqual(len(heap), len(model))
+        result = [heap.pop() for i in range(len(model))]
+        self.assertEqual(result, sorted(model.values()))
+
+    def test_handles(self):
+        heap = self.module.IndexedHeap()
+        other = self.module.IndexedHeap([1, 2])
+        handle = heap.push(2)
+        self.assertIsInstance(handle, self.module.HeapHandle)
+        self.assertNotIn(handle, other)
+        self.assertNotIn(2, heap)
+        self.assertRaises(ValueError, other.remove, handle)
+        self.assertRaises(ValueError, heap.remove, 2)
+        with self.assertRaises(AttributeError):
+            handle.item = 3
+        heap.clear()
+        self.assertEqual(len(heap), 0)
+        self.assertNotIn(handle, heap)
+
+    def test_comparison_error(self):
+        heap = self.module.IndexedHeap([1])
+        self.assertRaises(TypeError, heap.push, 'a')
+        self.assertRaises(TypeError, self.module.IndexedHeap, [1, 'a'])
+
+
+class TestIndexedHeapPython(TestIndexedHeap, TestCase):
+    module = py_heapq
+
+
+@skipUnless(c_heapq, 'requires _heapq')
+class TestIndexedHeapC(TestIndexedHeap, TestCase):
+    module = c_heapq
+
+    def test_mutation_during_comparison(self):
+        class Clearing:
+            def __init__(self, heap):
+                self.heap = heap
+            def __lt__(self, other):
+                self.heap.clear()
+                return True
+        heap = self.module.IndexedHeap([1, 2, 3])
+        self.assertRaises(RuntimeError, heap.push, Clearing(heap))
+        self.assertEqual(len(heap), 0)
+
+    def test_gc_cycle(self):
+        class Item:
+            def __lt__(self, other):
+                return False
+        heap = self.module.IndexedHeap()
+        item = Item()
+        item.heap = heap
+        item.handle = heap.push(item)
+        ref = weakref.ref(item)
+        del heap, item
+        support.gc_collect()
+        self.assertIsNone(ref())
+
+
 #==============================================================================
 
 class LenOnly:
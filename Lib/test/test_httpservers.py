@@ -14,6 +14,7 @@ import re
 import base64
 import ntpath
 import shutil
+import socket
 import email.message
 import email.utils
 import html
@@ -1103,6 +1104,239 @@ class SimpleHTTPRequestHandlerTestCase(unittest.TestCase):
             self.assertEqual(path, self.translated)
 
 
+class AsyncTestServerThread(threading.Thread):
+    def __init__(self, request_handler):
+        threading.Thread.__init__(self)
+        self.request_handler = request_handler
+        self.started = threading.Event()
+
+    def run(self):
+        import asyncio
+        asyncio.run(self.serve())
+
+    async def serve(self):
+        import asyncio
+        self.loop = asyncio.get_running_loop()
+        # A numeric address: resolving a name would leave a thread of
+        # the default executor of the loop running.
+        self.server = server.AsyncHTTPServer(('127.0.0.1', 0),
+                                             self.request_handler)
+        async with self.server:
+            self.task = asyncio.ensure_future(self.server.serve_forever())
+            self.started.set()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+
+    def stop(self):
+        self.loop.call_soon_threadsafe(self.task.cancel)
+        self.join()
+
+
+class AsyncHTTPServerTestCase(unittest.TestCase):
+    class request_handler(NoLogRequestHandler,
+                          server.AsyncSimpleHTTPRequestHandler):
+        max_body_size = 1024
+
+        def do_POST(self):
+            body = self.rfile.read()
+            self.send_response(HTTPStatus.OK)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        async def do_SLOW(self):
+            import asyncio
+            await asyncio.sleep(0.01)
+            self.send_response(HTTPStatus.NO_CONTENT)
+            self.end_headers()
+
+    def setUp(self):
+        self._threads = support.threading_setup()
+        self.cwd = os.getcwd()
+        self.tempdir = tempfile.mkdtemp(dir=os.getcwd())
+        self.addCleanup(shutil.rmtree, self.tempdir)
+        os.chdir(self.tempdir)
+        self.data = bytes(range(256)) * 40
+        with open('test', 'wb') as f:
+            f.write(self.data)
+        self.thread = AsyncTestServerThread(self.request_handler)
+        self.thread.start()
+        self.thread.started.wait()
+        self.HOST, self.PORT = self.thread.server.server_address[:2]
+        self.connection = http.client.HTTPConnection(self.HOST, self.PORT)
+
+    def tearDown(self):
+        self.connection.close()
+        self.thread.stop()
+        self.thread = None
+        os.chdir(self.cwd)
+        support.threading_cleanup(*self._threads)
+
+    @classmethod
+    def tearDownClass(cls):
+        import asyncio
+        asyncio.set_event_loop_policy(None)
+
+    def request(self, uri, method='GET', body=None, headers={}):
+        self.connection.request(method, uri, body, headers)
+        return self.connection.getresponse()
+
+    def test_get(self):
+        response = self.request('/test')
+        self.assertEqual(response.status, HTTPStatus.OK)
+        self.assertEqual(response.getheader('Content-Length'),
+                         str(len(self.data)))
+        self.assertEqual(response.getheader('Accept-Ranges'), 'bytes')
+        self.assertEqual(response.read(), self.data)
+        response = self.request('/')
+        self.assertEqual(response.status, HTTPStatus.OK)
+        self.assertIn(b'<a href="test">test</a>', response.read())
+        response = self.request('/missing')
+        self.assertEqual(response.status, HTTPStatus.NOT_FOUND)
+        response.read()
+
+    def test_keep_alive(self):
+        for _ in range(3):
+            response = self.request('/test')
+            self.assertEqual(response.read(), self.data)
+        sock = self.connection.sock
+        response = self.request('/test', method='HEAD')
+        self.assertEqual(response.status, HTTPStatus.OK)
+        self.assertEqual(response.read(), b'')
+        # The connection was reused for every request.
+        self.assertIs(self.connection.sock, sock)
+
+    def test_redirect_keep_alive(self):
+        os.mkdir('sub')
+        response = self.request('/sub')
+        self.assertEqual(response.status, HTTPStatus.MOVED_PERMANENTLY)
+        self.assertEqual(response.getheader('Location'), '/sub/')
+        self.assertEqual(response.getheader('Content-Length'), '0')
+        self.assertEqual(response.read(), b'')
+        sock = self.connection.sock
+        response = self.request('/test')
+        self.assertEqual(response.read(), self.data)
+        self.assertIs(self.connection.sock, sock)
+
+    def test_pipelining(self):
+        request = b'GET /test HTTP/1.1\r\nRange: bytes=%d-%d\r\n\r\n'
+        with socket.create_connection((self.HOST, self.PORT)) as sock:
+            sock.sendall(b''.join(request % (i, i) for i in range(4)) +
+                         b'SLOW / HTTP/1.1\r\nConnection: close\r\n\r\n')
+            with sock.makefile('rb') as f:
+                data = f.read()
+        self.assertEqual(data.count(b' 206 Partial Content\r\n'), 4)
+        # The responses are sent in the order of the requests.
+        positions = [data.index(b'bytes %d-%d/10240\r\n' % (i, i))
+                     for i in range(4)]
+        positions.append(data.index(b' 204 No Content\r\n'))
+        self.assertEqual(positions, sorted(positions))
+
+    def test_range(self):
+        response = self.request('/test', headers={'Range': 'bytes=10-19'})
+        self.assertEqual(response.status, HTTPStatus.PARTIAL_CONTENT)
+        self.assertEqual(response.getheader('Content-Range'),
+                         'bytes 10-19/10240')
+        self.assertEqual(response.read(), self.data[10:20])
+        response = self.request('/test', headers={'Range': 'bytes=-5'})
+        self.assertEqual(response.status, HTTPStatus.PARTIAL_CONTENT)
+        self.assertEqual(response.read(), self.data[-5:])
+        response = self.request('/test', headers={'Range': 'bytes=10000-'})
+        self.assertEqual(response.status, HTTPStatus.PARTIAL_CONTENT)
+        self.assertEqual(response.read(), self.data[10000:])
+        response = self.request('/test', headers={'Range': 'bytes=99999-'})
+        self.assertEqual(response.status,
+                         HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+        self.assertEqual(response.getheader('Content-Range'),
+                         'bytes */10240')
+        self.assertEqual(response.read(), b'')
+        # Several ranges are not supported: the whole file is sent.
+        response = self.request('/test', headers={'Range': 'bytes=0-1,5-6'})
+        self.assertEqual(response.status, HTTPStatus.OK)
+        self.assertEqual(response.read(), self.data)
+
+    def test_if_modified_since(self):
+        response = self.request('/test')
+        last_modified = response.getheader('Last-Modified')
+        response.read()
+        response = self.request('/test',
+                                headers={'If-Modified-Since': last_modified})
+        self.assertEqual(response.status, HTTPStatus.NOT_MODIFIED)
+        self.assertEqual(response.read(), b'')
+
+    def test_post(self):
+        response = self.request('/', 'POST', b'spam')
+        self.assertEqual(response.status, HTTPStatus.OK)
+        self.assertEqual(response.read(), b'spam')
+        # Chunked body
+        response = self.request('/', 'POST', iter([b'spam', b'eggs']))
+        self.assertEqual(response.status, HTTPStatus.OK)
+        self.assertEqual(response.read(), b'spameggs')
+
+    def raw_request(self, data):
+        # Send data, close the sending side and return the response.
+        with support.captured_stderr() as err:
+            with socket.create_connection((self.HOST, self.PORT)) as sock:
+                sock.sendall(data)
+                sock.shutdown(socket.SHUT_WR)
+                with sock.makefile('rb') as f:
+                    response = f.read()
+        # No traceback was printed.
+        self.assertEqual(err.getvalue(), '')
+        return response
+
+    def test_body_too_large(self):
+        response = self.request('/', 'POST', b'x' * 1024)
+        self.assertEqual(response.status, HTTPStatus.OK)
+        self.assertEqual(len(response.read()), 1024)
+        response = self.raw_request(b'POST / HTTP/1.1\r\n'
+                                    b'Content-Length: 1025\r\n\r\n')
+        self.assertTrue(response.startswith(b'HTTP/1.1 413 '), response)
+        response = self.raw_request(b'POST / HTTP/1.1\r\n'
+                                    b'Transfer-Encoding: chunked\r\n\r\n'
+                                    b'400\r\n' + b'x' * 1024 + b'\r\n'
+                                    b'1\r\n')
+        self.assertTrue(response.startswith(b'HTTP/1.1 413 '), response)
+
+    def test_bad_body(self):
+        response = self.raw_request(b'POST / HTTP/1.1\r\n'
+                                    b'Transfer-Encoding: chunked\r\n\r\n'
+                                    b'-5\r\n')
+        self.assertTrue(response.startswith(b'HTTP/1.1 400 '), response)
+        # A truncated body closes the connection.
+        response = self.raw_request(b'POST / HTTP/1.1\r\n'
+                                    b'Content-Length: 10\r\n\r\nspam')
+        self.assertEqual(response, b'')
+        response = self.raw_request(b'POST / HTTP/1.1\r\n'
+                                    b'Transfer-Encoding: chunked\r\n\r\n'
+                                    b'a\r\nspam')
+        self.assertEqual(response, b'')
+
+    def test_unsupported_method(self):
+        response = self.request('/', 'PUT', b'spam')
+        self.assertEqual(response.status, HTTPStatus.NOT_IMPLEMENTED)
+        response.read()
+        # The connection is still usable.
+        response = self.request('/test')
+        self.assertEqual(response.read(), self.data)
+
+    def test_parse_byte_range(self):
+        parse = server._parse_byte_range
+        self.assertIsNone(parse(None, 100))
+        self.assertEqual(parse('bytes=0-9', 100), (0, 10))
+        self.assertEqual(parse('bytes=90-199', 100), (90, 100))
+        self.assertEqual(parse('bytes=90-', 100), (90, 100))
+        self.assertEqual(parse('bytes=-10', 100), (90, 100))
+        self.assertEqual(parse('bytes=-200', 100), (0, 100))
+        self.assertEqual(parse('bytes=100-', 100), (100, 100))
+        self.assertEqual(parse('bytes=-0', 100), (100, 100))
+        for value in ('bytes=9-0', 'bytes=0-1,3-4', 'items=0-1', 'bytes=a-b',
+                      'bytes=-', 'bytes=5', 'bytes=\u0661-'):
+            self.assertIsNone(parse(value, 100), value)
+
+
 class MiscTestCase(unittest.TestCase):
     def test_all(self):
         expected = []
@@ -1126,6 +1360,7 @@ def test_main(verbose=None):
             SimpleHTTPServerTestCase,
             CGIHTTPServerTestCase,
             SimpleHTTPRequestHandlerTestCase,
+            AsyncHTTPServerTestCase,
             MiscTestCase,
         )
     finally:
@@ -33,6 +33,8 @@ class TestPyTest(PyTest):
                          'json.scanner')
         self.assertEqual(self.json.decoder.scanstring.__module__,
                          'json.decoder')
+        self.assertEqual(self.json.decoder.scan_structure.__module__,
+                         'json.decoder')
         self.assertEqual(self.json.encoder.encode_basestring_ascii.__module__,
                          'json.encoder')
 
@@ -40,6 +42,7 @@ class TestCTest(CTest):
     def test_cjson(self):
         self.assertEqual(self.json.scanner.make_scanner.__module__, '_json')
         self.assertEqual(self.json.decoder.scanstring.__module__, '_json')
+        self.assertEqual(self.json.decoder.scan_structure.__module__, '_json')
         self.assertEqual(self.json.encoder.c_make_encoder.__module__, '_json')
         self.assertEqual(self.json.encoder.encode_basestring_ascii.__module__,
                          '_json')
@@ -47,6 +47,24 @@ class TestDump:
         d[1337] = "true.dat"
         self.assertEqual(self.dumps(d, sort_keys=True), '{"1337": "true.dat"}')
 
+    def test_dump_large(self):
+        obj = [{'id': i, 'values': [i, str(i), None, True, 1.5]}
+               for i in range(10000)]
+        for kwargs in ({}, {'indent': 2}, {'sort_keys': True},
+                       {'separators': (',', ':')}):
+            with self.subTest(**kwargs):
+                sio = StringIO()
+                self.json.dump(obj, sio, **kwargs)
+                self.assertEqual(sio.getvalue(), self.dumps(obj, **kwargs))
+
+    def test_dump_custom_iterencode(self):
+        class Encoder(self.json.JSONEncoder):
+            def iterencode(self, o, _one_shot=False):
+                yield '[]'
+        sio = StringIO()
+        self.json.dump({'a': 1}, sio, cls=Encoder)
+        self.assertEqual(sio.getvalue(), '[]')
+
 
 class TestPyDump(TestDump, PyTest): pass
 
@@ -66,3 +84,18 @@ class TestCDump(TestDump, CTest):
         self.assertEqual(encoded[:1], "[")
         self.assertEqual(encoded[-2:], "1]")
         self.assertEqual(encoded[1:-2], "1, " * (N - 1))
+
+    def test_dump_writes_large_chunks(self):
+        writes = []
+        class File:
+            def write(self, s):
+                writes.append(s)
+        obj = [[i, str(i)] for i in range(100000)]
+        self.json.dump(obj, File())
+        self.assertEqual(''.join(writes), self.dumps(obj))
+        self.assertLess(len(writes), 1000)
+        # The output written before an error is not lost
+        writes.clear()
+        with self.assertRaises(TypeError):
+            self.json.dump(obj + [object()], File())
+        self.assertEqual(''.join(writes)[:1000], self.dumps(obj)[:1000])
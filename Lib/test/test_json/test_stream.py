@@ -0,0 +1,170 @@
+import codecs
+from io import BytesIO, StringIO
+from test.test_json import PyTest, CTest
+
+
+DOCUMENTS = [
+    {'a': [1, 2.5, None, True, False], 'b': '\\"]}\u20ac\U0001d120'},
+    [],
+    {},
+    'string with "quotes" and \\backslashes\\ ]}',
+    -123,
+    1.5e+300,
+    None,
+    [[[{'deep': [{}]}]]],
+]
+
+
+class TestScanStructure:
+    def test_complete(self):
+        scan_structure = self.json.decoder.scan_structure
+        self.assertEqual(scan_structure('{"a": [1, "]}"]} x', 0), (16, 0, 0))
+        self.assertEqual(scan_structure('x [[], {}] x', 2), (10, 0, 0))
+        self.assertEqual(scan_structure('"a\\"b" x', 0), (6, 0, 0))
+        self.assertEqual(scan_structure('[}', 0), (2, 0, 0))
+
+    def test_incomplete(self):
+        scan_structure = self.json.decoder.scan_structure
+        self.assertEqual(scan_structure('{"a": [1', 0), (-1, 2, 0))
+        self.assertEqual(scan_structure('{"a', 0), (-1, 1, 1))
+        self.assertEqual(scan_structure('{"a\\', 0), (-1, 1, 2))
+        self.assertEqual(scan_structure('', 0), (-1, 0, 0))
+        # Resume scanning
+        self.assertEqual(scan_structure('"]]', 0, 1, 2), (-1, 1, 1))
+        self.assertEqual(scan_structure('"]]', 0, 2, 1), (3, 0, 0))
+        self.assertEqual(scan_structure('b"', 0, 0, 1), (2, 0, 0))
+
+
+class TestStreamDecoder:
+    def decode_pieces(self, pieces, **kwargs):
+        decoder = self.json.JSONStreamDecoder(**kwargs)
+        values = []
+        for piece in pieces:
+            decoder.feed(piece)
+            values.extend(decoder.read_values())
+        decoder.close()
+        values.extend(decoder.read_values())
+        return values
+
+    def check(self, doc, expected, **kwargs):
+        for size in (1, 2, 3, 7, 100, len(doc) or 1):
+            with self.subTest(size=size):
+                pieces = [doc[i:i + size] for i in range(0, len(doc), size)]
+                self.assertEqual(self.decode_pieces(pieces, **kwargs),
+                                 expected)
+
+    def test_values(self):
+        doc = '\n'.join(self.dumps(d) for d in DOCUMENTS) + '\n'
+        self.check(doc, DOCUMENTS)
+        # Documents need not be separated by whitespace, except numbers
+        doc = ' '.join(self.dumps(d, separators=(',', ':'))
+                       for d in DOCUMENTS)
+        self.check(doc.replace('} ', '}').replace('] ', ']'), DOCUMENTS)
+
+    def test_empty(self):
+        self.check('', [])
+        self.check(' \n\t\r ', [])
+        self.check('[] [ ]', [], items=True)
+
+    def test_scalars(self):
+        self.check('1 -2.5e3 true false null "x" -Infinity',
+                   [1, -2.5e3, True, False, None, 'x', float('-inf')])
+        self.check('12345', [12345])
+        self.check('12345\n', [12345])
+
+    def test_items(self):
+        doc = self.dumps(DOCUMENTS, indent=2)
+        self.check(doc, DOCUMENTS, items=True)
+        self.check(doc + doc, DOCUMENTS * 2, items=True)
+        self.check('[1,2]', [1, 2], items=True)
+
+    def test_bytes(self):
+        doc = '\n'.join(self.dumps(d, ensure_ascii=False)
+                        for d in DOCUMENTS)
+        for encoding in ('utf-8', 'utf-8-sig', 'utf-16', 'utf-16-le',
+                         'utf-16-be', 'utf-32', 'utf-32-le', 'utf-32-be'):
+            with self.subTest(encoding=encoding):
+                self.check(doc.encode(encoding), DOCUMENTS)
+        self.check(b'1', [1])
+        self.check(bytearray(b'[1, "2"]'), [1, '2'], items=True)
+
+    def test_decoder_arguments(self):
+        decoder = self.json.JSONDecoder(object_pairs_hook=tuple,
+                                        parse_int=float)
+        self.check('{"a": 1, "b": [2]}', [(('a', 1.0), ('b', [2.0]))],
+                   decoder=decoder)
+
+    def test_errors(self):
+        JSONDecodeError = self.JSONDecodeError
+        for doc, items in [('[1, 2', False), ('{"a": ', False),
+                           ('"abc', False), ('1 2 x', False),
+                           ('tru', False), (']', False), ('{"a" 1}', False),
+                           ('1', True), ('[1, 2', True), ('[1,]', True),
+                           ('[1 2]', True), ('[1,', True), ('[', True)]:
+            with self.subTest(doc=doc, items=items):
+                with self.assertRaises(JSONDecodeError):
+                    self.decode_pieces([doc], items=items)
+                with self.assertRaises(JSONDecodeError):
+                    self.decode_pieces(doc, items=items)
+
+    def test_values_before_error(self):
+        decoder = self.json.JSONStreamDecoder()
+        decoder.feed('[1] {"a": 2} [3')
+        self.assertEqual(list(decoder.read_values()), [[1], {'a': 2}])
+        self.assertEqual(list(decoder.read_values()), [])
+        with self.assertRaises(self.JSONDecodeError):
+            decoder.close()
+
+    def test_bom(self):
+        with self.assertRaises(self.JSONDecodeError):
+            self.decode_pieces(['\ufeff[1]'])
+        self.assertEqual(self.decode_pieces([codecs.BOM_UTF8, b'[1]']), [[1]])
+
+    def test_misuse(self):
+        decoder = self.json.JSONStreamDecoder()
+        with self.assertRaises(TypeError):
+            decoder.feed(1)
+        decoder.close()
+        decoder.close()
+        with self.assertRaises(ValueError):
+            decoder.feed('1')
+
+
+class TestIterload:
+    def test_iterload(self):
+        doc = '\n'.join(self.dumps(d) for d in DOCUMENTS)
+        self.assertEqual(list(self.json.iterload(StringIO(doc))), DOCUMENTS)
+        self.assertEqual(list(self.json.iterload(BytesIO(doc.encode()))),
+                         DOCUMENTS)
+
+    def test_items(self):
+        doc = self.dumps(DOCUMENTS)
+        self.assertEqual(list(self.json.iterload(StringIO(doc), items=True)),
+                         DOCUMENTS)
+
+    def test_large(self):
+        obj = [{'id': i, 'name': str(i) * (i % 7)} for i in range(20000)]
+        doc = self.dumps(obj)
+        self.assertGreater(len(doc), 2 * self.json._ITERLOAD_CHUNK_SIZE)
+        it = self.json.iterload(StringIO(doc), items=True)
+        self.assertEqual(list(it), obj)
+
+    def test_arguments(self):
+        it = self.json.iterload(StringIO('{"a": 1.5} {"b": 2}'),
+                                object_hook=lambda d: sorted(d.items()),
+                                parse_float=str)
+        self.assertEqual(list(it), [[('a', '1.5')], [('b', 2)]])
+
+    def test_error(self):
+        it = self.json.iterload(StringIO('[1] [2'))
+        self.assertEqual(next(it), [1])
+        with self.assertRaises(self.JSONDecodeError):
+            next(it)
+
+
+class TestPyScanStructure(TestScanStructure, PyTest): pass
+class TestCScanStructure(TestScanStructure, CTest): pass
+class TestPyStreamDecoder(TestStreamDecoder, PyTest): pass
+class TestCStreamDecoder(TestStreamDecoder, CTest): pass
+class TestPyIterload(TestIterload, PyTest): pass
+class TestCIterload(TestIterload, CTest): pass
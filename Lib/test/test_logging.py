@@ -780,6 +780,46 @@ class StreamHandlerTest(BaseTest):
         actual = h.setStream(old)
         self.assertIsNone(actual)
 
+    def test_emit_batch(self):
+        class CountingStream(io.StringIO):
+            writes = flushes = 0
+            def write(self, data):
+                self.writes += 1
+                return super().write(data)
+            def flush(self):
+                self.flushes += 1
+
+        stream = CountingStream()
+        h = logging.StreamHandler(stream)
+        h.setFormatter(logging.Formatter('%(levelname)s:%(message)s'))
+        h.addFilter(lambda record: record.levelno > logging.DEBUG)
+        records = [logging.makeLogRecord({'msg': 'm%d', 'args': (i,),
+                                          'levelno': logging.DEBUG * i,
+                                          'levelname': 'L%d' % i})
+                   for i in range(1, 5)]
+        emitted = h.handleBatch(records)
+        self.assertEqual(emitted, records[1:])
+        self.assertEqual(stream.getvalue(), 'L2:m2\nL3:m3\nL4:m4\n')
+        self.assertEqual((stream.writes, stream.flushes), (1, 1))
+
+        # A subclass overriding emit() gets its emit() called.
+        class ReplacingStreamHandler(logging.StreamHandler):
+            def emit(self, record):
+                record.msg = record.msg.replace('m', 'M')
+                super().emit(record)
+
+        stream = CountingStream()
+        h = ReplacingStreamHandler(stream)
+        h.handleBatch(records[:2])
+        self.assertEqual(stream.getvalue(), 'M1\nM2\n')
+        self.assertEqual(stream.writes, 2)
+
+    def test_emit_batch_error_handling(self):
+        h = TestStreamHandler(BadStream())
+        records = [logging.makeLogRecord({}) for _ in range(3)]
+        h.handleBatch(records)
+        self.assertIs(h.error_record, records[-1])
+
 # -- The following section could be moved into a server_helper.py module
 # -- if it proves to be of wider utility than just test_logging
 
@@ -3595,6 +3635,170 @@ if hasattr(logging.handlers, 'QueueListener'):
                                      else m for m in items]))
 
 
+class RecordsHandler(logging.Handler):
+    def __init__(self, level=logging.NOTSET):
+        logging.Handler.__init__(self, level)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+    def messages(self):
+        return [record.getMessage() for record in self.records]
+
+
+class AsyncHandlerTest(BaseTest):
+
+    def setUp(self):
+        BaseTest.setUp(self)
+        self.async_logger = logging.getLogger('async')
+        self.async_logger.propagate = False
+        self.async_handlers = []
+
+    def tearDown(self):
+        for handler in self.async_handlers:
+            self.async_logger.removeHandler(handler)
+            handler.close()
+        self.async_handlers = None
+        BaseTest.tearDown(self)
+
+    def make_handler(self, *handlers, **kwargs):
+        handler = logging.handlers.AsyncHandler(*handlers, **kwargs)
+        self.async_handlers.append(handler)
+        self.async_logger.addHandler(handler)
+        return handler
+
+    def test_async_handler(self):
+        target = RecordsHandler(logging.ERROR)
+        handler = self.make_handler(target)
+        self.async_logger.warning('warning %s', 1)
+        self.async_logger.error('error %s', 2)
+        handler.flush()
+        self.assertEqual(target.messages(), ['warning 1', 'error 2'])
+        thread = handler._thread
+        handler.close()
+        self.assertFalse(thread.is_alive())
+        del thread
+        self.async_logger.error('too late')
+        self.assertEqual(handler.dropped, 1)
+        self.assertEqual(len(target.records), 2)
+
+    def test_respect_handler_level(self):
+        target = RecordsHandler(logging.ERROR)
+        handler = self.make_handler(target, respect_handler_level=True)
+        self.async_logger.warning('warning')
+        self.async_logger.error('error')
+        handler.flush()
+        self.assertEqual(target.messages(), ['error'])
+
+    def test_batches(self):
+        handler, target, event = self.blocked_handler(capacity=10,
+                                                      batch_size=3)
+        batches = []
+        handle = target.handleBatch
+        def handleBatch(records):
+            batches.append(len(records))
+            handle(records)
+        target.handleBatch = handleBatch
+        for i in range(1, 8):
+            self.async_logger.error(str(i))
+        event.set()
+        handler.flush()
+        self.assertEqual(batches, [3, 3, 1])
+        self.assertEqual(target.messages(), [str(i) for i in range(8)])
+
+    def test_lazy_formatting(self):
+        calls = []
+        class Arg:
+            def __str__(self):
+                calls.append(threading.current_thread())
+                return 'arg'
+        target = logging.StreamHandler(io.StringIO())
+        handler = self.make_handler(target)
+        self.async_logger.error('%s', Arg())
+        handler.flush()
+        self.assertEqual(target.stream.getvalue(), 'arg\n')
+        self.assertEqual(calls, [handler._thread])
+        del calls[:]
+
+    def blocked_handler(self, **kwargs):
+        target = RecordsHandler()
+        kwargs.setdefault('capacity', 2)
+        kwargs.setdefault('batch_size', 1)
+        handler = self.make_handler(target, **kwargs)
+        event = threading.Event()
+        handle = target.handleBatch
+        def handleBatch(records):
+            event.wait()
+            handle(records)
+        target.handleBatch = handleBatch
+        self.addCleanup(event.set)
+        self.async_logger.error('0')
+        # Wait for the background thread to take the first record.
+        while handler._records:
+            time.sleep(0.001)
+        return handler, target, event
+
+    def test_overflow_drop(self):
+        handler, target, event = self.blocked_handler(overflow='drop')
+        for i in range(1, 5):
+            self.async_logger.error(str(i))
+        self.assertEqual(handler.dropped, 2)
+        event.set()
+        handler.flush()
+        self.assertEqual(target.messages(),
+                         ['0', '1', '2'])
+
+    def test_overflow_drop_oldest(self):
+        handler, target, event = self.blocked_handler(overflow='drop_oldest')
+        for i in range(1, 5):
+            self.async_logger.error(str(i))
+        self.assertEqual(handler.dropped, 2)
+        event.set()
+        handler.flush()
+        self.assertEqual(target.messages(),
+                         ['0', '3', '4'])
+
+    def test_overflow_block(self):
+        handler, target, event = self.blocked_handler()
+        self.async_logger.error('1')
+        self.async_logger.error('2')
+        t = threading.Thread(target=self.async_logger.error, args=('3',))
+        t.start()
+        t.join(0.05)
+        self.assertTrue(t.is_alive())
+        event.set()
+        t.join()
+        handler.flush()
+        self.assertEqual(handler.dropped, 0)
+        self.assertEqual(target.messages(),
+                         ['0', '1', '2', '3'])
+
+    def test_overflow_block_in_event_loop(self):
+        asyncio = support.import_module('asyncio')
+        self.addCleanup(asyncio.set_event_loop_policy, None)
+        handler, target, event = self.blocked_handler()
+        async def log():
+            for i in range(1, 5):
+                self.async_logger.error(str(i))
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(log())
+        finally:
+            loop.close()
+        self.assertEqual(handler.dropped, 2)
+        event.set()
+        handler.flush()
+        self.assertEqual(target.messages(),
+                         ['0', '1', '2'])
+
+    def test_invalid_arguments(self):
+        AsyncHandler = logging.handlers.AsyncHandler
+        self.assertRaises(ValueError, AsyncHandler, capacity=0)
+        self.assertRaises(ValueError, AsyncHandler, batch_size=0)
+        self.assertRaises(ValueError, AsyncHandler, overflow='wait')
+
+
 ZERO = datetime.timedelta(0)
 
 class UTC(datetime.tzinfo):
@@ -3837,6 +4041,51 @@ class FormatterTest(unittest.TestCase):
         )
         self.assertRaises(ValueError, logging.Formatter, '${asctime', style='$')
 
+    def test_compiled_formats(self):
+        # Formats are converted to positional ones filled with the record
+        # attributes; the result must not change.
+        r = self.get_record()
+        r.asctime = 'now'
+        r.message = r.getMessage()
+        r.custom = ('a', 'tuple')
+        for fmt in ('%(message)s', '%(levelname)-8s|%(lineno)5d %%',
+                    '%(custom)s', 'no fields %%', '%(custom)r %(custom)s',
+                    '%(name)s %% %(asctime)s %(lineno)#x'):
+            with self.subTest(fmt=fmt):
+                f = logging.PercentStyle(fmt)
+                self.assertEqual(f.format(r), fmt % r.__dict__)
+        for fmt in ('{message}', '{levelname:<8}|{lineno:5d} {{}}',
+                    '{custom}', '{custom[1]}', '{custom!r:>20}',
+                    '{lineno.real}', '{name}{name}', '{lineno:{lineno}}'):
+            with self.subTest(fmt=fmt):
+                f = logging.StrFormatStyle(fmt)
+                self.assertEqual(f.format(r), fmt.format(**r.__dict__))
+
+    def test_compiled_format_fallback(self):
+        r = self.get_record()
+        r.message = r.getMessage()
+        f = logging.PercentStyle('%(message)s %s')
+        self.assertRaises(TypeError, f.format, r)
+        f = logging.StrFormatStyle('{message} {0}')
+        self.assertRaises(IndexError, f.format, r)
+        f = logging.StrFormatStyle('{message} {}')
+        self.assertRaises(IndexError, f.format, r)
+        # Missing fields are reported as before.
+        f = logging.StrFormatStyle('{message} {random}')
+        with self.assertRaisesRegex(ValueError, "not found.*'random'"):
+            f.format(r)
+        # The format string can be changed.
+        f = logging.PercentStyle('%(message)s')
+        self.assertEqual(f.format(r), 'Message with 2 placeholders')
+        f._fmt = '%(lineno)d'
+        self.assertEqual(f.format(r), '42')
+        # Only the record's instance attributes are fields.
+        for f in (logging.Formatter('%(getMessage)s'),
+                  logging.Formatter('{getMessage}', style='{')):
+            with self.assertRaisesRegex(ValueError,
+                                        "not found.*'getMessage'"):
+                f.format(r)
+
     def test_invalid_style(self):
         self.assertRaises(ValueError, logging.Formatter, None, None, 'x')
 
@@ -4161,6 +4410,32 @@ class LogRecordTest(BaseTest):
         r.removeHandler(h)
         h.close()
 
+    def test_pathname(self):
+        pathname = os.path.join('path', 'to', 'dummy.ext')
+        for i in range(2):
+            r = logging.LogRecord('name', logging.INFO, pathname, 1, 'msg',
+                                  (), None)
+            self.assertEqual((r.filename, r.module), ('dummy.ext', 'dummy'))
+        r = logging.LogRecord('name', logging.INFO, None, 1, 'msg', (), None)
+        self.assertEqual((r.filename, r.module), (None, 'Unknown module'))
+        r = logging.LogRecord('name', logging.INFO, [], 1, 'msg', (), None)
+        self.assertEqual((r.filename, r.module), ([], 'Unknown module'))
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'requires os.fork')
+    def test_process_after_fork(self):
+        r, w = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                record = logging.makeLogRecord({})
+                os.write(w, str(record.process).encode())
+            finally:
+                os._exit(0)
+        os.close(w)
+        with open(r, 'rb') as f:
+            self.assertEqual(f.read(), str(pid).encode())
+        os.waitpid(pid, 0)
+
     def test_multiprocessing(self):
         r = logging.makeLogRecord({})
         self.assertEqual(r.processName, 'MainProcess')
@@ -4178,6 +4453,7 @@ class LogRecordTest(BaseTest):
         NOT_NONE(r.threadName)
         NOT_NONE(r.process)
         NOT_NONE(r.processName)
+        self.assertEqual(r.process, os.getpid())
         log_threads = logging.logThreads
         log_processes = logging.logProcesses
         log_multiprocessing = logging.logMultiprocessing
@@ -5076,7 +5352,8 @@ def test_main():
         DatagramHandlerTest, MemoryTest, EncodingTest, WarningsTest,
         ConfigDictTest, ManagerTest, FormatterTest, BufferingFormatterTest,
         StreamHandlerTest, LogRecordFactoryTest, ChildLoggerTest,
-        QueueHandlerTest, ShutdownTest, ModuleLevelMiscTest, BasicConfigTest,
+        QueueHandlerTest, AsyncHandlerTest, ShutdownTest, ModuleLevelMiscTest,
+        BasicConfigTest,
         LoggerAdapterTest, LoggerTest, SMTPHandlerTest, FileHandlerTest,
         RotatingFileHandlerTest,  LastResortTest, LogRecordTest,
         ExceptionTest, SysLogHandlerTest, IPv6SysLogHandlerTest, HTTPHandlerTest,
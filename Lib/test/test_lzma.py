@@ -837,6 +837,17 @@ class FileTestCase(unittest.TestCase):
                       format=lzma.FORMAT_RAW, filters=FILTERS_RAW_3) as f:
             self.assertEqual(f.read(), INPUT * 4)
 
+    def test_read_threads(self):
+        with LZMAFile(BytesIO(COMPRESSED_XZ * 5), threads=2) as f:
+            self.assertEqual(f.read(), INPUT * 5)
+            self.assertEqual(f.seek(len(INPUT) - 5), len(INPUT) - 5)
+            self.assertEqual(f.read(10), INPUT[-5:] + INPUT[:5])
+        with LZMAFile(BytesIO(COMPRESSED_RAW_3 * 4), threads=2,
+                      format=lzma.FORMAT_RAW, filters=FILTERS_RAW_3) as f:
+            self.assertEqual(f.read(), INPUT * 4)
+        with LZMAFile(BytesIO(COMPRESSED_XZ[:128]), threads=2) as f:
+            self.assertRaises(EOFError, f.read)
+
     def test_read_multistream_buffer_size_aligned(self):
         # Test the case where a stream boundary coincides with the end
         # of the raw read buffer.
@@ -1036,6 +1047,30 @@ class FileTestCase(unittest.TestCase):
             expected = lzma.compress(INPUT)
             self.assertEqual(dst.getvalue(), expected)
 
+    def test_write_threads(self):
+        with support.swap_attr(lzma, "_PARALLEL_BLOCK_SIZE", 1024):
+            with BytesIO() as dst:
+                with LZMAFile(dst, "w", preset=1, threads=2) as f:
+                    for start in range(0, len(INPUT), 100):
+                        f.write(INPUT[start:start+100])
+                # The blocks are written as separate streams.
+                expected = b"".join(lzma.compress(INPUT[i:i+1024], preset=1)
+                                    for i in range(0, len(INPUT), 1024))
+                self.assertEqual(dst.getvalue(), expected)
+            with BytesIO() as dst:
+                with LZMAFile(dst, "w", threads=2):
+                    pass
+                self.assertEqual(dst.getvalue(), lzma.compress(b""))
+
+    def test_write_threads_bad_args(self):
+        with BytesIO() as dst:
+            with self.assertRaises(ValueError):
+                LZMAFile(dst, "w", format=lzma.FORMAT_ALONE, threads=2)
+            with self.assertRaises(LZMAError):
+                LZMAFile(dst, "w", preset=10, threads=2)
+            with self.assertRaises(ValueError):
+                LZMAFile(dst, "w", threads=-1)
+
     def test_write_append(self):
         part1 = INPUT[:1024]
         part2 = INPUT[1024:1536]
@@ -1009,6 +1009,33 @@ class WalkTests(unittest.TestCase):
             os.rename(path1new, path1)
 
 
+class ParallelWalkTests(WalkTests):
+    """Tests for os.walk() with workers."""
+
+    def walk(self, top, **kwargs):
+        if 'follow_symlinks' in kwargs:
+            kwargs['followlinks'] = kwargs.pop('follow_symlinks')
+        return os.walk(top, workers=4, **kwargs)
+
+    def test_compare_to_walk(self):
+        for topdown, followlinks in itertools.product((True, False),
+                                                      repeat=2):
+            with self.subTest(topdown=topdown, followlinks=followlinks):
+                kwargs = dict(topdown=topdown, followlinks=followlinks)
+                self.assertEqual(list(self.walk(self.walk_path, **kwargs)),
+                                 list(os.walk(self.walk_path, **kwargs)))
+
+    def test_close(self):
+        walk_it = self.walk(self.walk_path)
+        next(walk_it)
+        walk_it.close()
+        self.assertEqual(list(walk_it), [])
+
+    def test_invalid_workers(self):
+        with self.assertRaises(ValueError):
+            list(os.walk(self.walk_path, workers=0))
+
+
 @unittest.skipUnless(hasattr(os, 'fwalk'), "Test needs os.fwalk()")
 class FwalkTests(WalkTests):
     """Tests for os.fwalk()."""
@@ -1448,6 +1448,16 @@ class _BasePathTest(object):
         _check(p.rglob("file*"), ["dirC/fileC", "dirC/dirD/fileD"])
         _check(p.rglob("*/*"), ["dirC/dirD/fileD"])
 
+    def test_rglob_workers(self):
+        P = self.cls
+        p = P(BASE)
+        for pattern in ["fileA", "*/fileB", "file*", "*", "dir*/**"]:
+            with self.subTest(pattern=pattern):
+                self.assertEqual(set(p.rglob(pattern, workers=4)),
+                                 set(p.rglob(pattern)))
+                self.assertEqual(set(p.glob("**/" + pattern, workers=4)),
+                                 set(p.glob("**/" + pattern)))
+
     @support.skip_unless_symlink
     def test_rglob_symlink_loop(self):
         # Don't get fooled by symlink loops (Issue #26012)
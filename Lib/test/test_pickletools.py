@@ -6,8 +6,8 @@ import unittest
 
 class OptimizedPickleTests(AbstractPickleTests):
 
-    def dumps(self, arg, proto=None):
-        return pickletools.optimize(pickle.dumps(arg, proto))
+    def dumps(self, arg, proto=None, **kwargs):
+        return pickletools.optimize(pickle.dumps(arg, proto, **kwargs))
 
     def loads(self, buf, **kwds):
         return pickle.loads(buf, **kwds)
@@ -71,20 +71,21 @@ class MiscTestCase(unittest.TestCase):
                      'read_uint8', 'read_stringnl', 'read_stringnl_noescape',
                      'read_stringnl_noescape_pair', 'read_string1',
                      'read_string4', 'read_bytes1', 'read_bytes4',
-                     'read_bytes8', 'read_unicodestringnl',
+                     'read_bytes8', 'read_bytearray8', 'read_unicodestringnl',
                      'read_unicodestring1', 'read_unicodestring4',
                      'read_unicodestring8', 'read_decimalnl_short',
                      'read_decimalnl_long', 'read_floatnl', 'read_float8',
                      'read_long1', 'read_long4',
                      'uint1', 'uint2', 'int4', 'uint4', 'uint8', 'stringnl',
                      'stringnl_noescape', 'stringnl_noescape_pair', 'string1',
-                     'string4', 'bytes1', 'bytes4', 'bytes8',
+                     'string4', 'bytes1', 'bytes4', 'bytes8', 'bytearray8',
                      'unicodestringnl', 'unicodestring1', 'unicodestring4',
                      'unicodestring8', 'decimalnl_short', 'decimalnl_long',
                      'floatnl', 'float8', 'long1', 'long4',
                      'StackObject',
                      'pyint', 'pylong', 'pyinteger_or_bool', 'pybool', 'pyfloat',
-                     'pybytes_or_str', 'pystring', 'pybytes', 'pyunicode',
+                     'pybytes_or_str', 'pystring', 'pybytes', 'pybytearray',
+                     'pyunicode', 'pybuffer',
                      'pynone', 'pytuple', 'pylist', 'pydict', 'pyset',
                      'pyfrozenset', 'anyobject', 'markobject', 'stackslice',
                      'OpcodeInfo', 'opcodes', 'code2op',
@@ -1,10 +1,14 @@
 from test.support import (gc_collect, bigmemtest, _2G,
                           cpython_only, captured_stdout)
+import io
 import locale
+import marshal
+import pickle
 import re
 import sre_compile
 import string
 import unittest
+import unittest.mock
 import warnings
 from re import Scanner
 from weakref import proxy
@@ -2134,6 +2138,343 @@ class PatternReprTests(unittest.TestCase):
         self.assertEqual(r[-16:], ", re.IGNORECASE)")
 
 
+class CacheFileTests(unittest.TestCase):
+
+    def setUp(self):
+        re.purge()
+
+    def tearDown(self):
+        re.purge()
+
+    def dump(self, patterns=()):
+        f = io.BytesIO()
+        n = re.dump_cache(f, patterns)
+        f.seek(0)
+        return n, f
+
+    def test_round_trip(self):
+        re.compile('a+(?P<x>b)')
+        re.compile(b'[a-z]+', re.I)
+        n, f = self.dump(['x|y', ('z', re.IGNORECASE)])
+        self.assertEqual(n, 4)
+        re.purge()
+        self.assertEqual(re.load_cache(f), 4)
+        p = re.compile('a+(?P<x>b)')
+        self.assertIs(p, re.compile('a+(?P<x>b)'))
+        self.assertEqual(p.match('aab').groupdict(), {'x': 'b'})
+        self.assertEqual(p.groupindex, {'x': 1})
+        self.assertEqual(re.compile(b'[a-z]+', re.I).match(b'AbC').group(),
+                         b'AbC')
+        self.assertTrue(re.fullmatch('x|y', 'y'))
+        self.assertTrue(re.match('z', 'Z', re.I))
+        self.assertFalse(re.match('z', 'Z'))
+        # Loaded patterns are dumped again
+        re.purge()
+        f.seek(0)
+        re.load_cache(f)
+        n, f = self.dump()
+        self.assertEqual(n, 4)
+
+    def test_loaded_patterns_not_parsed(self):
+        n, f = self.dump(['a(b)c'])
+        self.assertEqual(n, 1)
+        re.purge()
+        re.load_cache(f)
+        with unittest.mock.patch('sre_parse.parse') as parse:
+            self.assertEqual(re.match('a(b)c', 'abc').group(1), 'b')
+        parse.assert_not_called()
+
+    def test_purge(self):
+        n, f = self.dump(['abc'])
+        re.load_cache(f)
+        self.assertTrue(re._loaded)
+        re.purge()
+        self.assertFalse(re._loaded)
+
+    def test_version_mismatch(self):
+        f = io.BytesIO()
+        marshal.dump(re._cache_header()[:-1] + (0,), f)
+        marshal.dump([(0, ('a', 32, [], 0, {}, (None,)))], f)
+        f.seek(0)
+        self.assertEqual(re.load_cache(f), 0)
+        self.assertFalse(re._loaded)
+
+    def test_errors(self):
+        f = io.BytesIO()
+        marshal.dump(('foo', 1), f)
+        f.seek(0)
+        with self.assertRaises(ValueError):
+            re.load_cache(f)
+        with self.assertRaises(TypeError):
+            re.dump_cache(io.BytesIO(), [1])
+        # Invalid code is rejected when loading
+        f = io.BytesIO()
+        marshal.dump(re._cache_header(), f)
+        marshal.dump([(0, ('a', 32, [1000], 0, {}, (None,)))], f)
+        f.seek(0)
+        with self.assertRaises(RuntimeError):
+            re.load_cache(f)
+        self.assertFalse(re._loaded)
+
+
+class PatternSetTests(unittest.TestCase):
+
+    patterns = [
+        r'error: \d+',
+        r'error: disk',
+        r'warn(ing)?',
+        r'\d+ms',
+        r'(?i)timeout',
+        r'err',
+        r'^start',
+        r'errand',
+    ]
+
+    def check(self, ps, method, string, *args):
+        expected = [i for i, p in enumerate(ps.patterns)
+                    if getattr(p, method)(string, *args)]
+        self.assertEqual(getattr(ps, method)(string, *args), expected)
+        return expected
+
+    def test_search(self):
+        ps = re.PatternSet(self.patterns)
+        self.assertEqual(len(ps), len(self.patterns))
+        self.assertEqual(ps.search('got error: 42 after 10ms'), [0, 3, 5])
+        self.assertEqual(ps.search('TIMEOUT, then errands'), [4, 5, 7])
+        self.assertEqual(ps.search('start: warn'), [2, 6])
+        self.assertEqual(ps.search('nothing'), [])
+        for s in ['error: disk', 'error: ', 'errors 5ms', 'a start', '',
+                  'warning error: 1 error: disk Timeout errand']:
+            self.check(ps, 'search', s)
+
+    def test_match(self):
+        ps = re.PatternSet(self.patterns)
+        self.assertEqual(ps.match('error: 1'), [0, 5])
+        self.assertEqual(ps.match('errand'), [5, 7])
+        self.assertEqual(ps.fullmatch('errand'), [7])
+        self.assertEqual(ps.fullmatch('warning'), [2])
+        for s in ['error: disk', 'err', '1ms', 'start', 'x err']:
+            self.check(ps, 'match', s)
+            self.check(ps, 'fullmatch', s)
+
+    def test_pos_endpos(self):
+        ps = re.PatternSet(self.patterns)
+        s = 'xx error: 12 warn'
+        self.assertEqual(ps.search(s, 3), [0, 2, 5])
+        self.assertEqual(ps.search(s, 4), [2])
+        self.assertEqual(ps.search(s, 0, 6), [5])
+        self.assertEqual(ps.match(s, 3), [0, 5])
+        self.assertEqual(ps.fullmatch(s, 3, 12), [0])
+        for args in [(0,), (3,), (3, 5), (6, 100), (13, 17)]:
+            self.check(ps, 'search', s, *args)
+            self.check(ps, 'match', s, *args)
+            self.check(ps, 'fullmatch', s, *args)
+
+    def test_shared_prefixes(self):
+        words = ['a', 'ab', 'abc', 'abd', 'b', 'ba', 'bab', 'c+']
+        ps = re.PatternSet(words)
+        for s in ['abc', 'bab', 'xabdx', 'cab', 'cc', 'ba']:
+            self.check(ps, 'search', s)
+            self.check(ps, 'match', s)
+            self.check(ps, 'fullmatch', s)
+
+    def test_many_patterns(self):
+        patterns = ['user%d: (\\w+)' % i for i in range(1000)]
+        patterns.append('[a-z]+%d' % 7)
+        ps = re.PatternSet(patterns)
+        self.assertEqual(ps.search('user42: bob'), [42])
+        self.assertEqual(ps.search('user999: x, user7: y'), [7, 999, 1000])
+        self.assertEqual(ps.match('user100: z'), [100])
+
+    def test_flags(self):
+        ps = re.PatternSet(['abc', 'a.c'], re.I | re.S)
+        self.assertEqual(ps.search('xA\nC'), [1])
+        self.assertEqual(ps.search('ABC'), [0, 1])
+        ps = re.PatternSet([re.compile('ab'), re.compile('a b', re.X)])
+        self.assertEqual(ps.search('xab'), [0, 1])
+        with self.assertRaises(ValueError):
+            re.PatternSet([re.compile('ab')], re.I)
+
+    def test_bytes(self):
+        ps = re.PatternSet([b'abc', b'ab\\d', b'\\xff\\x00', b'.'])
+        self.assertEqual(ps.search(b'xxab1'), [1, 3])
+        self.assertEqual(ps.search(b'\xff\x00'), [2, 3])
+        self.assertEqual(ps.match(b'abc'), [0, 3])
+        with self.assertRaises(TypeError):
+            ps.search('abc')
+        with self.assertRaises(TypeError):
+            re.PatternSet(['abc', b'abc'])
+
+    def test_no_prefixes(self):
+        ps = re.PatternSet(['.', r'\d', '(?i)x'])
+        self.assertEqual(ps.search('1'), [0, 1])
+        self.assertEqual(ps.fullmatch('X'), [0, 2])
+        ps = re.PatternSet([])
+        self.assertEqual(len(ps), 0)
+        self.assertEqual(ps.search('abc'), [])
+
+    def test_repr(self):
+        self.assertEqual(repr(re.PatternSet(['a', 'b'])),
+                         '<re.PatternSet with 2 patterns>')
+
+
+class LinearTests(unittest.TestCase):
+
+    patterns = [
+        r'a+b', r'(a|ab)(c|bcd)(d*)', r'(?i)h\xe9llo', r'\bfoo\b', r'\Bo',
+        r'^\w+$', r'(?m)^x.*$', r'(?:(a)|b)+', r'(a)()', r'\d{2,4}',
+        r'x*?y', r'(?P<n>[^\W\d]+)\s*=\s*(\d+)', r'a{0,3}?a', r'[a-c]+?c',
+        r'(?s).+', r'$', r'^', r'a|', r'(?i)[k-m]+', r'[^a-z]', r'(?a)\w+',
+        r'\Aab|b\Z', r'(?x) a b # c', r'((a)|(b))*', r'(?i:A)b', r'\S+\s',
+        r'(?:a??)*', r'(|a)*', r'(?:b*?a??)*', r'(a?)*', r'(a*)*b', r'(a|)+?',
+        r'(?:a??){0,3}',
+    ]
+    strings = [
+        '', 'aab', 'abcd', 'H\xc9LLO h\xe9llo', 'foo bar foofoo', 'abc',
+        'x1\nx2\n', 'aaab', '12345', 'xxy', 'ab = 12; cd=3', 'a\nb',
+        '\u212a k', 'bab', 'Ab AB',
+    ]
+
+    def check(self, pattern, string, *args):
+        p = re.compile(pattern)
+        lp = re.compile_linear(pattern)
+        for method in 'match', 'search', 'fullmatch':
+            m = getattr(p, method)(string, *args)
+            lm = getattr(lp, method)(string, *args)
+            if m is None:
+                self.assertIsNone(lm)
+                continue
+            self.assertEqual(lm.span(), m.span())
+            self.assertEqual(lm.regs, m.regs)
+            self.assertEqual(lm.groups(), m.groups())
+            self.assertEqual(lm.groupdict(), m.groupdict())
+            self.assertEqual(lm.lastindex, m.lastindex)
+            self.assertEqual(lm.lastgroup, m.lastgroup)
+        self.assertEqual(lp.findall(string, *args), p.findall(string, *args))
+
+    def test_same_matches(self):
+        for pattern in self.patterns:
+            for string in self.strings:
+                with self.subTest(pattern=pattern, string=string):
+                    self.check(pattern, string)
+                    self.check(pattern, string, 1)
+                    self.check(pattern, string, 1, 3)
+
+    def test_empty_iteration(self):
+        # An optional iteration matching the empty string ends the
+        # repetition, like in the backtracking engine.
+        self.assertEqual(re.compile_linear(r'(?:a??)*').match('aa').span(),
+                         (0, 0))
+        self.assertEqual(re.compile_linear(r'(|a)*').match('aa').span(),
+                         (0, 0))
+        self.assertEqual(re.compile_linear(r'(?:b*?a??)*').match('aab').span(),
+                         (0, 0))
+        m = re.compile_linear(r'(a?)*').match('aa')
+        self.assertEqual(m.span(), (0, 2))
+        self.assertEqual(m.group(1), '')
+        m = re.compile_linear(r'(a*)*b').match('aab')
+        self.assertEqual(m.span(1), (2, 2))
+
+    def test_sub_split(self):
+        for pattern in self.patterns:
+            p = re.compile(pattern)
+            lp = re.compile_linear(pattern)
+            for string in self.strings:
+                with self.subTest(pattern=pattern, string=string):
+                    self.assertEqual(lp.sub(r'<\g<0>>', string),
+                                     p.sub(r'<\g<0>>', string))
+                    self.assertEqual(lp.subn('-', string, 2),
+                                     p.subn('-', string, 2))
+                    self.assertEqual(lp.split(string), p.split(string))
+                    self.assertEqual(lp.split(string, 1), p.split(string, 1))
+        lp = re.compile_linear(r'(\w+)=(\d+)')
+        self.assertEqual(lp.sub(r'\2=\1', 'a=1 b=2'), '1=a 2=b')
+        self.assertEqual(lp.sub(lambda m: m[1].upper(), 'a=1 b=2'), 'A B')
+        self.assertEqual(lp.search('x=5').expand(r'\1 is \2'), 'x is 5')
+
+    def test_bytes(self):
+        lp = re.compile_linear(rb'(\d+)-(\w+)')
+        m = lp.search(b'xx 12-ab')
+        self.assertEqual(m.span(), (3, 8))
+        self.assertEqual(m.groups(), (b'12', b'ab'))
+        self.assertEqual(lp.findall(bytearray(b'1-a 2-b')),
+                         [(b'1', b'a'), (b'2', b'b')])
+        self.assertEqual(lp.findall(memoryview(b'1-a')), [(b'1', b'a')])
+        with self.assertRaises(TypeError):
+            lp.search('12-ab')
+        with self.assertRaises(TypeError):
+            re.compile_linear('a').search(b'a')
+        lp = re.compile_linear(rb'(?i)\xe9')
+        self.assertIsNone(lp.match(b'\xc9'))
+
+    def test_linear_time(self):
+        # These patterns take exponential time with backtracking
+        string = 'a' * 10000 + 'b'
+        self.assertIsNone(re.compile_linear(r'(a+)+$').match(string))
+        self.assertIsNone(re.compile_linear(r'(a|aa)*c').search(string))
+        self.assertIsNone(
+            re.compile_linear(r'(\w*)*$').fullmatch(string + '!'))
+
+    def test_maxstates(self):
+        lp = re.compile_linear(r'(a|b|c)*d', maxstates=2)
+        self.assertEqual(lp.search('abcabcd').span(), (0, 7))
+        self.assertLessEqual(len(lp._transitions), 2)
+        with self.assertRaises(ValueError):
+            re.compile_linear('a', maxstates=0)
+
+    def test_unsupported(self):
+        for pattern in [r'(a)\1', r'(?=a)', r'(?!a)', r'(?<=a)b',
+                        r'(?(1)a|b)']:
+            with self.subTest(pattern=pattern):
+                with self.assertRaises(re.error):
+                    re.compile_linear(pattern)
+        with self.assertRaises(re.error):
+            re.compile_linear(b'a', re.LOCALE)
+        with self.assertRaisesRegex(re.error, 'too large'):
+            re.compile_linear(r'(?:a{1000}){1000}')
+        with self.assertRaises(re.error):
+            re.compile_linear('(')
+
+    def test_match_object(self):
+        lp = re.compile_linear(r'(?P<k>\w+)=(?P<v>\d+)?')
+        m = lp.search('  key=')
+        self.assertEqual(m.group(), 'key=')
+        self.assertEqual(m.group('k', 2), ('key', None))
+        self.assertEqual(m['k'], 'key')
+        self.assertEqual(m.groupdict(''), {'k': 'key', 'v': ''})
+        self.assertEqual(m.span('v'), (-1, -1))
+        self.assertEqual(m.start(1), 2)
+        self.assertEqual(m.end(), 6)
+        self.assertIs(m.re, lp)
+        self.assertEqual(m.string, '  key=')
+        self.assertEqual((m.pos, m.endpos), (0, 6))
+        with self.assertRaises(IndexError):
+            m.group(3)
+        with self.assertRaises(IndexError):
+            m.group('x')
+        self.assertEqual(repr(m),
+                         "<sre_linear.Match object; span=(2, 6), "
+                         "match='key='>")
+
+    def test_pattern_object(self):
+        lp = re.compile_linear(r'(?P<a>x)(y)', re.I | re.M)
+        self.assertEqual(lp.pattern, r'(?P<a>x)(y)')
+        self.assertEqual(lp.flags, re.I | re.M | re.U)
+        self.assertEqual(lp.groups, 2)
+        self.assertEqual(lp.groupindex, {'a': 1})
+        self.assertEqual(repr(lp),
+                         "re.compile_linear('(?P<a>x)(y)', "
+                         "re.IGNORECASE|re.MULTILINE)")
+        self.assertEqual(repr(re.compile_linear('a')),
+                         "re.compile_linear('a')")
+        self.assertEqual([m.span() for m in lp.finditer('xy XY', 1)],
+                         [(3, 5)])
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            lp2 = pickle.loads(pickle.dumps(lp, proto))
+            self.assertEqual(lp2.pattern, lp.pattern)
+            self.assertEqual(lp2.flags, lp.flags)
+
+
 class ImplementationTest(unittest.TestCase):
     """
     Test implementation details of the re module.
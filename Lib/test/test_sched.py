@@ -110,6 +110,21 @@ class TestCase(unittest.TestCase):
         scheduler.run()
         self.assertEqual(l, [0.02, 0.03, 0.04])
 
+    def test_cancel_equal_event(self):
+        l = []
+        fun = lambda x: l.append(x)
+        scheduler = sched.scheduler(time.time, time.sleep)
+        now = time.time()
+        event1 = scheduler.enterabs(now + 0.01, 1, fun, (0.01,))
+        event2 = scheduler.enterabs(now + 0.02, 1, fun, (0.02,))
+        # An equal event, with the same time and priority, is accepted.
+        scheduler.cancel(sched.Event(now + 0.01, 1, None, (), {}))
+        self.assertRaises(ValueError, scheduler.cancel, event1)
+        self.assertRaises(ValueError, scheduler.cancel,
+                          sched.Event(now + 0.01, 1, None, (), {}))
+        scheduler.run()
+        self.assertEqual(l, [0.02])
+
     def test_cancel_concurrent(self):
         q = queue.Queue()
         fun = q.put
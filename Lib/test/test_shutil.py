@@ -919,6 +919,31 @@ class TestShutil(unittest.TestCase):
             shutil.rmtree(TESTFN, ignore_errors=True)
             shutil.rmtree(TESTFN2, ignore_errors=True)
 
+    def test_copytree_workers(self):
+        src_dir = self.mkdtemp()
+        dst_dir = os.path.join(self.mkdtemp(), 'destination')
+        for i in range(10):
+            write_file((src_dir, 'test%d.txt' % i), str(i))
+        os.mkdir(os.path.join(src_dir, 'test_dir'))
+        write_file((src_dir, 'test_dir', 'test.txt'), '456')
+        os.utime(os.path.join(src_dir, 'test_dir'), (0, 1000))
+
+        self.assertEqual(shutil.copytree(src_dir, dst_dir, workers=4),
+                         dst_dir)
+        for i in range(10):
+            self.assertEqual(read_file((dst_dir, 'test%d.txt' % i)), str(i))
+        self.assertEqual(read_file((dst_dir, 'test_dir', 'test.txt')), '456')
+        # The directory times are set after its files are copied.
+        self.assertEqual(os.stat(os.path.join(dst_dir, 'test_dir')).st_mtime,
+                         1000)
+
+        def _copy(src, dst):
+            raise OSError('cannot copy')
+        dst_dir = os.path.join(self.mkdtemp(), 'destination')
+        with self.assertRaises(shutil.Error) as cm:
+            shutil.copytree(src_dir, dst_dir, copy_function=_copy, workers=4)
+        self.assertEqual(len(cm.exception.args[0]), 11)
+
     def test_copytree_special_func(self):
 
         src_dir = self.mkdtemp()
@@ -10,6 +10,7 @@ import signal
 import socket
 import tempfile
 import threading
+import time
 import unittest
 import socketserver
 
@@ -27,6 +28,8 @@ requires_unix_sockets = unittest.skipUnless(HAVE_UNIX_SOCKETS,
                                             'requires Unix sockets')
 HAVE_FORKING = hasattr(os, "fork")
 requires_forking = unittest.skipUnless(HAVE_FORKING, 'requires forking')
+requires_reuse_port = unittest.skipUnless(hasattr(socket, 'SO_REUSEPORT'),
+                                          'requires SO_REUSEPORT')
 
 def signal_alarm(n):
     """Call signal.alarm when it exists (i.e. not on Windows)."""
@@ -52,6 +55,19 @@ if HAVE_UNIX_SOCKETS and HAVE_FORKING:
                                     socketserver.UnixDatagramServer):
         pass
 
+if HAVE_FORKING:
+    class PreforkTCPServer(socketserver.PreforkTCPServer):
+        processes = 2
+
+    class PreforkUDPServer(socketserver.PreforkUDPServer):
+        processes = 2
+
+    class ReusePortTCPServer(PreforkTCPServer):
+        reuse_port = True
+
+    class ReusePortUDPServer(PreforkUDPServer):
+        reuse_port = True
+
 
 @contextlib.contextmanager
 def simple_subprocess(testcase):
@@ -189,6 +205,24 @@ class SocketServerTest(unittest.TestCase):
                         socketserver.StreamRequestHandler,
                         self.stream_examine)
 
+    def test_ThreadPoolTCPServer(self):
+        self.run_server(socketserver.ThreadPoolTCPServer,
+                        socketserver.StreamRequestHandler,
+                        self.stream_examine)
+
+    @requires_forking
+    def test_PreforkTCPServer(self):
+        self.run_server(PreforkTCPServer,
+                        socketserver.StreamRequestHandler,
+                        self.stream_examine)
+
+    @requires_forking
+    @requires_reuse_port
+    def test_PreforkTCPServer_reuse_port(self):
+        self.run_server(ReusePortTCPServer,
+                        socketserver.StreamRequestHandler,
+                        self.stream_examine)
+
     @requires_forking
     def test_ForkingTCPServer(self):
         with simple_subprocess(self):
@@ -226,6 +260,24 @@ class SocketServerTest(unittest.TestCase):
                         socketserver.DatagramRequestHandler,
                         self.dgram_examine)
 
+    def test_ThreadPoolUDPServer(self):
+        self.run_server(socketserver.ThreadPoolUDPServer,
+                        socketserver.DatagramRequestHandler,
+                        self.dgram_examine)
+
+    @requires_forking
+    def test_PreforkUDPServer(self):
+        self.run_server(PreforkUDPServer,
+                        socketserver.DatagramRequestHandler,
+                        self.dgram_examine)
+
+    @requires_forking
+    @requires_reuse_port
+    def test_PreforkUDPServer_reuse_port(self):
+        self.run_server(ReusePortUDPServer,
+                        socketserver.DatagramRequestHandler,
+                        self.dgram_examine)
+
     @requires_forking
     def test_ForkingUDPServer(self):
         with simple_subprocess(self):
@@ -320,6 +372,14 @@ class ErrorHandlerTest(unittest.TestCase):
         ThreadingErrorTestServer(SystemExit)
         self.check_result(handled=False)
 
+    def test_thread_pool_handled(self):
+        ThreadPoolErrorTestServer(ValueError)
+        self.check_result(handled=True)
+
+    def test_thread_pool_not_handled(self):
+        ThreadPoolErrorTestServer(SystemExit)
+        self.check_result(handled=False)
+
     @requires_forking
     def test_forking_handled(self):
         ForkingErrorTestServer(ValueError)
@@ -377,11 +437,105 @@ class ThreadingErrorTestServer(socketserver.ThreadingMixIn,
         self.done.wait()
 
 
+class ThreadPoolErrorTestServer(socketserver.ThreadPoolMixIn,
+        ThreadingErrorTestServer):
+    pass
+
+
 if HAVE_FORKING:
     class ForkingErrorTestServer(socketserver.ForkingMixIn, BaseErrorTestServer):
         pass
 
 
+class ThreadPoolMixInTest(unittest.TestCase):
+
+    @reap_threads
+    def test_workers_are_reused(self):
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                self.wfile.write(self.rfile.readline())
+
+        class Server(socketserver.ThreadPoolTCPServer):
+            max_workers = 2
+            queue_size = 1
+
+        server = Server((HOST, 0), Handler)
+        t = threading.Thread(target=server.serve_forever,
+                             kwargs={'poll_interval': 0.01})
+        t.start()
+        try:
+            for i in range(20):
+                with socket.create_connection(server.server_address) as s:
+                    s.sendall(b'%d\n' % i)
+                    self.assertEqual(s.makefile('rb').readline(), b'%d\n' % i)
+            self.assertLessEqual(len(server._workers), 2)
+        finally:
+            server.shutdown()
+            t.join()
+            server.server_close()
+        self.assertIsNone(server._workers)
+
+
+@requires_forking
+class PreforkMixInTest(unittest.TestCase):
+
+    def setUp(self):
+        signal_alarm(60)  # Kill deadlocks after 60 seconds.
+
+    def tearDown(self):
+        signal_alarm(0)  # Didn't deadlock.
+        reap_children()
+
+    @reap_threads
+    def test_workers_are_restarted(self):
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                self.wfile.write(b'%d\n' % os.getpid())
+
+        server = PreforkTCPServer((HOST, 0), Handler)
+        t = threading.Thread(target=server.serve_forever,
+                             kwargs={'poll_interval': 0.01})
+        t.start()
+        try:
+            def request():
+                with socket.create_connection(server.server_address) as s:
+                    return int(s.makefile('rb').readline())
+
+            pid = request()
+            self.assertIn(pid, server._worker_pids)
+            os.kill(pid, signal.SIGKILL)
+            for _ in range(1000):
+                pids = server._worker_pids.copy()
+                if len(pids) == 2 and pid not in pids:
+                    break
+                time.sleep(0.01)
+            else:
+                self.fail('the worker was not restarted')
+            self.assertNotEqual(request(), pid)
+        finally:
+            server.shutdown()
+            t.join()
+            server.server_close()
+        self.assertIsNone(server._worker_pids)
+
+    @reap_threads
+    def test_shutdown_before_serve_forever(self):
+        # shutdown() may be called before the serving thread starts.
+        server = PreforkTCPServer((HOST, 0), socketserver.StreamRequestHandler)
+        self.addCleanup(server.server_close)
+        t = threading.Thread(target=server.shutdown)
+        t.start()
+        server.serve_forever(poll_interval=0.01)
+        t.join()
+        self.assertIsNone(server._worker_pids)
+        # The server can be started again.
+        t = threading.Thread(target=server.serve_forever,
+                             kwargs={'poll_interval': 0.01})
+        t.start()
+        server.shutdown()
+        t.join()
+
+
 class SocketWriterTest(unittest.TestCase):
     def test_basics(self):
         class Handler(socketserver.StreamRequestHandler):
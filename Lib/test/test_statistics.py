@@ -3,11 +3,13 @@ approx_equal function.
 
 """
 
+import array
 import collections
 import collections.abc
 import decimal
 import doctest
 import math
+import pickle
 import random
 import sys
 import unittest
@@ -1981,6 +1983,229 @@ class TestStdev(VarianceStdevMixin, NumericTestCase):
         self.assertEqual(self.func(data), expected)
 
 
+class TestFMean(unittest.TestCase):
+
+    def test_basics(self):
+        fmean = statistics.fmean
+        D = Decimal
+        F = Fraction
+        for data, expected_mean, kind in [
+            ([3.5, 4.0, 5.25], 4.25, 'floats'),
+            ([D('3.5'), D('4.0'), D('5.25')], 4.25, 'decimals'),
+            ([F(7, 2), F(4, 1), F(21, 4)], 4.25, 'fractions'),
+            ([True, False, True, True, False], 0.60, 'booleans'),
+            ([3.5, 4, F(21, 4)], 4.25, 'mixed types'),
+            ((3.5, 4.0, 5.25), 4.25, 'tuple'),
+            (iter([3.5, 4.0, 5.25]), 4.25, 'iterator'),
+            (array.array('d', [3.5, 4.0, 5.25]), 4.25, 'array'),
+            (memoryview(array.array('i', [3, 4, 5])), 4.0, 'memoryview'),
+                ]:
+            actual_mean = fmean(data)
+            self.assertIs(type(actual_mean), float, kind)
+            self.assertEqual(actual_mean, expected_mean, kind)
+
+    def test_errors(self):
+        fmean = statistics.fmean
+        StatisticsError = statistics.StatisticsError
+        with self.assertRaises(StatisticsError):
+            fmean([])
+        with self.assertRaises(StatisticsError):
+            fmean(iter([]))
+        with self.assertRaises(TypeError):
+            fmean(None)
+        with self.assertRaises(TypeError):
+            fmean(['a', 'b'])
+        with self.assertRaises(StatisticsError):
+            fmean([1, 2], weights=[1])
+        with self.assertRaises(StatisticsError):
+            fmean([1, 2], weights=[1, -1])
+
+    def test_weights(self):
+        fmean = statistics.fmean
+        self.assertEqual(fmean([3.5, 4.0, 5.25], weights=[1, 2, 1]), 4.1875)
+        self.assertEqual(fmean(iter([10, 20]), weights=iter([3, 1])), 12.5)
+        data = [random.random() for _ in range(100)]
+        self.assertAlmostEqual(fmean(data, [1] * 100), fmean(data))
+        # Repeating the data points is the same as weighting them
+        self.assertAlmostEqual(fmean([1, 1, 1, 5, 7, 7]),
+                               fmean([1, 5, 7], weights=[3, 1, 2]))
+
+    def test_special_values(self):
+        fmean = statistics.fmean
+        NaN = float('Nan')
+        Inf = float('Inf')
+        self.assertTrue(math.isnan(fmean([10, NaN])))
+        self.assertEqual(fmean([10, Inf]), Inf)
+        with self.assertRaises(ValueError):
+            fmean([Inf, -Inf])
+
+    def test_compare_to_mean(self):
+        data = [random.uniform(-100, 100) for _ in range(1000)]
+        self.assertAlmostEqual(statistics.fmean(data), statistics.mean(data))
+
+
+class TestFVariance(unittest.TestCase):
+
+    def test_compare_to_variance(self):
+        for data in ([random.uniform(-2, 9) for _ in range(1000)],
+                     [1e9 + random.random() for _ in range(1000)],
+                     [1, 2, 2, 4, 4, 4, 5, 6],
+                     [Fraction(1, 3), Decimal('0.5'), 2]):
+            floats = list(map(float, data))
+            self.assertAlmostEqual(statistics.fvariance(data),
+                                   statistics.variance(floats))
+            self.assertAlmostEqual(statistics.fpvariance(data),
+                                   statistics.pvariance(floats))
+            mu = statistics.mean(floats)
+            self.assertAlmostEqual(statistics.fvariance(data, mu),
+                                   statistics.variance(floats, mu))
+            self.assertAlmostEqual(statistics.fpvariance(data, mu),
+                                   statistics.pvariance(floats, mu))
+
+    def test_types(self):
+        data = array.array('d', [2.75, 1.75, 1.25, 0.25, 0.5, 1.25, 3.5])
+        self.assertIs(type(statistics.fvariance(data)), float)
+        self.assertEqual(statistics.fvariance(data), 1.3720238095238095)
+        self.assertEqual(statistics.fvariance(iter(data)), 1.3720238095238095)
+        self.assertEqual(statistics.fpvariance([5] * 10), 0.0)
+        self.assertEqual(statistics.fvariance([1, 2]), 0.5)
+
+    def test_weights(self):
+        self.assertEqual(statistics.fvariance([1, 2, 4], weights=[2, 1, 1]),
+                         statistics.variance([1, 1, 2, 4]))
+        self.assertEqual(statistics.fpvariance([1, 2, 4], weights=[2, 1, 1]),
+                         statistics.pvariance([1, 1, 2, 4]))
+        self.assertEqual(statistics.fpvariance([1, 2], weights=[0.5, 0.5]),
+                         0.25)
+
+    def test_errors(self):
+        StatisticsError = statistics.StatisticsError
+        for data in [], [1]:
+            with self.assertRaises(StatisticsError):
+                statistics.fvariance(data)
+        with self.assertRaises(StatisticsError):
+            statistics.fpvariance([])
+        with self.assertRaises(StatisticsError):
+            statistics.fvariance([1, 2], weights=[0.5, 0.5])
+        with self.assertRaises(StatisticsError):
+            statistics.fpvariance([1, 2], weights=[1, 2, 3])
+        with self.assertRaises(TypeError):
+            statistics.fvariance([None, 2])
+
+
+class TestQuantiles(unittest.TestCase):
+
+    def test_specific_cases(self):
+        quantiles = statistics.quantiles
+        data = [100, 200, 400, 800]
+        for n, expected in [
+            (1, []),
+            (2, [300.0]),
+            (4, [125.0, 300.0, 700.0]),
+            (5, [100.0, 200.0, 400.0, 800.0]),
+                ]:
+            self.assertEqual(expected, quantiles(data, n=n))
+            self.assertEqual(expected, quantiles(reversed(data), n=n))
+        self.assertEqual(quantiles([1, 3, 4, 6, 8, 9, 10, 12], n=4),
+                         [3.25, 7.0, 9.75])
+        self.assertEqual(len(quantiles(range(1000), n=100)), 99)
+
+    def test_inclusive(self):
+        quantiles = statistics.quantiles
+        data = [100, 200, 400, 800]
+        for n, expected in [
+            (2, [300.0]),
+            (4, [175.0, 300.0, 500.0]),
+            (5, [160.0, 240.0, 360.0, 560.0]),
+                ]:
+            self.assertEqual(expected,
+                             quantiles(data, n=n, method='inclusive'))
+        data = [random.random() for _ in range(1000)]
+        actual = quantiles(data, n=2, method='inclusive')
+        self.assertEqual(actual, [statistics.median(data)])
+        self.assertEqual(quantiles([0, 10], n=4, method='inclusive'),
+                         [2.5, 5.0, 7.5])
+
+    def test_error_cases(self):
+        quantiles = statistics.quantiles
+        StatisticsError = statistics.StatisticsError
+        with self.assertRaises(TypeError):
+            quantiles()
+        with self.assertRaises(StatisticsError):
+            quantiles([10], n=4)
+        with self.assertRaises(StatisticsError):
+            quantiles([10, 20], n=0)
+        with self.assertRaises(ValueError):
+            quantiles([10, 20], method='X')
+        with self.assertRaises(TypeError):
+            quantiles([10, None, 30], n=4)
+
+
+class TestRunningStats(unittest.TestCase):
+
+    def check(self, stats, data):
+        self.assertEqual(stats.count, len(data))
+        self.assertAlmostEqual(stats.mean, statistics.mean(data))
+        self.assertAlmostEqual(stats.pvariance, statistics.pvariance(data))
+        self.assertAlmostEqual(stats.pstdev, statistics.pstdev(data))
+        if len(data) > 1:
+            self.assertAlmostEqual(stats.variance, statistics.variance(data))
+            self.assertAlmostEqual(stats.stdev, statistics.stdev(data))
+        self.assertEqual(stats.min, min(data))
+        self.assertEqual(stats.max, max(data))
+
+    def test_add_and_update(self):
+        data = [random.uniform(-5, 5) for _ in range(500)]
+        stats = statistics.RunningStats()
+        for x in data:
+            stats.add(x)
+            self.assertEqual(stats.max, max(data[:stats.count]))
+        self.check(stats, data)
+        self.check(statistics.RunningStats(data), data)
+        self.check(statistics.RunningStats(array.array('d', data)), data)
+        stats = statistics.RunningStats(data[:10])
+        stats.update(iter(data[10:]))
+        stats.update([])
+        self.check(stats, data)
+
+    def test_merge(self):
+        data = [1e6 + random.random() for _ in range(1000)]
+        parts = [statistics.RunningStats(data[i:i+100])
+                 for i in range(0, 1000, 100)]
+        total = statistics.RunningStats()
+        for part in parts:
+            total.merge(part)
+        self.check(total, data)
+        self.check(sum(parts, statistics.RunningStats()), data)
+        self.check(parts[0] + statistics.RunningStats(), data[:100])
+        # The operands of + are unchanged
+        self.check(parts[0], data[:100])
+        with self.assertRaises(TypeError):
+            parts[0] + 1
+
+    def test_pickle(self):
+        stats = statistics.RunningStats([1, 2, 3, 4])
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            copy = pickle.loads(pickle.dumps(stats, proto))
+            self.check(copy, [1, 2, 3, 4])
+
+    def test_empty(self):
+        stats = statistics.RunningStats()
+        self.assertEqual(stats.count, 0)
+        self.assertIsNone(stats.min)
+        self.assertEqual(repr(stats), 'RunningStats()')
+        for attr in 'mean', 'pvariance', 'variance', 'stdev':
+            with self.assertRaises(statistics.StatisticsError):
+                getattr(stats, attr)
+        stats.add(3)
+        self.assertEqual(stats.mean, 3.0)
+        self.assertEqual(stats.pvariance, 0.0)
+        with self.assertRaises(statistics.StatisticsError):
+            stats.variance
+        self.assertEqual(repr(stats),
+                         '<RunningStats count=1 mean=3.0 min=3.0 max=3.0>')
+
+
 # === Run tests ===
 
 def load_tests(loader, tests, ignore):
@@ -584,6 +584,28 @@ class MiscReadTestBase(CommonReadTest):
             tar.close()
             support.rmtree(DIR)
 
+    def test_extractall_workers(self):
+        with tarfile.open(self.tarname, encoding="iso8859-1") as tar:
+            members = [t for t in tar
+                       if t.isreg() or t.isdir() or t.issym() or t.islnk()]
+            for workers in 1, 4:
+                DIR = os.path.join(TEMPDIR, "extractall%d" % workers)
+                self.addCleanup(support.rmtree, DIR)
+                tar.extractall(DIR, members, workers=workers)
+        for tarinfo in members:
+            if tarinfo.isreg():
+                path = os.path.join("extractall%d", tarinfo.name)
+                with open(os.path.join(TEMPDIR, path % 1), "rb") as f:
+                    expected = f.read()
+                with open(os.path.join(TEMPDIR, path % 4), "rb") as f:
+                    self.assertEqual(f.read(), expected, tarinfo.name)
+                self.assertEqual(len(expected), tarinfo.size)
+
+    def test_extractall_bad_workers(self):
+        with tarfile.open(self.tarname, encoding="iso8859-1") as tar:
+            with self.assertRaises(ValueError):
+                tar.extractall(TEMPDIR, workers=0)
+
     def test_extract_directory(self):
         dirtype = "ustar/dirtype"
         DIR = os.path.join(TEMPDIR, "extractdir")
@@ -1748,6 +1748,17 @@ class MiscTests(unittest.TestCase):
         self.opener_has_handler(o, MyHTTPHandler)
         self.opener_has_handler(o, MyOtherHTTPHandler)
 
+        # pooled handlers replace the default HTTP(S) handlers
+        o = build_opener(urllib.request.PooledHTTPHandler)
+        self.opener_has_handler(o, urllib.request.PooledHTTPHandler)
+        self.assertFalse(any(h.__class__ == urllib.request.HTTPHandler
+                             for h in o.handlers))
+        if hasattr(urllib.request, 'PooledHTTPSHandler'):
+            o = build_opener(urllib.request.PooledHTTPSHandler)
+            self.opener_has_handler(o, urllib.request.PooledHTTPSHandler)
+            self.assertFalse(any(h.__class__ == urllib.request.HTTPSHandler
+                                 for h in o.handlers))
+
     @unittest.skipUnless(support.is_resource_enabled('network'),
                          'test requires network access')
     def test_issue16464(self):
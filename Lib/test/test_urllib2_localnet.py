@@ -1,5 +1,6 @@
 import base64
 import os
+import select
 import email
 import urllib.parse
 import urllib.request
@@ -7,6 +8,7 @@ import http.server
 import threading
 import unittest
 import hashlib
+from unittest import mock
 
 from test import support
 
@@ -659,6 +661,148 @@ class TestUrlopen(unittest.TestCase):
         self.assertEqual(index + 1, len(lines))
 
 
+class KeepAliveRequestHandler(http.server.BaseHTTPRequestHandler):
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.client_ports.append(self.client_address[1])
+        if self.path in ("/close", "/drop"):
+            self.close_connection = True
+        body = b"hello"
+        if self.path == "/chunked":
+            self.send_response(200)
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            self.wfile.write(b"5\r\nhello\r\n0\r\n\r\n")
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        if self.path == "/close":
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.do_GET()
+
+    def log_message(self, *args):
+        pass
+
+
+class PooledHTTPHandlerTests(unittest.TestCase):
+
+    def setUp(self):
+        self.httpd = http.server.ThreadingHTTPServer(
+            ("127.0.0.1", 0), KeepAliveRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.client_ports = []
+        self.addCleanup(self.httpd.server_close)
+        thread = threading.Thread(target=self.httpd.serve_forever,
+                                  kwargs={"poll_interval": 0.01})
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(self.httpd.shutdown)
+
+        self.pool = urllib.request.HTTPConnectionPool(maxsize=2)
+        self.addCleanup(self.pool.clear)
+        self.opener = urllib.request.build_opener(
+            urllib.request.ProxyHandler({}),
+            urllib.request.PooledHTTPHandler(pool=self.pool))
+        self.url = "http://127.0.0.1:%d" % self.httpd.server_port
+
+    def fetch(self, path="/", data=None):
+        with self.opener.open(self.url + path, data) as f:
+            return f.read()
+
+    def test_connection_reused(self):
+        for i in range(3):
+            self.assertEqual(self.fetch(), b"hello")
+        self.assertEqual(len(self.httpd.client_ports), 3)
+        self.assertEqual(len(set(self.httpd.client_ports)), 1)
+
+    def test_chunked_response_reused(self):
+        self.assertEqual(self.fetch("/chunked"), b"hello")
+        self.assertEqual(self.fetch("/chunked"), b"hello")
+        self.assertEqual(len(set(self.httpd.client_ports)), 1)
+
+    def test_post_reused(self):
+        self.assertEqual(self.fetch("/", b"data"), b"hello")
+        self.assertEqual(self.fetch("/", b"data"), b"hello")
+        self.assertEqual(len(set(self.httpd.client_ports)), 1)
+
+    def test_partially_read_response_not_reused(self):
+        with self.opener.open(self.url) as f:
+            self.assertEqual(f.read(2), b"he")
+        self.assertEqual(self.fetch(), b"hello")
+        self.assertEqual(len(set(self.httpd.client_ports)), 2)
+
+    def test_connection_close_not_reused(self):
+        self.assertEqual(self.fetch("/close"), b"hello")
+        self.assertEqual(self.fetch(), b"hello")
+        self.assertEqual(len(set(self.httpd.client_ports)), 2)
+
+    def test_stale_connection_discarded(self):
+        # The server closes the connection without telling the client.
+        self.assertEqual(self.fetch("/drop"), b"hello")
+        self.assertEqual(self.fetch(), b"hello")
+        self.assertEqual(len(set(self.httpd.client_ports)), 2)
+
+    def test_stale_connection_retried(self):
+        self.assertEqual(self.fetch("/drop"), b"hello")
+        # Let the server close its end before the connection is reused.
+        key, = self.pool._idle
+        conn = self.pool._idle[key][-1][1]
+        conn.sock.settimeout(10.0)
+        self.assertEqual(conn.sock.recv(1), b"")
+        with mock.patch("urllib.request._is_connection_dropped",
+                        return_value=False):
+            self.assertEqual(self.fetch("/", b"data"), b"hello")
+        self.assertEqual(len(set(self.httpd.client_ports)), 2)
+
+    @unittest.skipUnless(hasattr(select, "poll"), "requires select.poll()")
+    def test_connection_reused_without_select(self):
+        # select() fails for file descriptors above FD_SETSIZE.
+        with mock.patch("select.select", side_effect=ValueError):
+            self.assertEqual(self.fetch(), b"hello")
+            self.assertEqual(self.fetch(), b"hello")
+        self.assertEqual(len(set(self.httpd.client_ports)), 1)
+
+    def test_idle_timeout(self):
+        self.pool.timeout = 0
+        self.assertEqual(self.fetch(), b"hello")
+        self.assertEqual(self.fetch(), b"hello")
+        self.assertEqual(len(set(self.httpd.client_ports)), 2)
+
+    def test_concurrent_responses_use_separate_connections(self):
+        f1 = self.opener.open(self.url)
+        f2 = self.opener.open(self.url)
+        self.assertEqual(f1.read(), b"hello")
+        self.assertEqual(f2.read(), b"hello")
+        f1.close()
+        f2.close()
+        self.assertEqual(len(set(self.httpd.client_ports)), 2)
+        # Both connections were kept and are reused.
+        self.assertEqual(self.fetch(), b"hello")
+        self.assertEqual(self.fetch(), b"hello")
+        self.assertEqual(len(set(self.httpd.client_ports)), 2)
+
+    def test_maxsize(self):
+        responses = [self.opener.open(self.url) for i in range(3)]
+        for f in responses:
+            f.read()
+            f.close()
+        self.assertEqual(sum(len(conns) for conns in self.pool._idle.values()),
+                         2)
+        self.pool.clear()
+        self.assertEqual(self.pool._idle, {})
+
+    def test_bad_maxsize(self):
+        with self.assertRaises(ValueError):
+            urllib.request.HTTPConnectionPool(maxsize=0)
+
+
 threads_key = None
 
 def setUpModule():
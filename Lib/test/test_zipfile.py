@@ -402,6 +402,30 @@ class AbstractTestsWithSourceFile:
             self.assertEqual(one_info._compresslevel, 1)
             self.assertEqual(nine_info._compresslevel, 9)
 
+    def test_writeall_workers(self):
+        names = ['name%d' % i for i in range(10)]
+        with zipfile.ZipFile(TESTFN2, "w", self.compression) as zipfp:
+            zipfp.writeall([(TESTFN, name) for name in names], workers=3)
+            zipfp.writeall([TESTFN], compresslevel=1, workers=2)
+        with zipfile.ZipFile(TESTFN2, "r") as zipfp:
+            self.assertIsNone(zipfp.testzip())
+            self.assertEqual(zipfp.namelist(), names + [TESTFN])
+            for info in zipfp.infolist():
+                self.assertEqual(info.compress_type, self.compression)
+                self.assertEqual(info.file_size, len(self.data))
+                self.assertEqual(zipfp.read(info), self.data)
+
+    def test_extractall_workers(self):
+        names = ['dir%d/name%d' % (i % 3, i) for i in range(10)]
+        with zipfile.ZipFile(TESTFN2, "w", self.compression) as zipfp:
+            for name in names:
+                zipfp.write(TESTFN, name)
+        with temp_dir() as extdir, zipfile.ZipFile(TESTFN2, "r") as zipfp:
+            zipfp.extractall(extdir, workers=4)
+            for name in names:
+                with open(os.path.join(extdir, name), "rb") as f:
+                    self.assertEqual(f.read(), self.data)
+
     def tearDown(self):
         unlink(TESTFN)
         unlink(TESTFN2)
@@ -1123,6 +1147,30 @@ class ExtractTests(unittest.TestCase):
         with temp_dir() as extdir:
             self._test_extract_all_with_target(pathlib.Path(extdir))
 
+    def test_extract_all_workers(self):
+        with temp_cwd():
+            with zipfile.ZipFile(TESTFN2, "w") as zipfp:
+                zipfp.writestr("dir/", b"")
+                for fpath, fdata in SMALL_TEST_DATA:
+                    zipfp.writestr(fpath, fdata)
+                # With duplicate names, the last member wins.
+                with self.assertWarns(UserWarning):
+                    zipfp.writestr(SMALL_TEST_DATA[0][0], b"last")
+            with zipfile.ZipFile(TESTFN2, "r") as zipfp:
+                zipfp.extractall("target", zipfp.infolist(), workers=3)
+            self.assertTrue(os.path.isdir(os.path.join("target", "dir")))
+            for fpath, fdata in SMALL_TEST_DATA[1:]:
+                self.check_file(os.path.join("target", fpath), fdata.encode())
+            self.check_file(os.path.join("target", SMALL_TEST_DATA[0][0]),
+                            b"last")
+
+    def test_extract_all_bad_workers(self):
+        self.make_test_file()
+        with zipfile.ZipFile(TESTFN2, "r") as zipfp:
+            with self.assertRaises(ValueError):
+                zipfp.extractall(workers=0)
+        unlink(TESTFN2)
+
     def check_file(self, filename, content):
         self.assertTrue(os.path.isfile(filename))
         with open(filename, 'rb') as f:
@@ -2033,6 +2081,26 @@ class UnseekableTests(unittest.TestCase):
                     with zipf.open('twos') as zopen:
                         self.assertEqual(zopen.read(), b'222')
 
+    def test_writeall(self):
+        for wrapper in (lambda f: f), Tellable, Unseekable:
+            with self.subTest(wrapper=wrapper):
+                f = io.BytesIO()
+                f.write(b'abc')
+                bf = io.BufferedWriter(f)
+                self.addCleanup(unlink, TESTFN)
+                self.addCleanup(unlink, TESTFN2)
+                with open(TESTFN, 'wb') as f2:
+                    f2.write(b'111')
+                with open(TESTFN2, 'wb') as f2:
+                    f2.write(b'222')
+                with zipfile.ZipFile(wrapper(bf), 'w', zipfile.ZIP_STORED) as zipfp:
+                    zipfp.writeall([(TESTFN, 'ones'), (TESTFN2, 'twos')],
+                                   workers=2)
+                self.assertEqual(f.getvalue()[:5], b'abcPK')
+                with zipfile.ZipFile(f) as zipf:
+                    self.assertEqual(zipf.read('ones'), b'111')
+                    self.assertEqual(zipf.read('twos'), b'222')
+
     def test_open_write(self):
         for wrapper in (lambda f: f), Tellable, Unseekable:
             with self.subTest(wrapper=wrapper):
@@ -432,6 +432,47 @@ class CompressObjectTestCase(BaseCompressTestCase, unittest.TestCase):
         ddata += dco.decompress(dco.unconsumed_tail)
         self.assertEqual(dco.unconsumed_tail, b"")
 
+    @unittest.skipUnless(hasattr(zlib, 'Z_BLOCK'), 'requires zlib.Z_BLOCK')
+    def test_decompress_block_mode(self):
+        # In Z_BLOCK mode, decompress() stops at the end of each deflate
+        # block, and decompression can be resumed there with a new object
+        # given the preceding data and the bits of the partial last byte.
+        data = HAMLET_SCENE * 8
+        co = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        comp = b''
+        for i in range(0, len(data), 1000):
+            comp += co.compress(data[i:i+1000])
+            comp += co.flush(zlib.Z_PARTIAL_FLUSH)
+        comp += co.flush()
+
+        dco = zlib.decompressobj(wbits=-zlib.MAX_WBITS)
+        out = b''
+        points = []
+        tail = comp
+        while not dco.eof:
+            out += dco.decompress(tail, mode=zlib.Z_BLOCK)
+            tail = dco.unconsumed_tail
+            if dco.data_type & 128 and not dco.data_type & 64:
+                points.append((len(comp) - len(tail), dco.data_type & 7,
+                               len(out)))
+        self.assertEqual(out, data)
+        self.assertGreater(len(points), 5)
+        self.assertTrue(any(bits for offset, bits, size in points))
+
+        for offset, bits, size in points:
+            dco = zlib.decompressobj(wbits=-zlib.MAX_WBITS,
+                                     zdict=data[max(size - 32768, 0):size])
+            if bits:
+                dco.prime(bits, comp[offset - 1] >> (8 - bits))
+            self.assertEqual(dco.decompress(comp[offset:]), data[size:])
+            self.assertTrue(dco.eof)
+
+    def test_prime_errors(self):
+        dco = zlib.decompressobj(wbits=-zlib.MAX_WBITS)
+        self.assertRaises(zlib.error, dco.prime, 17, 0)
+        self.assertRaises(TypeError, dco.prime, 1)
+        self.assertEqual(zlib.decompressobj().data_type, 0)
+
     def test_flushes(self):
         # Test flush() with the various options, using all the
         # different levels in order to provide more variations.
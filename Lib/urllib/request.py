@@ -90,9 +90,11 @@ import io
 import os
 import posixpath
 import re
+import select
 import socket
 import string
 import sys
+import threading
 import time
 import tempfile
 import contextlib
@@ -123,6 +125,7 @@ __all__ = [
     'HTTPPasswordMgrWithPriorAuth', 'AbstractBasicAuthHandler',
     'HTTPBasicAuthHandler', 'ProxyBasicAuthHandler', 'AbstractDigestAuthHandler',
     'HTTPDigestAuthHandler', 'ProxyDigestAuthHandler', 'HTTPHandler',
+    'PooledHTTPHandler', 'HTTPConnectionPool',
     'FileHandler', 'FTPHandler', 'CacheFTPHandler', 'DataHandler',
     'UnknownHandler', 'HTTPErrorProcessor',
     # Functions
@@ -1272,6 +1275,26 @@ class AbstractHTTPHandler(BaseHandler):
 
         return request
 
+    def _get_headers(self, req, keep_alive):
+        """Return the headers to send for req and those for the proxy tunnel.
+        """
+        headers = dict(req.unredirected_hdrs)
+        headers.update({k: v for k, v in req.headers.items()
+                        if k not in headers})
+        if not keep_alive:
+            headers["Connection"] = "close"
+        headers = {name.title(): val for name, val in headers.items()}
+
+        tunnel_headers = {}
+        if req._tunnel_host:
+            proxy_auth_hdr = "Proxy-Authorization"
+            if proxy_auth_hdr in headers:
+                tunnel_headers[proxy_auth_hdr] = headers[proxy_auth_hdr]
+                # Proxy-Authorization should not be sent to origin
+                # server.
+                del headers[proxy_auth_hdr]
+        return headers, tunnel_headers
+
     def do_open(self, http_class, req, **http_conn_args):
         """Return an HTTPResponse object for the request, using http_class.
 
@@ -1285,30 +1308,14 @@ class AbstractHTTPHandler(BaseHandler):
         h = http_class(host, timeout=req.timeout, **http_conn_args)
         h.set_debuglevel(self._debuglevel)
 
-        headers = dict(req.unredirected_hdrs)
-        headers.update({k: v for k, v in req.headers.items()
-                        if k not in headers})
-
-        # TODO(jhylton): Should this be redesigned to handle
-        # persistent connections?
-
         # We want to make an HTTP/1.1 request, but the addinfourl
         # class isn't prepared to deal with a persistent connection.
         # It will try to read all remaining data from the socket,
         # which will block while the server waits for the next request.
         # So make sure the connection gets closed after the (only)
-        # request.
-        headers["Connection"] = "close"
-        headers = {name.title(): val for name, val in headers.items()}
-
+        # request.  PooledHTTPHandler keeps connections open instead.
+        headers, tunnel_headers = self._get_headers(req, keep_alive=False)
         if req._tunnel_host:
-            tunnel_headers = {}
-            proxy_auth_hdr = "Proxy-Authorization"
-            if proxy_auth_hdr in headers:
-                tunnel_headers[proxy_auth_hdr] = headers[proxy_auth_hdr]
-                # Proxy-Authorization should not be sent to origin
-                # server.
-                del headers[proxy_auth_hdr]
             h.set_tunnel(req._tunnel_host, headers=tunnel_headers)
 
         try:
@@ -1363,6 +1370,219 @@ if hasattr(http.client, 'HTTPSConnection'):
 
     __all__.append('HTTPSHandler')
 
+
+def _is_connection_dropped(conn):
+    """Return True if an idle connection can no longer be used.
+
+    An idle persistent connection should have nothing to read: if its
+    socket is readable, the server has closed it (or sent unexpected data).
+    """
+    sock = conn.sock
+    if sock is None:
+        return True
+    try:
+        # select() cannot watch file descriptors above FD_SETSIZE.
+        if hasattr(select, 'poll'):
+            poller = select.poll()
+            poller.register(sock, select.POLLIN)
+            return bool(poller.poll(0))
+        readable, _, _ = select.select([sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+class HTTPConnectionPool:
+    """A pool of idle persistent HTTP connections.
+
+    Connections are stored under a hashable key chosen by the caller.  At
+    most maxsize idle connections are kept per key; a connection idle for
+    more than timeout seconds, or one the server has closed, is discarded
+    instead of being reused.  A pool can be shared by several handlers and
+    threads.
+    """
+
+    def __init__(self, maxsize=10, timeout=60.0):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.timeout = timeout
+        # key -> list of (expiry time, connection), most recent last
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return an idle connection for key, or None if there is none."""
+        while True:
+            with self._lock:
+                conns = self._idle.get(key)
+                if not conns:
+                    return None
+                expiry, conn = conns.pop()
+                if not conns:
+                    del self._idle[key]
+            if expiry > time.monotonic() and not _is_connection_dropped(conn):
+                return conn
+            conn.close()
+
+    def put(self, key, conn):
+        """Make conn available for reuse by later requests for key.
+
+        conn must not have a pending response.  It is closed if the pool
+        already holds maxsize idle connections for key.
+        """
+        if conn.sock is None:
+            return
+        now = time.monotonic()
+        expired = []
+        with self._lock:
+            # Drop expired connections, including those for hosts which
+            # are not contacted anymore.
+            for k, conns in list(self._idle.items()):
+                while conns and conns[0][0] <= now:
+                    expired.append(conns.pop(0)[1])
+                if not conns:
+                    del self._idle[k]
+            conns = self._idle.setdefault(key, [])
+            if len(conns) < self.maxsize:
+                conns.append((now + self.timeout, conn))
+                conn = None
+        for c in expired:
+            c.close()
+        if conn is not None:
+            conn.close()
+
+    def clear(self):
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for expiry, conn in conns:
+                conn.close()
+
+
+class _PooledHTTPResponse(http.client.HTTPResponse):
+    # Tells the handler whether the connection can be reused once the
+    # response has been closed.
+
+    _release_conn = None
+    _complete = False
+
+    def _read_and_discard_trailer(self):
+        super()._read_and_discard_trailer()
+        # The last chunk of a chunked response has been read.
+        self._complete = True
+
+    def _close_conn(self):
+        complete = self._complete or self.length == 0
+        super()._close_conn()
+        release, self._release_conn = self._release_conn, None
+        if release is not None:
+            release(complete)
+
+
+class _PooledHandlerMixin:
+    # Implements do_open() for HTTP handlers which keep connections open
+    # and reuse them from an HTTPConnectionPool.
+
+    def do_open(self, http_class, req, **http_conn_args):
+        host = req.host
+        if not host:
+            raise URLError('no host given')
+
+        pool = self.pool
+        key = (http_class, req.type, host, req._tunnel_host,
+               tuple(sorted(http_conn_args.items())))
+        headers, tunnel_headers = self._get_headers(req, keep_alive=True)
+        # A request can only be sent again if its body was not consumed.
+        replayable = req.data is None or isinstance(req.data, (bytes, bytearray))
+
+        while True:
+            h = pool.get(key)
+            reused = h is not None
+            if reused:
+                h.timeout = req.timeout
+                if req.timeout is socket._GLOBAL_DEFAULT_TIMEOUT:
+                    h.sock.settimeout(socket.getdefaulttimeout())
+                else:
+                    h.sock.settimeout(req.timeout)
+            else:
+                h = http_class(host, timeout=req.timeout, **http_conn_args)
+                if req._tunnel_host:
+                    h.set_tunnel(req._tunnel_host, headers=tunnel_headers)
+            h.set_debuglevel(self._debuglevel)
+            h.response_class = _PooledHTTPResponse
+
+            try:
+                try:
+                    h.request(req.get_method(), req.selector, req.data,
+                              headers,
+                              encode_chunked=req.has_header(
+                                  'Transfer-encoding'))
+                except OSError as err: # timeout error
+                    raise URLError(err)
+                r = h.getresponse()
+            except (URLError, ConnectionError) as exc:
+                h.close()
+                if (reused and replayable and
+                        isinstance(getattr(exc, 'reason', exc),
+                                   ConnectionError)):
+                    # The server closed the idle connection before
+                    # answering: retry on another connection.
+                    continue
+                raise
+            except:
+                h.close()
+                raise
+            break
+
+        if not r.will_close:
+            def release(complete, h=h):
+                if complete:
+                    pool.put(key, h)
+                else:
+                    h.close()
+            r._release_conn = release
+
+        r.url = req.get_full_url()
+        r.msg = r.reason
+        return r
+
+    def close(self):
+        self.pool.clear()
+
+
+class PooledHTTPHandler(_PooledHandlerMixin, HTTPHandler):
+    """HTTP handler which reuses persistent connections.
+
+    Connections are returned to pool once the response body has been read
+    to the end.  A new HTTPConnectionPool is created if pool is None.
+    """
+
+    def __init__(self, debuglevel=0, pool=None):
+        HTTPHandler.__init__(self, debuglevel)
+        if pool is None:
+            pool = HTTPConnectionPool()
+        self.pool = pool
+
+if hasattr(http.client, 'HTTPSConnection'):
+
+    class PooledHTTPSHandler(_PooledHandlerMixin, HTTPSHandler):
+        """HTTPS handler which reuses persistent connections.
+
+        Connections are keyed by host, port, proxy and SSL context, so a
+        connection is never reused with different TLS settings.
+        """
+
+        def __init__(self, debuglevel=0, context=None, check_hostname=None,
+                     pool=None):
+            HTTPSHandler.__init__(self, debuglevel, context, check_hostname)
+            if pool is None:
+                pool = HTTPConnectionPool()
+            self.pool = pool
+
+    __all__.append('PooledHTTPSHandler')
+
 class HTTPCookieProcessor(BaseHandler):
     def __init__(self, cookiejar=None):
         import http.cookiejar
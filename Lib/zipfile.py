@@ -13,6 +13,7 @@ import shutil
 import struct
 import binascii
 import threading
+import collections
 
 try:
     import zlib # We may need its compression method
@@ -664,6 +665,13 @@ compressor_names = {
     98: 'ppmd',
 }
 
+# Size of the chunks compressed by ZipFile.writeall() workers, large
+# enough for the compressors to run with the GIL released, and size above
+# which the compressed data is spooled to disk.
+_WRITE_CHUNK_SIZE = 64 * 1024
+_SPOOL_MAX_SIZE = 1 << 20
+
+
 def _check_compression(compression):
     if compression == ZIP_STORED:
         pass
@@ -716,6 +724,36 @@ def _get_decompressor(compress_type):
             raise NotImplementedError("compression type %d" % (compress_type,))
 
 
+def _compress_file(filename, zinfo):
+    """Compress the contents of filename for ZipFile.writeall() into a
+    temporary file, and set the sizes and CRC of zinfo."""
+    import tempfile
+    compressor = _get_compressor(zinfo.compress_type, zinfo._compresslevel)
+    file_size = crc = 0
+    dest = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE)
+    try:
+        with open(filename, "rb") as src:
+            while True:
+                data = src.read(_WRITE_CHUNK_SIZE)
+                if not data:
+                    break
+                file_size += len(data)
+                crc = crc32(data, crc)
+                if compressor:
+                    data = compressor.compress(data)
+                dest.write(data)
+        if compressor:
+            dest.write(compressor.flush())
+        zinfo.file_size = file_size
+        zinfo.compress_size = dest.tell()
+        zinfo.CRC = crc
+        dest.seek(0)
+    except:
+        dest.close()
+        raise
+    return dest
+
+
 class _SharedFile:
     def __init__(self, file, pos, close, lock, writing):
         self._file = file
@@ -1480,7 +1518,8 @@ class ZipFile:
                     "Close the writing handle before trying to read.")
 
         # Open for reading:
-        self._fileRefCnt += 1
+        with self._lock:
+            self._fileRefCnt += 1
         zef_file = _SharedFile(self.fp, zinfo.header_offset,
                                self._fpclose, self._lock, lambda: self._writing)
         try:
@@ -1603,12 +1642,15 @@ class ZipFile:
 
         return self._extract_member(member, path, pwd)
 
-    def extractall(self, path=None, members=None, pwd=None):
+    def extractall(self, path=None, members=None, pwd=None, *, workers=1):
         """Extract all members from the archive to the current working
            directory. `path' specifies a different directory to extract to.
            `members' is optional and must be a subset of the list returned
-           by namelist().
+           by namelist(). If `workers' is greater than 1, that many threads
+           extract the members concurrently.
         """
+        if workers < 1:
+            raise ValueError("workers must be greater than 0")
         if members is None:
             members = self.namelist()
 
@@ -1617,8 +1659,36 @@ class ZipFile:
         else:
             path = os.fspath(path)
 
-        for zipinfo in members:
-            self._extract_member(zipinfo, path, pwd)
+        if workers == 1:
+            for zipinfo in members:
+                self._extract_member(zipinfo, path, pwd)
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(workers) as executor:
+            pending = collections.deque()
+            targets = set()
+            try:
+                for zipinfo in members:
+                    if not isinstance(zipinfo, ZipInfo):
+                        zipinfo = self.getinfo(zipinfo)
+                    targetpath = self._get_targetpath(zipinfo, path)
+                    if targetpath in targets:
+                        # The same name appears twice: the last member
+                        # wins, as when extracting sequentially.
+                        while pending:
+                            pending.popleft().result()
+                        targets.clear()
+                    elif len(pending) >= 2 * workers:
+                        pending.popleft().result()
+                    targets.add(targetpath)
+                    pending.append(executor.submit(
+                        self._extract_to, zipinfo, targetpath, pwd))
+                while pending:
+                    pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
 
     @classmethod
     def _sanitize_windows_name(cls, arcname, pathsep):
@@ -1642,6 +1712,13 @@ class ZipFile:
         if not isinstance(member, ZipInfo):
             member = self.getinfo(member)
 
+        targetpath = self._get_targetpath(member, targetpath)
+        return self._extract_to(member, targetpath, pwd)
+
+    def _get_targetpath(self, member, targetpath):
+        """Return the path where the ZipInfo object 'member' is extracted
+           in the directory targetpath.
+        """
         # build the destination pathname, replacing
         # forward slashes to platform specific separators.
         arcname = member.filename.replace('/', os.path.sep)
@@ -1659,16 +1736,17 @@ class ZipFile:
             arcname = self._sanitize_windows_name(arcname, os.path.sep)
 
         targetpath = os.path.join(targetpath, arcname)
-        targetpath = os.path.normpath(targetpath)
+        return os.path.normpath(targetpath)
 
-        # Create all upper directories if necessary.
+    def _extract_to(self, member, targetpath, pwd):
+        # Create all upper directories if necessary.  Other threads of
+        # extractall() may be creating them too.
         upperdirs = os.path.dirname(targetpath)
         if upperdirs and not os.path.exists(upperdirs):
-            os.makedirs(upperdirs)
+            os.makedirs(upperdirs, exist_ok=True)
 
         if member.is_dir():
-            if not os.path.isdir(targetpath):
-                os.mkdir(targetpath)
+            os.makedirs(targetpath, exist_ok=True)
             return targetpath
 
         with self.open(member, pwd=pwd) as source, \
@@ -1749,6 +1827,93 @@ class ZipFile:
             with open(filename, "rb") as src, self.open(zinfo, 'w') as dest:
                 shutil.copyfileobj(src, dest, 1024*8)
 
+    def writeall(self, filenames, compress_type=None, compresslevel=None, *,
+                 workers=1):
+        """Put the files from the iterable filenames into the archive.  Its
+        items are file names or (filename, arcname) pairs.  If workers is
+        greater than 1, that many threads compress the files concurrently,
+        and they are added to the archive in order."""
+        if workers < 1:
+            raise ValueError("workers must be greater than 0")
+        if workers == 1:
+            for filename in filenames:
+                arcname = None
+                if isinstance(filename, tuple):
+                    filename, arcname = filename
+                self.write(filename, arcname, compress_type, compresslevel)
+            return
+
+        if not self.fp:
+            raise ValueError(
+                "Attempt to write to ZIP archive that was already closed")
+        if self._writing:
+            raise ValueError(
+                "Can't write to ZIP archive while an open writing handle exists"
+            )
+
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(workers) as executor:
+            pending = collections.deque()
+            try:
+                for filename in filenames:
+                    arcname = None
+                    if isinstance(filename, tuple):
+                        filename, arcname = filename
+                    zinfo = ZipInfo.from_file(
+                        filename, arcname,
+                        strict_timestamps=self._strict_timestamps)
+                    if zinfo.is_dir():
+                        future = None
+                    else:
+                        if compress_type is not None:
+                            zinfo.compress_type = compress_type
+                        else:
+                            zinfo.compress_type = self.compression
+                        if compresslevel is not None:
+                            zinfo._compresslevel = compresslevel
+                        else:
+                            zinfo._compresslevel = self.compresslevel
+                        _check_compression(zinfo.compress_type)
+                        future = executor.submit(_compress_file,
+                                                 filename, zinfo)
+                    pending.append((filename, arcname, zinfo, future))
+                    while len(pending) > 2 * workers:
+                        self._write_pending(*pending.popleft())
+                while pending:
+                    self._write_pending(*pending.popleft())
+            finally:
+                for filename, arcname, zinfo, future in pending:
+                    if future is not None and not future.cancel():
+                        try:
+                            future.result().close()
+                        except Exception:
+                            pass
+
+    def _write_pending(self, filename, arcname, zinfo, future):
+        # Add a member compressed by a writeall() worker to the archive.
+        if future is None:
+            self.write(filename, arcname)
+            return
+        with future.result() as src:
+            zinfo.flag_bits = 0x00
+            if zinfo.compress_type == ZIP_LZMA:
+                # Compressed data includes an end-of-stream (EOS) marker
+                zinfo.flag_bits |= 0x02
+            with self._lock:
+                if self._seekable:
+                    self.fp.seek(self.start_dir)
+                zinfo.header_offset = self.fp.tell()
+                self._writecheck(zinfo)
+                self._didModify = True
+                # Sizes and CRC are known: no data descriptor is needed,
+                # even for unseekable streams.
+                self.fp.write(zinfo.FileHeader(
+                    None if self._allowZip64 else False))
+                shutil.copyfileobj(src, self.fp)
+                self.start_dir = self.fp.tell()
+                self.filelist.append(zinfo)
+                self.NameToInfo[zinfo.filename] = zinfo
+
     def writestr(self, zinfo_or_arcname, data,
                  compress_type=None, compresslevel=None):
         """Write a file into the archive.  The contents is 'data', which
@@ -1919,10 +2084,11 @@ class ZipFile:
         self.fp.flush()
 
     def _fpclose(self, fp):
-        assert self._fileRefCnt > 0
-        self._fileRefCnt -= 1
-        if not self._fileRefCnt and not self._filePassed:
-            fp.close()
+        with self._lock:
+            assert self._fileRefCnt > 0
+            self._fileRefCnt -= 1
+            if not self._fileRefCnt and not self._filePassed:
+                fp.close()
 
 
 class PyZipFile(ZipFile):
@@ -7,14 +7,35 @@ annotated by François Pinard, and converted to C by Raymond Hettinger.
 */
 
 #include "Python.h"
-
-#include "clinic/_heapqmodule.c.h"
+#include "structmember.h"
 
 /*[clinic input]
 module _heapq
 [clinic start generated code]*/
 /*[clinic end generated code: output=da39a3ee5e6b4b0d input=d7cca0a2e4c0ceb3]*/
 
+/* IndexedHeap: a heap of handles, each handle knowing its position so
+   that its item can be removed or changed in O(log n) time. */
+
+typedef struct {
+    PyObject_HEAD
+    PyObject *item;
+    Py_ssize_t index;           /* -1 once removed from the heap */
+} heaphandleobject;
+
+typedef struct {
+    PyObject_HEAD
+    heaphandleobject **handles;
+    Py_ssize_t size;
+    Py_ssize_t allocated;
+    size_t version;             /* incremented by every mutation */
+} indexedheapobject;
+
+static PyTypeObject HeapHandle_Type;
+static PyTypeObject IndexedHeap_Type;
+
+#include "clinic/_heapqmodule.c.h"
+
 static int
 siftdown(PyListObject *heap, Py_ssize_t startpos, Py_ssize_t pos)
 {
@@ -538,6 +559,564 @@ _heapq__heapify_max(PyObject *module, PyObject *heap)
     return heapify_internal(heap, siftup_max);
 }
 
+/* IndexedHeap */
+
+/*[clinic input]
+class _heapq.IndexedHeap "indexedheapobject *" "&IndexedHeap_Type"
+[clinic start generated code]*/
+/*[clinic end generated code: output=da39a3ee5e6b4b0d input=b98c965dbce27e72]*/
+
+static heaphandleobject *
+heaphandle_new(PyObject *item, Py_ssize_t index)
+{
+    heaphandleobject *handle;
+
+    handle = PyObject_GC_New(heaphandleobject, &HeapHandle_Type);
+    if (handle == NULL)
+        return NULL;
+    Py_INCREF(item);
+    handle->item = item;
+    handle->index = index;
+    PyObject_GC_Track(handle);
+    return handle;
+}
+
+static int
+heaphandle_traverse(heaphandleobject *handle, visitproc visit, void *arg)
+{
+    Py_VISIT(handle->item);
+    return 0;
+}
+
+static int
+heaphandle_clear(heaphandleobject *handle)
+{
+    /* The item is replaced rather than cleared: a handle may still be in
+       a heap, whose comparisons expect an item. */
+    PyObject *item = handle->item;
+    Py_INCREF(Py_None);
+    handle->item = Py_None;
+    Py_DECREF(item);
+    return 0;
+}
+
+static void
+heaphandle_dealloc(heaphandleobject *handle)
+{
+    PyObject_GC_UnTrack(handle);
+    Py_XDECREF(handle->item);
+    PyObject_GC_Del(handle);
+}
+
+static PyMemberDef heaphandle_members[] = {
+    {"item", T_OBJECT, offsetof(heaphandleobject, item), READONLY,
+     PyDoc_STR("The item the handle refers to.")},
+    {NULL}
+};
+
+PyDoc_STRVAR(heaphandle_doc,
+"Handle of an item pushed on an IndexedHeap.");
+
+static PyTypeObject HeapHandle_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "heapq.HeapHandle",                 /* tp_name */
+    sizeof(heaphandleobject),           /* tp_basicsize */
+    0,                                  /* tp_itemsize */
+    (destructor)heaphandle_dealloc,     /* tp_dealloc */
+    0,                                  /* tp_print */
+    0,                                  /* tp_getattr */
+    0,                                  /* tp_setattr */
+    0,                                  /* tp_reserved */
+    0,                                  /* tp_repr */
+    0,                                  /* tp_as_number */
+    0,                                  /* tp_as_sequence */
+    0,                                  /* tp_as_mapping */
+    0,                                  /* tp_hash */
+    0,                                  /* tp_call */
+    0,                                  /* tp_str */
+    PyObject_GenericGetAttr,            /* tp_getattro */
+    0,                                  /* tp_setattro */
+    0,                                  /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,    /* tp_flags */
+    heaphandle_doc,                     /* tp_doc */
+    (traverseproc)heaphandle_traverse,  /* tp_traverse */
+    (inquiry)heaphandle_clear,          /* tp_clear */
+    0,                                  /* tp_richcompare */
+    0,                                  /* tp_weaklistoffset */
+    0,                                  /* tp_iter */
+    0,                                  /* tp_iternext */
+    0,                                  /* tp_methods */
+    heaphandle_members,                 /* tp_members */
+};
+
+/* Return 1 if the item of a is less than the item of b, 0 if not and -1
+   on error, in particular if the heap was changed by the comparison. */
+static int
+indexedheap_lt(indexedheapobject *heap, heaphandleobject *a,
+               heaphandleobject *b)
+{
+    PyObject *x = a->item, *y = b->item;
+    size_t version = heap->version;
+    int cmp;
+
+    Py_INCREF(x);
+    Py_INCREF(y);
+    cmp = PyObject_RichCompareBool(x, y, Py_LT);
+    Py_DECREF(x);
+    Py_DECREF(y);
+    if (cmp >= 0 && version != heap->version) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "heap changed during comparison");
+        return -1;
+    }
+    return cmp;
+}
+
+static void
+indexedheap_swap(indexedheapobject *heap, Py_ssize_t i, Py_ssize_t j)
+{
+    heaphandleobject **arr = heap->handles;
+    heaphandleobject *tmp = arr[i];
+
+    arr[i] = arr[j];
+    arr[i]->index = i;
+    arr[j] = tmp;
+    tmp->index = j;
+}
+
+static int
+indexedheap_siftdown(indexedheapobject *heap, Py_ssize_t startpos,
+                     Py_ssize_t pos)
+{
+    Py_ssize_t parentpos;
+    int cmp;
+
+    /* Move the handle up to the root until finding a place it fits.
+       Handles are swapped at each step, so that the heap is consistent
+       whenever a comparison fails. */
+    while (pos > startpos) {
+        parentpos = (pos - 1) >> 1;
+        cmp = indexedheap_lt(heap, heap->handles[pos],
+                             heap->handles[parentpos]);
+        if (cmp < 0)
+            return -1;
+        if (cmp == 0)
+            break;
+        indexedheap_swap(heap, pos, parentpos);
+        pos = parentpos;
+    }
+    return 0;
+}
+
+static int
+indexedheap_siftup(indexedheapobject *heap, Py_ssize_t pos)
+{
+    Py_ssize_t startpos = pos, endpos = heap->size, childpos, limit;
+    int cmp;
+
+    /* Bubble up the smaller child until hitting a leaf. */
+    limit = endpos >> 1;
+    while (pos < limit) {
+        childpos = 2*pos + 1;
+        if (childpos + 1 < endpos) {
+            cmp = indexedheap_lt(heap, heap->handles[childpos],
+                                 heap->handles[childpos + 1]);
+            if (cmp < 0)
+                return -1;
+            childpos += ((unsigned)cmp ^ 1);
+        }
+        indexedheap_swap(heap, pos, childpos);
+        pos = childpos;
+    }
+    /* Bubble it up to its final resting place. */
+    return indexedheap_siftdown(heap, startpos, pos);
+}
+
+static int
+indexedheap_append(indexedheapobject *heap, PyObject *item)
+{
+    heaphandleobject *handle, **handles;
+    Py_ssize_t allocated;
+
+    if (heap->size == heap->allocated) {
+        allocated = heap->size + (heap->size >> 3) + 8;
+        handles = PyMem_Resize(heap->handles, heaphandleobject *, allocated);
+        if (handles == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        heap->handles = handles;
+        heap->allocated = allocated;
+    }
+    handle = heaphandle_new(item, heap->size);
+    if (handle == NULL)
+        return -1;
+    heap->version++;
+    heap->handles[heap->size++] = handle;
+    return 0;
+}
+
+static void
+indexedheap_clear_handles(indexedheapobject *heap)
+{
+    heaphandleobject **handles = heap->handles;
+    Py_ssize_t i, size = heap->size;
+
+    /* Detach the array first: releasing a handle may run arbitrary code
+       using the heap. */
+    heap->version++;
+    heap->handles = NULL;
+    heap->size = heap->allocated = 0;
+    for (i = 0; i < size; i++) {
+        handles[i]->index = -1;
+        Py_DECREF(handles[i]);
+    }
+    PyMem_Free(handles);
+}
+
+static PyObject *
+indexedheap_remove_at(indexedheapobject *heap, Py_ssize_t pos)
+{
+    heaphandleobject *handle = heap->handles[pos], *last;
+    PyObject *item;
+    int err = 0;
+
+    heap->version++;
+    last = heap->handles[--heap->size];
+    handle->index = -1;
+    item = handle->item;
+    Py_INCREF(item);
+    if (last != handle) {
+        heap->handles[pos] = last;
+        last->index = pos;
+        err = indexedheap_siftup(heap, pos);
+        if (!err)
+            err = indexedheap_siftdown(heap, 0, last->index);
+    }
+    Py_DECREF(handle);
+    if (err) {
+        Py_DECREF(item);
+        return NULL;
+    }
+    return item;
+}
+
+static int
+indexedheap_contains(indexedheapobject *heap, PyObject *handle)
+{
+    Py_ssize_t index;
+
+    if (!PyObject_TypeCheck(handle, &HeapHandle_Type))
+        return 0;
+    index = ((heaphandleobject *)handle)->index;
+    return (0 <= index && index < heap->size &&
+            heap->handles[index] == (heaphandleobject *)handle);
+}
+
+static PyObject *
+indexedheap_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    indexedheapobject *heap;
+
+    heap = (indexedheapobject *)type->tp_alloc(type, 0);
+    if (heap == NULL)
+        return NULL;
+    heap->handles = NULL;
+    heap->size = heap->allocated = 0;
+    heap->version = 0;
+    return (PyObject *)heap;
+}
+
+/*[clinic input]
+_heapq.IndexedHeap.__init__
+
+    iterable: object(c_default="NULL") = ()
+
+Heap whose items can be removed or changed through handles.
+
+push() returns a handle which can later be passed to remove() or
+update(), both taking O(log n) time, like push() and pop().  The
+items are compared with the < operator, as for heappush().
+[clinic start generated code]*/
+
+static int
+_heapq_IndexedHeap___init___impl(indexedheapobject *self, PyObject *iterable)
+/*[clinic end generated code: output=e12a029f10cd2c7e input=ba30ecc89e01444f]*/
+{
+    PyObject *it, *item;
+    Py_ssize_t i;
+
+    indexedheap_clear_handles(self);
+    if (iterable == NULL)
+        return 0;
+    it = PyObject_GetIter(iterable);
+    if (it == NULL)
+        return -1;
+    while ((item = PyIter_Next(it)) != NULL) {
+        if (indexedheap_append(self, item) < 0) {
+            Py_DECREF(item);
+            Py_DECREF(it);
+            return -1;
+        }
+        Py_DECREF(item);
+    }
+    Py_DECREF(it);
+    if (PyErr_Occurred())
+        return -1;
+    for (i = self->size / 2 - 1; i >= 0; i--) {
+        if (indexedheap_siftup(self, i) < 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int
+indexedheap_traverse(indexedheapobject *heap, visitproc visit, void *arg)
+{
+    Py_ssize_t i;
+
+    for (i = 0; i < heap->size; i++)
+        Py_VISIT(heap->handles[i]);
+    return 0;
+}
+
+static int
+indexedheap_tp_clear(indexedheapobject *heap)
+{
+    indexedheap_clear_handles(heap);
+    return 0;
+}
+
+static void
+indexedheap_dealloc(indexedheapobject *heap)
+{
+    PyObject_GC_UnTrack(heap);
+    indexedheap_clear_handles(heap);
+    Py_TYPE(heap)->tp_free(heap);
+}
+
+static Py_ssize_t
+indexedheap_length(indexedheapobject *heap)
+{
+    return heap->size;
+}
+
+static PyObject *
+indexedheap_iter(indexedheapobject *heap)
+{
+    PyObject *items, *it;
+    Py_ssize_t i;
+
+    items = PyList_New(heap->size);
+    if (items == NULL)
+        return NULL;
+    for (i = 0; i < heap->size; i++) {
+        Py_INCREF(heap->handles[i]->item);
+        PyList_SET_ITEM(items, i, heap->handles[i]->item);
+    }
+    it = PyObject_GetIter(items);
+    Py_DECREF(items);
+    return it;
+}
+
+/*[clinic input]
+_heapq.IndexedHeap.push
+
+    item: object
+    /
+
+Push item onto the heap and return its handle.
+[clinic start generated code]*/
+
+static PyObject *
+_heapq_IndexedHeap_push(indexedheapobject *self, PyObject *item)
+/*[clinic end generated code: output=570cbd248de0f959 input=a0a595a96aa9f970]*/
+{
+    heaphandleobject *handle;
+
+    if (indexedheap_append(self, item) < 0)
+        return NULL;
+    handle = self->handles[self->size - 1];
+    Py_INCREF(handle);
+    if (indexedheap_siftdown(self, 0, self->size - 1) < 0) {
+        Py_DECREF(handle);
+        return NULL;
+    }
+    return (PyObject *)handle;
+}
+
+/*[clinic input]
+_heapq.IndexedHeap.peek
+
+Return the smallest item without removing it.
+[clinic start generated code]*/
+
+static PyObject *
+_heapq_IndexedHeap_peek_impl(indexedheapobject *self)
+/*[clinic end generated code: output=8c427b24020f8892 input=9dab24fa48ef611d]*/
+{
+    if (self->size == 0) {
+        PyErr_SetString(PyExc_IndexError, "peek at empty heap");
+        return NULL;
+    }
+    Py_INCREF(self->handles[0]->item);
+    return self->handles[0]->item;
+}
+
+/*[clinic input]
+_heapq.IndexedHeap.pop
+
+Remove and return the smallest item.
+[clinic start generated code]*/
+
+static PyObject *
+_heapq_IndexedHeap_pop_impl(indexedheapobject *self)
+/*[clinic end generated code: output=31b324b9574aed67 input=2109d4641579d1b6]*/
+{
+    if (self->size == 0) {
+        PyErr_SetString(PyExc_IndexError, "pop from empty heap");
+        return NULL;
+    }
+    return indexedheap_remove_at(self, 0);
+}
+
+/*[clinic input]
+_heapq.IndexedHeap.remove
+
+    handle: object
+    /
+
+Remove the item of handle from the heap and return it.
+[clinic start generated code]*/
+
+static PyObject *
+_heapq_IndexedHeap_remove(indexedheapobject *self, PyObject *handle)
+/*[clinic end generated code: output=6d9ce68d11e1200c input=e8f60cf198b22862]*/
+{
+    if (!indexedheap_contains(self, handle)) {
+        PyErr_SetString(PyExc_ValueError, "handle is not in the heap");
+        return NULL;
+    }
+    return indexedheap_remove_at(self,
+                                 ((heaphandleobject *)handle)->index);
+}
+
+/*[clinic input]
+_heapq.IndexedHeap.update
+
+    handle: object
+    item: object
+    /
+
+Replace the item of handle and restore the heap invariant.
+[clinic start generated code]*/
+
+static PyObject *
+_heapq_IndexedHeap_update_impl(indexedheapobject *self, PyObject *handle,
+                               PyObject *item)
+/*[clinic end generated code: output=992ccd3077004002 input=2c72bffad6123e13]*/
+{
+    heaphandleobject *h = (heaphandleobject *)handle;
+    PyObject *olditem;
+    int err;
+
+    if (!indexedheap_contains(self, handle)) {
+        PyErr_SetString(PyExc_ValueError, "handle is not in the heap");
+        return NULL;
+    }
+    self->version++;
+    olditem = h->item;
+    Py_INCREF(item);
+    h->item = item;
+    Py_INCREF(h);
+    err = indexedheap_siftup(self, h->index);
+    if (!err)
+        err = indexedheap_siftdown(self, 0, h->index);
+    Py_DECREF(h);
+    Py_DECREF(olditem);
+    if (err)
+        return NULL;
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+_heapq.IndexedHeap.clear
+
+Remove all items.
+[clinic start generated code]*/
+
+static PyObject *
+_heapq_IndexedHeap_clear_impl(indexedheapobject *self)
+/*[clinic end generated code: output=81cdf8812fb334eb input=4a20d9f985a42ff9]*/
+{
+    indexedheap_clear_handles(self);
+    Py_RETURN_NONE;
+}
+
+static PySequenceMethods indexedheap_as_sequence = {
+    (lenfunc)indexedheap_length,        /* sq_length */
+    0,                                  /* sq_concat */
+    0,                                  /* sq_repeat */
+    0,                                  /* sq_item */
+    0,                                  /* sq_slice */
+    0,                                  /* sq_ass_item */
+    0,                                  /* sq_ass_slice */
+    (objobjproc)indexedheap_contains,   /* sq_contains */
+};
+
+static PyMethodDef indexedheap_methods[] = {
+    _HEAPQ_INDEXEDHEAP_PUSH_METHODDEF
+    _HEAPQ_INDEXEDHEAP_PEEK_METHODDEF
+    _HEAPQ_INDEXEDHEAP_POP_METHODDEF
+    _HEAPQ_INDEXEDHEAP_REMOVE_METHODDEF
+    _HEAPQ_INDEXEDHEAP_UPDATE_METHODDEF
+    _HEAPQ_INDEXEDHEAP_CLEAR_METHODDEF
+    {NULL, NULL}           /* sentinel */
+};
+
+static PyTypeObject IndexedHeap_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "heapq.IndexedHeap",                /* tp_name */
+    sizeof(indexedheapobject),          /* tp_basicsize */
+    0,                                  /* tp_itemsize */
+    (destructor)indexedheap_dealloc,    /* tp_dealloc */
+    0,                                  /* tp_print */
+    0,                                  /* tp_getattr */
+    0,                                  /* tp_setattr */
+    0,                                  /* tp_reserved */
+    0,                                  /* tp_repr */
+    0,                                  /* tp_as_number */
+    &indexedheap_as_sequence,           /* tp_as_sequence */
+    0,                                  /* tp_as_mapping */
+    0,                                  /* tp_hash */
+    0,                                  /* tp_call */
+    0,                                  /* tp_str */
+    PyObject_GenericGetAttr,            /* tp_getattro */
+    0,                                  /* tp_setattro */
+    0,                                  /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_GC,
+                                        /* tp_flags */
+    _heapq_IndexedHeap___init____doc__, /* tp_doc */
+    (traverseproc)indexedheap_traverse, /* tp_traverse */
+    (inquiry)indexedheap_tp_clear,      /* tp_clear */
+    0,                                  /* tp_richcompare */
+    0,                                  /* tp_weaklistoffset */
+    (getiterfunc)indexedheap_iter,      /* tp_iter */
+    0,                                  /* tp_iternext */
+    indexedheap_methods,                /* tp_methods */
+    0,                                  /* tp_members */
+    0,                                  /* tp_getset */
+    0,                                  /* tp_base */
+    0,                                  /* tp_dict */
+    0,                                  /* tp_descr_get */
+    0,                                  /* tp_descr_set */
+    0,                                  /* tp_dictoffset */
+    _heapq_IndexedHeap___init__,        /* tp_init */
+    PyType_GenericAlloc,                /* tp_alloc */
+    indexedheap_new,                    /* tp_new */
+    PyObject_GC_Del,                    /* tp_free */
+};
+
 
 static PyMethodDef heapq_methods[] = {
     _HEAPQ_HEAPPUSH_METHODDEF
@@ -694,11 +1273,19 @@ PyInit__heapq(void)
 {
     PyObject *m, *about;
 
+    if (PyType_Ready(&HeapHandle_Type) < 0)
+        return NULL;
+    if (PyType_Ready(&IndexedHeap_Type) < 0)
+        return NULL;
     m = PyModule_Create(&_heapqmodule);
     if (m == NULL)
         return NULL;
     about = PyUnicode_DecodeUTF8(__about__, strlen(__about__), NULL);
     PyModule_AddObject(m, "__about__", about);
+    Py_INCREF(&HeapHandle_Type);
+    PyModule_AddObject(m, "HeapHandle", (PyObject *)&HeapHandle_Type);
+    Py_INCREF(&IndexedHeap_Type);
+    PyModule_AddObject(m, "IndexedHeap", (PyObject *)&IndexedHeap_Type);
     return m;
 }
 
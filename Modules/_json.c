@@ -70,6 +70,17 @@ static PyMemberDef encoder_members[] = {
     {NULL}
 };
 
+/* Output of the encoder.  The encoded pieces are accumulated in acc.  When
+ * write is not NULL, they are joined and passed to it every
+ * ENCODER_WRITE_PIECES pieces instead of being kept until the end.
+ */
+typedef struct {
+    _PyAccu acc;
+    PyObject *write;
+} EncoderOutput;
+
+#define ENCODER_WRITE_PIECES 8192
+
 static PyObject *
 join_list_unicode(PyObject *lst)
 {
@@ -107,11 +118,11 @@ encoder_dealloc(PyObject *self);
 static int
 encoder_clear(PyObject *self);
 static int
-encoder_listencode_list(PyEncoderObject *s, _PyAccu *acc, PyObject *seq, Py_ssize_t indent_level);
+encoder_listencode_list(PyEncoderObject *s, EncoderOutput *acc, PyObject *seq, Py_ssize_t indent_level);
 static int
-encoder_listencode_obj(PyEncoderObject *s, _PyAccu *acc, PyObject *obj, Py_ssize_t indent_level);
+encoder_listencode_obj(PyEncoderObject *s, EncoderOutput *acc, PyObject *obj, Py_ssize_t indent_level);
 static int
-encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc, PyObject *dct, Py_ssize_t indent_level);
+encoder_listencode_dict(PyEncoderObject *s, EncoderOutput *acc, PyObject *dct, Py_ssize_t indent_level);
 static PyObject *
 _encoded_const(PyObject *obj);
 static void
@@ -610,6 +621,83 @@ py_scanstring(PyObject* self UNUSED, PyObject *args)
     return _build_rval_index_tuple(rval, next_end);
 }
 
+PyDoc_STRVAR(pydoc_scan_structure,
+    "scan_structure(string, end, depth=0, state=0) -> (end, depth, state)\n"
+    "\n"
+    "Scan string from index end, following the nesting of JSON arrays,\n"
+    "objects and strings without decoding them.  depth is the number of\n"
+    "arrays and objects currently open and state is 0 outside strings,\n"
+    "1 inside a string and 2 after a backslash inside a string.\n"
+    "\n"
+    "Returns the index after the character which completes the value being\n"
+    "scanned (the closing bracket or quote bringing depth back to 0), or -1\n"
+    "with the depth and state at the end of string if it is incomplete."
+);
+
+static PyObject *
+py_scan_structure(PyObject* self UNUSED, PyObject *args)
+{
+    PyObject *pystr;
+    Py_ssize_t idx, len;
+    Py_ssize_t depth = 0;
+    int state = 0;
+    void *buf;
+    int kind;
+
+    if (!PyArg_ParseTuple(args, "On|ni:scan_structure",
+                          &pystr, &idx, &depth, &state)) {
+        return NULL;
+    }
+    if (!PyUnicode_Check(pystr)) {
+        PyErr_Format(PyExc_TypeError,
+                     "first argument must be a string, not %.80s",
+                     Py_TYPE(pystr)->tp_name);
+        return NULL;
+    }
+    if (PyUnicode_READY(pystr) == -1)
+        return NULL;
+    len = PyUnicode_GET_LENGTH(pystr);
+    if (idx < 0 || idx > len) {
+        PyErr_SetString(PyExc_ValueError, "end is out of bounds");
+        return NULL;
+    }
+    if (depth < 0 || state < 0 || state > 2) {
+        PyErr_SetString(PyExc_ValueError, "invalid scan state");
+        return NULL;
+    }
+    buf = PyUnicode_DATA(pystr);
+    kind = PyUnicode_KIND(pystr);
+    for (; idx < len; idx++) {
+        Py_UCS4 c = PyUnicode_READ(kind, buf, idx);
+        if (state == 2) {
+            state = 1;
+        }
+        else if (state == 1) {
+            if (c == '\\') {
+                state = 2;
+            }
+            else if (c == '"') {
+                state = 0;
+                if (depth == 0) {
+                    return Py_BuildValue("nni", idx + 1, depth, state);
+                }
+            }
+        }
+        else if (c == '"') {
+            state = 1;
+        }
+        else if (c == '[' || c == '{') {
+            depth++;
+        }
+        else if (c == ']' || c == '}') {
+            if (--depth <= 0) {
+                return Py_BuildValue("nni", idx + 1, (Py_ssize_t)0, state);
+            }
+        }
+    }
+    return Py_BuildValue("nni", (Py_ssize_t)-1, depth, state);
+}
+
 PyDoc_STRVAR(pydoc_encode_basestring_ascii,
     "encode_basestring_ascii(string) -> string\n"
     "\n"
@@ -1341,28 +1429,67 @@ encoder_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     return (PyObject *)s;
 }
 
+static int
+encoder_write(EncoderOutput *out)
+{
+    /* Pass the pending pieces to out->write as a single string */
+    PyObject *chunk, *res;
+
+    if (PyList_GET_SIZE(out->acc.small) == 0 && out->acc.large == NULL)
+        return 0;
+    chunk = _PyAccu_Finish(&out->acc);
+    if (chunk == NULL)
+        return -1;
+    res = PyObject_CallFunctionObjArgs(out->write, chunk, NULL);
+    Py_DECREF(chunk);
+    if (res == NULL)
+        return -1;
+    Py_DECREF(res);
+    return _PyAccu_Init(&out->acc);
+}
+
+static int
+encoder_accumulate(EncoderOutput *out, PyObject *unicode)
+{
+    if (_PyAccu_Accumulate(&out->acc, unicode))
+        return -1;
+    if (out->write != NULL &&
+        PyList_GET_SIZE(out->acc.small) >= ENCODER_WRITE_PIECES)
+        return encoder_write(out);
+    return 0;
+}
+
 static PyObject *
 encoder_call(PyObject *self, PyObject *args, PyObject *kwds)
 {
     /* Python callable interface to encode_listencode_obj */
-    static char *kwlist[] = {"obj", "_current_indent_level", NULL};
+    static char *kwlist[] = {"obj", "_current_indent_level", "write", NULL};
     PyObject *obj;
     Py_ssize_t indent_level;
+    PyObject *write = Py_None;
     PyEncoderObject *s;
-    _PyAccu acc;
+    EncoderOutput out;
 
     assert(PyEncoder_Check(self));
     s = (PyEncoderObject *)self;
-    if (!PyArg_ParseTupleAndKeywords(args, kwds, "On:_iterencode", kwlist,
-        &obj, &indent_level))
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "On|O:_iterencode", kwlist,
+        &obj, &indent_level, &write))
         return NULL;
-    if (_PyAccu_Init(&acc))
+    out.write = (write == Py_None) ? NULL : write;
+    if (_PyAccu_Init(&out.acc))
         return NULL;
-    if (encoder_listencode_obj(s, &acc, obj, indent_level)) {
-        _PyAccu_Destroy(&acc);
+    if (encoder_listencode_obj(s, &out, obj, indent_level)) {
+        _PyAccu_Destroy(&out.acc);
         return NULL;
     }
-    return _PyAccu_FinishAsList(&acc);
+    if (out.write == NULL)
+        return _PyAccu_FinishAsList(&out.acc);
+    if (encoder_write(&out)) {
+        _PyAccu_Destroy(&out.acc);
+        return NULL;
+    }
+    _PyAccu_Destroy(&out.acc);
+    Py_RETURN_NONE;
 }
 
 static PyObject *
@@ -1446,16 +1573,16 @@ encoder_encode_string(PyEncoderObject *s, PyObject *obj)
 }
 
 static int
-_steal_accumulate(_PyAccu *acc, PyObject *stolen)
+_steal_accumulate(EncoderOutput *acc, PyObject *stolen)
 {
     /* Append stolen and then decrement its reference count */
-    int rval = _PyAccu_Accumulate(acc, stolen);
+    int rval = encoder_accumulate(acc, stolen);
     Py_DECREF(stolen);
     return rval;
 }
 
 static int
-encoder_listencode_obj(PyEncoderObject *s, _PyAccu *acc,
+encoder_listencode_obj(PyEncoderObject *s, EncoderOutput *acc,
                        PyObject *obj, Py_ssize_t indent_level)
 {
     /* Encode Python object obj to a JSON term */
@@ -1551,7 +1678,7 @@ encoder_listencode_obj(PyEncoderObject *s, _PyAccu *acc,
 }
 
 static int
-encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
+encoder_listencode_dict(PyEncoderObject *s, EncoderOutput *acc,
                         PyObject *dct, Py_ssize_t indent_level)
 {
     /* Encode Python dict dct a JSON term */
@@ -1573,7 +1700,7 @@ encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
             return -1;
     }
     if (PyDict_GET_SIZE(dct) == 0)  /* Fast path */
-        return _PyAccu_Accumulate(acc, empty_dict);
+        return encoder_accumulate(acc, empty_dict);
 
     if (s->markers != Py_None) {
         int has_key;
@@ -1591,7 +1718,7 @@ encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
         }
     }
 
-    if (_PyAccu_Accumulate(acc, open_dict))
+    if (encoder_accumulate(acc, open_dict))
         goto bail;
 
     if (s->indent != Py_None) {
@@ -1657,7 +1784,7 @@ encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
         }
 
         if (idx) {
-            if (_PyAccu_Accumulate(acc, s->item_separator))
+            if (encoder_accumulate(acc, s->item_separator))
                 goto bail;
         }
 
@@ -1665,12 +1792,12 @@ encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
         Py_CLEAR(kstr);
         if (encoded == NULL)
             goto bail;
-        if (_PyAccu_Accumulate(acc, encoded)) {
+        if (encoder_accumulate(acc, encoded)) {
             Py_DECREF(encoded);
             goto bail;
         }
         Py_DECREF(encoded);
-        if (_PyAccu_Accumulate(acc, s->key_separator))
+        if (encoder_accumulate(acc, s->key_separator))
             goto bail;
 
         value = PyTuple_GET_ITEM(item, 1);
@@ -1694,7 +1821,7 @@ encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
 
         yield '\n' + (' ' * (_indent * _current_indent_level))
     }*/
-    if (_PyAccu_Accumulate(acc, close_dict))
+    if (encoder_accumulate(acc, close_dict))
         goto bail;
     return 0;
 
@@ -1708,7 +1835,7 @@ bail:
 
 
 static int
-encoder_listencode_list(PyEncoderObject *s, _PyAccu *acc,
+encoder_listencode_list(PyEncoderObject *s, EncoderOutput *acc,
                         PyObject *seq, Py_ssize_t indent_level)
 {
     /* Encode Python list seq to a JSON term */
@@ -1732,7 +1859,7 @@ encoder_listencode_list(PyEncoderObject *s, _PyAccu *acc,
         return -1;
     if (PySequence_Fast_GET_SIZE(s_fast) == 0) {
         Py_DECREF(s_fast);
-        return _PyAccu_Accumulate(acc, empty_array);
+        return encoder_accumulate(acc, empty_array);
     }
 
     if (s->markers != Py_None) {
@@ -1751,7 +1878,7 @@ encoder_listencode_list(PyEncoderObject *s, _PyAccu *acc,
         }
     }
 
-    if (_PyAccu_Accumulate(acc, open_array))
+    if (encoder_accumulate(acc, open_array))
         goto bail;
     if (s->indent != Py_None) {
         /* TODO: DOES NOT RUN */
@@ -1765,7 +1892,7 @@ encoder_listencode_list(PyEncoderObject *s, _PyAccu *acc,
     for (i = 0; i < PySequence_Fast_GET_SIZE(s_fast); i++) {
         PyObject *obj = PySequence_Fast_GET_ITEM(s_fast, i);
         if (i) {
-            if (_PyAccu_Accumulate(acc, s->item_separator))
+            if (encoder_accumulate(acc, s->item_separator))
                 goto bail;
         }
         if (encoder_listencode_obj(s, acc, obj, indent_level))
@@ -1783,7 +1910,7 @@ encoder_listencode_list(PyEncoderObject *s, _PyAccu *acc,
 
         yield '\n' + (' ' * (_indent * _current_indent_level))
     }*/
-    if (_PyAccu_Accumulate(acc, close_array))
+    if (encoder_accumulate(acc, close_array))
         goto bail;
     Py_DECREF(s_fast);
     return 0;
@@ -1834,7 +1961,10 @@ encoder_clear(PyObject *self)
     return 0;
 }
 
-PyDoc_STRVAR(encoder_doc, "_iterencode(obj, _current_indent_level) -> iterable");
+PyDoc_STRVAR(encoder_doc,
+"_iterencode(obj, _current_indent_level, write=None) -> iterable\n\n"
+"If write is given, the encoded data is passed to it by large chunks\n"
+"and None is returned.");
 
 static
 PyTypeObject PyEncoderType = {
@@ -1892,6 +2022,10 @@ static PyMethodDef speedups_methods[] = {
         (PyCFunction)py_scanstring,
         METH_VARARGS,
         pydoc_scanstring},
+    {"scan_structure",
+        (PyCFunction)py_scan_structure,
+        METH_VARARGS,
+        pydoc_scan_structure},
     {NULL, NULL, 0, NULL}
 };
 
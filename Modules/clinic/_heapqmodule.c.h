@@ -169,4 +169,138 @@ PyDoc_STRVAR(_heapq__heapify_max__doc__,
 
 #define _HEAPQ__HEAPIFY_MAX_METHODDEF    \
     {"_heapify_max", (PyCFunction)_heapq__heapify_max, METH_O, _heapq__heapify_max__doc__},
-/*[clinic end generated code: output=0bb0dd0df473ab14 input=a9049054013a1b77]*/
+
+PyDoc_STRVAR(_heapq_IndexedHeap___init____doc__,
+"IndexedHeap(iterable=())\n"
+"--\n"
+"\n"
+"Heap whose items can be removed or changed through handles.\n"
+"\n"
+"push() returns a handle which can later be passed to remove() or\n"
+"update(), both taking O(log n) time, like push() and pop().  The\n"
+"items are compared with the < operator, as for heappush().");
+
+static int
+_heapq_IndexedHeap___init___impl(indexedheapobject *self, PyObject *iterable);
+
+static int
+_heapq_IndexedHeap___init__(PyObject *self, PyObject *args, PyObject *kwargs)
+{
+    int return_value = -1;
+    static const char * const _keywords[] = {"iterable", NULL};
+    static _PyArg_Parser _parser = {"|O:IndexedHeap", _keywords, 0};
+    PyObject *iterable = NULL;
+
+    if (!_PyArg_ParseTupleAndKeywordsFast(args, kwargs, &_parser,
+        &iterable)) {
+        goto exit;
+    }
+    return_value = _heapq_IndexedHeap___init___impl((indexedheapobject *)self, iterable);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_heapq_IndexedHeap_push__doc__,
+"push($self, item, /)\n"
+"--\n"
+"\n"
+"Push item onto the heap and return its handle.");
+
+#define _HEAPQ_INDEXEDHEAP_PUSH_METHODDEF    \
+    {"push", (PyCFunction)_heapq_IndexedHeap_push, METH_O, _heapq_IndexedHeap_push__doc__},
+
+PyDoc_STRVAR(_heapq_IndexedHeap_peek__doc__,
+"peek($self, /)\n"
+"--\n"
+"\n"
+"Return the smallest item without removing it.");
+
+#define _HEAPQ_INDEXEDHEAP_PEEK_METHODDEF    \
+    {"peek", (PyCFunction)_heapq_IndexedHeap_peek, METH_NOARGS, _heapq_IndexedHeap_peek__doc__},
+
+static PyObject *
+_heapq_IndexedHeap_peek_impl(indexedheapobject *self);
+
+static PyObject *
+_heapq_IndexedHeap_peek(indexedheapobject *self, PyObject *Py_UNUSED(ignored))
+{
+    return _heapq_IndexedHeap_peek_impl(self);
+}
+
+PyDoc_STRVAR(_heapq_IndexedHeap_pop__doc__,
+"pop($self, /)\n"
+"--\n"
+"\n"
+"Remove and return the smallest item.");
+
+#define _HEAPQ_INDEXEDHEAP_POP_METHODDEF    \
+    {"pop", (PyCFunction)_heapq_IndexedHeap_pop, METH_NOARGS, _heapq_IndexedHeap_pop__doc__},
+
+static PyObject *
+_heapq_IndexedHeap_pop_impl(indexedheapobject *self);
+
+static PyObject *
+_heapq_IndexedHeap_pop(indexedheapobject *self, PyObject *Py_UNUSED(ignored))
+{
+    return _heapq_IndexedHeap_pop_impl(self);
+}
+
+PyDoc_STRVAR(_heapq_IndexedHeap_remove__doc__,
+"remove($self, handle, /)\n"
+"--\n"
+"\n"
+"Remove the item of handle from the heap and return it.");
+
+#define _HEAPQ_INDEXEDHEAP_REMOVE_METHODDEF    \
+    {"remove", (PyCFunction)_heapq_IndexedHeap_remove, METH_O, _heapq_IndexedHeap_remove__doc__},
+
+PyDoc_STRVAR(_heapq_IndexedHeap_update__doc__,
+"update($self, handle, item, /)\n"
+"--\n"
+"\n"
+"Replace the item of handle and restore the heap invariant.");
+
+#define _HEAPQ_INDEXEDHEAP_UPDATE_METHODDEF    \
+    {"update", (PyCFunction)_heapq_IndexedHeap_update, METH_FASTCALL, _heapq_IndexedHeap_update__doc__},
+
+static PyObject *
+_heapq_IndexedHeap_update_impl(indexedheapobject *self, PyObject *handle,
+                               PyObject *item);
+
+static PyObject *
+_heapq_IndexedHeap_update(indexedheapobject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    PyObject *handle;
+    PyObject *item;
+
+    if (!_PyArg_UnpackStack(args, nargs, "update",
+        2, 2,
+        &handle, &item)) {
+        goto exit;
+    }
+    return_value = _heapq_IndexedHeap_update_impl(self, handle, item);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_heapq_IndexedHeap_clear__doc__,
+"clear($self, /)\n"
+"--\n"
+"\n"
+"Remove all items.");
+
+#define _HEAPQ_INDEXEDHEAP_CLEAR_METHODDEF    \
+    {"clear", (PyCFunction)_heapq_IndexedHeap_clear, METH_NOARGS, _heapq_IndexedHeap_clear__doc__},
+
+static PyObject *
+_heapq_IndexedHeap_clear_impl(indexedheapobject *self);
+
+static PyObject *
+_heapq_IndexedHeap_clear(indexedheapobject *self, PyObject *Py_UNUSED(ignored))
+{
+    return _heapq_IndexedHeap_clear_impl(self);
+}
+/*[clinic end generated code: output=222e17a871e15d44 input=a9049054013a1b77]*/
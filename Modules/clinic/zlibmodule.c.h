@@ -230,7 +230,7 @@ exit:
 }
 
 PyDoc_STRVAR(zlib_Decompress_decompress__doc__,
-"decompress($self, data, /, max_length=0)\n"
+"decompress($self, data, /, max_length=0, mode=zlib.Z_SYNC_FLUSH)\n"
 "--\n"
 "\n"
 "Return a bytes object containing the decompressed version of the data.\n"
@@ -241,6 +241,10 @@ PyDoc_STRVAR(zlib_Decompress_decompress__doc__,
 "    The maximum allowable length of the decompressed data.\n"
 "    Unconsumed input data will be stored in\n"
 "    the unconsumed_tail attribute.\n"
+"  mode\n"
+"    The flush mode passed to zlib\'s inflate().  With Z_BLOCK or\n"
+"    Z_TREES, decompression stops at the next deflate block boundary;\n"
+"    see the data_type attribute.\n"
 "\n"
 "After calling this function, some of the input data may still be stored in\n"
 "internal buffers for later processing.\n"
@@ -251,22 +255,23 @@ PyDoc_STRVAR(zlib_Decompress_decompress__doc__,
 
 static PyObject *
 zlib_Decompress_decompress_impl(compobject *self, Py_buffer *data,
-                                Py_ssize_t max_length);
+                                Py_ssize_t max_length, int mode);
 
 static PyObject *
 zlib_Decompress_decompress(compobject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
     PyObject *return_value = NULL;
-    static const char * const _keywords[] = {"", "max_length", NULL};
-    static _PyArg_Parser _parser = {"y*|O&:decompress", _keywords, 0};
+    static const char * const _keywords[] = {"", "max_length", "mode", NULL};
+    static _PyArg_Parser _parser = {"y*|O&i:decompress", _keywords, 0};
     Py_buffer data = {NULL, NULL};
     Py_ssize_t max_length = 0;
+    int mode = Z_SYNC_FLUSH;
 
     if (!_PyArg_ParseStackAndKeywords(args, nargs, kwnames, &_parser,
-        &data, ssize_t_converter, &max_length)) {
+        &data, ssize_t_converter, &max_length, &mode)) {
         goto exit;
     }
-    return_value = zlib_Decompress_decompress_impl(self, &data, max_length);
+    return_value = zlib_Decompress_decompress_impl(self, &data, max_length, mode);
 
 exit:
     /* Cleanup for data */
@@ -421,6 +426,43 @@ PyDoc_STRVAR(zlib_Decompress___deepcopy____doc__,
 
 #endif /* defined(HAVE_ZLIB_COPY) */
 
+PyDoc_STRVAR(zlib_Decompress_prime__doc__,
+"prime($self, bits, value, /)\n"
+"--\n"
+"\n"
+"Insert bits in the input stream, before the next data to decompress.\n"
+"\n"
+"  bits\n"
+"    Number of bits to insert, from 0 to 16.\n"
+"  value\n"
+"    The bits to insert, in its low-order bits.\n"
+"\n"
+"This allows resuming decompression of a raw deflate stream in the middle\n"
+"of a byte, at a block boundary found with the Z_BLOCK mode of decompress().");
+
+#define ZLIB_DECOMPRESS_PRIME_METHODDEF    \
+    {"prime", (PyCFunction)zlib_Decompress_prime, METH_FASTCALL, zlib_Decompress_prime__doc__},
+
+static PyObject *
+zlib_Decompress_prime_impl(compobject *self, int bits, int value);
+
+static PyObject *
+zlib_Decompress_prime(compobject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    int bits;
+    int value;
+
+    if (!_PyArg_ParseStack(args, nargs, "ii:prime",
+        &bits, &value)) {
+        goto exit;
+    }
+    return_value = zlib_Decompress_prime_impl(self, bits, value);
+
+exit:
+    return return_value;
+}
+
 PyDoc_STRVAR(zlib_Decompress_flush__doc__,
 "flush($self, length=zlib.DEF_BUF_SIZE, /)\n"
 "--\n"
@@ -553,4 +595,4 @@ exit:
 #ifndef ZLIB_DECOMPRESS___DEEPCOPY___METHODDEF
     #define ZLIB_DECOMPRESS___DEEPCOPY___METHODDEF
 #endif /* !defined(ZLIB_DECOMPRESS___DEEPCOPY___METHODDEF) */
-/*[clinic end generated code: output=d46c646770146ade input=a9049054013a1b77]*/
+/*[clinic end generated code: output=75e156bbcf8d2ba4 input=a9049054013a1b77]*/
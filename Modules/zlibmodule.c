@@ -564,6 +564,7 @@ zlib_decompressobj_impl(PyObject *module, int wbits, PyObject *zdict)
     self->zst.zfree = PyZlib_Free;
     self->zst.next_in = NULL;
     self->zst.avail_in = 0;
+    self->zst.data_type = 0;
     if (zdict != NULL) {
         Py_INCREF(zdict);
         self->zdict = zdict;
@@ -744,6 +745,10 @@ zlib.Decompress.decompress
         The maximum allowable length of the decompressed data.
         Unconsumed input data will be stored in
         the unconsumed_tail attribute.
+    mode: int(c_default="Z_SYNC_FLUSH") = zlib.Z_SYNC_FLUSH
+        The flush mode passed to zlib's inflate().  With Z_BLOCK or
+        Z_TREES, decompression stops at the next deflate block boundary;
+        see the data_type attribute.
 
 Return a bytes object containing the decompressed version of the data.
 
@@ -754,8 +759,8 @@ Call the flush() method to clear these buffers.
 
 static PyObject *
 zlib_Decompress_decompress_impl(compobject *self, Py_buffer *data,
-                                Py_ssize_t max_length)
-/*[clinic end generated code: output=6e5173c74e710352 input=b85a212a012b770a]*/
+                                Py_ssize_t max_length, int mode)
+/*[clinic end generated code: output=2eb32206dd38a8bf input=50c93318ce1b6802]*/
 {
     int err = Z_OK;
     Py_ssize_t ibuflen, obuflen = DEF_BUF_SIZE, hard_limit;
@@ -795,7 +800,7 @@ zlib_Decompress_decompress_impl(compobject *self, Py_buffer *data,
             }
 
             Py_BEGIN_ALLOW_THREADS
-            err = inflate(&self->zst, Z_SYNC_FLUSH);
+            err = inflate(&self->zst, mode);
             Py_END_ALLOW_THREADS
 
             switch (err) {
@@ -813,6 +818,15 @@ zlib_Decompress_decompress_impl(compobject *self, Py_buffer *data,
                 goto save;
             }
 
+#ifdef Z_BLOCK
+            /* Do not go past the block boundary inflate() stopped at. */
+            if ((mode == Z_BLOCK
+#ifdef Z_TREES
+                 || mode == Z_TREES
+#endif
+                ) && (self->zst.data_type & 128))
+                goto save;
+#endif
         } while (self->zst.avail_out == 0 || err == Z_NEED_DICT);
 
     } while (err != Z_STREAM_END && ibuflen != 0);
@@ -1094,6 +1108,37 @@ zlib_Decompress___deepcopy__(compobject *self, PyObject *memo)
 
 #endif
 
+/*[clinic input]
+zlib.Decompress.prime
+
+    bits: int
+        Number of bits to insert, from 0 to 16.
+    value: int
+        The bits to insert, in its low-order bits.
+    /
+
+Insert bits in the input stream, before the next data to decompress.
+
+This allows resuming decompression of a raw deflate stream in the middle
+of a byte, at a block boundary found with the Z_BLOCK mode of decompress().
+[clinic start generated code]*/
+
+static PyObject *
+zlib_Decompress_prime_impl(compobject *self, int bits, int value)
+/*[clinic end generated code: output=667944a4574c40d3 input=c8196831b167d7cd]*/
+{
+    int err;
+
+    ENTER_ZLIB(self);
+    err = inflatePrime(&self->zst, bits, value);
+    LEAVE_ZLIB(self);
+    if (err != Z_OK) {
+        zlib_error(self->zst, err, "while priming decompression object");
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
 /*[clinic input]
 zlib.Decompress.flush
 
@@ -1201,6 +1246,7 @@ static PyMethodDef Decomp_methods[] =
 {
     ZLIB_DECOMPRESS_DECOMPRESS_METHODDEF
     ZLIB_DECOMPRESS_FLUSH_METHODDEF
+    ZLIB_DECOMPRESS_PRIME_METHODDEF
     ZLIB_DECOMPRESS_COPY_METHODDEF
     ZLIB_DECOMPRESS___COPY___METHODDEF
     ZLIB_DECOMPRESS___DEEPCOPY___METHODDEF
@@ -1212,6 +1258,7 @@ static PyMemberDef Decomp_members[] = {
     {"unused_data",     T_OBJECT, COMP_OFF(unused_data), READONLY},
     {"unconsumed_tail", T_OBJECT, COMP_OFF(unconsumed_tail), READONLY},
     {"eof",             T_BOOL,   COMP_OFF(eof), READONLY},
+    {"data_type",       T_INT,    COMP_OFF(zst.data_type), READONLY},
     {NULL},
 };
 
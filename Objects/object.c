@@ -1899,6 +1899,9 @@ _Py_ReadyTypes(void)
     if (PyType_Ready(&_PyNamespace_Type) < 0)
         Py_FatalError("Can't initialize namespace type");
 
+    if (PyType_Ready(&PyPickleBuffer_Type) < 0)
+        Py_FatalError("Can't initialize pickle buffer type");
+
     if (PyType_Ready(&PyCapsule_Type) < 0)
         Py_FatalError("Can't initialize capsule type");
 
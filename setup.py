@@ -1591,6 +1591,15 @@ class PyBuildExt(build_ext):
         exts.append ( Extension('_multiprocessing', multiprocessing_srcs,
                                 define_macros=list(macros.items()),
                                 include_dirs=["Modules/_multiprocessing"]))
+
+        if (sysconfig.get_config_var('HAVE_SHM_OPEN') and
+            sysconfig.get_config_var('HAVE_SHM_UNLINK')):
+            posixshmem_srcs = [ '_multiprocessing/posixshmem.c',
+                              ]
+            exts.append( Extension('_posixshmem', posixshmem_srcs,
+                                   define_macros=list(macros.items()),
+                                   libraries=libraries,
+                                   include_dirs=["Modules/_multiprocessing"]))
         # End multiprocessing
 
         # Platform-specific libraries